@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark the thread, process and interpreter batch backends.
+
+The interpreter backend needs Python 3.14+ and falls back to the thread
+backend on older versions (reported as such below).
+
+Usage:
+    $ uv run python benchmarks/backends.py [--texts N] [--workers W]
+"""
+
+# Imports.
+import argparse
+import sys
+import time
+
+import avro
+from avro.core import backends
+
+
+def make_corpus(count: int, tag: str) -> list[str]:
+    """Builds a corpus of unique texts so that caches don't help."""
+
+    words = "ami banglay gan gai tumi kOthay zao amar sOnar bangla".split()
+    return [
+        " ".join(words[(i + j) % len(words)] for j in range(12)) + f" {tag}{i}"
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}\n")
+
+    for backend in backends.BACKENDS:
+        resolved = backends.resolve_backend(backend)
+        label = backend if resolved == backend else f"{backend} -> {resolved}"
+
+        # Warm the pool up first so that we measure steady-state throughput.
+        avro.parse_iter(
+            make_corpus(args.workers, "warmup"),
+            backend=backend,
+            max_workers=args.workers,
+        )
+
+        texts = make_corpus(args.texts, backend)
+        start = time.perf_counter()
+        avro.parse_iter(texts, backend=backend, max_workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{label:<24} {elapsed:.3f}s ({args.texts / elapsed:,.0f} texts/s)"
+        )
+
+    backends.shutdown_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark converting batches of short texts to and from Bijoy.
+
+Compares avro.to_bijoy_iter() and avro.to_unicode_iter(), which convert
+whole batches in one pass (see avro/core/bijoy.py), with the per-item path
+they take for custom engines: a call (and a cache lookup) per text.
+
+Usage:
+    $ uv run python benchmarks/bijoy_batches.py [--texts N]
+"""
+
+# Imports.
+import argparse
+import time
+
+import avro
+from avro import main as avro_main
+
+
+def make_names(count: int, tag: str) -> list[str]:
+    """Builds unique short texts (names, mostly) so that caches don't help."""
+
+    words = "rahim karim salma nasrin shapla bokul tanvir".split()
+    return [
+        f"{words[i % len(words)]} {words[i // len(words) % len(words)]} {tag}{i}"
+        for i in range(count)
+    ]
+
+
+def measure(name: str, func, texts: list[str]) -> float:
+    start = time.perf_counter()
+    func(texts)
+    seconds = time.perf_counter() - start
+    print(f"{name:>28}: {len(texts) / seconds:10,.0f} texts/s")
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    transliterator = avro_main._DEFAULT
+    for operation, source in (
+        ("to_bijoy", lambda tag: avro.parse_iter(make_names(args.texts, tag))),
+        (
+            "to_unicode",
+            lambda tag: avro.parse_iter(
+                make_names(args.texts, tag), bijoy=True
+            ),
+        ),
+    ):
+        per_item = getattr(transliterator, f"_{operation}")
+        batch = getattr(avro, f"{operation}_iter")
+
+        single = measure(
+            f"{operation} per item",
+            lambda texts: avro_main._sync_concurrency_helper(
+                per_item, tuple(texts), None
+            ),
+            source("a"),
+        )
+        joined = measure(f"{operation}_iter (joined)", batch, source("b"))
+        print(f"{'speedup':>28}: {single / joined:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark converting legacy Bijoy files to Unicode.
+
+Writes Bijoy files of growing sizes, converts them with
+avro.core.bijoy.convert_file(), and reports the throughput along with the
+peak memory used. Also compares the sequence conversion on its own against
+the Bijoy table's regex with a callback per match.
+
+Usage:
+    $ uv run python benchmarks/bijoy_files.py [--max-mb N]
+"""
+
+# Imports.
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import avro
+from avro.core import bijoy, tables
+
+
+def make_text(size: int) -> str:
+    """Builds Bijoy text of (about) the given number of characters."""
+
+    line = avro.parse(
+        "ami banglay gan gai tumi kOthay zao amar sOnar bangla.\n", bijoy=True
+    )
+    return line * (size // len(line) + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-mb", type=int, default=64)
+    args = parser.parse_args()
+
+    text = make_text(1_000_000)
+    reverse = tables.bijoy().reverse
+    start = time.perf_counter()
+    tables.bijoy().reverse_pattern.sub(lambda m: reverse[m.group(0)], text)
+    regex = time.perf_counter() - start
+    start = time.perf_counter()
+    bijoy.convert(text)
+    converted = time.perf_counter() - start
+    print(
+        f"sequences: regex {1 / regex:6.2f} MB/s, "
+        f"translate {1 / converted:6.2f} MB/s"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.txt")
+        target = os.path.join(directory, "target.txt")
+
+        size = 1
+        while size <= args.max_mb:
+            # Written a MB at a time, so as not to hold it in memory here.
+            with open(source, "wb") as file:
+                for _ in range(size):
+                    file.write(text.encode(bijoy.ENCODING))
+            stats = bijoy.convert_file(source, target)
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{size:>5} MB: {stats}, peak RSS {peak:.0f} MB")
+            size *= 4
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark parsing a column of texts against parsing a list of them.
+
+Builds a column of short texts (one buffer plus offsets), and parses it
+with avro.parse_iter() (after decoding it to a list of strings) and with
+avro.parse_columns() in separate processes, reporting the time taken and
+the peak memory used on top of the column itself.
+
+Usage:
+    $ uv run python benchmarks/columns.py [--rows N]
+"""
+
+# Imports.
+import argparse
+import multiprocessing
+import random
+import resource
+import time
+
+import avro
+from avro.core import columns
+
+
+def make_column(rows: int) -> columns.Column:
+    """Builds a column of short texts, some of them repeated."""
+
+    words = "ami banglay gan gai tumi kOthay zao amar sOnar bangla".split()
+    rng = random.Random(0)
+    return columns.Column.from_texts(
+        " ".join(rng.choice(words) for _ in range(3)) + str(i % 5000)
+        for i in range(rows)
+    )
+
+
+def measure(kind: str, rows: int) -> None:
+    column = make_column(rows)
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if kind == "parse_iter":
+        avro.parse_iter(list(column.texts()))
+    else:
+        avro.parse_columns(*column)
+    seconds = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base
+    print(f"{kind:>13}: {seconds:7.2f}s, +{peak / 1024:.0f} MB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for kind in ("parse_iter", "parse_columns"):
+        process = multiprocessing.Process(
+            target=measure, args=(kind, args.rows)
+        )
+        process.start()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark detecting encodings, and converting mixed batches by them.
+
+Measures avro.detect() and avro.detect_runs() on a large mixed text, and
+compares avro.convert_iter() on a batch mixing Unicode, Bijoy and Banglish
+texts with converting the same batch the way callers had to without it:
+guessing the conversion, and falling back to the others.
+
+Usage:
+    $ uv run python benchmarks/detection.py [--texts N]
+"""
+
+# Imports.
+import argparse
+import time
+
+import avro
+
+LINES = [
+    "ami banglay gan gai",
+    "Avgvi ‡mvbvi evsjv",
+    "আমি বাংলায় গান গাই।",
+]
+
+
+def make_texts(count: int, tag: str) -> list[str]:
+    """Builds unique mixed texts so that caches don't help."""
+
+    return [f"{LINES[i % len(LINES)]} {tag}{i}" for i in range(count)]
+
+
+def measure(name: str, func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    seconds = time.perf_counter() - start
+    print(f"{name:>28}: {seconds * 1e3:10,.1f} ms")
+    return seconds
+
+
+def every_conversion(texts: list[str]) -> None:
+    avro.parse_iter(texts)
+    avro.to_unicode_iter(texts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=5_000)
+    args = parser.parse_args()
+
+    text = "\n".join(make_texts(args.texts * 10, "x"))
+    avro.detect("")
+    measure(f"detect ({len(text) / 1e6:.1f}M chars)", avro.detect, text)
+    measure("detect_runs", avro.detect_runs, text)
+
+    every = measure(
+        "every conversion", every_conversion, make_texts(args.texts, "a")
+    )
+    routed = measure(
+        "convert_iter", avro.convert_iter, make_texts(args.texts, "b")
+    )
+    print(f"{'speedup':>28}: {every / routed:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark parse_iter() scaling with the number of worker threads.
+
+Run this on a free-threaded interpreter (e.g. python3.13t / python3.14t) to
+see real multicore scaling of the thread-pool backend. On regular builds
+the GIL keeps the speedup close to 1x.
+
+Usage:
+    $ uv run python benchmarks/free_threading.py [--texts N] [--repeat R]
+"""
+
+# Imports.
+import argparse
+import os
+import sys
+import sysconfig
+import time
+
+import avro
+
+
+def make_corpus(count: int) -> list[str]:
+    """Builds a corpus of unique texts so that caches don't help."""
+
+    words = "ami banglay gan gai tumi kOthay zao amar sOnar bangla".split()
+    return [
+        " ".join(words[(i + j) % len(words)] for j in range(12)) + f" {i}"
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}")
+    print(
+        f"Free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}"
+    )
+    print(f"GIL enabled at runtime: {gil_enabled}")
+    print(f"CPUs: {os.cpu_count()}\n")
+
+    corpus = make_corpus(args.texts)
+    baseline = None
+
+    for threads in (1, 2, 4, 8, 16):
+        best = float("inf")
+        for run in range(args.repeat):
+            # Fresh texts per run; the backend caches would hide the work.
+            texts = [f"{text} {threads}{run}" for text in corpus]
+            start = time.perf_counter()
+            avro.parse_iter(texts, max_workers=threads)
+            best = min(best, time.perf_counter() - start)
+
+        baseline = baseline or best
+        print(
+            f"{threads:>2} threads: {best:.3f}s "
+            f"({args.texts / best:,.0f} texts/s, {baseline / best:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark the cold-start cost of importing and first using avro.py.
+
+Each scenario runs in a fresh interpreter, and reports the median wall time
+along with which of the heavier subsystems ended up being loaded.
+
+By default the dictionary tables are compiled from the dictionary sources;
+pass --snapshots to load them from freshly built snapshots instead (see
+avro/core/tables.py).
+
+Usage:
+    $ uv run python benchmarks/import_time.py [--runs N] [--snapshots]
+"""
+
+# Imports.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Scenarios to measure: (label, code run after the timer starts).
+SCENARIOS = [
+    ("import avro", "import avro"),
+    ("to_bijoy()", "import avro; avro.to_bijoy('আমি বাংলায় গান গাই।')"),
+    ("to_unicode()", "import avro; avro.to_unicode('Avwg evsjvq Mvb MvB|')"),
+    ("parse()", "import avro; avro.parse('ami banglay gan gai.')"),
+    ("reverse()", "import avro; avro.reverse('আমি বাংলায় গান গাই।')"),
+    (
+        "parse_async()",
+        "import asyncio, avro; asyncio.run(avro.parse_async('ami'))",
+    ),
+]
+
+# Subsystems reported as loaded / not loaded for each scenario.
+SUBSYSTEMS = {
+    "phonetic": "avro.resources.phonetic",
+    "bijoy": "avro.resources.bijoy",
+    "asyncio": "asyncio",
+    "futures": "concurrent.futures",
+}
+
+RUNNER = """
+import sys, time, json
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {modules!r} if m in sys.modules]]))
+"""
+
+
+def measure(code: str, cache_dir: str = "") -> tuple[float, list[str]]:
+    """Runs code in a fresh interpreter and returns (seconds, modules)."""
+
+    script = RUNNER.format(code=code, modules=list(SUBSYSTEMS.values()))
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "AVRO_CACHE_DIR": cache_dir},
+    )
+    elapsed, modules = json.loads(output.stdout)
+    return elapsed, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--snapshots", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if args.snapshots:
+            from avro.core import tables
+
+            tables.write_snapshots(cache_dir)
+
+        run(args.runs, cache_dir if args.snapshots else "")
+
+
+def run(runs: int, cache_dir: str) -> None:
+    tables = "snapshots" if cache_dir else "dictionary sources"
+    print(f"Python {sys.version.split()[0]}, tables from {tables}\n")
+    print(f"{'scenario':<16} {'median':>9}   loaded subsystems")
+
+    for label, code in SCENARIOS:
+        timings = []
+        for _ in range(runs):
+            elapsed, modules = measure(code, cache_dir)
+            timings.append(elapsed)
+
+        loaded = [name for name, mod in SUBSYSTEMS.items() if mod in modules]
+        print(
+            f"{label:<16} {statistics.median(timings) * 1000:>7.1f}ms"
+            f"   {', '.join(loaded) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark incremental parsing against parsing the whole text per key.
+
+Types a word into the middle of documents of growing sizes, one keystroke
+at a time, and reports the latency per keystroke.
+
+Usage:
+    $ uv run python benchmarks/incremental.py [--keys N]
+"""
+
+# Imports.
+import argparse
+import time
+
+import avro
+
+
+def make_document(size: int) -> str:
+    """Builds a document of (about) the given number of characters."""
+
+    words = "ami banglay gan gai tumi kOthay zao amar sOnar bangla".split()
+    line = " ".join(words) + ".\n"
+    return line * (size // len(line) + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=200)
+    args = parser.parse_args()
+
+    typed = ("ekhane kichu lekha " * args.keys)[: args.keys]
+
+    for size in (10_000, 100_000, 1_000_000, 10_000_000):
+        text = make_document(size)
+        document = avro.parse_incremental(text)
+        offset = len(text) // 2
+
+        start = time.perf_counter()
+        for i, char in enumerate(typed):
+            document.edit(offset + i, 0, char)
+        incremental = (time.perf_counter() - start) / len(typed)
+
+        # Parsing the whole text per key is only measured on small texts.
+        if size <= 100_000:
+            keys = typed[:10]
+            start = time.perf_counter()
+            for i in range(len(keys)):
+                avro.parse(text[:offset] + keys[: i + 1] + text[offset:])
+            full = f"{(time.perf_counter() - start) / len(keys) * 1e3:9.2f}ms"
+        else:
+            full = "        -"
+
+        print(
+            f"{len(text):>12,} chars: "
+            f"incremental {incremental * 1e3:6.3f}ms/key, full parse {full}/key"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Benchmark the private memory of forked workers, with and without warmup.
+
+A parent process imports avro.py (and optionally calls avro.warmup()), then
+forks a few workers which each handle the same small workload. Memory that
+the workers still share with the parent is free; what matters is how much
+each of them ends up having to copy (their private memory, as reported by
+/proc/self/smaps_rollup). Linux only.
+
+Usage:
+    $ uv run python benchmarks/prefork_memory.py [--workers N]
+"""
+
+# Imports.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# The workload handled by every worker.
+WORDS = "ami banglay gan gai tumi kOthay zao amar sOnar bangla".split()
+TEXTS = [" ".join(WORDS[i:] + WORDS[:i]) for i in range(len(WORDS))]
+
+
+def private_memory() -> int:
+    """Returns the private (unshared) memory of this process, in KiB."""
+
+    total = 0
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def work() -> None:
+    import avro
+
+    for text in TEXTS:
+        avro.reverse(avro.parse(text))
+        avro.parse(text, bijoy=True)
+
+
+def fork_workers(workers: int, warmup: bool) -> list[int]:
+    """Forks workers and returns their private memory after the workload."""
+
+    import avro
+
+    if warmup:
+        avro.warmup(WORDS)
+
+    results = []
+
+    for _ in range(workers):
+        read, write = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(read)
+            work()
+            os.write(write, str(private_memory()).encode())
+            os._exit(0)
+
+        os.close(write)
+        with os.fdopen(read) as pipe:
+            results.append(int(pipe.read()))
+        os.waitpid(pid, 0)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", choices=["cold", "warm"], help="internal")
+    args = parser.parse_args()
+
+    if args.child:
+        results = fork_workers(args.workers, args.child == "warm")
+        print(json.dumps(results))
+        return
+
+    print(f"Python {sys.version.split()[0]}, {args.workers} workers\n")
+    print(f"{'parent':<22} {'median private memory':>22}")
+
+    # Every mode runs in a fresh parent process.
+    for mode, label in (("cold", "import avro"), ("warm", "avro.warmup()")):
+        output = subprocess.run(
+            [sys.executable, __file__, "--workers", str(args.workers)]
+            + ["--child", mode],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        results = json.loads(output.stdout)
+        print(f"{label:<22} {statistics.median(results):>19} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,31 +8,60 @@ Project Links:
 
 """
 
-# Import only the public API functions to avoid import cycles.
-from .main import (
-    parse,
-    parse_async,
-    parse_iter,
-    parse_async_iter,
-    to_bijoy,
-    to_bijoy_async,
-    to_bijoy_iter,
-    to_bijoy_async_iter,
-    to_unicode,
-    to_unicode_async,
-    to_unicode_iter,
-    to_unicode_async_iter,
-    reverse,
-    reverse_async,
-    reverse_iter,
-    reverse_async_iter,
-)
+# The public API is loaded lazily (PEP 562) on first attribute access, so
+# that `import avro` itself stays cheap and each subsystem is only loaded
+# when it is actually used. Type checkers still see the eager imports below.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .main import (
+        parse,
+        parse_async,
+        parse_iter,
+        parse_async_iter,
+        parse_incremental,
+        typing_session,
+        to_bijoy,
+        to_bijoy_async,
+        to_bijoy_iter,
+        to_bijoy_async_iter,
+        to_unicode,
+        to_unicode_async,
+        to_unicode_iter,
+        to_unicode_async_iter,
+        reverse,
+        reverse_async,
+        reverse_iter,
+        reverse_async_iter,
+        parse_bytes,
+        reverse_bytes,
+        to_bijoy_bytes,
+        to_unicode_bytes,
+        parse_columns,
+        reverse_columns,
+        to_bijoy_columns,
+        to_unicode_columns,
+        detect,
+        detect_runs,
+        convert,
+        convert_iter,
+        stats,
+        load_wordlist,
+        add_exceptions,
+        remove_exceptions,
+        set_exceptions,
+        set_engine,
+        warmup,
+        MicroBatcher,
+        Transliterator,
+    )
 
 __all__ = [
     "parse",
     "parse_async",
     "parse_iter",
     "parse_async_iter",
+    "parse_incremental",
+    "typing_session",
     "to_bijoy",
     "to_bijoy_async",
     "to_bijoy_iter",
@@ -45,4 +74,44 @@ __all__ = [
     "reverse_async",
     "reverse_iter",
     "reverse_async_iter",
+    "parse_bytes",
+    "reverse_bytes",
+    "to_bijoy_bytes",
+    "to_unicode_bytes",
+    "parse_columns",
+    "reverse_columns",
+    "to_bijoy_columns",
+    "to_unicode_columns",
+    "detect",
+    "detect_runs",
+    "convert",
+    "convert_iter",
+    "stats",
+    "load_wordlist",
+    "add_exceptions",
+    "remove_exceptions",
+    "set_exceptions",
+    "set_engine",
+    "warmup",
+    "MicroBatcher",
+    "Transliterator",
 ]
+
+# Maps each lazily loaded public name to the module providing it.
+_LAZY = {name: ".main" for name in __all__}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Imports.
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# The execution backends accepted by the batch functions.
+BACKENDS: tuple[str, ...] = ("thread", "process", "interpreter")
+
+# Whether subinterpreter pools are available. This is checked by version
+# so that concurrent.futures isn't imported until a pool is needed.
+HAS_INTERPRETER_POOL = sys.version_info >= (3, 14)
+
+# Shared worker pools, keyed by backend and worker count. Starting processes
+# and interpreters is expensive, so these are kept alive between calls.
+_POOLS: dict[tuple[str, int | None], Executor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+# Functions.
+def resolve_backend(backend: str) -> str:
+    """Validates a backend name and resolves it for the running interpreter.
+
+    The "interpreter" backend gracefully falls back to "thread" on Python
+    versions without concurrent.futures.InterpreterPoolExecutor.
+
+    Parameters:
+    -----------
+
+    backend: str
+        The requested backend.
+
+    Returns:
+    --------
+
+    str
+        The backend that will actually be used.
+    """
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}, expected one of {BACKENDS}"
+        )
+
+    if backend == "interpreter" and not HAS_INTERPRETER_POOL:
+        return "thread"
+
+    return backend
+
+
+def get_pool(
+    backend: str,
+    max_workers: int | None = None,
+    initializer: Callable[[], None] | None = None,
+) -> Executor:
+    """Returns the shared worker pool for a process / interpreter backend.
+
+    Parameters:
+    -----------
+
+    backend: str
+        Either "process" or "interpreter" (see resolve_backend()).
+
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    initializer: Callable[[], None] | None = None
+        Run once in every worker when it starts, e.g. to build the
+        dictionary tables once per process / interpreter.
+
+    Returns:
+    --------
+
+    Executor
+        The (possibly already running) worker pool.
+    """
+
+    import concurrent.futures
+
+    key = (backend, max_workers)
+
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            if backend == "process":
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers, initializer=initializer
+                )
+            elif backend == "interpreter":
+                pool = concurrent.futures.InterpreterPoolExecutor(  # type: ignore[attr-defined]
+                    max_workers, initializer=initializer
+                )
+            else:
+                raise ValueError(f"Backend {backend!r} has no shared pool")
+            _POOLS[key] = pool
+
+    return pool
+
+
+def shutdown_pools() -> None:
+    """Shuts down all shared worker pools (they restart on next use)."""
+
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+
+    for pool in pools:
+        pool.shutdown()
+
+
+def chunk(
+    items: Sequence[str], max_workers: int | None = None
+) -> list[tuple[str, ...]]:
+    """Splits items into a few chunks per worker.
+
+    Shipping whole chunks (instead of single items) amortizes the cost of
+    moving work between processes or interpreters.
+
+    Parameters:
+    -----------
+
+    items: Sequence[str]
+        The items to split.
+
+    max_workers: int | None = None
+        The number of workers. Defaults to the CPU count if None.
+
+    Returns:
+    --------
+
+    list[tuple[str, ...]]
+        The chunks, in order.
+    """
+
+    workers = max_workers or os.cpu_count() or 1
+    size = max(1, -(-len(items) // (workers * 4)))
+    return [tuple(items[i : i + size]) for i in range(0, len(items), size)]
@@ -0,0 +1,424 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""The Bijoy converters, for texts, batches of them and legacy files.
+
+The sequences of the Bijoy tables are converted without a Python callback
+per match: the single characters with str.translate(), and the few longer
+sequences by splitting them out with one compiled pattern (a trie of them,
+matching the longest) and looking them up in bulk. The rearrangements
+around that are run on small chunks of the text (see core/parallel.py),
+keeping them linear.
+
+Batches of texts have their sequences converted in one pass, joined by a
+separator (see to_bijoy_batch()).
+
+Bijoy files were saved a byte per character, in the Windows-1252 code page
+of the fonts that display them, so they're decoded with a 256-entry table
+(bytes undefined there stand for the same code point, as in Latin-1)
+rather than a codec. They're memory-mapped and read a block at a time, and
+converted in chunks (see core/streams.py) written to the output as UTF-8
+as they go, so memory use doesn't grow with their size. Run it with:
+
+    $ python -m avro.core.bijoy SOURCE TARGET [SOURCE TARGET ...]
+"""
+
+# Imports.
+from __future__ import annotations
+
+import codecs
+import contextlib
+import mmap
+import os
+import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, BinaryIO, NamedTuple
+
+from . import parallel, processor, streams, tables
+from .cache import once
+
+# The code page Bijoy text was saved in.
+ENCODING = "cp1252"
+
+# The size of the blocks read from the files.
+BLOCK_SIZE = 1 << 20
+
+# Joins the texts of a batch (see to_bijoy_batch()).
+SEPARATOR = parallel.SENTINEL
+
+# The size of the chunks rearranged at once, as that gets slower with their
+# size (the text is rebuilt for every move).
+_CHUNK = 1 << 10
+
+
+# Classes.
+class Stats(NamedTuple):
+    """How much a conversion read and wrote, and how long it took."""
+
+    read: int
+    written: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """The input converted per second, in MB."""
+
+        return self.read / 1e6 / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.read / 1e6:.1f} MB in {self.seconds:.2f}s, "
+            f"{self.throughput:.2f} MB/s ({self.written / 1e6:.1f} MB written)"
+        )
+
+
+class _Tables(NamedTuple):
+    # The single characters converted by translation, and the longer
+    # sequences with the pattern splitting them out.
+    singles: dict[int, str]
+    sequences: dict[str, str]
+    pattern: re.Pattern[str]
+
+
+# Functions.
+def _automaton(keys: Iterable[str]) -> str:
+    # A pattern matching the longest of the keys, as the table's own pattern
+    # does, shaped as a trie of them so that every character is only
+    # looked at once rather than once per key.
+    trie: dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def source(node: dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + source(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = (
+            branches[0]
+            if len(branches) == 1
+            else "(?:" + "|".join(branches) + ")"
+        )
+        # Longer keys first: optional is greedy.
+        return f"(?:{body})?" if "" in node else body
+
+    return source(trie)
+
+
+def _build(mappings: dict[str, str]) -> _Tables:
+    # Batches are converted joined by the separator (see to_bijoy_batch()),
+    # which only works as long as no sequence contains it.
+    if any(SEPARATOR in key for key in mappings):
+        raise ValueError("The separator is part of a Bijoy sequence")
+
+    singles = {ord(k): v for k, v in mappings.items() if len(k) == 1}
+    sequences = {k: v for k, v in mappings.items() if len(k) > 1}
+    pattern = re.compile(f"({_automaton(sequences)})")
+    return _Tables(singles, sequences, pattern)
+
+
+@once
+def _unicode_tables() -> _Tables:
+    return _build(tables.bijoy().mappings)
+
+
+@once
+def _bijoy_tables() -> _Tables:
+    return _build(tables.bijoy().reverse)
+
+
+@once
+def _decoding() -> str:
+    # The character of every byte.
+    return "".join(
+        bytes([byte]).decode(ENCODING, "ignore") or chr(byte)
+        for byte in range(256)
+    )
+
+
+def decode(data: bytes | bytearray | memoryview) -> str:
+    """Decodes the bytes of a legacy Bijoy file to (Bijoy) text.
+
+    Parameters:
+    -----------
+
+    data: bytes | bytearray | memoryview
+        The bytes, a character each.
+
+    Returns:
+    --------
+
+    str
+        The text.
+    """
+
+    return codecs.charmap_decode(data, "strict", _decoding())[0]
+
+
+def convert(text: str, reverse: bool = False) -> str:
+    """Converts the sequences of (rearranged) Unicode text to Bijoy, or
+    the other way around before it's rearranged (see to_bijoy() and
+    to_unicode()).
+
+    Parameters:
+    -----------
+
+    text: str
+        The text.
+
+    reverse: bool = False
+        Whether to convert Bijoy text to Unicode.
+
+    Returns:
+    --------
+
+    str
+        The converted text.
+    """
+
+    t = _bijoy_tables() if reverse else _unicode_tables()
+    # Runs without sequences and the sequences, alternating.
+    parts = t.pattern.split(text)
+    parts[::2] = [part.translate(t.singles) for part in parts[::2]]
+    parts[1::2] = map(t.sequences.__getitem__, parts[1::2])
+    return "".join(parts)
+
+
+def _rearrange_unicode(text: str) -> str:
+    # What to_bijoy() converts: the Unicode text, with the two-part vowel
+    # signs decomposed, and rearranged.
+    text = text.replace("\u09cb", "\u09c7\u09be")
+    text = text.replace("\u09cc", "\u09c7\u09d7")
+    return processor.rearrange_unicode_text(text)
+
+
+def _rearrange_bijoy(text: str) -> str:
+    # What to_unicode() makes of converted Bijoy text.
+    text = processor.rearrange_bijoy_text(text)
+    return text.replace("অা", "আ").strip()
+
+
+def _to_unicode(text: str) -> str:
+    return _rearrange_bijoy(convert(text, True))
+
+
+def to_bijoy(text: str) -> str:
+    """Converts Unicode text to Bijoy, as avro.to_bijoy() does.
+
+    Parameters:
+    -----------
+
+    text: str
+        The Unicode text.
+
+    Returns:
+    --------
+
+    str
+        The Bijoy text.
+    """
+
+    return convert(_rearrange_unicode(text)).strip()
+
+
+def to_unicode(text: str) -> str:
+    """Converts Bijoy text to Unicode, as avro.to_unicode() does.
+
+    Parameters:
+    -----------
+
+    text: str
+        The Bijoy text.
+
+    Returns:
+    --------
+
+    str
+        The Unicode text.
+    """
+
+    chunks = parallel.split(text, "to_unicode", size=_CHUNK)
+    if len(chunks) == 1:
+        return _to_unicode(text)
+    outputs = map(_to_unicode, parallel.wrap(chunks, "to_unicode"))
+    return parallel.unwrap(list(outputs), chunks, "to_unicode")
+
+
+def _batch(
+    texts: Sequence[str],
+    before: Callable[[str], str],
+    reverse: bool,
+    after: Callable[[str], str],
+) -> list[str]:
+    # Converts the sequences of a whole batch at once (see
+    # to_bijoy_batch()); whatever looks across characters runs per text.
+    if not texts:
+        return []
+
+    joined = SEPARATOR.join(map(before, texts))
+    if joined.count(SEPARATOR) != len(texts) - 1:
+        # A text contains the separator itself.
+        return [after(convert(before(text), reverse)) for text in texts]
+    return list(map(after, convert(joined, reverse).split(SEPARATOR)))
+
+
+def to_bijoy_batch(texts: Sequence[str]) -> list[str]:
+    """Converts a batch of Unicode texts to Bijoy, as avro.to_bijoy_iter()
+    does, in one pass.
+
+    The texts are rearranged one by one (as that moves characters around
+    within a text, and looks up to its ends), and the sequences of all of
+    them converted at once, joined by SEPARATOR: as the sequences are only
+    ever looked up from where they start, and none of them contains the
+    separator, it's never part of one, and converts to itself. Texts that
+    contain the separator themselves are converted one by one.
+
+    Parameters:
+    -----------
+
+    texts: Sequence[str]
+        The Unicode texts.
+
+    Returns:
+    --------
+
+    list[str]
+        The Bijoy texts, in the same order.
+    """
+
+    return _batch(texts, _rearrange_unicode, False, str.strip)
+
+
+def to_unicode_batch(texts: Sequence[str]) -> list[str]:
+    """Converts a batch of Bijoy texts to Unicode, as avro.to_unicode_iter()
+    does, in one pass (see to_bijoy_batch()).
+
+    Parameters:
+    -----------
+
+    texts: Sequence[str]
+        The Bijoy texts.
+
+    Returns:
+    --------
+
+    list[str]
+        The Unicode texts, in the same order.
+    """
+
+    if any(len(text) > _CHUNK for text in texts):
+        # Long texts are rearranged in chunks (see to_unicode()).
+        return list(map(to_unicode, texts))
+    return _batch(texts, str, True, _rearrange_bijoy)
+
+
+def _blocks(data: mmap.mmap | bytes, size: int) -> Iterator[bytes]:
+    # Slices of a map are copies, so that the pages read can be dropped
+    # (and the map closed) right after.
+    drop = isinstance(data, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED")
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+        if drop and not start % mmap.PAGESIZE:
+            data.madvise(
+                mmap.MADV_DONTNEED, start, min(size, len(data) - start)
+            )
+
+
+def convert_file(
+    source: str | os.PathLike,
+    target: str | os.PathLike | BinaryIO,
+    *,
+    size: int = BLOCK_SIZE,
+) -> Stats:
+    """Converts a legacy Bijoy file to a UTF-8 Unicode one.
+
+    Parameters:
+    -----------
+
+    source: str | os.PathLike
+        The path of the Bijoy file.
+
+    target: str | os.PathLike | BinaryIO
+        The path to write the Unicode text to, or a binary file.
+
+    size: int = BLOCK_SIZE
+        The size of the blocks read.
+
+    Returns:
+    --------
+
+    Stats
+        The bytes read and written, and the time it took.
+    """
+
+    start = time.perf_counter()
+    stream = streams.Stream(to_unicode, "to_unicode")
+    written = 0
+
+    with contextlib.ExitStack() as stack:
+        file = stack.enter_context(open(source, "rb"))
+        # Empty files can't be mapped.
+        length = os.fstat(file.fileno()).st_size
+        data: mmap.mmap | bytes = b""
+        if length:
+            data = stack.enter_context(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+
+        output = (
+            stack.enter_context(open(target, "wb"))
+            if isinstance(target, (str, os.PathLike))
+            else target
+        )
+        for block in _blocks(data, size):
+            encoded = stream.feed(decode(block)).encode()
+            streams.write(output, encoded)
+            written += len(encoded)
+        encoded = stream.close().encode()
+        streams.write(output, encoded)
+        written += len(encoded)
+
+    return Stats(length, written, time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point for converting files."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m avro.core.bijoy",
+        description="Convert legacy Bijoy files to UTF-8 Unicode ones.",
+    )
+    parser.add_argument(
+        "files", nargs="+", help="A Bijoy file and its target, per file."
+    )
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if len(args.files) % 2:
+        parser.error("expected a target for every source")
+
+    total = Stats(0, 0, 0.0)
+    for source, target in zip(args.files[::2], args.files[1::2]):
+        stats = convert_file(source, target)
+        total = Stats(*(a + b for a, b in zip(total, stats)))
+        if not args.quiet:
+            print(f"{source}: {stats}", file=sys.stderr)
+
+    if not args.quiet and len(args.files) > 2:
+        print(f"Total: {total}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Imports.
+import itertools
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Hashable
+from functools import lru_cache, update_wrapper, wraps
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+# Same shape as the statistics reported by functools.lru_cache.
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Whether the interpreter is running without the GIL (free-threaded builds of
+# CPython 3.13+ with the GIL actually disabled at runtime).
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Number of independently locked shards used by the free-threaded cache.
+DEFAULT_SHARDS = 16
+
+
+# Classes.
+class _Shard:
+    """A single LRU shard guarded by its own lock."""
+
+    __slots__ = ("data", "hits", "lock", "misses")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # The results by key, least recently used first, along with when
+        # they were last used (see _ShardedLRUCache._clock).
+        self.data: OrderedDict[Hashable, tuple[int, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+class _ShardedLRUCache:
+    """A thread-safe LRU cache split into independently locked shards.
+
+    Under free-threading, functools.lru_cache serializes every caller on a
+    single per-cache lock. Splitting the keys over several shards lets
+    threads working on different inputs hit the cache without contending,
+    while the computation itself always runs outside of any lock.
+
+    The cache holds as many results as functools.lru_cache would with the
+    same maxsize (all of them if None, none if 0), however they spread over
+    the shards: once it's full, the least recently used result of all the
+    shards is evicted.
+
+    Mirrors the cache_info() / cache_clear() API of functools.lru_cache.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], maxsize: int | None, shards: int
+    ):
+        self.__wrapped__ = func
+        self._shards = tuple(_Shard() for _ in range(shards))
+        self._maxsize = None if maxsize is None else max(0, maxsize)
+        # Counts the uses of results, ordering them across the shards.
+        self._clock = itertools.count()
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        shard = self._shards[hash(key) % len(self._shards)]
+
+        if self._maxsize == 0:
+            with shard.lock:
+                shard.misses += 1
+            return self.__wrapped__(*args, **kwargs)
+
+        with shard.lock:
+            try:
+                _, result = shard.data[key]
+            except KeyError:
+                pass
+            else:
+                shard.data[key] = (next(self._clock), result)
+                shard.data.move_to_end(key)
+                shard.hits += 1
+                return result
+
+        result = self.__wrapped__(*args, **kwargs)
+
+        with shard.lock:
+            shard.misses += 1
+            added = key not in shard.data
+            shard.data[key] = (next(self._clock), result)
+            shard.data.move_to_end(key)
+
+        if added:
+            self._evict()
+
+        return result
+
+    def _evict(self) -> None:
+        # Evicts the least recently used results while there are too many,
+        # locking one shard at a time.
+        if self._maxsize is None:
+            return
+
+        while self._currsize() > self._maxsize:
+            oldest: tuple[int, _Shard, Hashable] | None = None
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.data:
+                        key, (used, _) = next(iter(shard.data.items()))
+                        if oldest is None or used < oldest[0]:
+                            oldest = (used, shard, key)
+            if oldest is None:
+                return
+
+            used, shard, key = oldest
+            with shard.lock:
+                # Unless it was used (or evicted) in the meantime.
+                entry = shard.data.get(key)
+                if entry is not None and entry[0] == used:
+                    del shard.data[key]
+
+    def _currsize(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
+
+    def __reduce__(self) -> tuple:
+        # Pickled as an empty cache of the same function: bound methods
+        # (e.g. of a Transliterator) are pickled along with their instance.
+        return (
+            _ShardedLRUCache,
+            (self.__wrapped__, self._maxsize, len(self._shards)),
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """Reports cache statistics."""
+
+        return CacheInfo(
+            sum(shard.hits for shard in self._shards),
+            sum(shard.misses for shard in self._shards),
+            self._maxsize,
+            self._currsize(),
+        )
+
+    def cache_clear(self) -> None:
+        """Clears the cache and its statistics."""
+
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+                shard.hits = shard.misses = 0
+
+
+# Functions.
+def thread_cache(
+    maxsize: int | None = 128, *, shards: int = DEFAULT_SHARDS
+) -> Callable[[F], F]:
+    """Decorator for a memoizing cache that scales across threads.
+
+    On regular (GIL) builds this is simply functools.lru_cache. On
+    free-threaded builds it returns a sharded LRU cache so that threads
+    don't serialize on a single cache lock.
+
+    Parameters:
+    -----------
+
+    maxsize: int | None = 128
+        The maximum number of cached results, as for functools.lru_cache:
+        None for no limit, and 0 for no caching.
+
+    shards: int = DEFAULT_SHARDS
+        The number of independently locked shards on free-threaded builds.
+
+    Returns:
+    --------
+
+    Callable[[F], F]
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        if not FREE_THREADED:
+            return lru_cache(maxsize=maxsize)(func)  # type: ignore[return-value]
+        return _ShardedLRUCache(func, maxsize, shards)  # type: ignore[return-value]
+
+    return decorator
+
+
+def once(func: Callable[[], T]) -> Callable[[], T]:
+    """Decorator for a zero-argument function that only ever runs once.
+
+    The first caller computes the value while holding a lock; every caller
+    afterwards (from any thread) gets the same object back without locking.
+    This is race-free even on free-threaded builds.
+
+    Parameters:
+    -----------
+
+    func: Callable[[], T]
+        The function to run once.
+
+    Returns:
+    --------
+
+    Callable[[], T]
+        The wrapped function.
+    """
+
+    lock = threading.Lock()
+    result: list[T] = []
+
+    @wraps(func)
+    def wrapper() -> T:
+        if not result:
+            with lock:
+                if not result:
+                    result.append(func())
+        return result[0]
+
+    return wrapper
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Detection of the encoding of text: Unicode Bengali, Bijoy or Banglish.
+
+Every character is mapped to what it tells (see _categories()) in one
+str.translate() pass, and the categories counted with str.count(), so
+texts are classified in linear time without a Python step per character:
+
+- Bengali characters (and the rest of what Bijoy text is converted from)
+  are Unicode text.
+- The non-ASCII characters of Bijoy, the ASCII keys of its vowel signs
+  (e.g. v for া) and the upper case letters Avro doesn't tell apart from
+  lower case ones are Bijoy text.
+- The vowels of Avro Phonetic are Banglish, as there's one in almost every
+  syllable typed with it, while Bijoy texts type vowels as signs.
+
+Anything else (digits, punctuation, the other letters) goes either way.
+Single words are often too short to tell Bijoy and Banglish apart, so
+runs of ASCII words are told apart as a whole, unless a few words in a row
+lean the other way (see runs()).
+"""
+
+# Imports.
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+from . import config
+from .cache import once
+
+# The encodings.
+UNICODE = "unicode"
+BIJOY = "bijoy"
+BANGLISH = "banglish"
+ENCODINGS = (UNICODE, BIJOY, BANGLISH)
+
+# What the characters are mapped to (see _categories()).
+_UNICODE, _BIJOY, _VOWEL, _LETTER = "u", "b", "v", "l"
+
+_WORD = re.compile(r"\S+")
+
+# A stretch of ASCII words switches between Bijoy and Banglish text (see
+# runs()) if it has this many words, leaning the other way by this many
+# characters telling them apart.
+_SWITCH_WORDS = 2
+_SWITCH_MARGIN = 3
+
+# The Bengali block.
+_BENGALI = range(0x0980, 0x0A00)
+
+
+# Classes.
+class Run(NamedTuple):
+    """A stretch of text in one encoding (see runs())."""
+
+    start: int
+    end: int
+    encoding: str | None
+
+
+# Functions.
+@once
+def _categories() -> dict[int, str]:
+    # The category of every character telling anything; the rest are left
+    # as they are by str.translate(), and none of them is a category.
+    reverse = config.BIJOY_MAP_REVERSE
+    kars = {
+        key
+        for key, value in reverse.items()
+        if len(key) == 1 and key.isascii() and value in config.AVRO_KAR
+    }
+    bijoy = {char for key in reverse for char in key if not char.isascii()}
+    unicode = {chr(code) for code in _BENGALI}
+    unicode.update(char for key in config.BIJOY_MAP for char in key)
+    # Characters both kinds of text have (e.g. curly quotes).
+    shared = bijoy & unicode
+
+    table = {}
+    for char in map(chr, range(ord("a"), ord("z") + 1)):
+        upper = char.upper()
+        table[ord(char)] = _VOWEL if char in config.AVRO_VOWELS else _LETTER
+        table[ord(upper)] = (
+            _LETTER if char in config.AVRO_CASESENSITIVES else _BIJOY
+        )
+    for char in unicode - shared:
+        table[ord(char)] = _UNICODE
+    for char in (bijoy | kars) - shared:
+        table[ord(char)] = _BIJOY
+    return table
+
+
+def _counts(
+    categories: str, start: int = 0, end: int | None = None
+) -> tuple[int, int, int, int]:
+    # The Unicode, Bijoy, vowel and other letter characters in a stretch.
+    end = len(categories) if end is None else end
+    return (
+        categories.count(_UNICODE, start, end),
+        categories.count(_BIJOY, start, end),
+        categories.count(_VOWEL, start, end),
+        categories.count(_LETTER, start, end),
+    )
+
+
+def _ascii(bijoy: int, vowels: int) -> str:
+    return BIJOY if bijoy > vowels else BANGLISH
+
+
+def classify(text: str) -> str | None:
+    """Detects the encoding of text.
+
+    Parameters:
+    -----------
+
+    text: str
+        The text.
+
+    Returns:
+    --------
+
+    str | None
+        UNICODE, BIJOY or BANGLISH, whichever most of the text is in; None
+        if it has nothing to tell them apart (e.g. only digits).
+    """
+
+    unicode, bijoy, vowels, letters = _counts(text.translate(_categories()))
+    if unicode and unicode >= bijoy + vowels + letters:
+        return UNICODE
+    if bijoy or vowels or letters:
+        return _ascii(bijoy, vowels)
+    return None
+
+
+def _switches(stretches: list[list[int]]) -> list[tuple[int, int, int]]:
+    # Splits a run of ASCII words where the text switches between Bijoy
+    # and Banglish, given its stretches of words leaning the same way (see
+    # runs()): at the stretches leaning the other way by enough to tell
+    # (see _SWITCH_WORDS and _SWITCH_MARGIN), not at every word that does,
+    # as single words are often misleading (e.g. "PDF" in Banglish text).
+    # Returns the start and Bijoy and vowel counts of every part.
+    if len(stretches) == 1:
+        start, _, bijoy, vowels, _ = stretches[0]
+        return [(start, bijoy, vowels)]
+
+    parts: list[list[int]] = []
+    for start, lean, bijoy, vowels, count in stretches:
+        strong = (
+            count >= _SWITCH_WORDS and abs(bijoy - vowels) >= _SWITCH_MARGIN
+        )
+        if parts and not (strong and parts[-1][1] not in (0, lean)):
+            # Part of the one before it.
+            parts[-1][1] = parts[-1][1] or (lean if strong else 0)
+            parts[-1][2] += bijoy
+            parts[-1][3] += vowels
+        else:
+            parts.append([start, lean if strong else 0, bijoy, vowels])
+    return [(start, bijoy, vowels) for start, _, bijoy, vowels in parts]
+
+
+def runs(text: str) -> list[Run]:
+    """Splits text into runs of the same encoding.
+
+    Words are either Unicode or ASCII (Bijoy or Banglish), and consecutive
+    words of the same kind make a run, which is classified as a whole.
+    Runs of ASCII words also end at line breaks, and where a few words in a
+    row switch from Bijoy to Banglish or the other way around. Words with
+    nothing to tell (e.g. numbers) are part of the run before them (or
+    after them, at the start of the text).
+
+    Parameters:
+    -----------
+
+    text: str
+        The text.
+
+    Returns:
+    --------
+
+    list[Run]
+        The runs, covering the text from start to end: each one ends where
+        the next one starts, along with the whitespace before it. A single
+        run with no encoding if the text has nothing to tell.
+    """
+
+    if not text:
+        return []
+
+    categories = text.translate(_categories())
+    # The kind (Unicode or not) of every run of words, and its stretches of
+    # words leaning the same way (Bijoy, Banglish or neither, as 1, -1 or
+    # 0): their start, lean, Bijoy and vowel counts and number of words.
+    groups: list[tuple[str, list[list[int]]]] = []
+    last = 0
+    for match in _WORD.finditer(text):
+        start, end = match.span()
+        unicode, bijoy, vowels, letters = _counts(categories, start, end)
+        kind = None
+        if unicode and unicode >= bijoy + vowels + letters:
+            kind = UNICODE
+        elif bijoy or vowels or letters:
+            kind = "ascii"
+
+        if kind is not None:
+            if (
+                not groups
+                or groups[-1][0] != kind
+                or (kind != UNICODE and text.find("\n", last, start) >= 0)
+            ):
+                groups.append((kind, [[start, 0, 0, 0, 0]]))
+            if kind != UNICODE:
+                stretch = groups[-1][1][-1]
+                lean = (bijoy > vowels) - (bijoy < vowels)
+                if lean and stretch[1] and lean != stretch[1]:
+                    stretch = [start, lean, 0, 0, 0]
+                    groups[-1][1].append(stretch)
+                elif not stretch[1]:
+                    stretch[1] = lean
+                stretch[2] += bijoy
+                stretch[3] += vowels
+                stretch[4] += 1
+        last = end
+
+    if not groups:
+        return [Run(0, len(text), None)]
+
+    # The start and encoding of every run.
+    starts: list[tuple[int, str]] = []
+    for kind, stretches in groups:
+        if kind == UNICODE:
+            starts.append((stretches[0][0], UNICODE))
+        else:
+            starts.extend(
+                (start, _ascii(bijoy, vowels))
+                for start, bijoy, vowels in _switches(stretches)
+            )
+
+    output: list[Run] = []
+    ends = [start for start, _ in starts[1:]] + [len(text)]
+    for (start, encoding), end in zip(starts, ends):
+        if not output:
+            start = 0
+        elif output[-1].encoding == encoding:
+            start = output.pop().start
+        output.append(Run(start, end, encoding))
+    return output
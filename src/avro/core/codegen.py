@@ -0,0 +1,321 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Generates a matcher module specialized for the phonetic dictionary.
+
+The interpreted matcher (processor.first_match() / apply_rules()) walks the
+compiled pattern records for every character. Since the dictionary is
+static, all of that can be unrolled ahead of time instead: the generated
+module dispatches on the character at the cursor to a function which tries
+the candidate patterns as straight-line startswith() checks, with the rule
+conditions inlined as plain expressions.
+
+The generated module (core/matcher.py) is checked in. Regenerate it after
+changing the dictionary with:
+
+    $ python -m avro.core.codegen
+"""
+
+# Imports.
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+from . import tables
+
+if TYPE_CHECKING:
+    from ..resources.dictionary import AvroDict
+
+# The path of the generated module.
+MATCHER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "matcher.py"
+)
+_PHONETIC_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "resources",
+    "phonetic.py",
+)
+
+
+# Functions.
+def dictionary_digest() -> str | None:
+    """Returns the hash of the phonetic dictionary source, if available."""
+
+    try:
+        with open(_PHONETIC_PATH, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _condition(
+    match: tables.RuleMatch, fallbacks: list[tables.RuleMatch]
+) -> str:
+    # Inlines processor.check_match() for a single rule condition, with the
+    # text in "t", the cursor in "c", the end cursor in "e" and the length
+    # of the text in "n".
+    kind, scope, negative, value = match
+
+    if kind is None:
+        return "False"
+
+    if kind not in ("prefix", "suffix"):
+        # Never the case in the shipped dictionary; defer to the
+        # interpreted check rather than inlining the odd semantics.
+        fallbacks.append(match)
+        return f"_check(_MATCHES[{len(fallbacks) - 1}], t, c, e)"
+
+    prefix = kind == "prefix"
+
+    if scope == "punctuation":
+        expression = (
+            "(c == 0 or t[c - 1].lower() not in _LETTERS)"
+            if prefix
+            else "(e >= n or t[e].lower() not in _LETTERS)"
+        )
+    elif scope in ("vowel", "consonant"):
+        letters = "_VOWELS" if scope == "vowel" else "_CONSONANTS"
+        expression = (
+            f"(c > 0 and t[c - 1].lower() in {letters})"
+            if prefix
+            else f"(e < n and t[e].lower() in {letters})"
+        )
+    elif scope == "exact":
+        if not isinstance(value, str):
+            return "False"
+        length = len(value)
+        # Mirrors validate.is_exact(), including its strict end bound.
+        expression = (
+            f"(c >= {length} and t[c - {length} : c] == {value!r})"
+            if prefix
+            else f"(e + {length} < n and t[e : e + {length}] == {value!r})"
+        )
+    else:
+        return "True"
+
+    return f"not {expression}" if negative else expression
+
+
+def generate(phonetic: AvroDict, digest: str | None = None) -> str:
+    """Generates the source of the specialized matcher module.
+
+    Parameters:
+    -----------
+
+    phonetic: AvroDict
+        The phonetic dictionary.
+
+    digest: str | None = None
+        The hash of the dictionary source, recorded in the module.
+
+    Returns:
+    --------
+
+    str
+        The source of the module.
+    """
+
+    compiled = tables.PhoneticTables(tables.build_phonetic(phonetic))
+    sets = compiled.sets
+    matches: list[tables.RuleMatch] = []
+    out: list[str] = []
+    emit = out.append
+
+    def startswith(text: str, char: str | None) -> str | None:
+        # The condition for text matching at the cursor, or None if it
+        # always does (the dispatch already checked the first character).
+        if not text or (char is not None and text == char):
+            return None
+        return f"t.startswith({text!r}, c)"
+
+    def parse_functions(name: str, char: str | None) -> None:
+        emit(f"def _parse_{name}(t: str, c: int, n: int) -> tuple[str, int]:")
+        emit(f"    # Candidates for {char!r}." if char else "    # Fallback.")
+
+        for pattern in compiled.candidates(char or "\0", False, False):
+            check = startswith(pattern.find, char)  # type: ignore[arg-type]
+            result = (
+                f"return _rules_{name}(t, c, n)"
+                if pattern.replace is None
+                else f"return {pattern.replace!r}, c + {len(pattern.find)}"  # type: ignore[arg-type]
+            )
+            if check is None:
+                emit(f"    {result}")
+                break
+            emit(f"    if {check}:")
+            emit(f"        {result}")
+        else:
+            emit(f"    return _rules_{name}(t, c, n)")
+
+        emit("")
+        emit("")
+        emit(f"def _rules_{name}(t: str, c: int, n: int) -> tuple[str, int]:")
+
+        for pattern in compiled.candidates(char or "\0", True, False):
+            check = startswith(pattern.find, char)  # type: ignore[arg-type]
+            indent = "    " if check is None else "        "
+            if check is not None:
+                emit(f"    if {check}:")
+            emit(f"{indent}e = c + {len(pattern.find)}")  # type: ignore[arg-type]
+            fallback = pattern.replace or ""
+
+            for rule in pattern.rules or ():
+                if not rule.matches:
+                    continue
+                conditions = [
+                    _condition(match, matches) for match in rule.matches
+                ]
+                emit(f"{indent}if {' and '.join(conditions)}:")
+                emit(f"{indent}    return {rule.replace or fallback!r}, e")
+
+            emit(f"{indent}return {fallback!r}, e")
+            if check is None:
+                break
+        else:
+            emit("    return t[c], c + 1")
+
+        emit("")
+        emit("")
+
+    def reverse_function(name: str, char: str | None) -> None:
+        emit(
+            f"def _reverse_{name}(t: str, c: int)"
+            " -> tuple[str | None, str | None] | None:"
+        )
+        emit(f"    # Candidates for {char!r}." if char else "    # Fallback.")
+
+        for pattern in compiled.candidates(char or "\0", False, True):
+            check = startswith(pattern.replace, char)  # type: ignore[arg-type]
+            result = f"return {pattern.reverse!r}, {pattern.find!r}"
+            if check is None:
+                emit(f"    {result}")
+                break
+            emit(f"    if {check}:")
+            emit(f"        {result}")
+        else:
+            emit("    return None")
+
+        emit("")
+        emit("")
+
+    parse_chars = sorted(
+        set(compiled.index[False, False][0])
+        | set(compiled.index[True, False][0])
+    )
+    reverse_chars = sorted(compiled.index[False, True][0])
+
+    for i, char in enumerate(parse_chars):
+        parse_functions(str(i), char)
+    parse_functions("default", None)
+
+    for i, char in enumerate(reverse_chars):
+        reverse_function(str(i), char)
+    reverse_function("default", None)
+
+    header = [
+        "# SPDX-License-Identifier: MIT OR Apache-2.0",
+        "",
+        '"""A matcher specialized for the phonetic dictionary.',
+        "",
+        "Generated by `python -m avro.core.codegen`, do not edit by hand.",
+        '"""',
+        "",
+        "# ruff: noqa",
+        "",
+        "# Imports.",
+        "from .processor import check_match as _check, reverse_with_rules",
+        "from .tables import RuleMatch",
+        "",
+        "# The hash of the dictionary source this was generated from.",
+        f"DICTIONARY_DIGEST = {digest!r}",
+        "",
+        f"_VOWELS = frozenset({''.join(sorted(sets['vowel']))!r})",
+        f"_CONSONANTS = frozenset({''.join(sorted(sets['consonant']))!r})",
+        "_LETTERS = _VOWELS | _CONSONANTS",
+        "_MATCHES = (",
+        *(f"    RuleMatch{tuple(match)!r}," for match in matches),
+        ")",
+        "",
+        "",
+        "# Functions.",
+        "def parse(text: str) -> str:",
+        '    """Parses case-fixed text, like main._parse_output_generator()."""',
+        "",
+        "    output = []",
+        "    append = output.append",
+        "    cur_end = 0",
+        "    n = len(text)",
+        "",
+        "    for cur, char in enumerate(text):",
+        "        if ord(char) >= 128:",
+        "            cur_end = cur + 1",
+        "            append(char)",
+        "        elif cur >= cur_end:",
+        "            replaced, cur_end = _PARSE.get(char, _parse_default)(",
+        "                text, cur, n",
+        "            )",
+        "            append(replaced)",
+        "",
+        '    return "".join(output)',
+        "",
+        "",
+        "def reverse(text: str) -> str:",
+        '    """Reverses text, like main._reverse_output_generator()."""',
+        "",
+        "    output = []",
+        "    append = output.append",
+        "",
+        "    for cur, char in enumerate(text):",
+        '        char.encode("utf-8")',
+        "        found = _REVERSE.get(char, _reverse_default)(text, cur)",
+        "",
+        "        if found is None:",
+        "            append(char)",
+        "            continue",
+        "",
+        "        reversed = reverse_with_rules(cur, text, found[0])",
+        "        if reversed is not None:",
+        "            append(reversed)",
+        "        elif found[1] is not None:",
+        "            append(found[1])",
+        "        else:",
+        "            append(char)",
+        "",
+        '    return "".join(output)',
+        "",
+        "",
+    ]
+
+    footer = [
+        "_PARSE = {",
+        *(f"    {char!r}: _parse_{i}," for i, char in enumerate(parse_chars)),
+        "}",
+        "",
+        "_REVERSE = {",
+        *(
+            f"    {char!r}: _reverse_{i},"
+            for i, char in enumerate(reverse_chars)
+        ),
+        "}",
+        "",
+    ]
+
+    return "\n".join(header + out + footer)
+
+
+def main() -> None:
+    """Command-line entry point for regenerating core/matcher.py."""
+
+    from ..resources.phonetic import PHONETIC
+
+    source = generate(PHONETIC, dictionary_digest())
+
+    with open(MATCHER_PATH, "w", encoding="utf-8") as file:
+        file.write(source)
+
+    print(f"Wrote {MATCHER_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Columns of texts, held as one buffer plus an array of offsets.
+
+A column holds its texts (rows) UTF-8 encoded back to back in a single
+buffer, along with the offsets they start at: row i spans
+buffer[offsets[i]:offsets[i + 1]], as in the string arrays of Apache Arrow.
+Converting a column rather than a list keeps millions of small objects from
+being built on either side: every row is only decoded while it's converted,
+its conversion is encoded straight into the output buffer, and the workers
+of the process and interpreter backends are shipped slices of the column
+rather than lists of strings.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import os
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import NamedTuple
+
+# The type code of the offsets arrays built here (64-bit, as in Arrow's
+# large string arrays).
+TYPECODE = "q"
+
+Buffer = bytes | bytearray | memoryview
+
+
+# Classes.
+class Column(NamedTuple):
+    """A column of texts (see the module docstring).
+
+    Parameters:
+    -----------
+
+    buffer: bytes | bytearray | memoryview
+        The UTF-8 encoded rows, back to back.
+
+    offsets: Sequence[int]
+        Where every row starts in the buffer, followed by where the last one
+        ends; an array("q") usually.
+    """
+
+    buffer: Buffer
+    offsets: Sequence[int]
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> Column:
+        """Builds a column of texts."""
+
+        buffer = bytearray()
+        offsets = array(TYPECODE, [0])
+        for text in texts:
+            buffer += text.encode("utf-8")
+            offsets.append(len(buffer))
+        return cls(buffer, offsets)
+
+    @property
+    def rows(self) -> int:
+        """The number of rows."""
+
+        return max(len(self.offsets) - 1, 0)
+
+    def texts(self) -> Iterator[str]:
+        """Decodes the rows, one at a time."""
+
+        view, base = _view(self)
+        start = self.offsets[0] if self.offsets else 0
+        for end in islice(self.offsets, 1, None):
+            yield str(view[start - base : end - base], "utf-8")
+            start = end
+
+
+# Functions.
+def _view(column: Column) -> tuple[memoryview, int]:
+    # The bytes of the rows, and the offset they start at.
+    view = memoryview(column.buffer)
+    if view.format != "B":
+        view = view.cast("B")
+    if not column.offsets:
+        return view[:0], 0
+
+    start, end = column.offsets[0], column.offsets[-1]
+    if not 0 <= start <= end <= len(view):
+        raise ValueError(
+            f"Offsets from {start} to {end} are out of the buffer's bounds "
+            f"(0 to {len(view)})"
+        )
+    return view[start:end], start
+
+
+def split(column: Column, max_workers: int | None = None) -> list[Column]:
+    """Splits a column into a few columns of consecutive rows per worker.
+
+    The columns share the buffer of the original one, and index it the same
+    way.
+
+    Parameters:
+    -----------
+
+    column: Column
+        The column to split.
+
+    max_workers: int | None = None
+        The number of workers. Defaults to the CPU count if None.
+
+    Returns:
+    --------
+
+    list[Column]
+        The columns, in order.
+    """
+
+    workers = max_workers or os.cpu_count() or 1
+    size = max(1, -(-column.rows // (workers * 4)))
+    return [
+        Column(column.buffer, column.offsets[i : i + size + 1])
+        for i in range(0, column.rows, size)
+    ]
+
+
+def compact(column: Column) -> Column:
+    """Copies the rows of a column out of the buffer it shares with others
+    (e.g. to be shipped to another process)."""
+
+    view, base = _view(column)
+    offsets = array(TYPECODE, column.offsets)
+    if base:
+        for i in range(len(offsets)):
+            offsets[i] -= base
+    return Column(view.tobytes(), offsets)
+
+
+def convert(func: Callable[..., str], args: tuple, column: Column) -> Column:
+    """Converts every row of a column.
+
+    This is kept at module level so that it can be pickled and shipped to
+    process / interpreter pools.
+
+    Parameters:
+    -----------
+
+    func: Callable[..., str]
+        The function converting a row.
+
+    args: tuple
+        Extra positional arguments passed after each row.
+
+    column: Column
+        The column to convert.
+
+    Returns:
+    --------
+
+    Column
+        The conversions, in the same order as the rows (with offsets
+        starting at 0).
+    """
+
+    view, base = _view(column)
+    buffer = bytearray()
+    offsets = array(TYPECODE, [0])
+
+    start = base
+    for end in islice(column.offsets, 1, None):
+        if end < start:
+            raise ValueError(f"Offsets decrease from {start} to {end}")
+        text = str(view[start - base : end - base], "utf-8")
+        buffer += func(text, *args).encode("utf-8")
+        offsets.append(len(buffer))
+        start = end
+
+    return Column(buffer, offsets)
+
+
+def join(columns: Iterable[Column]) -> Column:
+    """Joins columns (as returned by convert()) back to back.
+
+    Parameters:
+    -----------
+
+    columns: Iterable[Column]
+        The columns, in order.
+
+    Returns:
+    --------
+
+    Column
+        The joined column.
+    """
+
+    buffer = bytearray()
+    offsets = array(TYPECODE, [0])
+    for column in columns:
+        base = len(buffer) - column.offsets[0]
+        buffer += memoryview(column.buffer)[
+            column.offsets[0] : column.offsets[-1]
+        ]
+        offsets.extend(offset + base for offset in column.offsets[1:])
+    return Column(buffer, offsets)
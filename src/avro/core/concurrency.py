@@ -0,0 +1,347 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Imports.
+# asyncio is only imported once the async machinery is actually used.
+from __future__ import annotations
+
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+
+# Classes.
+class Coalescer:
+    """Groups concurrent single-item async calls into batch jobs.
+
+    Items submitted within `max_delay` seconds of each other (or until
+    `max_batch_size` items are pending) are dispatched to `func` as a
+    single tuple on the given executor. The results are then fanned back
+    out to each awaiting caller in submission order.
+
+    A coalescer is bound to the event loop it is first used on.
+
+    Parameters:
+    -----------
+
+    func: Callable[[tuple[str, ...]], Sequence[str]]
+        The batch function. Must be picklable when used with a process pool.
+
+    max_batch_size: int = 64
+        The maximum number of items dispatched in a single batch.
+
+    max_delay: float = 0.002
+        The maximum time (in seconds) an item waits for its batch to fill.
+
+    executor: Executor | None = None
+        The executor to run batches on. Uses the loop's default if None.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[tuple[str, ...]], Sequence[str]],
+        *,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+
+        self.func = func
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+
+        # Number of batches and items dispatched so far.
+        self.batches = 0
+        self.items = 0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[tuple[str, asyncio.Future[str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def submit(self, text: str) -> str:
+        """Submits a single item and waits for its batched result.
+
+        Parameters:
+        -----------
+
+        text: str
+            The item to process.
+
+        Returns:
+        --------
+
+        str
+            The result for the given item.
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("Coalescer is bound to a different event loop")
+
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Dispatches all pending items as a single batch right away."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending or self._loop is None:
+            return
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.items += len(batch)
+
+        job = self._loop.run_in_executor(
+            self.executor, self.func, tuple(text for text, _ in batch)
+        )
+        job.add_done_callback(lambda done: _fan_out(done, batch))
+
+
+def _fan_out(
+    done: asyncio.Future[Sequence[str]],
+    batch: list[tuple[str, asyncio.Future[str]]],
+) -> None:
+    """Resolves the waiters of a batch with the results of its job."""
+
+    if done.cancelled():
+        for _, future in batch:
+            future.cancel()
+        return
+
+    exc = done.exception()
+    for index, (_, future) in enumerate(batch):
+        if future.done():
+            continue
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(done.result()[index])
+
+
+class _Call:
+    """A synchronous call in flight, waited on by its followers."""
+
+    __slots__ = ("error", "event", "result")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: str | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Deduplicates identical calls that are in flight at the same time.
+
+    The first caller for a key runs the computation while every concurrent
+    caller with the same key waits for (and shares) its result, instead of
+    scheduling its own job. Keys are forgotten as soon as the computation
+    finishes, so this only ever complements result caches.
+
+    Attributes:
+    -----------
+
+    deduplicated: int
+        The number of calls that were served by another in-flight call.
+    """
+
+    def __init__(self) -> None:
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future[str]
+        ] = {}
+
+    def do(self, key: Hashable, func: Callable[..., str], *args: Any) -> str:
+        """Runs func(*args) unless an identical call is already in flight.
+
+        Parameters:
+        -----------
+
+        key: Hashable
+            The identity of the call.
+
+        func: Callable[..., str]
+            The function to run.
+
+        *args: Any
+            The arguments to pass to the function.
+
+        Returns:
+        --------
+
+        str
+            The result of the (possibly shared) call.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.deduplicated += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def do_async(
+        self,
+        key: Hashable,
+        func: Callable[..., str],
+        *args: Any,
+        executor: Executor | None = None,
+    ) -> Awaitable[str]:
+        """Schedules func(*args) on an executor unless an identical call is
+        already in flight on the running event loop.
+
+        Parameters:
+        -----------
+
+        key: Hashable
+            The identity of the call.
+
+        func: Callable[..., str]
+            The function to run.
+
+        *args: Any
+            The arguments to pass to the function.
+
+        executor: Executor | None = None
+            The executor to run on. Uses the loop's default if None.
+
+        Returns:
+        --------
+
+        Awaitable[str]
+            An awaitable for the result of the (possibly shared) call.
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+
+        with self._lock:
+            future = self._tasks.get(task_key)
+            if future is not None:
+                self.deduplicated += 1
+            else:
+                future = self._tasks[task_key] = loop.run_in_executor(
+                    executor, func, *args
+                )
+                future.add_done_callback(lambda _: self._forget_task(task_key))
+
+        # Shield the shared job so one cancelled caller can't cancel it for
+        # everyone else waiting on it.
+        return asyncio.shield(future)
+
+    def _forget_task(
+        self, task_key: tuple[asyncio.AbstractEventLoop, Hashable]
+    ) -> None:
+        """Removes a finished async call from the in-flight table."""
+
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+
+class BatchDeduplicator:
+    """Collapses duplicate items of a batch before it is dispatched.
+
+    Each unique item is computed once and its result scattered back to
+    every position it appeared at, so output order is preserved.
+
+    Attributes:
+    -----------
+
+    items: int
+        The total number of items seen across all batches.
+
+    unique: int
+        The number of unique items actually dispatched.
+    """
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.unique = 0
+        self._lock = threading.Lock()
+
+    @property
+    def unique_ratio(self) -> float:
+        """The fraction of batch items that were unique (1.0 if none)."""
+
+        return self.unique / self.items if self.items else 1.0
+
+    def collapse(
+        self, params: Sequence[str]
+    ) -> tuple[tuple[str, ...], list[int]]:
+        """Collapses a batch into its unique items.
+
+        Parameters:
+        -----------
+
+        params: Sequence[str]
+            The items of the batch.
+
+        Returns:
+        --------
+
+        tuple[tuple[str, ...], list[int]]
+            A tuple of two elements:
+            1. The unique items, in order of first appearance.
+            2. For each original item, the index of its unique item.
+        """
+
+        index: dict[str, int] = {}
+        positions = [index.setdefault(text, len(index)) for text in params]
+
+        with self._lock:
+            self.items += len(positions)
+            self.unique += len(index)
+
+        return tuple(index), positions
+
+    @staticmethod
+    def scatter(results: Sequence[str], positions: list[int]) -> list[str]:
+        """Scatters the results of unique items back to every position."""
+
+        return [results[i] for i in positions]
@@ -2,27 +2,98 @@
 
 
 # Imports.
-from ..resources import DICT
-
-# Shortcuts to vowels, constants, case-sensitives and numbers.
-AVRO_VOWELS = set(DICT["avro"]["vowel"])
-AVRO_CONSONANTS = set(DICT["avro"]["consonant"])
-AVRO_CASESENSITIVES = set(DICT["avro"]["casesensitive"])
-AVRO_NUMBERS = set(DICT["avro"]["number"])
-
-# Shortcuts to Bengali stuff.
-AVRO_SHORBORNO = set(DICT["avro"]["shorborno"])
-AVRO_SHONGKHA = set(DICT["avro"]["shongkha"])
-AVRO_KAR = set(DICT["avro"]["kar"])
-AVRO_IGNORE = set(DICT["avro"]["ignore"])
-AVRO_EXCEPTIONS = DICT["avro"]["exceptions"]
-
-# Shortcuts necessary for conversion to Bijoy Keyboard format (ASCII).
-BIJOY_MAP = DICT["bijoy"]["mappings"]
-BIJOY_PREKAR = set(DICT["bijoy"]["prekar"])
-BIJOY_POSTKAR = set(DICT["bijoy"]["postkar"])
-BIJOY_BANJONBORNO = set(DICT["bijoy"]["banjonborno"])
-BIJOY_EXCEPTIONS = DICT["bijoy"]["exceptions"]
-
-# Shortcuts for conversion to Unicode format.
-BIJOY_MAP_REVERSE = {v: k for k, v in BIJOY_MAP.items()}
+import threading
+from typing import Any
+
+from . import tables
+
+# The character sets below are frozen so that they can be read concurrently
+# from any number of threads (including on free-threaded builds) without
+# any locking.
+#
+# They are loaded lazily, one group at a time, on first access (PEP 562), from
+# the compiled tables (see tables.py), so that e.g. Bijoy conversions never
+# load the phonetic half of the dictionary.
+_LOCK = threading.Lock()
+
+
+def _avro_shortcuts() -> dict[str, Any]:
+    sets = tables.phonetic().sets
+
+    return {
+        # Shortcuts to vowels, constants, case-sensitives and numbers.
+        "AVRO_VOWELS": sets["vowel"],
+        "AVRO_CONSONANTS": sets["consonant"],
+        "AVRO_CASESENSITIVES": sets["casesensitive"],
+        "AVRO_NUMBERS": sets["number"],
+        # Shortcuts to Bengali stuff.
+        "AVRO_SHORBORNO": sets["shorborno"],
+        "AVRO_SHONGKHA": sets["shongkha"],
+        "AVRO_KAR": sets["kar"],
+        "AVRO_IGNORE": sets["ignore"],
+        "AVRO_EXCEPTIONS": tables.phonetic().exceptions,
+    }
+
+
+def _bijoy_shortcuts() -> dict[str, Any]:
+    bijoy = tables.bijoy()
+
+    return {
+        # Shortcuts necessary for conversion to Bijoy Keyboard format (ASCII).
+        "BIJOY_MAP": bijoy.mappings,
+        "BIJOY_PREKAR": bijoy.prekar,
+        "BIJOY_POSTKAR": bijoy.postkar,
+        "BIJOY_BANJONBORNO": bijoy.banjonborno,
+        "BIJOY_EXCEPTIONS": bijoy.exceptions,
+        # Shortcuts for conversion to Unicode format.
+        "BIJOY_MAP_REVERSE": bijoy.reverse,
+    }
+
+
+_GROUPS = {
+    name: loader
+    for loader, names in (
+        (
+            _avro_shortcuts,
+            (
+                "AVRO_VOWELS",
+                "AVRO_CONSONANTS",
+                "AVRO_CASESENSITIVES",
+                "AVRO_NUMBERS",
+                "AVRO_SHORBORNO",
+                "AVRO_SHONGKHA",
+                "AVRO_KAR",
+                "AVRO_IGNORE",
+                "AVRO_EXCEPTIONS",
+            ),
+        ),
+        (
+            _bijoy_shortcuts,
+            (
+                "BIJOY_MAP",
+                "BIJOY_PREKAR",
+                "BIJOY_POSTKAR",
+                "BIJOY_BANJONBORNO",
+                "BIJOY_EXCEPTIONS",
+                "BIJOY_MAP_REVERSE",
+            ),
+        ),
+    )
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    loader = _GROUPS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _LOCK:
+        if name not in globals():
+            globals().update(loader())
+
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_GROUPS))
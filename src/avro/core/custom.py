@@ -0,0 +1,402 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Custom exception words, added at runtime.
+
+The built-in exception words (see PhoneticTables.remap()) are substituted
+one after the other, which is fine for a few hundred of them but scales
+with their number. Custom words are matched as whole words instead: the
+text is split into words, and every word is looked up in a dictionary of
+the words (and phrases) starting with it, so that the cost of a lookup is
+independent of how many custom words there are.
+
+The words are published as immutable snapshots. Updates build a new
+snapshot off to the side and publish it by swapping a single reference, so
+that readers never lock, calls in flight finish on the snapshot they
+started with, and no reader ever sees half of an update. To keep single
+word updates cheap, a snapshot shares the (large) dictionaries of the
+previous one and only copies a small delta on top of them, which is merged
+back once it grows past the square root of their size.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+from collections.abc import Iterable, Mapping
+
+# A word: a run of letters, digits and Bengali characters (including the
+# vowel signs and joiners, which aren't "word" characters to the re module).
+_WORD = re.compile(r"[\w\u0980-\u09ff\u200c\u200d]+")
+
+# Whitespace allowed between the words of a phrase.
+_SPACE = re.compile(r"\s+")
+
+# The smallest delta merged into the shared dictionaries.
+_MIN_DELTA = 64
+
+# An entry: the original word (or phrase) and its replacement.
+Entry = tuple[str, str]
+Key = tuple[str, ...]
+
+
+# Functions.
+def _key(text: str) -> Key | None:
+    # The lookup key of a word or phrase: its lowercase words. None if there
+    # is more to it than words and the whitespace between them (e.g. "C++"
+    # or "e-mail"), as text is only ever matched a whole word at a time.
+    lowered = text.lower()
+    key = tuple(_WORD.findall(lowered))
+    return key if " ".join(key) == " ".join(lowered.split()) else None
+
+
+def _lengths(entries: Mapping[Key, Entry | None]) -> dict[str, int]:
+    # First word -> the longest phrase starting with it (in words).
+    lengths: dict[str, int] = {}
+    for key, entry in entries.items():
+        if entry is not None and lengths.get(key[0], 0) < len(key):
+            lengths[key[0]] = len(key)
+    return lengths
+
+
+# Classes.
+class _Table:
+    """The words of one direction: shared dictionaries plus a delta.
+
+    Never modified once published. The delta maps keys to their new entry,
+    or to None for removed words.
+    """
+
+    __slots__ = ("base", "base_lengths", "delta", "delta_lengths", "size")
+
+    def __init__(
+        self,
+        base: dict[Key, Entry],
+        delta: dict[Key, Entry | None],
+        base_lengths: dict[str, int],
+        delta_lengths: dict[str, int],
+        size: int,
+    ) -> None:
+        self.base = base
+        self.delta = delta
+        self.base_lengths = base_lengths
+        # Only ever grows until merged, as it merely bounds the lookups.
+        self.delta_lengths = delta_lengths
+        self.size = size
+
+    def get(self, key: Key) -> Entry | None:
+        if key in self.delta:
+            return self.delta[key]
+        return self.base.get(key)
+
+    def longest(self, word: str) -> int:
+        return max(
+            self.base_lengths.get(word, 0), self.delta_lengths.get(word, 0)
+        )
+
+    def entries(self) -> list[Entry]:
+        merged = {**self.base, **self.delta}
+        return [entry for entry in merged.values() if entry is not None]
+
+    def updated(self, changes: dict[Key, Entry | None]) -> _Table:
+        size = self.size
+        for key, entry in changes.items():
+            size += (entry is not None) - (self.get(key) is not None)
+
+        delta = {**self.delta, **changes}
+
+        if len(delta) > max(_MIN_DELTA, math.isqrt(len(self.base))):
+            base = {
+                key: entry
+                for key, entry in {**self.base, **delta}.items()
+                if entry is not None
+            }
+            return _Table(base, {}, _lengths(base), {}, size)
+
+        delta_lengths = dict(self.delta_lengths)
+        for word, length in _lengths(changes).items():
+            if self.longest(word) < length:
+                delta_lengths[word] = length
+
+        return _Table(self.base, delta, self.base_lengths, delta_lengths, size)
+
+    def split(self, text: str) -> list[tuple[str, bool]]:
+        words = list(_WORD.finditer(text))
+        lowered = [match.group().lower() for match in words]
+        pieces: list[tuple[str, bool]] = []
+        start = i = 0
+
+        while i < len(words):
+            found = None
+
+            for n in range(
+                min(self.longest(lowered[i]), len(words) - i), 0, -1
+            ):
+                entry = self.get(tuple(lowered[i : i + n]))
+                if entry is not None and all(
+                    _SPACE.fullmatch(
+                        text, words[j].end(), words[j + 1].start()
+                    )
+                    for j in range(i, i + n - 1)
+                ):
+                    found = n, entry[1]
+                    break
+
+            if found is None:
+                i += 1
+                continue
+
+            n, replacement = found
+            if words[i].start() > start:
+                pieces.append((text[start : words[i].start()], False))
+            pieces.append((replacement, True))
+            start = words[i + n - 1].end()
+            i += n
+
+        if start < len(text):
+            pieces.append((text[start:], False))
+
+        return pieces
+
+
+_EMPTY = _Table({}, {}, {}, {}, 0)
+
+
+class Snapshot:
+    """An immutable version of a set of custom words."""
+
+    __slots__ = ("_parse", "_reverse", "version")
+
+    def __init__(self, version: int, parse: _Table, reverse: _Table) -> None:
+        self.version = version
+        self._parse = parse
+        self._reverse = reverse
+
+    def __len__(self) -> int:
+        return self._parse.size
+
+    def __bool__(self) -> bool:
+        return self._parse.size > 0
+
+    def items(self) -> list[tuple[str, str]]:
+        """Returns the words and their Bengali text."""
+
+        return self._parse.entries()
+
+    def has_phrases(self, reversed: bool = False) -> bool:
+        """Returns whether any of the words (or their Bengali text, if
+        reversed) is a phrase."""
+
+        table = self._reverse if reversed else self._parse
+        return any(
+            length > 1
+            for lengths in (table.base_lengths, table.delta_lengths)
+            for length in lengths.values()
+        )
+
+    def split(
+        self, text: str, reversed: bool = False
+    ) -> list[tuple[str, bool]]:
+        """Splits text around the custom words it contains.
+
+        Parameters:
+        -----------
+
+        text: str
+            The text to split.
+
+        reversed: bool = False
+            Whether to look for the Bengali text of the words instead.
+
+        Returns:
+        --------
+
+        list[tuple[str, bool]]
+            The pieces of the text, in order, with whether they're the
+            replacement of a custom word (True) or text left to process.
+        """
+
+        return (self._reverse if reversed else self._parse).split(text)
+
+    def updated(
+        self,
+        add: Mapping[str, str] | None = None,
+        remove: Iterable[str] = (),
+    ) -> Snapshot:
+        """Returns the next version, with words added and removed.
+
+        Parameters:
+        -----------
+
+        add: Mapping[str, str] | None = None
+            Roman-script words (or phrases) and their Bengali text, added
+            or overriding the current ones. Words with anything but words
+            and whitespace in them raise ValueError (see _key()), and
+            Bengali text with anything else isn't reversed.
+
+        remove: Iterable[str] = ()
+            Roman-script words (or phrases) to remove, if present.
+
+        Returns:
+        --------
+
+        Snapshot
+            The new snapshot.
+        """
+
+        parse: dict[Key, Entry | None] = {}
+        reverse: dict[Key, Entry | None] = {}
+
+        def current(table: _Table, changes: dict, key: Key) -> Entry | None:
+            return changes[key] if key in changes else table.get(key)
+
+        def forget(key: Key) -> None:
+            # Drops the reverse entry of a word, unless another word took it.
+            previous = current(self._parse, parse, key)
+            if previous is None:
+                return
+            reverse_key = _key(previous[1])
+            if reverse_key is None:
+                return
+            entry = current(self._reverse, reverse, reverse_key)
+            if entry is not None and _key(entry[1]) == key:
+                reverse[reverse_key] = None
+
+        for word in remove:
+            key = _key(word)
+            if not key:
+                continue
+            forget(key)
+            parse[key] = None
+
+        for word, value in (add or {}).items():
+            key = _key(word)
+            if not key:
+                raise ValueError(f"Not a word: {word!r}")
+
+            forget(key)
+            parse[key] = (word, value)
+            reverse_key = _key(value)
+            if reverse_key:
+                reverse[reverse_key] = (value, word)
+
+        return Snapshot(
+            self.version + 1,
+            self._parse.updated(parse),
+            self._reverse.updated(reverse),
+        )
+
+
+class CustomWords:
+    """A set of custom exception words, updated by publishing snapshots.
+
+    Parameters:
+    -----------
+
+    words: Mapping[str, str] | None = None
+        Roman-script words (or phrases) and the Bengali text they're parsed
+        to. Bengali text is reversed to the Roman-script words.
+    """
+
+    def __init__(self, words: Mapping[str, str] | None = None) -> None:
+        # Serializes writers; readers only ever read self.snapshot.
+        self._lock = threading.Lock()
+        # Identifies these words (along with the version of the snapshot)
+        # in process / interpreter workers.
+        self.id = os.urandom(8).hex()
+        self.snapshot = Snapshot(0, _EMPTY, _EMPTY)
+        if words:
+            self.add(words)
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    def __bool__(self) -> bool:
+        return bool(self.snapshot)
+
+    @property
+    def version(self) -> int:
+        """The version of the current snapshot."""
+
+        return self.snapshot.version
+
+    def items(self) -> list[tuple[str, str]]:
+        """Returns the words and their Bengali text."""
+
+        return self.snapshot.items()
+
+    def split(
+        self, text: str, reversed: bool = False
+    ) -> list[tuple[str, bool]]:
+        """Splits text around custom words. See Snapshot.split()."""
+
+        return self.snapshot.split(text, reversed)
+
+    def add(self, words: Mapping[str, str]) -> int:
+        """Adds (or overrides) words.
+
+        Parameters:
+        -----------
+
+        words: Mapping[str, str]
+            Roman-script words (or phrases) and their Bengali text.
+
+        Returns:
+        --------
+
+        int
+            The number of custom words.
+        """
+
+        with self._lock:
+            self.snapshot = self.snapshot.updated(add=words)
+            return len(self.snapshot)
+
+    def remove(self, words: Iterable[str]) -> int:
+        """Removes words, ignoring the ones that aren't there.
+
+        Parameters:
+        -----------
+
+        words: Iterable[str]
+            Roman-script words (or phrases).
+
+        Returns:
+        --------
+
+        int
+            The number of custom words.
+        """
+
+        with self._lock:
+            self.snapshot = self.snapshot.updated(remove=words)
+            return len(self.snapshot)
+
+    def replace(self, words: Mapping[str, str]) -> int:
+        """Replaces all words at once.
+
+        The new snapshot is built without holding up readers or writers,
+        and then published in one step.
+
+        Parameters:
+        -----------
+
+        words: Mapping[str, str]
+            Roman-script words (or phrases) and their Bengali text.
+
+        Returns:
+        --------
+
+        int
+            The number of custom words.
+        """
+
+        fresh = Snapshot(0, _EMPTY, _EMPTY).updated(add=words)
+
+        with self._lock:
+            self.snapshot = Snapshot(
+                self.snapshot.version + 1, fresh._parse, fresh._reverse
+            )
+            return len(self.snapshot)
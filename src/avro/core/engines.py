@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Registry of the engines that the conversion functions run on.
+
+An engine bundles the steps that sit below the caches and the frequency
+table: the exception (remap) matcher, the phonetic parser and reverser for
+plain segments, and the Bijoy converters. Every engine must produce the
+same output as the others; they only differ in how fast they get there.
+
+Engines are registered by name with a factory, which is only called on
+first use (so that e.g. the generated matcher is never imported unless it
+is selected). The built-in engines are registered by avro.main:
+- "legacy", the reference implementation walking the dictionary as-is.
+- "interpreted" (default), walking the compiled dictionary tables.
+- "generated", running a matcher generated from the dictionary.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+# Classes.
+class Engine(NamedTuple):
+    """The implementations of the conversion steps of an engine."""
+
+    # Marks exception words: remap(text, reversed=...) -> (text, manual).
+    remap: Callable[..., tuple[str, bool]]
+    # Parses a case-fixed segment without exception words.
+    parse: Callable[[str], str]
+    # Reverses a segment without exception words.
+    reverse: Callable[[str], str]
+    # Converts Unicode text to Bijoy.
+    to_bijoy: Callable[[str], str]
+    # Converts Bijoy text to Unicode.
+    to_unicode: Callable[[str], str]
+
+
+# The registered factories, the engines built from them so far, and the
+# name of the engine used when none is given.
+_FACTORIES: dict[str, Callable[[], Engine]] = {}
+_ENGINES: dict[str, Engine] = {}
+_DEFAULT = "interpreted"
+_LOCK = threading.Lock()
+
+
+# Functions.
+def register(name: str, factory: Callable[[], Engine]) -> None:
+    """Registers (or replaces) an engine.
+
+    Parameters:
+    -----------
+
+    name: str
+        The name of the engine.
+
+    factory: Callable[[], Engine]
+        Builds the engine. Called once, on first use; may raise to signal
+        that the engine is unavailable.
+    """
+
+    with _LOCK:
+        _FACTORIES[name] = factory
+        _ENGINES.pop(name, None)
+
+
+def names() -> tuple[str, ...]:
+    """Returns the names of the registered engines."""
+
+    return tuple(_FACTORIES)
+
+
+def default() -> str:
+    """Returns the name of the engine used when none is given."""
+
+    return _DEFAULT
+
+
+def get(name: str | None = None) -> Engine:
+    """Returns an engine, building it if needed.
+
+    Parameters:
+    -----------
+
+    name: str | None = None
+        The name of the engine. Defaults to the selected engine.
+
+    Returns:
+    --------
+
+    Engine
+        The engine.
+    """
+
+    if name is None:
+        name = _DEFAULT
+
+    engine = _ENGINES.get(name)
+    if engine is None:
+        with _LOCK:
+            engine = _ENGINES.get(name)
+            if engine is None:
+                factory = _FACTORIES.get(name)
+                if factory is None:
+                    raise ValueError(
+                        f"Unknown engine {name!r}, expected one of "
+                        f"{tuple(_FACTORIES)}"
+                    )
+                engine = _ENGINES[name] = factory()
+
+    return engine
+
+
+def use(name: str) -> None:
+    """Selects the engine used when none is given.
+
+    Parameters:
+    -----------
+
+    name: str
+        The name of the engine.
+    """
+    global _DEFAULT
+
+    get(name)
+    _DEFAULT = name
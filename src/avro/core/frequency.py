@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Precomputed transliterations of frequent words.
+
+Real-world traffic is dominated by a small set of very common words. The
+parse() and reverse() backends resolve those with a single lookup in a
+read-only table before falling back to their (bounded) caches and the
+matcher itself.
+
+The table shipped with the package (resources/frequent.py) can be extended
+at runtime with avro.load_wordlist(). Updates build a new table and publish
+it in one step, so that readers never lock and never see a partially
+updated table. Regenerate the shipped table after changing the dictionary
+with:
+
+    $ python -m avro.core.frequency [WORDLIST]
+"""
+
+# Imports.
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterable, Mapping
+
+# The path of the shipped table, relative to this module.
+_RESOURCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "resources",
+    "frequent.py",
+)
+
+
+# Classes.
+class FrequencyTable:
+    """An immutable pair of word -> transliteration lookups."""
+
+    __slots__ = ("parse", "reverse")
+
+    def __init__(self, parse: dict[str, str], reverse: dict[str, str]):
+        # Roman-script words -> Bengali (parse() with the default options).
+        self.parse = parse
+        # Bengali words -> Roman script (reverse() with the default options).
+        self.reverse = reverse
+
+    def __len__(self) -> int:
+        return len(self.parse) + len(self.reverse)
+
+
+# The published table, loaded on first use.
+_TABLE: FrequencyTable | None = None
+_LOCK = threading.Lock()
+
+
+# Functions.
+def _shipped() -> FrequencyTable:
+    from ..resources.frequent import FREQUENT_PARSE, FREQUENT_REVERSE
+
+    return FrequencyTable(FREQUENT_PARSE, FREQUENT_REVERSE)
+
+
+def table() -> FrequencyTable:
+    """Returns the current frequency table, loading it if needed."""
+    global _TABLE
+
+    current = _TABLE
+    if current is None:
+        with _LOCK:
+            if _TABLE is None:
+                _TABLE = _shipped()
+            current = _TABLE
+
+    return current
+
+
+def extend(parse: Mapping[str, str], reverse: Mapping[str, str]) -> int:
+    """Publishes a new table with the given entries added.
+
+    Parameters:
+    -----------
+
+    parse: Mapping[str, str]
+        Roman-script words and their parsed forms.
+
+    reverse: Mapping[str, str]
+        Bengali words and their reversed forms.
+
+    Returns:
+    --------
+
+    int
+        The number of entries in the new table.
+    """
+    global _TABLE
+
+    with _LOCK:
+        current = _TABLE or _shipped()
+        _TABLE = FrequencyTable(
+            {**current.parse, **parse}, {**current.reverse, **reverse}
+        )
+        return len(_TABLE)
+
+
+def reset() -> None:
+    """Drops all runtime additions, going back to the shipped table."""
+    global _TABLE
+
+    with _LOCK:
+        _TABLE = None
+
+
+def read_wordlist(
+    source: str | os.PathLike[str] | Iterable[str], limit: int | None = None
+) -> list[str]:
+    """Reads the words of a frequency list.
+
+    Only the first column of every line is used, so that lists in the
+    common "word count" format work as-is. Empty lines and lines starting
+    with "#" are skipped.
+
+    Parameters:
+    -----------
+
+    source: str | os.PathLike[str] | Iterable[str]
+        The path of a UTF-8 text file, or the lines / words themselves.
+
+    limit: int | None = None
+        Only read this many words (lists are expected to be sorted by
+        frequency, most frequent first).
+
+    Returns:
+    --------
+
+    list[str]
+        The unique words, in order.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+    else:
+        lines = list(source)
+
+    words: dict[str, None] = {}
+
+    for line in lines:
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        words[fields[0]] = None
+        if limit is not None and len(words) >= limit:
+            break
+
+    return list(words)
+
+
+def render(parse: Mapping[str, str], reverse: Mapping[str, str]) -> str:
+    """Renders the source of resources/frequent.py."""
+
+    def literal(text: str) -> str:
+        # JSON strings are valid Python literals, with quotes and backslashes
+        # escaped (and Bengali text kept as it is).
+        return json.dumps(text, ensure_ascii=False)
+
+    def entries(mapping: Mapping[str, str]) -> str:
+        return "".join(
+            f"    {literal(key)}: {literal(value)},\n"
+            for key, value in mapping.items()
+        )
+
+    return (
+        "# SPDX-License-Identifier: MIT OR Apache-2.0\n"
+        "\n"
+        "\n"
+        "# Precomputed transliterations of common Roman-script words (parse()\n"
+        "# with the default options), and of their Bengali forms (reverse()).\n"
+        "#\n"
+        "# Generated by `python -m avro.core.frequency`, do not edit by hand.\n"
+        "FREQUENT_PARSE: dict[str, str] = {\n"
+        f"{entries(parse)}"
+        "}\n"
+        "\n"
+        "FREQUENT_REVERSE: dict[str, str] = {\n"
+        f"{entries(reverse)}"
+        "}\n"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point for regenerating the shipped table."""
+
+    import argparse
+
+    from .. import main as avro
+
+    parser = argparse.ArgumentParser(
+        prog="python -m avro.core.frequency",
+        description="Regenerate the shipped table of frequent words.",
+    )
+    parser.add_argument(
+        "wordlist",
+        nargs="?",
+        help="Roman-script frequency list. Defaults to the current words.",
+    )
+    parser.add_argument("--limit", type=int, help="Maximum number of words.")
+    args = parser.parse_args(argv)
+
+    words = read_wordlist(
+        args.wordlist or list(_shipped().parse), limit=args.limit
+    )
+    parse, reverse = avro._transliterate_words(words)
+
+    with open(_RESOURCE, "w", encoding="utf-8") as file:
+        file.write(render(parse, reverse))
+
+    print(f"Wrote {len(parse)} + {len(reverse)} entries to {_RESOURCE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Differential fuzzer for the engines (see core/engines.py).
+
+Generates random Banglish, Bengali and Bijoy strings and checks that every
+registered engine gives the same result for them: the same output, or the
+same exception type. The strings are built from pieces of the dictionary
+itself, so that they exercise pattern and rule boundaries as well as the
+exception (remap) words, mixed with arbitrary characters. Some of the
+Bengali and Bijoy strings are long enough for the Bijoy conversions to be
+run in chunks (see core/parallel.py), which the legacy engine checks them
+against by converting the whole text at once. Run it with:
+
+    $ python -m avro.core.fuzz [--iterations N] [--seed SEED]
+"""
+
+# Imports.
+from __future__ import annotations
+
+import random
+import string
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from . import engines, tables
+
+# Characters mixed into the generated strings.
+_PUNCTUATION = " .,?!-;'`\"\n\t"
+_BENGALI = "".join(chr(c) for c in range(0x0980, 0x0A00)) + "।‌‍"
+
+
+# Classes.
+class Mismatch(NamedTuple):
+    """A string the engines disagree on."""
+
+    operation: str
+    text: str
+    results: dict[str, str]
+
+
+class _Pieces:
+    # Building blocks for the generated strings, from the dictionary.
+
+    def __init__(self) -> None:
+        phonetic = tables.phonetic()
+        bijoy = tables.bijoy()
+        sets = phonetic.sets
+
+        self.finds = sorted(
+            {p.find for p in phonetic.patterns if p.find}  # type: ignore[misc]
+        )
+        self.replaces = sorted(
+            {p.replace for p in phonetic.patterns if p.replace}  # type: ignore[misc]
+        )
+        self.rules = [p for p in phonetic.patterns if p.rules]
+        self.vowels = sorted(sets["vowel"])
+        self.consonants = sorted(sets["consonant"])
+        self.exceptions = sorted(phonetic.exceptions.items())
+        self.bijoy = sorted(bijoy.reverse)
+
+
+# Functions.
+def _rule_case(rng: random.Random, pieces: _Pieces) -> str:
+    # A rule pattern in a context satisfying (or just missing) one of its
+    # rules, e.g. "o" right after a punctuation mark or a consonant.
+    pattern = rng.choice(pieces.rules)
+    rule = rng.choice(pattern.rules)  # type: ignore[arg-type]
+    before = after = ""
+
+    for kind, scope, _, value in rule.matches:
+        if scope == "exact":
+            context = value or ""
+        elif scope == "vowel":
+            context = rng.choice(pieces.vowels)
+        elif scope == "consonant":
+            context = rng.choice(pieces.consonants)
+        else:
+            context = rng.choice(("", " ", rng.choice(_PUNCTUATION)))
+
+        if rng.random() < 0.2:
+            context = context[:-1]
+        if kind == "prefix":
+            before = context + before
+        else:
+            after += context
+
+    return before + pattern.find + after  # type: ignore[operator]
+
+
+def banglish(rng: random.Random, pieces: _Pieces) -> str:
+    """Returns a random Roman-script string."""
+
+    parts = []
+
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        if roll < 0.35:
+            part = rng.choice(pieces.finds)
+        elif roll < 0.6:
+            part = _rule_case(rng, pieces)
+        elif roll < 0.7:
+            part = rng.choice(pieces.exceptions)[1]
+        elif roll < 0.9:
+            part = rng.choice(_PUNCTUATION)
+        else:
+            part = "".join(rng.choices(string.printable, k=rng.randint(1, 4)))
+
+        if rng.random() < 0.2:
+            part = "".join(rng.choice((c.lower(), c.upper())) for c in part)
+        parts.append(part)
+
+    return "".join(parts)
+
+
+def bengali(rng: random.Random, pieces: _Pieces) -> str:
+    """Returns a random Bengali string."""
+
+    parts = []
+
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        if roll < 0.5:
+            part = rng.choice(pieces.replaces)
+        elif roll < 0.6:
+            part = rng.choice(pieces.exceptions)[0]
+        elif roll < 0.8:
+            part = rng.choice(_PUNCTUATION + "।")
+        else:
+            part = "".join(rng.choices(_BENGALI, k=rng.randint(1, 4)))
+        parts.append(part)
+
+    return "".join(parts)
+
+
+def bijoy(rng: random.Random, pieces: _Pieces) -> str:
+    """Returns a random Bijoy string."""
+
+    parts = []
+
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        if roll < 0.7:
+            part = rng.choice(pieces.bijoy)
+        elif roll < 0.85:
+            part = rng.choice(_PUNCTUATION)
+        else:
+            part = "".join(rng.choices(string.printable, k=rng.randint(1, 4)))
+        parts.append(part)
+
+    return "".join(parts)
+
+
+def _long(
+    generate: Callable[[random.Random, _Pieces], str],
+) -> Callable[[random.Random, _Pieces], str]:
+    # Some of the strings joined into a text of a few thousand characters.
+    def long(rng: random.Random, pieces: _Pieces) -> str:
+        if rng.random() < 0.02:
+            return " ".join(generate(rng, pieces) for _ in range(200))
+        return generate(rng, pieces)
+
+    return long
+
+
+def _outcome(func: Callable[..., str], text: str, **kwargs: object) -> str:
+    # The result of a call, or the type of the exception it raised: any
+    # exception is an outcome the engines have to agree on.
+    try:
+        return func(text, **kwargs)
+    except Exception as error:  # noqa: BLE001
+        return f"<{type(error).__name__}>"
+
+
+def _operations() -> dict[str, tuple[Callable[..., str], dict]]:
+    from .. import main
+
+    return {
+        "parse": (main.parse, {}),
+        "parse(remap_words=False)": (main.parse, {"remap_words": False}),
+        "reverse": (main.reverse, {}),
+        "reverse(remap_words=False)": (main.reverse, {"remap_words": False}),
+        "to_bijoy": (main.to_bijoy, {}),
+        "to_unicode": (main.to_unicode, {}),
+    }
+
+
+def check(
+    operation: str, text: str, names: Iterable[str] | None = None
+) -> Mismatch | None:
+    """Runs an operation on every engine and compares the results.
+
+    Parameters:
+    -----------
+
+    operation: str
+        The name of the operation, e.g. "parse" or "to_unicode".
+
+    text: str
+        The input text.
+
+    names: Iterable[str] | None = None
+        The engines to compare. Defaults to all registered engines.
+
+    Returns:
+    --------
+
+    Mismatch | None
+        The results of all engines if they disagree, else None.
+    """
+
+    func, kwargs = _operations()[operation]
+    results = {
+        name: _outcome(func, text, engine=name, **kwargs)
+        for name in (engines.names() if names is None else names)
+    }
+
+    if len(set(results.values())) > 1:
+        return Mismatch(operation, text, results)
+    return None
+
+
+def run(
+    iterations: int = 1000,
+    seed: int | None = None,
+    names: Iterable[str] | None = None,
+) -> list[Mismatch]:
+    """Fuzzes the engines against each other.
+
+    Parameters:
+    -----------
+
+    iterations: int = 1000
+        The number of strings to generate of every kind.
+
+    seed: int | None = None
+        The seed of the random generator, for reproducible runs.
+
+    names: Iterable[str] | None = None
+        The engines to compare. Defaults to all registered engines.
+
+    Returns:
+    --------
+
+    list[Mismatch]
+        The strings the engines disagree on.
+    """
+
+    from .. import main  # noqa: F401 (registers the built-in engines)
+
+    rng = random.Random(seed)
+    pieces = _Pieces()
+    names = tuple(engines.names() if names is None else names)
+    cases = (
+        (banglish, ("parse", "parse(remap_words=False)")),
+        (bengali, ("reverse", "reverse(remap_words=False)")),
+        (_long(bengali), ("to_bijoy",)),
+        (_long(bijoy), ("to_unicode",)),
+    )
+    mismatches = []
+
+    for _ in range(iterations):
+        for generate, operations in cases:
+            text = generate(rng, pieces)
+            for operation in operations:
+                mismatch = check(operation, text, names)
+                if mismatch is not None:
+                    mismatches.append(mismatch)
+
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point for the fuzzer."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m avro.core.fuzz",
+        description="Check that all avro.py engines agree on random text.",
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=1000)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--engine",
+        action="append",
+        dest="engines",
+        help="An engine to compare (repeatable). Defaults to all.",
+    )
+    args = parser.parse_args(argv)
+
+    mismatches = run(args.iterations, args.seed, args.engines)
+
+    for mismatch in mismatches:
+        print(f"{mismatch.operation}({mismatch.text!r}):")
+        for name, result in mismatch.results.items():
+            print(f"    {name}: {result!r}")
+
+    print(f"{len(mismatches)} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
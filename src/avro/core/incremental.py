@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Incremental conversion of documents being edited.
+
+Patterns and rules only look a few characters around the cursor, and
+nothing matches across a separator (see PhoneticTables.separators()), so
+text can be converted in chunks ending with one. A Document keeps the
+chunks of a text along with their conversions, and applies edits to them by
+converting only the chunks touched by the edit again (usually one word).
+
+The chunks are grouped in pages of a bounded number of chunks, with their
+total lengths, so that finding the chunks under an edit doesn't walk every
+chunk of the document. Only summing up the lengths of the pages depends on
+the size of the document, which takes microseconds even for megabytes of
+text.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from itertools import accumulate
+from typing import NamedTuple
+
+# The maximum number of chunks per page.
+_PAGE = 512
+
+# Literal remap markers in the text: see _split().
+_MARKER = "<rm>"
+
+
+# Classes.
+class Edit(NamedTuple):
+    """A change of a text: replaces `deleted` characters at `offset`."""
+
+    offset: int
+    deleted: int
+    inserted: str
+
+
+class _Page:
+    # A run of chunks, their conversions and their total lengths.
+
+    __slots__ = ("inputs", "output_size", "outputs", "size")
+
+    def __init__(self, inputs: list[str], outputs: list[str]) -> None:
+        self.inputs = inputs
+        self.outputs = outputs
+        self.size = sum(map(len, inputs))
+        self.output_size = sum(map(len, outputs))
+
+
+class Document:
+    """A text kept in sync with its conversion, as it's edited.
+
+    Parameters:
+    -----------
+
+    text: str
+        The initial text.
+
+    convert: Callable[[str], str]
+        Converts a chunk of text. Chunks end with a separator (unless they
+        end the text), and must convert the same on their own as in the
+        middle of the text.
+
+    separators: Iterable[str]
+        The characters that chunks may end with.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        convert: Callable[[str], str],
+        separators: Iterable[str],
+    ) -> None:
+        self._convert = convert
+        chars = "".join(sorted(separators))
+        self._chunk = re.compile(
+            f"[^{re.escape(chars)}]*[{re.escape(chars)}]+|.+$"
+            if chars
+            else ".+",
+            re.DOTALL,
+        )
+        self._separators = frozenset(chars)
+        self._pages: list[_Page] = []
+        self._sizes: list[int] = []
+        self._output_sizes: list[int] = []
+        self._splice(0, 0, self._paginate(*self._converted(text)))
+        self._text: str | None = text
+        self._output: str | None = None
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    @property
+    def text(self) -> str:
+        """The current text."""
+
+        if self._text is None:
+            self._text = "".join("".join(page.inputs) for page in self._pages)
+        return self._text
+
+    @property
+    def output(self) -> str:
+        """The conversion of the current text."""
+
+        if self._output is None:
+            self._output = "".join(
+                "".join(page.outputs) for page in self._pages
+            )
+        return self._output
+
+    def _split(self, text: str) -> list[str]:
+        # Text with literal remap markers is parsed specially as a whole
+        # (see main._process_remapped()), so it's never split.
+        if _MARKER in text:
+            return [text] if text else []
+        return self._chunk.findall(text)
+
+    def _converted(self, text: str) -> tuple[list[str], list[str]]:
+        inputs = self._split(text)
+        return inputs, [self._convert(chunk) for chunk in inputs]
+
+    def _paginate(self, inputs: list[str], outputs: list[str]) -> list[_Page]:
+        return [
+            _Page(inputs[i : i + _PAGE], outputs[i : i + _PAGE])
+            for i in range(0, len(inputs), _PAGE)
+        ] or [_Page([], [])]
+
+    def _splice(self, start: int, stop: int, pages: list[_Page]) -> None:
+        # Replaces pages, along with their lengths.
+        self._pages[start:stop] = pages
+        self._sizes[start:stop] = [page.size for page in pages]
+        self._output_sizes[start:stop] = [page.output_size for page in pages]
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> Edit:
+        """Applies an edit to the text, and converts what it touched.
+
+        Parameters:
+        -----------
+
+        offset: int
+            Where the edit starts in the current text.
+
+        deleted: int
+            The number of characters removed from there.
+
+        inserted: str
+            The text inserted in their place.
+
+        Returns:
+        --------
+
+        Edit
+            The matching (minimal) edit of the output, in the same terms.
+        """
+
+        pages = self._pages
+        ends = list(accumulate(self._sizes))
+        size = ends[-1]
+        if offset < 0 or deleted < 0 or offset + deleted > size:
+            raise ValueError(
+                f"Edit ({offset}, {deleted}) out of range for a text of "
+                f"{size} characters"
+            )
+
+        # Find the pages under the edit, and the text before them.
+        first = min(bisect_right(ends, offset), len(pages) - 1)
+        last = min(bisect_left(ends, offset + deleted, first), len(pages) - 1)
+        base = ends[first] - self._sizes[first]
+        output_base = sum(self._output_sizes[:first])
+
+        inputs = [
+            chunk for page in pages[first : last + 1] for chunk in page.inputs
+        ]
+        outputs = [
+            chunk for page in pages[first : last + 1] for chunk in page.outputs
+        ]
+
+        # Find the chunks under the edit, and the text replacing them.
+        starts = [0, *accumulate(map(len, inputs))]
+        local = offset - base
+        start = max(0, min(bisect_right(starts, local), len(inputs)) - 1)
+        stop = max(start, bisect_right(starts, local + deleted - 1) - 1)
+        stop = min(stop, len(inputs) - 1)
+
+        if inputs:
+            text = (
+                inputs[start][: local - starts[start]]
+                + inserted
+                + inputs[stop][local + deleted - starts[stop] :]
+            )
+        else:
+            text, stop = inserted, -1
+
+        # The new text must end with a separator (or the document), else
+        # it runs into the following chunks.
+        while not text or text[-1] not in self._separators:
+            if stop + 1 == len(inputs):
+                if last + 1 == len(pages):
+                    break
+                last += 1
+                inputs += pages[last].inputs
+                outputs += pages[last].outputs
+            stop += 1
+            text += inputs[stop]
+
+        # Literal markers make the whole text a single chunk (see _split()).
+        if _MARKER in text:
+            return self._replace(offset, deleted, inserted)
+
+        new_inputs, new_outputs = self._converted(text)
+        old_output = "".join(outputs[start : stop + 1])
+        new_output = "".join(new_outputs)
+        output_offset = output_base + sum(map(len, outputs[:start]))
+
+        inputs[start : stop + 1] = new_inputs
+        outputs[start : stop + 1] = new_outputs
+        self._splice(first, last + 1, self._paginate(inputs, outputs))
+        self._text = self._output = None
+
+        return _diff(output_offset, old_output, new_output)
+
+    def _replace(self, offset: int, deleted: int, inserted: str) -> Edit:
+        # Converts the whole text again.
+        old_output = self.output
+        text = self.text
+        text = text[:offset] + inserted + text[offset + deleted :]
+        self._splice(
+            0, len(self._pages), self._paginate(*self._converted(text))
+        )
+        self._text = text
+        self._output = None
+        return _diff(0, old_output, self.output)
+
+
+# Functions.
+def _diff(offset: int, old: str, new: str) -> Edit:
+    # The edit turning old into new, without their common ends.
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old[len(old) - suffix - 1] == new[len(new) - suffix - 1]
+    ):
+        suffix += 1
+
+    return Edit(
+        offset + prefix,
+        len(old) - prefix - suffix,
+        new[prefix : len(new) - suffix],
+    )
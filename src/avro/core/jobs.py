@@ -0,0 +1,591 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Resumable batch jobs, converting whole collections of files.
+
+A job converts the files listed in a manifest (one path per line, relative
+to the manifest) into an output directory, under the same relative paths.
+Every output is written to a temporary file and renamed into place, so
+that it's either complete or not there at all, and then recorded in a
+checkpoint log along with the size and modification time of its input.
+Running a job again skips the files recorded there (unless their input
+changed since), so a job that was killed carries on where it stopped.
+
+Files are spread over worker processes, and over independent invocations
+(e.g. on machines sharing a file system) by giving each of them a shard:
+a shard takes the files whose path hashes to it, and keeps a checkpoint log
+of its own. Run it with:
+
+    $ python -m avro.core.jobs MANIFEST OUTPUT --operation to_unicode \\
+        [--workers N] [--shard INDEX/COUNT]
+"""
+
+# Imports.
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from . import streams
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from ..main import Transliterator
+
+# The operations a job can run, named after the functions running them.
+OPERATIONS: tuple[str, ...] = ("parse", "reverse", "to_bijoy", "to_unicode")
+
+# Where the checkpoint logs are kept, in the output directory by default.
+CHECKPOINTS = ".checkpoints"
+
+# The transliterator of a worker process (see _init_worker()).
+_WORKER: Transliterator | None = None
+
+
+# Classes.
+class Task(NamedTuple):
+    """A file to convert."""
+
+    path: str
+    source: Path
+    target: Path
+    size: int
+    mtime_ns: int
+
+
+class Progress(NamedTuple):
+    """How far a job got.
+
+    Files count the inputs converted (or failed) by this run, out of the
+    ones it had to convert, and bytes the inputs converted; the bytes of
+    the ones that failed, and the files skipped as already converted, are
+    counted separately.
+    """
+
+    files: int
+    total_files: int
+    bytes: int
+    total_bytes: int
+    skipped: int
+    failed: int
+    failed_bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """The input converted per second, in MB."""
+
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """The estimated number of seconds left, if known yet."""
+
+        if not self.bytes:
+            return None
+        left = self.total_bytes - self.bytes - self.failed_bytes
+        return left * self.seconds / self.bytes
+
+    def __str__(self) -> str:
+        eta = "?" if self.eta is None else _duration(self.eta)
+        return (
+            f"{self.files}/{self.total_files} files, "
+            f"{self.bytes / 1e6:.1f}/{self.total_bytes / 1e6:.1f} MB, "
+            f"{self.throughput:.2f} MB/s, {self.skipped} skipped, "
+            f"{self.failed} failed ({self.failed_bytes / 1e6:.1f} MB), "
+            f"ETA {eta}"
+        )
+
+
+class Report(NamedTuple):
+    """The outcome of a job: its final progress, and the files that failed
+    (by path) with their errors."""
+
+    progress: Progress
+    errors: dict[str, str]
+
+
+class Checkpoints:
+    """The checkpoint logs of a job.
+
+    Every shard appends to a log of its own, and reads the logs of all
+    shards, so that resuming with a different number of shards still skips
+    whatever was converted. Lines cut short by a killed job are ignored.
+
+    Parameters:
+    -----------
+
+    directory: Path
+        Where the logs are kept.
+
+    shard: tuple[int, int]
+        The index of the shard, and the number of shards.
+
+    signature: str
+        Identifies the operation and options of the job. Records of other
+        jobs are ignored.
+    """
+
+    def __init__(
+        self, directory: Path, shard: tuple[int, int], signature: str
+    ) -> None:
+        self.directory = directory
+        self.signature = signature
+        self._records: dict[str, dict] = {}
+        self._log: IO[str] | None = None
+
+        index, count = shard
+        self.path = directory / f"shard-{index}-of-{count}.jsonl"
+
+        for log in sorted(directory.glob("shard-*.jsonl")):
+            with open(log, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("job") == signature:
+                        self._records[record["path"]] = record
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def done(self, task: Task) -> bool:
+        """Returns whether a file was converted since its input changed."""
+
+        record = self._records.get(task.path)
+        return (
+            record is not None
+            and record["size"] == task.size
+            and record["mtime_ns"] == task.mtime_ns
+            and task.target.exists()
+        )
+
+    def record(self, task: Task, seconds: float) -> None:
+        """Records a converted file, durably."""
+
+        if self._log is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Kept open across records, and closed by close().
+            self._log = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+
+        record = {
+            "job": self.signature,
+            "path": task.path,
+            "size": task.size,
+            "mtime_ns": task.mtime_ns,
+            "seconds": round(seconds, 6),
+        }
+        self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._records[task.path] = record
+
+    def close(self) -> None:
+        """Closes the log of the shard."""
+
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+# Functions.
+def _duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}"
+
+
+def read_manifest(path: str | os.PathLike) -> list[str]:
+    """Reads the paths listed in a manifest.
+
+    Parameters:
+    -----------
+
+    path: str | os.PathLike
+        The manifest: one path per line. Blank lines and lines starting
+        with "#" are ignored.
+
+    Returns:
+    --------
+
+    list[str]
+        The paths, in order.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        return [
+            line.strip()
+            for line in file
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+def shard_of(path: str, count: int) -> int:
+    """Returns the shard a path belongs to, out of `count` shards.
+
+    The shard only depends on the path, so that every invocation of a job
+    agrees on it.
+    """
+
+    return zlib.crc32(path.encode("utf-8")) % count
+
+
+def _relative(path: str, root: Path) -> str:
+    # The path of a file relative to the root, which its output is written
+    # under in the output directory.
+    relative = Path(path)
+    if relative.is_absolute():
+        relative = relative.relative_to(root)
+    posix = PurePosixPath(relative.as_posix())
+    if ".." in posix.parts:
+        raise ValueError(f"Path outside of the job: {path!r}")
+    return str(posix)
+
+
+def _init_worker(transliterator: Transliterator | None) -> None:
+    global _WORKER
+    _WORKER = transliterator
+
+
+def _edges(texts: Iterable[str], edges: list[str]) -> Iterator[str]:
+    # Passes text through, keeping the whitespace at its start and end in
+    # edges (all of it at the start, if it's nothing but whitespace).
+    started = False
+    for text in texts:
+        if not started:
+            body = text.lstrip()
+            edges[0] += text[: len(text) - len(body)]
+            started = bool(body)
+        if started:
+            body = text.rstrip()
+            edges[1] = text[len(body) :] if body else edges[1] + text
+        yield text
+
+
+def _convert(
+    task: Task,
+    operation: str,
+    options: Mapping[str, object],
+    encoding: str,
+    transliterator: Transliterator | None = None,
+) -> float:
+    # Converts a file, returning the time it took.
+    from .. import main
+
+    start = time.perf_counter()
+    transliterator = transliterator or _WORKER or main._DEFAULT
+
+    # Files are converted a block at a time (see core/streams.py), so that
+    # memory use doesn't grow with their size. The Bijoy conversions strip
+    # their output, so the whitespace at the edges of the file is put back.
+    chain = transliterator._streams(
+        operation,
+        **options,  # type: ignore[arg-type]
+    )
+    edges = ["", ""]
+
+    # Written next to the target, so that renaming it is atomic.
+    task.target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = task.target.with_name(f".{task.target.name}.{os.getpid()}.tmp")
+    try:
+        with (
+            open(task.source, encoding=encoding, newline="") as source,
+            open(temporary, "wb") as target,
+        ):
+            texts: Iterable[str] = iter(
+                partial(source.read, streams.BLOCK_SIZE), ""
+            )
+            if any(stream.stripped for stream in chain):
+                texts = _edges(texts, edges)
+
+            started = False
+            for text in streams.pipe(texts, chain):
+                if not started:
+                    streams.write(target, edges[0].encode("utf-8"))
+                    started = True
+                streams.write(target, text.encode("utf-8"))
+            if not started:
+                streams.write(target, edges[0].encode("utf-8"))
+            streams.write(target, edges[1].encode("utf-8"))
+
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temporary, task.target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    return time.perf_counter() - start
+
+
+def run(
+    manifest: str | os.PathLike,
+    output: str | os.PathLike,
+    operation: str,
+    options: Mapping[str, object] | None = None,
+    *,
+    root: str | os.PathLike | None = None,
+    workers: int = 1,
+    shard: tuple[int, int] = (0, 1),
+    encoding: str = "utf-8",
+    transliterator: Transliterator | None = None,
+    checkpoints: str | os.PathLike | None = None,
+    on_progress: Callable[[Progress], object] | None = None,
+) -> Report:
+    """Runs a job, resuming it if it ran before.
+
+    Parameters:
+    -----------
+
+    manifest: str | os.PathLike
+        The manifest listing the files to convert (see read_manifest()).
+
+    output: str | os.PathLike
+        The directory to write the outputs to, under the same paths.
+
+    operation: str
+        One of OPERATIONS.
+
+    options: Mapping[str, object] | None = None
+        Keyword arguments of the operation, e.g. {"from_bijoy": True}.
+
+    root: str | os.PathLike | None = None
+        The directory the paths are relative to. Defaults to the directory
+        of the manifest.
+
+    workers: int = 1
+        The number of worker processes. Converts the files in this process
+        if 1.
+
+    shard: tuple[int, int] = (0, 1)
+        The index of the shard to run, and the number of shards.
+
+    encoding: str = "utf-8"
+        The encoding of the inputs. Outputs are written in UTF-8.
+
+    transliterator: Transliterator | None = None
+        The transliterator to run on (e.g. with custom exception words).
+        Defaults to the one of the module-level functions.
+
+    checkpoints: str | os.PathLike | None = None
+        The directory of the checkpoint logs. Defaults to CHECKPOINTS in
+        the output directory.
+
+    on_progress: Callable[[Progress], object] | None = None
+        Called with the progress of the job, as every file is done.
+
+    Returns:
+    --------
+
+    Report
+        The final progress, and the files that failed.
+    """
+
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation!r}")
+    index, count = shard
+    if not 0 <= index < count:
+        raise ValueError(f"Invalid shard: {index}/{count}")
+
+    options = dict(options or {})
+    manifest = Path(manifest)
+    output = Path(output)
+    root = manifest.parent if root is None else Path(root)
+    signature = f"{operation}{json.dumps(options, sort_keys=True)}"
+
+    errors: dict[str, str] = {}
+    tasks: list[Task] = []
+    skipped = 0
+
+    with Checkpoints(
+        output / CHECKPOINTS if checkpoints is None else Path(checkpoints),
+        shard,
+        signature,
+    ) as state:
+        for path in read_manifest(manifest):
+            if shard_of(path, count) != index:
+                continue
+            try:
+                relative = _relative(path, root)
+                source = root / relative
+                stat = source.stat()
+            except (OSError, ValueError) as error:
+                errors[path] = f"{type(error).__name__}: {error}"
+                continue
+
+            task = Task(
+                relative,
+                source,
+                output / relative,
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+            if state.done(task):
+                skipped += 1
+            else:
+                tasks.append(task)
+
+        total_bytes = sum(task.size for task in tasks)
+        done = done_bytes = failed_bytes = 0
+        start = time.perf_counter()
+
+        def progress() -> Progress:
+            return Progress(
+                done,
+                len(tasks),
+                done_bytes,
+                total_bytes,
+                skipped,
+                len(errors),
+                failed_bytes,
+                time.perf_counter() - start,
+            )
+
+        def finish(task: Task, result: Callable[[], float]) -> None:
+            nonlocal done, done_bytes, failed_bytes
+            try:
+                seconds = result()
+            except Exception as error:  # noqa: BLE001
+                # Whatever a file fails with, the job goes on with the
+                # rest, and the error is reported along with its path.
+                errors[task.path] = f"{type(error).__name__}: {error}"
+                failed_bytes += task.size
+            else:
+                state.record(task, seconds)
+                done_bytes += task.size
+            done += 1
+            if on_progress is not None:
+                on_progress(progress())
+
+        job = (operation, options, encoding)
+
+        if workers <= 1:
+            for task in tasks:
+                finish(
+                    task,
+                    lambda task=task: _convert(task, *job, transliterator),
+                )
+        else:
+            from concurrent.futures import (
+                FIRST_COMPLETED,
+                ProcessPoolExecutor,
+                wait,
+            )
+
+            # A few files per worker in flight, so that a long manifest
+            # isn't queued up all at once.
+            with ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(transliterator,)
+            ) as pool:
+                pending: dict = {}
+                queue = iter(tasks)
+                while True:
+                    for task in queue:
+                        pending[pool.submit(_convert, task, *job)] = task
+                        if len(pending) >= workers * 2:
+                            break
+                    if not pending:
+                        break
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        finish(pending.pop(future), future.result)
+
+        return Report(progress(), errors)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point for running jobs."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m avro.core.jobs",
+        description="Convert the files listed in a manifest, resumably.",
+    )
+    parser.add_argument("manifest", help="A file listing a path per line.")
+    parser.add_argument("output", help="The output directory.")
+    parser.add_argument("-O", "--operation", choices=OPERATIONS, required=True)
+    parser.add_argument(
+        "--from-bijoy",
+        action="store_true",
+        help="Reverse from Bijoy (with --operation reverse).",
+    )
+    parser.add_argument(
+        "--bijoy",
+        action="store_true",
+        help="Parse to Bijoy (with --operation parse).",
+    )
+    parser.add_argument(
+        "--no-remap",
+        action="store_true",
+        help="Don't parse / reverse exception words.",
+    )
+    parser.add_argument("--root", help="The directory paths are relative to.")
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument(
+        "--shard", default="0/1", help="INDEX/COUNT (default: 0/1)."
+    )
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    options: dict[str, object] = {}
+    if args.from_bijoy:
+        if args.operation != "reverse":
+            parser.error("--from-bijoy only applies to reverse")
+        options["from_bijoy"] = True
+    if args.bijoy:
+        if args.operation != "parse":
+            parser.error("--bijoy only applies to parse")
+        options["bijoy"] = True
+    if args.no_remap:
+        if args.operation not in ("parse", "reverse"):
+            parser.error("--no-remap only applies to parse and reverse")
+        options["remap_words"] = False
+
+    try:
+        index, count = map(int, args.shard.split("/"))
+    except ValueError:
+        parser.error(f"invalid shard: {args.shard!r}")
+
+    last = 0.0
+
+    def report(progress: Progress) -> None:
+        nonlocal last
+        if time.monotonic() - last >= 1:
+            last = time.monotonic()
+            print(f"\r{progress}", end="", file=sys.stderr, flush=True)
+
+    result = run(
+        args.manifest,
+        args.output,
+        args.operation,
+        options,
+        root=args.root,
+        workers=args.workers,
+        shard=(index, count),
+        encoding=args.encoding,
+        on_progress=None if args.quiet else report,
+    )
+
+    if not args.quiet:
+        print(f"\r{result.progress}", file=sys.stderr)
+    for path, error in result.errors.items():
+        print(f"{path}: {error}", file=sys.stderr)
+
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
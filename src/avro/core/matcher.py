@@ -0,0 +1,1993 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""A matcher specialized for the phonetic dictionary.
+
+Generated by `python -m avro.core.codegen`, do not edit by hand.
+"""
+
+# ruff: noqa
+
+# Imports.
+from .processor import check_match as _check, reverse_with_rules
+from .tables import RuleMatch
+
+# The hash of the dictionary source this was generated from.
+DICTIONARY_DIGEST = 'd52ce22ae38fb72be2802af5cd19989a9d46eb2aa5e3aefea8710baa3f594328'
+
+_VOWELS = frozenset('aeiou')
+_CONSONANTS = frozenset('bcdfghjklmnpqrstvwxyz')
+_LETTERS = _VOWELS | _CONSONANTS
+_MATCHES = (
+)
+
+
+# Functions.
+def parse(text: str) -> str:
+    """Parses case-fixed text, like main._parse_output_generator()."""
+
+    output = []
+    append = output.append
+    cur_end = 0
+    n = len(text)
+
+    for cur, char in enumerate(text):
+        if ord(char) >= 128:
+            cur_end = cur + 1
+            append(char)
+        elif cur >= cur_end:
+            replaced, cur_end = _PARSE.get(char, _parse_default)(
+                text, cur, n
+            )
+            append(replaced)
+
+    return "".join(output)
+
+
+def reverse(text: str) -> str:
+    """Reverses text, like main._reverse_output_generator()."""
+
+    output = []
+    append = output.append
+
+    for cur, char in enumerate(text):
+        char.encode("utf-8")
+        found = _REVERSE.get(char, _reverse_default)(text, cur)
+
+        if found is None:
+            append(char)
+            continue
+
+        reversed = reverse_with_rules(cur, text, found[0])
+        if reversed is not None:
+            append(reversed)
+        elif found[1] is not None:
+            append(found[1])
+        else:
+            append(char)
+
+    return "".join(output)
+
+
+def _parse_0(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '$'.
+    return '৳', c + 1
+
+
+def _rules_0(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_1(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for ','.
+    if t.startswith(',,', c):
+        return '্\u200c', c + 2
+    return ',', c + 1
+
+
+def _rules_1(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_2(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '.'.
+    if t.startswith('...', c):
+        return '...', c + 3
+    if t.startswith('.`', c):
+        return '.', c + 2
+    if t.startswith('..', c):
+        return '।।', c + 2
+    return '।', c + 1
+
+
+def _rules_2(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_3(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '0'.
+    return '০', c + 1
+
+
+def _rules_3(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_4(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '1'.
+    return '১', c + 1
+
+
+def _rules_4(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_5(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '2'.
+    return '২', c + 1
+
+
+def _rules_5(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_6(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '3'.
+    return '৩', c + 1
+
+
+def _rules_6(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_7(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '4'.
+    return '৪', c + 1
+
+
+def _rules_7(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_8(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '5'.
+    return '৫', c + 1
+
+
+def _rules_8(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_9(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '6'.
+    return '৬', c + 1
+
+
+def _rules_9(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_10(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '7'.
+    return '৭', c + 1
+
+
+def _rules_10(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_11(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '8'.
+    return '৮', c + 1
+
+
+def _rules_11(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_12(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '9'.
+    return '৯', c + 1
+
+
+def _rules_12(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_13(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for ':'.
+    if t.startswith(':`', c):
+        return ':', c + 2
+    return 'ঃ', c + 1
+
+
+def _rules_13(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_14(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'A'.
+    if t.startswith('AZ', c):
+        return 'অ্যা', c + 2
+    if t.startswith('A`', c):
+        return 'া', c + 2
+    return _rules_14(t, c, n)
+
+
+def _rules_14(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_15(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'D'.
+    if t.startswith('DD', c):
+        return 'ড্ড', c + 2
+    if t.startswith('Dh', c):
+        return 'ঢ', c + 2
+    return 'ড', c + 1
+
+
+def _rules_15(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_16(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'G'.
+    if t.startswith('Ghn', c):
+        return 'ঘ্ন', c + 3
+    if t.startswith('Gdh', c):
+        return 'গ্ধ', c + 3
+    if t.startswith('GN', c):
+        return 'গ্ণ', c + 2
+    if t.startswith('Gn', c):
+        return 'গ্ন', c + 2
+    if t.startswith('Gm', c):
+        return 'গ্ম', c + 2
+    if t.startswith('Gl', c):
+        return 'গ্ল', c + 2
+    if t.startswith('GG', c):
+        return 'জ্ঞ', c + 2
+    if t.startswith('Gg', c):
+        return 'জ্ঞ', c + 2
+    if t.startswith('Gh', c):
+        return 'ঘ', c + 2
+    return 'গ', c + 1
+
+
+def _rules_16(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_17(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'I'.
+    if t.startswith('I`', c):
+        return 'ী', c + 2
+    return _rules_17(t, c, n)
+
+
+def _rules_17(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ঈ', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ঈ', e
+    return 'ী', e
+
+
+def _parse_18(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'J'.
+    return 'জ', c + 1
+
+
+def _rules_18(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_19(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'N'.
+    if t.startswith('NgkSh', c):
+        return 'ঙ্ক্ষ', c + 5
+    if t.startswith('Ngkkh', c):
+        return 'ঙ্ক্ষ', c + 5
+    if t.startswith('NGch', c):
+        return 'ঞ্ছ', c + 4
+    if t.startswith('Nggh', c):
+        return 'ঙ্ঘ', c + 4
+    if t.startswith('Ngkh', c):
+        return 'ঙ্খ', c + 4
+    if t.startswith('NGjh', c):
+        return 'ঞ্ঝ', c + 4
+    if t.startswith('Ngkx', c):
+        return 'ঙ্ক্ষ', c + 4
+    if t.startswith('NGc', c):
+        return 'ঞ্চ', c + 3
+    if t.startswith('Ngk', c):
+        return 'ঙ্ক', c + 3
+    if t.startswith('Ngx', c):
+        return 'ঙ্ষ', c + 3
+    if t.startswith('Ngg', c):
+        return 'ঙ্গ', c + 3
+    if t.startswith('Ngm', c):
+        return 'ঙ্ম', c + 3
+    if t.startswith('NGj', c):
+        return 'ঞ্জ', c + 3
+    if t.startswith('NTh', c):
+        return 'ণ্ঠ', c + 3
+    if t.startswith('NDh', c):
+        return 'ণ্ঢ', c + 3
+    if t.startswith('Ngr', c):
+        return 'ঙর', c + 3
+    if t.startswith('NGr', c):
+        return 'ঞর', c + 3
+    if t.startswith('Ng', c):
+        return 'ঙ', c + 2
+    if t.startswith('NG', c):
+        return 'ঞ', c + 2
+    if t.startswith('NN', c):
+        return 'ণ্ণ', c + 2
+    if t.startswith('Nn', c):
+        return 'ণ্ন', c + 2
+    if t.startswith('Nm', c):
+        return 'ণ্ম', c + 2
+    if t.startswith('NT', c):
+        return 'ণ্ট', c + 2
+    if t.startswith('ND', c):
+        return 'ণ্ড', c + 2
+    return 'ণ', c + 1
+
+
+def _rules_19(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_20(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'O'.
+    if t.startswith('OI`', c):
+        return 'ৈ', c + 3
+    if t.startswith('OU`', c):
+        return 'ৌ', c + 3
+    if t.startswith('O`', c):
+        return 'ো', c + 2
+    return _rules_20(t, c, n)
+
+
+def _rules_20(t: str, c: int, n: int) -> tuple[str, int]:
+    if t.startswith('OI', c):
+        e = c + 2
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS):
+            return 'ঐ', e
+        if (c == 0 or t[c - 1].lower() not in _LETTERS):
+            return 'ঐ', e
+        return 'ৈ', e
+    if t.startswith('OU', c):
+        e = c + 2
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS):
+            return 'ঔ', e
+        if (c == 0 or t[c - 1].lower() not in _LETTERS):
+            return 'ঔ', e
+        return 'ৌ', e
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS):
+        return 'ও', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS):
+        return 'ও', e
+    return 'ো', e
+
+
+def _parse_21(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'R'.
+    if t.startswith('Rg', c):
+        return 'ড়্গ', c + 2
+    if t.startswith('Rh', c):
+        return 'ঢ়', c + 2
+    return 'ড়', c + 1
+
+
+def _rules_21(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_22(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'S'.
+    if t.startswith('ShTh', c):
+        return 'ষ্ঠ', c + 4
+    if t.startswith('Shph', c):
+        return 'ষ্ফ', c + 4
+    if t.startswith('Sch', c):
+        return 'শ্ছ', c + 3
+    if t.startswith('Shk', c):
+        return 'ষ্ক', c + 3
+    if t.startswith('ShT', c):
+        return 'ষ্ট', c + 3
+    if t.startswith('ShN', c):
+        return 'ষ্ণ', c + 3
+    if t.startswith('Shp', c):
+        return 'ষ্প', c + 3
+    if t.startswith('Shf', c):
+        return 'ষ্ফ', c + 3
+    if t.startswith('Shm', c):
+        return 'ষ্ম', c + 3
+    if t.startswith('Sc', c):
+        return 'শ্চ', c + 2
+    if t.startswith('Sc', c):
+        return 'শ্চ', c + 2
+    if t.startswith('St', c):
+        return 'শ্ত', c + 2
+    if t.startswith('Sn', c):
+        return 'শ্ন', c + 2
+    if t.startswith('Sm', c):
+        return 'শ্ম', c + 2
+    if t.startswith('Sl', c):
+        return 'শ্ল', c + 2
+    if t.startswith('Sh', c):
+        return 'ষ', c + 2
+    return 'শ', c + 1
+
+
+def _rules_22(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_23(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'T'.
+    if t.startswith('TT', c):
+        return 'ট্ট', c + 2
+    if t.startswith('Tm', c):
+        return 'ট্ম', c + 2
+    if t.startswith('Th', c):
+        return 'ঠ', c + 2
+    return 'ট', c + 1
+
+
+def _rules_23(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_24(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'U'.
+    if t.startswith('U`', c):
+        return 'ূ', c + 2
+    return _rules_24(t, c, n)
+
+
+def _rules_24(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ঊ', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ঊ', e
+    return 'ূ', e
+
+
+def _parse_25(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'Y'.
+    return 'য়', c + 1
+
+
+def _rules_25(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_26(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'Z'.
+    return '্য', c + 1
+
+
+def _rules_26(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_27(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for '^'.
+    if t.startswith('^`', c):
+        return '^', c + 2
+    return 'ঁ', c + 1
+
+
+def _rules_27(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_28(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'a'.
+    if t.startswith('aZ', c):
+        return 'অ্যা', c + 2
+    if t.startswith('a`', c):
+        return 'া', c + 2
+    return _rules_28(t, c, n)
+
+
+def _rules_28(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'আ', e
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c >= 1 and t[c - 1 : c] == 'a') and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'য়া', e
+    if (c >= 1 and t[c - 1 : c] == 'a') and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'আ', e
+    return 'া', e
+
+
+def _parse_29(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'b'.
+    if t.startswith('bhl', c):
+        return 'ভ্ল', c + 3
+    if t.startswith('bdh', c):
+        return 'ব্ধ', c + 3
+    if t.startswith('bj', c):
+        return 'ব্জ', c + 2
+    if t.startswith('bd', c):
+        return 'ব্দ', c + 2
+    if t.startswith('bb', c):
+        return 'ব্ব', c + 2
+    if t.startswith('bl', c):
+        return 'ব্ল', c + 2
+    if t.startswith('bh', c):
+        return 'ভ', c + 2
+    return 'ব', c + 1
+
+
+def _rules_29(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_30(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'c'.
+    if t.startswith('cNG', c):
+        return 'চ্ঞ', c + 3
+    if t.startswith('cch', c):
+        return 'চ্ছ', c + 3
+    if t.startswith('cc', c):
+        return 'চ্চ', c + 2
+    if t.startswith('ch', c):
+        return 'ছ', c + 2
+    return 'চ', c + 1
+
+
+def _rules_30(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_31(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'd'.
+    if t.startswith('dhn', c):
+        return 'ধ্ন', c + 3
+    if t.startswith('dhm', c):
+        return 'ধ্ম', c + 3
+    if t.startswith('dgh', c):
+        return 'দ্ঘ', c + 3
+    if t.startswith('ddh', c):
+        return 'দ্ধ', c + 3
+    if t.startswith('dbh', c):
+        return 'দ্ভ', c + 3
+    if t.startswith('dv', c):
+        return 'দ্ভ', c + 2
+    if t.startswith('dm', c):
+        return 'দ্ম', c + 2
+    if t.startswith('dh', c):
+        return 'ধ', c + 2
+    if t.startswith('dg', c):
+        return 'দ্গ', c + 2
+    if t.startswith('dd', c):
+        return 'দ্দ', c + 2
+    return 'দ', c + 1
+
+
+def _rules_31(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_32(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'e'.
+    if t.startswith('ee`', c):
+        return 'ী', c + 3
+    if t.startswith('e`', c):
+        return 'ে', c + 2
+    return _rules_32(t, c, n)
+
+
+def _rules_32(t: str, c: int, n: int) -> tuple[str, int]:
+    if t.startswith('ee', c):
+        e = c + 2
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+            return 'ঈ', e
+        if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+            return 'ঈ', e
+        return 'ী', e
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'এ', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'এ', e
+    return 'ে', e
+
+
+def _parse_33(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'f'.
+    if t.startswith('fl', c):
+        return 'ফ্ল', c + 2
+    return 'ফ', c + 1
+
+
+def _rules_33(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_34(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'g'.
+    if t.startswith('ghn', c):
+        return 'ঘ্ন', c + 3
+    if t.startswith('gdh', c):
+        return 'গ্ধ', c + 3
+    if t.startswith('gN', c):
+        return 'গ্ণ', c + 2
+    if t.startswith('gn', c):
+        return 'গ্ন', c + 2
+    if t.startswith('gm', c):
+        return 'গ্ম', c + 2
+    if t.startswith('gl', c):
+        return 'গ্ল', c + 2
+    if t.startswith('gg', c):
+        return 'জ্ঞ', c + 2
+    if t.startswith('gG', c):
+        return 'জ্ঞ', c + 2
+    if t.startswith('gh', c):
+        return 'ঘ', c + 2
+    return 'গ', c + 1
+
+
+def _rules_34(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_35(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'h'.
+    if t.startswith('hN', c):
+        return 'হ্ণ', c + 2
+    if t.startswith('hn', c):
+        return 'হ্ন', c + 2
+    if t.startswith('hm', c):
+        return 'হ্ম', c + 2
+    if t.startswith('hl', c):
+        return 'হ্ল', c + 2
+    return 'হ', c + 1
+
+
+def _rules_35(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_36(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'i'.
+    if t.startswith('i`', c):
+        return 'ি', c + 2
+    return _rules_36(t, c, n)
+
+
+def _rules_36(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ই', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'ই', e
+    return 'ি', e
+
+
+def _parse_37(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'j'.
+    if t.startswith('jjh', c):
+        return 'জ্ঝ', c + 3
+    if t.startswith('jNG', c):
+        return 'জ্ঞ', c + 3
+    if t.startswith('jh', c):
+        return 'ঝ', c + 2
+    if t.startswith('jj', c):
+        return 'জ্জ', c + 2
+    return 'জ', c + 1
+
+
+def _rules_37(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_38(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'k'.
+    if t.startswith('kkhN', c):
+        return 'ক্ষ্ণ', c + 4
+    if t.startswith('kShN', c):
+        return 'ক্ষ্ণ', c + 4
+    if t.startswith('kkhm', c):
+        return 'ক্ষ্ম', c + 4
+    if t.startswith('kShm', c):
+        return 'ক্ষ্ম', c + 4
+    if t.startswith('kxN', c):
+        return 'ক্ষ্ণ', c + 3
+    if t.startswith('kxm', c):
+        return 'ক্ষ্ম', c + 3
+    if t.startswith('kkh', c):
+        return 'ক্ষ', c + 3
+    if t.startswith('kSh', c):
+        return 'ক্ষ', c + 3
+    if t.startswith('ksh', c):
+        return 'কশ', c + 3
+    if t.startswith('kx', c):
+        return 'ক্ষ', c + 2
+    if t.startswith('kk', c):
+        return 'ক্ক', c + 2
+    if t.startswith('kT', c):
+        return 'ক্ট', c + 2
+    if t.startswith('kt', c):
+        return 'ক্ত', c + 2
+    if t.startswith('kl', c):
+        return 'ক্ল', c + 2
+    if t.startswith('ks', c):
+        return 'ক্স', c + 2
+    if t.startswith('kh', c):
+        return 'খ', c + 2
+    return 'ক', c + 1
+
+
+def _rules_38(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_39(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'l'.
+    if t.startswith('lbh', c):
+        return 'ল্ভ', c + 3
+    if t.startswith('ldh', c):
+        return 'ল্ধ', c + 3
+    if t.startswith('lkh', c):
+        return 'লখ', c + 3
+    if t.startswith('lgh', c):
+        return 'লঘ', c + 3
+    if t.startswith('lph', c):
+        return 'লফ', c + 3
+    if t.startswith('lk', c):
+        return 'ল্ক', c + 2
+    if t.startswith('lg', c):
+        return 'ল্গ', c + 2
+    if t.startswith('lT', c):
+        return 'ল্ট', c + 2
+    if t.startswith('lD', c):
+        return 'ল্ড', c + 2
+    if t.startswith('lp', c):
+        return 'ল্প', c + 2
+    if t.startswith('lv', c):
+        return 'ল্ভ', c + 2
+    if t.startswith('lm', c):
+        return 'ল্ম', c + 2
+    if t.startswith('ll', c):
+        return 'ল্ল', c + 2
+    if t.startswith('lb', c):
+        return 'ল্ব', c + 2
+    return 'ল', c + 1
+
+
+def _rules_39(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_40(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'm'.
+    if t.startswith('mth', c):
+        return 'ম্থ', c + 3
+    if t.startswith('mph', c):
+        return 'ম্ফ', c + 3
+    if t.startswith('mbh', c):
+        return 'ম্ভ', c + 3
+    if t.startswith('mpl', c):
+        return 'মপ্ল', c + 3
+    if t.startswith('mn', c):
+        return 'ম্ন', c + 2
+    if t.startswith('mp', c):
+        return 'ম্প', c + 2
+    if t.startswith('mv', c):
+        return 'ম্ভ', c + 2
+    if t.startswith('mm', c):
+        return 'ম্ম', c + 2
+    if t.startswith('ml', c):
+        return 'ম্ল', c + 2
+    if t.startswith('mb', c):
+        return 'ম্ব', c + 2
+    if t.startswith('mf', c):
+        return 'ম্ফ', c + 2
+    return 'ম', c + 1
+
+
+def _rules_40(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_41(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'n'.
+    if t.startswith('ngOU', c):
+        return 'ঙ্গৌ', c + 4
+    if t.startswith('ngOI', c):
+        return 'ঙ্গৈ', c + 4
+    if t.startswith('nch', c):
+        return 'ঞ্ছ', c + 3
+    if t.startswith('njh', c):
+        return 'ঞ্ঝ', c + 3
+    if t.startswith('ngh', c):
+        return 'ঙ্ঘ', c + 3
+    if t.startswith('ndh', c):
+        return 'ন্ধ', c + 3
+    if t.startswith('nTh', c):
+        return 'ন্ঠ', c + 3
+    if t.startswith('nth', c):
+        return 'ন্থ', c + 3
+    if t.startswith('nkh', c):
+        return 'ঙ্খ', c + 3
+    if t.startswith('ngo', c):
+        return 'ঙ্গ', c + 3
+    if t.startswith('nga', c):
+        return 'ঙ্গা', c + 3
+    if t.startswith('ngi', c):
+        return 'ঙ্গি', c + 3
+    if t.startswith('ngI', c):
+        return 'ঙ্গী', c + 3
+    if t.startswith('ngu', c):
+        return 'ঙ্গু', c + 3
+    if t.startswith('ngU', c):
+        return 'ঙ্গূ', c + 3
+    if t.startswith('nge', c):
+        return 'ঙ্গে', c + 3
+    if t.startswith('ngO', c):
+        return 'ঙ্গো', c + 3
+    if t.startswith('nsh', c):
+        return 'নশ', c + 3
+    if t.startswith('ngr', c):
+        return 'ংর', c + 3
+    if t.startswith('nj', c):
+        return 'ঞ্জ', c + 2
+    if t.startswith('nk', c):
+        return 'ঙ্ক', c + 2
+    if t.startswith('ng', c):
+        return 'ং', c + 2
+    if t.startswith('nn', c):
+        return 'ন্ন', c + 2
+    if t.startswith('nm', c):
+        return 'ন্ম', c + 2
+    if t.startswith('nd', c):
+        return 'ন্দ', c + 2
+    if t.startswith('nT', c):
+        return 'ন্ট', c + 2
+    if t.startswith('nD', c):
+        return 'ন্ড', c + 2
+    if t.startswith('nt', c):
+        return 'ন্ত', c + 2
+    if t.startswith('ns', c):
+        return 'ন্স', c + 2
+    if t.startswith('nc', c):
+        return 'ঞ্চ', c + 2
+    return 'ন', c + 1
+
+
+def _rules_41(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_42(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'o'.
+    if t.startswith('oo`', c):
+        return 'ু', c + 3
+    if t.startswith('oZ', c):
+        return 'অ্য', c + 2
+    return _rules_42(t, c, n)
+
+
+def _rules_42(t: str, c: int, n: int) -> tuple[str, int]:
+    if t.startswith('oo', c):
+        e = c + 2
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+            return 'উ', e
+        if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+            return 'উ', e
+        return 'ু', e
+    e = c + 1
+    if (c > 0 and t[c - 1].lower() in _VOWELS) and not (c >= 1 and t[c - 1 : c] == 'o'):
+        return 'ও', e
+    if (c > 0 and t[c - 1].lower() in _VOWELS) and (c >= 1 and t[c - 1 : c] == 'o'):
+        return 'অ', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS):
+        return 'অ', e
+    return '', e
+
+
+def _parse_43(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'p'.
+    if t.startswith('psh', c):
+        return 'পশ', c + 3
+    if t.startswith('phl', c):
+        return 'ফ্ল', c + 3
+    if t.startswith('pT', c):
+        return 'প্ট', c + 2
+    if t.startswith('pt', c):
+        return 'প্ত', c + 2
+    if t.startswith('pn', c):
+        return 'প্ন', c + 2
+    if t.startswith('pp', c):
+        return 'প্প', c + 2
+    if t.startswith('pl', c):
+        return 'প্ল', c + 2
+    if t.startswith('ps', c):
+        return 'প্স', c + 2
+    if t.startswith('ph', c):
+        return 'ফ', c + 2
+    return 'প', c + 1
+
+
+def _rules_43(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_44(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'q'.
+    return 'ক', c + 1
+
+
+def _rules_44(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_45(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'r'.
+    if t.startswith('rri`', c):
+        return 'ৃ', c + 4
+    if t.startswith('rrZ', c):
+        return 'রর\u200d্য', c + 3
+    if t.startswith('rry', c):
+        return 'রর\u200d্য', c + 3
+    return _rules_45(t, c, n)
+
+
+def _rules_45(t: str, c: int, n: int) -> tuple[str, int]:
+    if t.startswith('rri', c):
+        e = c + 3
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS):
+            return 'ঋ', e
+        if (c == 0 or t[c - 1].lower() not in _LETTERS):
+            return 'ঋ', e
+        return 'ৃ', e
+    if t.startswith('rZ', c):
+        e = c + 2
+        if (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c >= 1 and t[c - 1 : c] == 'r') and not (c >= 1 and t[c - 1 : c] == 'y') and not (c >= 1 and t[c - 1 : c] == 'w') and not (c >= 1 and t[c - 1 : c] == 'x'):
+            return '্র্য', e
+        return 'র\u200d্য', e
+    if t.startswith('ry', c):
+        e = c + 2
+        if (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c >= 1 and t[c - 1 : c] == 'r') and not (c >= 1 and t[c - 1 : c] == 'y') and not (c >= 1 and t[c - 1 : c] == 'w') and not (c >= 1 and t[c - 1 : c] == 'x'):
+            return '্র্য', e
+        return 'র\u200d্য', e
+    if t.startswith('rr', c):
+        e = c + 2
+        if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e < n and t[e].lower() in _VOWELS) and not (e + 1 < n and t[e : e + 1] == 'r') and not (e >= n or t[e].lower() not in _LETTERS):
+            return 'র্', e
+        if (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c >= 1 and t[c - 1 : c] == 'r'):
+            return '্রর', e
+        return 'রর', e
+    e = c + 1
+    if (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c >= 1 and t[c - 1 : c] == 'r') and not (c >= 1 and t[c - 1 : c] == 'y') and not (c >= 1 and t[c - 1 : c] == 'w') and not (c >= 1 and t[c - 1 : c] == 'x') and not (c >= 1 and t[c - 1 : c] == 'Z'):
+        return '্র', e
+    return 'র', e
+
+
+def _parse_46(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 's'.
+    if t.startswith('shch', c):
+        return 'শ্ছ', c + 4
+    if t.startswith('skl', c):
+        return 'স্ক্ল', c + 3
+    if t.startswith('skh', c):
+        return 'স্খ', c + 3
+    if t.startswith('sth', c):
+        return 'স্থ', c + 3
+    if t.startswith('sph', c):
+        return 'স্ফ', c + 3
+    if t.startswith('shc', c):
+        return 'শ্চ', c + 3
+    if t.startswith('sht', c):
+        return 'শ্ত', c + 3
+    if t.startswith('shn', c):
+        return 'শ্ন', c + 3
+    if t.startswith('shm', c):
+        return 'শ্ম', c + 3
+    if t.startswith('shl', c):
+        return 'শ্ল', c + 3
+    if t.startswith('spl', c):
+        return 'স্প্ল', c + 3
+    if t.startswith('sk', c):
+        return 'স্ক', c + 2
+    if t.startswith('sT', c):
+        return 'স্ট', c + 2
+    if t.startswith('st', c):
+        return 'স্ত', c + 2
+    if t.startswith('sn', c):
+        return 'স্ন', c + 2
+    if t.startswith('sp', c):
+        return 'স্প', c + 2
+    if t.startswith('sf', c):
+        return 'স্ফ', c + 2
+    if t.startswith('sm', c):
+        return 'স্ম', c + 2
+    if t.startswith('sl', c):
+        return 'স্ল', c + 2
+    if t.startswith('sh', c):
+        return 'শ', c + 2
+    return 'স', c + 1
+
+
+def _rules_46(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_47(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 't'.
+    if t.startswith('tth', c):
+        return 'ত্থ', c + 3
+    if t.startswith('t``', c):
+        return 'ৎ', c + 3
+    if t.startswith('tn', c):
+        return 'ত্ন', c + 2
+    if t.startswith('tm', c):
+        return 'ত্ম', c + 2
+    if t.startswith('th', c):
+        return 'থ', c + 2
+    if t.startswith('tt', c):
+        return 'ত্ত', c + 2
+    return 'ত', c + 1
+
+
+def _rules_47(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_48(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'u'.
+    if t.startswith('u`', c):
+        return 'ু', c + 2
+    return _rules_48(t, c, n)
+
+
+def _rules_48(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'উ', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and not (e + 1 < n and t[e : e + 1] == '`'):
+        return 'উ', e
+    return 'ু', e
+
+
+def _parse_49(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'v'.
+    if t.startswith('vl', c):
+        return 'ভ্ল', c + 2
+    return 'ভ', c + 1
+
+
+def _rules_49(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_50(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'w'.
+    return _rules_50(t, c, n)
+
+
+def _rules_50(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if (c == 0 or t[c - 1].lower() not in _LETTERS) and (e < n and t[e].lower() in _VOWELS):
+        return 'ওয়', e
+    if (c > 0 and t[c - 1].lower() in _CONSONANTS):
+        return '্ব', e
+    return 'ও', e
+
+
+def _parse_51(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'x'.
+    return _rules_51(t, c, n)
+
+
+def _rules_51(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if (c == 0 or t[c - 1].lower() not in _LETTERS):
+        return 'এক্স', e
+    return 'ক্স', e
+
+
+def _parse_52(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'y'.
+    return _rules_52(t, c, n)
+
+
+def _rules_52(t: str, c: int, n: int) -> tuple[str, int]:
+    e = c + 1
+    if not (c > 0 and t[c - 1].lower() in _CONSONANTS) and not (c == 0 or t[c - 1].lower() not in _LETTERS):
+        return 'য়', e
+    if (c == 0 or t[c - 1].lower() not in _LETTERS):
+        return 'ইয়', e
+    return '্য', e
+
+
+def _parse_53(t: str, c: int, n: int) -> tuple[str, int]:
+    # Candidates for 'z'.
+    return 'য', c + 1
+
+
+def _rules_53(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _parse_default(t: str, c: int, n: int) -> tuple[str, int]:
+    # Fallback.
+    return _rules_default(t, c, n)
+
+
+def _rules_default(t: str, c: int, n: int) -> tuple[str, int]:
+    return t[c], c + 1
+
+
+def _reverse_0(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for ','.
+    return None, ','
+
+
+def _reverse_1(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '.'.
+    if t.startswith('...', c):
+        return None, '...'
+    return '.', '.`'
+
+
+def _reverse_2(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for ':'.
+    return None, ':`'
+
+
+def _reverse_3(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '^'.
+    return None, '^`'
+
+
+def _reverse_4(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '।'.
+    if t.startswith('।।', c):
+        return None, '..'
+    return '.', '.'
+
+
+def _reverse_5(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঁ'.
+    return '', '^'
+
+
+def _reverse_6(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ং'.
+    if t.startswith('ংর', c):
+        return None, 'ngr'
+    return 'ng', 'ng'
+
+
+def _reverse_7(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঃ'.
+    return None, ':'
+
+
+def _reverse_8(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'অ'.
+    if t.startswith('অ্য', c):
+        return None, 'oZ'
+    if t.startswith('অ্যা', c):
+        return None, 'aZ'
+    if t.startswith('অ্যা', c):
+        return None, 'AZ'
+    return None
+
+
+def _reverse_9(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'আ'.
+    return 'a', None
+
+
+def _reverse_10(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ই'.
+    return 'i', None
+
+
+def _reverse_11(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'উ'.
+    return 'u', None
+
+
+def _reverse_12(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'এ'.
+    return 'e', None
+
+
+def _reverse_13(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ও'.
+    return 'w', None
+
+
+def _reverse_14(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ক'.
+    if t.startswith('ক্ষ্ণ', c):
+        return 'kkhn', 'kkhN'
+    if t.startswith('ক্ষ্ণ', c):
+        return 'kkhn', 'kShN'
+    if t.startswith('ক্ষ্ম', c):
+        return None, 'kkhm'
+    if t.startswith('ক্ষ্ম', c):
+        return 'kkh', 'kShm'
+    if t.startswith('ক্ষ্ণ', c):
+        return 'kkh', 'kxN'
+    if t.startswith('ক্ষ্ম', c):
+        return 'kkh', 'kxm'
+    if t.startswith('ক্ষ', c):
+        return 'kkh', 'kkh'
+    if t.startswith('ক্ষ', c):
+        return 'kkh', 'kSh'
+    if t.startswith('কশ', c):
+        return None, 'ksh'
+    if t.startswith('ক্ষ', c):
+        return 'kkh', 'kx'
+    if t.startswith('ক্ক', c):
+        return 'kk', 'kk'
+    if t.startswith('ক্ট', c):
+        return 'kt', 'kT'
+    if t.startswith('ক্ত', c):
+        return 'kt', 'kt'
+    if t.startswith('ক্ল', c):
+        return 'kl', 'kl'
+    if t.startswith('ক্স', c):
+        return 'ks', 'ks'
+    return 'k', 'k'
+
+
+def _reverse_15(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'খ'.
+    return 'kh', 'kh'
+
+
+def _reverse_16(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'গ'.
+    if t.startswith('গ্ধ', c):
+        return 'gdh', 'gdh'
+    if t.startswith('গ্ধ', c):
+        return 'gdh', 'Gdh'
+    if t.startswith('গ্ণ', c):
+        return 'gn', 'gN'
+    if t.startswith('গ্ণ', c):
+        return 'gn', 'GN'
+    if t.startswith('গ্ন', c):
+        return 'gn', 'gn'
+    if t.startswith('গ্ন', c):
+        return 'gn', 'Gn'
+    if t.startswith('গ্ম', c):
+        return None, 'gm'
+    if t.startswith('গ্ম', c):
+        return 'gm', 'Gm'
+    if t.startswith('গ্ল', c):
+        return 'gl', 'gl'
+    if t.startswith('গ্ল', c):
+        return 'gl', 'Gl'
+    return 'g', 'g'
+
+
+def _reverse_17(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঘ'.
+    if t.startswith('ঘ্ন', c):
+        return 'ghn', 'ghn'
+    if t.startswith('ঘ্ন', c):
+        return 'ghn', 'Ghn'
+    return 'gh', 'gh'
+
+
+def _reverse_18(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঙ'.
+    if t.startswith('ঙ্ক্ষ', c):
+        return 'ngkh', 'NgkSh'
+    if t.startswith('ঙ্ক্ষ', c):
+        return 'ngkh', 'Ngkkh'
+    if t.startswith('ঙ্ঘ', c):
+        return None, 'Nggh'
+    if t.startswith('ঙ্খ', c):
+        return 'ngkh', 'Ngkh'
+    if t.startswith('ঙ্গৌ', c):
+        return None, 'ngOU'
+    if t.startswith('ঙ্গৈ', c):
+        return None, 'ngOI'
+    if t.startswith('ঙ্ক্ষ', c):
+        return 'ngkh', 'Ngkx'
+    if t.startswith('ঙ্ঘ', c):
+        return None, 'ngh'
+    if t.startswith('ঙ্ক', c):
+        return 'ngk', 'Ngk'
+    if t.startswith('ঙ্ষ', c):
+        return None, 'Ngx'
+    if t.startswith('ঙ্গ', c):
+        return 'ngg', 'Ngg'
+    if t.startswith('ঙ্ম', c):
+        return None, 'Ngm'
+    if t.startswith('ঙ্খ', c):
+        return 'ngkh', 'nkh'
+    if t.startswith('ঙ্গ', c):
+        return 'ngg', 'ngo'
+    if t.startswith('ঙ্গা', c):
+        return None, 'nga'
+    if t.startswith('ঙ্গি', c):
+        return None, 'ngi'
+    if t.startswith('ঙ্গী', c):
+        return None, 'ngI'
+    if t.startswith('ঙ্গু', c):
+        return None, 'ngu'
+    if t.startswith('ঙ্গূ', c):
+        return None, 'ngU'
+    if t.startswith('ঙ্গে', c):
+        return None, 'nge'
+    if t.startswith('ঙ্গো', c):
+        return None, 'ngO'
+    if t.startswith('ঙর', c):
+        return None, 'Ngr'
+    return 'ng', 'Ng'
+
+
+def _reverse_19(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'চ'.
+    if t.startswith('চ্ঞ', c):
+        return 'cng', 'cNG'
+    if t.startswith('চ্ছ', c):
+        return 'cch', 'cch'
+    if t.startswith('চ্চ', c):
+        return 'cc', 'cc'
+    return 'ch', 'c'
+
+
+def _reverse_20(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ছ'.
+    return None, 'ch'
+
+
+def _reverse_21(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'জ'.
+    if t.startswith('জ্ঞ', c):
+        return 'gg', 'gg'
+    if t.startswith('জ্ঞ', c):
+        return 'gg', 'GG'
+    if t.startswith('জ্ঞ', c):
+        return 'gg', 'Gg'
+    if t.startswith('জ্ঞ', c):
+        return 'gg', 'gG'
+    if t.startswith('জ্ঝ', c):
+        return None, 'jjh'
+    if t.startswith('জ্ঞ', c):
+        return 'gg', 'jNG'
+    if t.startswith('জ্জ', c):
+        return 'jj', 'jj'
+    return 'j', 'j'
+
+
+def _reverse_22(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঝ'.
+    return 'jh', 'jh'
+
+
+def _reverse_23(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঞ'.
+    if t.startswith('ঞ্ছ', c):
+        return 'ngch', 'NGch'
+    if t.startswith('ঞ্ঝ', c):
+        return None, 'NGjh'
+    if t.startswith('ঞ্চ', c):
+        return 'nch', 'NGc'
+    if t.startswith('ঞ্ছ', c):
+        return 'ngch', 'nch'
+    if t.startswith('ঞ্ঝ', c):
+        return None, 'njh'
+    if t.startswith('ঞ্জ', c):
+        return 'ngj', 'NGj'
+    if t.startswith('ঞর', c):
+        return None, 'NGr'
+    if t.startswith('ঞ্জ', c):
+        return 'ngj', 'nj'
+    return 'y', 'NG'
+
+
+def _reverse_24(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ট'.
+    if t.startswith('ট্ট', c):
+        return 'tt', 'TT'
+    if t.startswith('ট্ম', c):
+        return None, 'Tm'
+    return 't', 'T'
+
+
+def _reverse_25(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঠ'.
+    return 'th', 'Th'
+
+
+def _reverse_26(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ড'.
+    if t.startswith('ড্ড', c):
+        return 'dd', 'DD'
+    return 'd', 'D'
+
+
+def _reverse_27(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঢ'.
+    return 'dh', 'Dh'
+
+
+def _reverse_28(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ণ'.
+    if t.startswith('ণ্ঠ', c):
+        return 'nth', 'NTh'
+    if t.startswith('ণ্ঢ', c):
+        return None, 'NDh'
+    if t.startswith('ণ্ণ', c):
+        return None, 'NN'
+    if t.startswith('ণ্ন', c):
+        return None, 'Nn'
+    if t.startswith('ণ্ম', c):
+        return None, 'Nm'
+    if t.startswith('ণ্ট', c):
+        return 'nt', 'NT'
+    if t.startswith('ণ্ড', c):
+        return 'nd', 'ND'
+    return 'n', 'N'
+
+
+def _reverse_29(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ত'.
+    if t.startswith('ত্থ', c):
+        return None, 'tth'
+    if t.startswith('ত্ন', c):
+        return None, 'tn'
+    if t.startswith('ত্ম', c):
+        return 'tt', 'tm'
+    if t.startswith('ত্ত', c):
+        return 'tt', 'tt'
+    return 't', 't'
+
+
+def _reverse_30(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'থ'.
+    return 'th', 'th'
+
+
+def _reverse_31(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'দ'.
+    if t.startswith('দ্ঘ', c):
+        return 'dgh', 'dgh'
+    if t.startswith('দ্ধ', c):
+        return 'ddh', 'ddh'
+    if t.startswith('দ্ভ', c):
+        return 'dv', 'dbh'
+    if t.startswith('দ্ভ', c):
+        return 'dv', 'dv'
+    if t.startswith('দ্ম', c):
+        return 'dd', 'dm'
+    if t.startswith('দ্গ', c):
+        return None, 'dg'
+    if t.startswith('দ্দ', c):
+        return 'dd', 'dd'
+    return 'd', 'd'
+
+
+def _reverse_32(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ধ'.
+    if t.startswith('ধ্ন', c):
+        return 'dhn', 'dhn'
+    if t.startswith('ধ্ম', c):
+        return 'dhm', 'dhm'
+    return 'dh', 'dh'
+
+
+def _reverse_33(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ন'.
+    if t.startswith('ন্ধ', c):
+        return 'ndh', 'ndh'
+    if t.startswith('ন্ঠ', c):
+        return 'nth', 'nTh'
+    if t.startswith('ন্থ', c):
+        return 'nth', 'nth'
+    if t.startswith('নশ', c):
+        return None, 'nsh'
+    if t.startswith('ন্ন', c):
+        return 'nn', 'nn'
+    if t.startswith('ন্ম', c):
+        return 'nm', 'nm'
+    if t.startswith('ন্দ', c):
+        return 'nd', 'nd'
+    if t.startswith('ন্ট', c):
+        return 'nt', 'nT'
+    if t.startswith('ন্ড', c):
+        return 'nd', 'nD'
+    if t.startswith('ন্ত', c):
+        return 'nt', 'nt'
+    if t.startswith('ন্স', c):
+        return None, 'ns'
+    return 'n', 'n'
+
+
+def _reverse_34(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'প'.
+    if t.startswith('পশ', c):
+        return None, 'psh'
+    if t.startswith('প্ট', c):
+        return 'pt', 'pT'
+    if t.startswith('প্ত', c):
+        return 'pt', 'pt'
+    if t.startswith('প্ন', c):
+        return 'pn', 'pn'
+    if t.startswith('প্প', c):
+        return 'pp', 'pp'
+    if t.startswith('প্ল', c):
+        return 'pl', 'pl'
+    if t.startswith('প্স', c):
+        return 'ps', 'ps'
+    return 'p', 'p'
+
+
+def _reverse_35(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ফ'.
+    if t.startswith('ফ্ল', c):
+        return 'fl', 'phl'
+    return 'ph', 'ph'
+
+
+def _reverse_36(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ব'.
+    if t.startswith('ব্ধ', c):
+        return 'bdh', 'bdh'
+    if t.startswith('ব্জ', c):
+        return 'bj', 'bj'
+    if t.startswith('ব্দ', c):
+        return 'bd', 'bd'
+    if t.startswith('ব্ব', c):
+        return 'bb', 'bb'
+    if t.startswith('ব্ল', c):
+        return 'bl', 'bl'
+    return 'b', 'b'
+
+
+def _reverse_37(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ভ'.
+    if t.startswith('ভ্ল', c):
+        return None, 'bhl'
+    return 'bh', 'bh'
+
+
+def _reverse_38(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ম'.
+    if t.startswith('ম্থ', c):
+        return None, 'mth'
+    if t.startswith('ম্ফ', c):
+        return 'mf', 'mph'
+    if t.startswith('ম্ভ', c):
+        return 'mv', 'mbh'
+    if t.startswith('মপ্ল', c):
+        return None, 'mpl'
+    if t.startswith('ম্ন', c):
+        return 'mn', 'mn'
+    if t.startswith('ম্প', c):
+        return 'mp', 'mp'
+    if t.startswith('ম্ভ', c):
+        return 'mv', 'mv'
+    if t.startswith('ম্ম', c):
+        return 'mm', 'mm'
+    if t.startswith('ম্ল', c):
+        return 'ml', 'ml'
+    if t.startswith('ম্ব', c):
+        return 'mb', 'mb'
+    if t.startswith('ম্ফ', c):
+        return 'mf', 'mf'
+    return 'm', 'm'
+
+
+def _reverse_39(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'য'.
+    return 'z', 'z'
+
+
+def _reverse_40(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'র'.
+    if t.startswith('রর\u200d্য', c):
+        return None, 'rrZ'
+    if t.startswith('রর\u200d্য', c):
+        return None, 'rry'
+    return 'r', None
+
+
+def _reverse_41(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ল'.
+    if t.startswith('ল্ভ', c):
+        return None, 'lbh'
+    if t.startswith('ল্ধ', c):
+        return None, 'ldh'
+    if t.startswith('লখ', c):
+        return None, 'lkh'
+    if t.startswith('লঘ', c):
+        return None, 'lgh'
+    if t.startswith('লফ', c):
+        return None, 'lph'
+    if t.startswith('ল্ক', c):
+        return 'lk', 'lk'
+    if t.startswith('ল্গ', c):
+        return None, 'lg'
+    if t.startswith('ল্ট', c):
+        return 'lt', 'lT'
+    if t.startswith('ল্ড', c):
+        return 'ld', 'lD'
+    if t.startswith('ল্প', c):
+        return 'lp', 'lp'
+    if t.startswith('ল্ভ', c):
+        return None, 'lv'
+    if t.startswith('ল্ম', c):
+        return 'lm', 'lm'
+    if t.startswith('ল্ল', c):
+        return 'll', 'll'
+    if t.startswith('ল্ব', c):
+        return 'lb', 'lb'
+    return 'l', 'l'
+
+
+def _reverse_42(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'শ'.
+    if t.startswith('শ্ছ', c):
+        return 'sch', 'shch'
+    if t.startswith('শ্ছ', c):
+        return 'sch', 'Sch'
+    if t.startswith('শ্চ', c):
+        return 'scch', 'shc'
+    if t.startswith('শ্ত', c):
+        return None, 'sht'
+    if t.startswith('শ্ন', c):
+        return 'sn', 'shn'
+    if t.startswith('শ্ম', c):
+        return 'ss', 'shm'
+    if t.startswith('শ্ল', c):
+        return 'sl', 'shl'
+    if t.startswith('শ্চ', c):
+        return 'scch', 'Sc'
+    return 'sh', 'sh'
+
+
+def _reverse_43(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ষ'.
+    if t.startswith('ষ্ঠ', c):
+        return 'sth', 'ShTh'
+    if t.startswith('ষ্ফ', c):
+        return 'sf', 'Shph'
+    if t.startswith('ষ্ক', c):
+        return 'sk', 'Shk'
+    if t.startswith('ষ্ট', c):
+        return 'st', 'ShT'
+    if t.startswith('ষ্ণ', c):
+        return 'sn', 'ShN'
+    if t.startswith('ষ্প', c):
+        return 'sp', 'Shp'
+    if t.startswith('ষ্ফ', c):
+        return 'sf', 'Shf'
+    if t.startswith('ষ্ম', c):
+        return 'sm', 'Shm'
+    return 'sh', 'Sh'
+
+
+def _reverse_44(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'স'.
+    if t.startswith('স্ক্ল', c):
+        return None, 'skl'
+    if t.startswith('স্খ', c):
+        return None, 'skh'
+    if t.startswith('স্থ', c):
+        return 'sth', 'sth'
+    if t.startswith('স্ফ', c):
+        return 'sf', 'sph'
+    if t.startswith('স্প্ল', c):
+        return None, 'spl'
+    if t.startswith('স্ক', c):
+        return 'sk', 'sk'
+    if t.startswith('স্ট', c):
+        return 'st', 'sT'
+    if t.startswith('স্ত', c):
+        return 'st', 'st'
+    if t.startswith('স্ন', c):
+        return 'sn', 'sn'
+    if t.startswith('স্প', c):
+        return 'sp', 'sp'
+    if t.startswith('স্ফ', c):
+        return 'sf', 'sf'
+    if t.startswith('স্ম', c):
+        return 'sh', 'sm'
+    if t.startswith('স্ল', c):
+        return 'sl', 'sl'
+    return 's', 's'
+
+
+def _reverse_45(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'হ'.
+    if t.startswith('হ্ণ', c):
+        return 'nn', 'hN'
+    if t.startswith('হ্ন', c):
+        return 'nn', 'hn'
+    if t.startswith('হ্ম', c):
+        return 'mm', 'hm'
+    if t.startswith('হ্ল', c):
+        return None, 'hl'
+    return 'h', 'h'
+
+
+def _reverse_46(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'া'.
+    return 'a', 'a`'
+
+
+def _reverse_47(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ি'.
+    return 'i', 'i`'
+
+
+def _reverse_48(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ী'.
+    return 'i', 'I`'
+
+
+def _reverse_49(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ু'.
+    return 'u', 'oo`'
+
+
+def _reverse_50(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ূ'.
+    return 'u', 'U`'
+
+
+def _reverse_51(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ৃ'.
+    return 'ri', 'rri`'
+
+
+def _reverse_52(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ে'.
+    return 'e', 'e`'
+
+
+def _reverse_53(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ৈ'.
+    return 'oi', 'OI`'
+
+
+def _reverse_54(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ো'.
+    return 'o', 'O`'
+
+
+def _reverse_55(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ৌ'.
+    return 'ou', 'OU`'
+
+
+def _reverse_56(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '্'.
+    if t.startswith('্য', c):
+        return None, 'Z'
+    if t.startswith('্\u200c', c):
+        return None, ',,'
+    return None
+
+
+def _reverse_57(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ৎ'.
+    return 't', 't``'
+
+
+def _reverse_58(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ড়'.
+    if t.startswith('ড়্গ', c):
+        return None, 'Rg'
+    return 'r', 'R'
+
+
+def _reverse_59(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'ঢ়'.
+    return None, 'Rh'
+
+
+def _reverse_60(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for 'য়'.
+    return 'y', 'Y'
+
+
+def _reverse_61(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '০'.
+    return '0', '0'
+
+
+def _reverse_62(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '১'.
+    return '1', '1'
+
+
+def _reverse_63(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '২'.
+    return '2', '2'
+
+
+def _reverse_64(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৩'.
+    return '3', '3'
+
+
+def _reverse_65(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৪'.
+    return '4', '4'
+
+
+def _reverse_66(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৫'.
+    return '5', '5'
+
+
+def _reverse_67(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৬'.
+    return '6', '6'
+
+
+def _reverse_68(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৭'.
+    return '7', '7'
+
+
+def _reverse_69(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৮'.
+    return '8', '8'
+
+
+def _reverse_70(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৯'.
+    return '9', '9'
+
+
+def _reverse_71(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Candidates for '৳'.
+    return None, '$'
+
+
+def _reverse_default(t: str, c: int) -> tuple[str | None, str | None] | None:
+    # Fallback.
+    return None
+
+
+_PARSE = {
+    '$': _parse_0,
+    ',': _parse_1,
+    '.': _parse_2,
+    '0': _parse_3,
+    '1': _parse_4,
+    '2': _parse_5,
+    '3': _parse_6,
+    '4': _parse_7,
+    '5': _parse_8,
+    '6': _parse_9,
+    '7': _parse_10,
+    '8': _parse_11,
+    '9': _parse_12,
+    ':': _parse_13,
+    'A': _parse_14,
+    'D': _parse_15,
+    'G': _parse_16,
+    'I': _parse_17,
+    'J': _parse_18,
+    'N': _parse_19,
+    'O': _parse_20,
+    'R': _parse_21,
+    'S': _parse_22,
+    'T': _parse_23,
+    'U': _parse_24,
+    'Y': _parse_25,
+    'Z': _parse_26,
+    '^': _parse_27,
+    'a': _parse_28,
+    'b': _parse_29,
+    'c': _parse_30,
+    'd': _parse_31,
+    'e': _parse_32,
+    'f': _parse_33,
+    'g': _parse_34,
+    'h': _parse_35,
+    'i': _parse_36,
+    'j': _parse_37,
+    'k': _parse_38,
+    'l': _parse_39,
+    'm': _parse_40,
+    'n': _parse_41,
+    'o': _parse_42,
+    'p': _parse_43,
+    'q': _parse_44,
+    'r': _parse_45,
+    's': _parse_46,
+    't': _parse_47,
+    'u': _parse_48,
+    'v': _parse_49,
+    'w': _parse_50,
+    'x': _parse_51,
+    'y': _parse_52,
+    'z': _parse_53,
+}
+
+_REVERSE = {
+    ',': _reverse_0,
+    '.': _reverse_1,
+    ':': _reverse_2,
+    '^': _reverse_3,
+    '।': _reverse_4,
+    'ঁ': _reverse_5,
+    'ং': _reverse_6,
+    'ঃ': _reverse_7,
+    'অ': _reverse_8,
+    'আ': _reverse_9,
+    'ই': _reverse_10,
+    'উ': _reverse_11,
+    'এ': _reverse_12,
+    'ও': _reverse_13,
+    'ক': _reverse_14,
+    'খ': _reverse_15,
+    'গ': _reverse_16,
+    'ঘ': _reverse_17,
+    'ঙ': _reverse_18,
+    'চ': _reverse_19,
+    'ছ': _reverse_20,
+    'জ': _reverse_21,
+    'ঝ': _reverse_22,
+    'ঞ': _reverse_23,
+    'ট': _reverse_24,
+    'ঠ': _reverse_25,
+    'ড': _reverse_26,
+    'ঢ': _reverse_27,
+    'ণ': _reverse_28,
+    'ত': _reverse_29,
+    'থ': _reverse_30,
+    'দ': _reverse_31,
+    'ধ': _reverse_32,
+    'ন': _reverse_33,
+    'প': _reverse_34,
+    'ফ': _reverse_35,
+    'ব': _reverse_36,
+    'ভ': _reverse_37,
+    'ম': _reverse_38,
+    'য': _reverse_39,
+    'র': _reverse_40,
+    'ল': _reverse_41,
+    'শ': _reverse_42,
+    'ষ': _reverse_43,
+    'স': _reverse_44,
+    'হ': _reverse_45,
+    'া': _reverse_46,
+    'ি': _reverse_47,
+    'ী': _reverse_48,
+    'ু': _reverse_49,
+    'ূ': _reverse_50,
+    'ৃ': _reverse_51,
+    'ে': _reverse_52,
+    'ৈ': _reverse_53,
+    'ো': _reverse_54,
+    'ৌ': _reverse_55,
+    '্': _reverse_56,
+    'ৎ': _reverse_57,
+    'ড়': _reverse_58,
+    'ঢ়': _reverse_59,
+    'য়': _reverse_60,
+    '০': _reverse_61,
+    '১': _reverse_62,
+    '২': _reverse_63,
+    '৩': _reverse_64,
+    '৪': _reverse_65,
+    '৫': _reverse_66,
+    '৬': _reverse_67,
+    '৭': _reverse_68,
+    '৮': _reverse_69,
+    '৯': _reverse_70,
+    '৳': _reverse_71,
+}
@@ -0,0 +1,333 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Splitting single large texts into chunks that convert independently.
+
+Every conversion only looks a few characters around the cursor, and some
+characters are never looked across, so text can be split right after them
+and the chunks converted on their own (and concurrently), joining up to
+exactly what converting the whole text gives:
+
+- parse() splits after separators (see PhoneticTables.separators()).
+- reverse() splits after the delimiters it splits text at anyway (see
+  main.REVERSE_REGEX).
+- to_bijoy() and to_unicode() split after whitespace, unless what follows
+  it is a sign the rearrangements move around or look behind from, or
+  what's before it is a halant, which they move signs past the character
+  after (see processor.rearrange_unicode_text() and
+  processor.rearrange_bijoy_text()).
+
+Custom phrases span whitespace, so whitespace isn't split at while there
+are any. A literal remap marker can pair up with any later one, so parse()
+only splits text ahead of the first (see limit()). Whether exception words
+left anything to parse also depends on the text before it, which always
+ends with a separator that is left to parse, so the chunk with the marker
+is converted after that separator.
+
+The Bijoy converters strip their result, so their chunks are converted
+between sentinels which no table contains and nothing moves across (but
+the first one, which starts the text anyway).
+
+wrap() and unwrap() take care of all of the above.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import os
+import re
+import string
+import unicodedata
+
+from . import config, tables
+from .cache import once
+
+# The operations that can be split.
+OPERATIONS: tuple[str, ...] = ("parse", "reverse", "to_bijoy", "to_unicode")
+
+# Wrapped around the chunks of the Bijoy converters.
+SENTINEL = "\x00"
+
+# The smallest chunk worth shipping to a worker.
+_MIN_CHUNK = 1 << 16
+
+# Literal remap markers in the text (see main._process_remapped()).
+_MARKER = "<rm>"
+
+# The delimiters of main.REVERSE_REGEX, but whitespace.
+_DELIMITERS = ".,?।\\-;'"
+
+_BOUNDARIES: dict[tuple[str, bool], re.Pattern[str]] = {}
+
+
+# Functions.
+@once
+def _moved() -> frozenset[str]:
+    # Unicode characters the rearrangements move, or look behind from:
+    # Bengali signs (kars among them) and joiners, and the "র" of a reph.
+    # Only the Bijoy tables are looked at, so that the Bijoy converters
+    # don't load the phonetic dictionary.
+    signs = {
+        char
+        for char in map(chr, range(0x0980, 0x0A00))
+        if unicodedata.category(char).startswith("M")
+    }
+    signs.update(config.BIJOY_PREKAR, config.BIJOY_POSTKAR)
+    signs.update(config.BIJOY_EXCEPTIONS["nukta"])
+    signs.update(config.BIJOY_EXCEPTIONS["halant"])
+    return frozenset(signs | {"র", "\u200c", "\u200d"})
+
+
+@once
+def _moved_bijoy() -> frozenset[str]:
+    # Bijoy characters starting a sequence converted to one of the above
+    # (or one of them, passed through as is).
+    moved = _moved()
+    return moved | {
+        key[0]
+        for key, value in tables.bijoy().reverse.items()
+        if value[:1] in moved
+    }
+
+
+@once
+def _halants() -> frozenset[str]:
+    # Characters converted to a halant, which moves the sign before it past
+    # the character after it (see processor.rearrange_bijoy_text()).
+    halant = config.BIJOY_EXCEPTIONS["halant"]
+    return frozenset(
+        {halant}
+        | {
+            key[-1]
+            for key, value in tables.bijoy().reverse.items()
+            if value.endswith(halant)
+        }
+    )
+
+
+def _unsafe(operation: str) -> frozenset[str]:
+    # Characters that chunks of an operation must not start with.
+    if operation == "to_bijoy":
+        return _moved()
+    if operation == "to_unicode":
+        return _moved_bijoy()
+    return frozenset()
+
+
+def boundary(operation: str, phrases: bool = False) -> re.Pattern[str]:
+    """Returns the pattern of the characters an operation splits text after.
+
+    Parameters:
+    -----------
+
+    operation: str
+        One of OPERATIONS.
+
+    phrases: bool = False
+        Whether there are custom phrases (in the direction of the
+        operation), which keeps whitespace from being split at.
+
+    Returns:
+    --------
+
+    re.Pattern[str]
+        The pattern, matching the character to split after.
+    """
+
+    key = (operation, phrases)
+    pattern = _BOUNDARIES.get(key)
+    if pattern is not None:
+        return pattern
+
+    if operation == "parse":
+        separators = tables.phonetic().separators()
+        if phrases:
+            separators -= frozenset(string.whitespace)
+        chars = "".join(sorted(separators))
+        source = f"[{re.escape(chars)}]" if chars else "(?!)"
+    elif operation == "reverse":
+        source = f"[{_DELIMITERS}]" if phrases else rf"[\s{_DELIMITERS}]"
+    elif operation in OPERATIONS:
+        unsafe = "".join(sorted(_unsafe(operation)))
+        halants = "".join(sorted(_halants()))
+        source = rf"(?<![{re.escape(halants)}])\s(?=[^{re.escape(unsafe)}])"
+    else:
+        raise ValueError(f"Unknown operation: {operation!r}")
+
+    # A concurrent duplicate is harmless.
+    pattern = _BOUNDARIES[key] = re.compile(source)
+    return pattern
+
+
+def limit(text: str, operation: str) -> int:
+    """Returns how far into text an operation can split it.
+
+    parse() splits text up to the first literal remap marker. Other
+    operations can split text anywhere.
+    """
+
+    if operation != "parse":
+        return len(text)
+    found = text.find(_MARKER)
+    return len(text) if found == -1 else found
+
+
+def split(
+    text: str,
+    operation: str,
+    max_workers: int | None = None,
+    *,
+    phrases: bool = False,
+    size: int | None = None,
+) -> list[str]:
+    """Splits text into a few chunks per worker, converting independently.
+
+    Parameters:
+    -----------
+
+    text: str
+        The text to split.
+
+    operation: str
+        The operation the chunks are for: one of OPERATIONS.
+
+    max_workers: int | None = None
+        The number of workers. Defaults to the CPU count if None.
+
+    phrases: bool = False
+        Whether there are custom phrases (see boundary()).
+
+    size: int | None = None
+        The smallest size of a chunk. Defaults to a few chunks per worker,
+        of 64K characters at least.
+
+    Returns:
+    --------
+
+    list[str]
+        The chunks, in order. The whole text if it can't (or needn't) be
+        split.
+    """
+
+    pattern = boundary(operation, phrases)
+
+    if size is None:
+        workers = max_workers or os.cpu_count() or 1
+        size = max(_MIN_CHUNK, -(-len(text) // (workers * 4)))
+
+    if len(text) <= size:
+        return [text]
+
+    end = limit(text, operation)
+    chunks: list[str] = []
+    start = 0
+    while end - start > size:
+        match = pattern.search(text, start + size - 1, end)
+        if match is None:
+            break
+        chunks.append(text[start : match.end()])
+        start = match.end()
+
+    if start < len(text):
+        chunks.append(text[start:])
+
+    return chunks
+
+
+def around(
+    chunk: str, operation: str, previous: str, last: bool
+) -> tuple[str, str]:
+    """Returns the text a chunk is converted between, to be dropped from
+    (the start and the end of) its conversion.
+
+    Parameters:
+    -----------
+
+    chunk: str
+        The chunk.
+
+    operation: str
+        One of OPERATIONS.
+
+    previous: str
+        The text before the chunk (or its end), empty for the first chunk.
+
+    last: bool
+        Whether the chunk ends the text.
+
+    Returns:
+    --------
+
+    tuple[str, str]
+        The text to convert the chunk after, and before. Both are empty or
+        convert to a single character.
+    """
+
+    if operation in ("to_bijoy", "to_unicode"):
+        return SENTINEL if previous else "", "" if last else SENTINEL
+    if operation == "parse" and previous and _MARKER in chunk:
+        return previous[-1], ""
+    return "", ""
+
+
+def wrap(chunks: list[str], operation: str) -> list[str]:
+    """Prepares the chunks from split() to be converted (see around()).
+
+    Parameters:
+    -----------
+
+    chunks: list[str]
+        The chunks, in order.
+
+    operation: str
+        One of OPERATIONS.
+
+    Returns:
+    --------
+
+    list[str]
+        The text to convert for every chunk.
+    """
+
+    wrapped = []
+    for i, chunk in enumerate(chunks):
+        before, after = around(
+            chunk, operation, chunks[i - 1] if i else "", i == len(chunks) - 1
+        )
+        wrapped.append(before + chunk + after)
+    return wrapped
+
+
+def unwrap(outputs: list[str], chunks: list[str], operation: str) -> str:
+    """Joins the conversions of the chunks from wrap().
+
+    Parameters:
+    -----------
+
+    outputs: list[str]
+        The conversions, in order.
+
+    chunks: list[str]
+        The chunks, in order.
+
+    operation: str
+        One of OPERATIONS.
+
+    Returns:
+    --------
+
+    str
+        The conversion of the whole text.
+    """
+
+    pieces = []
+    for i, (output, chunk) in enumerate(zip(outputs, chunks)):
+        before, after = around(
+            chunk, operation, chunks[i - 1] if i else "", i == len(chunks) - 1
+        )
+        pieces.append(output[len(before) : len(output) - len(after)])
+
+    joined = "".join(pieces)
+    if operation in ("to_bijoy", "to_unicode"):
+        # The whole text is stripped, as the converters would.
+        return joined.strip()
+    return joined
@@ -4,17 +4,11 @@
 # Imports.
 import contextlib
 import re
-from functools import lru_cache
-
-from . import validate
-from .config import (
-    AVRO_EXCEPTIONS,
-    AVRO_IGNORE,
-    AVRO_KAR,
-    AVRO_SHONGKHA,
-    AVRO_SHORBORNO,
-)
-from ..resources import DICT
+import threading
+
+from . import config, tables, validate
+from .cache import once, thread_cache
+from .tables import Pattern, Rule, RuleMatch
 from ..resources.dictionary import (
     PatternDict,
     PatternRule,
@@ -23,9 +17,41 @@ from ..resources.dictionary import (
 
 
 # Setup pattern variables for matching.
-PATTERNS = DICT["avro"]["patterns"]
-NON_RULE_PATTERNS = [p for p in PATTERNS if "rules" not in p]
-RULE_PATTERNS = [p for p in PATTERNS if "rules" in p]
+# These are split out of the dictionary on first use rather than at import
+# time, and are published together as a single tuple. PATTERNS,
+# NON_RULE_PATTERNS and RULE_PATTERNS remain available as module attributes.
+_PATTERN_NAMES = ("PATTERNS", "NON_RULE_PATTERNS", "RULE_PATTERNS")
+_PATTERN_TABLES: (
+    tuple[list[PatternDict], list[PatternDict], list[PatternDict]] | None
+) = None
+_PATTERN_LOCK = threading.Lock()
+
+
+def _pattern_tables() -> tuple[
+    list[PatternDict], list[PatternDict], list[PatternDict]
+]:
+    """Returns all, non-rule and rule patterns, loading them if needed."""
+    global _PATTERN_TABLES
+
+    if _PATTERN_TABLES is None:
+        with _PATTERN_LOCK:
+            if _PATTERN_TABLES is None:
+                from ..resources.phonetic import PHONETIC
+
+                patterns = PHONETIC["patterns"]
+                _PATTERN_TABLES = (
+                    patterns,
+                    [p for p in patterns if "rules" not in p],
+                    [p for p in patterns if "rules" in p],
+                )
+
+    return _PATTERN_TABLES
+
+
+def __getattr__(name: str) -> list[PatternDict]:
+    if name not in _PATTERN_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _pattern_tables()[_PATTERN_NAMES.index(name)]
 
 
 # ---
@@ -37,7 +63,7 @@ RULE_PATTERNS = [p for p in PATTERNS if "rules" in p]
 # ---
 
 
-@lru_cache(maxsize=128)
+@thread_cache(maxsize=128)
 def find_in_remap(text: str, *, reversed: bool = False) -> tuple[str, bool]:
     """Finds and returns the remapped value for a given text.
 
@@ -56,7 +82,31 @@ def find_in_remap(text: str, *, reversed: bool = False) -> tuple[str, bool]:
         2. Whether manual intervention is required.
     """
 
-    for key, value in AVRO_EXCEPTIONS.items():
+    return _mark_manual(tables.phonetic().remap(text, reversed))
+
+
+def find_in_remap_reference(
+    text: str, *, reversed: bool = False
+) -> tuple[str, bool]:
+    """Same as find_in_remap(), replacing one exception at a time.
+
+    This is the reference implementation used by the "legacy" engine.
+
+    Parameters:
+    -----------
+    text: str
+        The text to be remapped.
+    reversed: bool
+        Whether to operate in reverse mode.
+
+    Returns:
+    -----------
+    tuple[str, bool]
+        The remapped text with markers, and whether manual intervention is
+        required.
+    """
+
+    for key, value in config.AVRO_EXCEPTIONS.items():
         if reversed:
             pattern = re.compile(re.escape(key), re.IGNORECASE)
             text = pattern.sub(lambda m: "<rm>" + value + "</rm>", text)
@@ -64,6 +114,11 @@ def find_in_remap(text: str, *, reversed: bool = False) -> tuple[str, bool]:
             pattern = re.compile(re.escape(value.lower()), re.IGNORECASE)
             text = pattern.sub(lambda m: "<rm>" + key + "</rm>", text)
 
+    return _mark_manual(text)
+
+
+def _mark_manual(text: str) -> tuple[str, bool]:
+    # Whether any part of the remapped text is left to be processed.
     segments = re.split(r"(<rm>.*?</rm>)", text)
     manual_required = any(
         segment
@@ -78,6 +133,9 @@ def match_patterns(
 ) -> dict[str, str | bool | list[PatternRule] | None]:
     """Matches given text at cursor position with rule / non rule patterns.
 
+    This scans the dictionary patterns as-is, and is used by the "legacy"
+    engine as the reference for first_match().
+
     Parameters:
     -----------
 
@@ -105,7 +163,8 @@ def match_patterns(
         5. rules: dict[str, Any]
     """
 
-    rule_type = NON_RULE_PATTERNS if not rule else RULE_PATTERNS
+    _, non_rule_patterns, rule_patterns = _pattern_tables()
+    rule_type = non_rule_patterns if not rule else rule_patterns
     pattern = exact_find_in_pattern(fixed_text, reversed, cur, rule_type)
 
     if pattern:
@@ -131,11 +190,96 @@ def match_patterns(
     }
 
 
+def first_match(
+    fixed_text: str, cur: int = 0, rule: bool = False, reversed: bool = False
+) -> Pattern | None:
+    """Returns the first pattern that matches given text at cursor position.
+
+    This is equivalent to the first item of exact_find_in_pattern() over the
+    rule / non rule patterns, but only tries the patterns starting with the
+    character at the cursor (see tables.PhoneticTables).
+
+    Parameters:
+    -----------
+
+    fixed_text: str
+        The text to be matched.
+
+    cur: int = 0
+        The cursor position.
+
+    rule: bool = False
+        Whether to match rule patterns.
+
+    reversed: bool = False
+        Whether to operate in reverse mode.
+
+    Returns:
+    --------
+
+    Pattern | None
+        The record of the matching pattern, if any.
+    """
+
+    char = fixed_text[cur] if cur < len(fixed_text) else ""
+    candidates = tables.phonetic().candidates(char, rule, reversed)
+
+    if reversed:
+        for pattern in candidates:
+            if fixed_text.startswith(pattern.replace, cur):  # type: ignore[arg-type]
+                return pattern
+    else:
+        for pattern in candidates:
+            if fixed_text.startswith(pattern.find, cur):  # type: ignore[arg-type]
+                return pattern
+
+    return None
+
+
+def parse_step(fixed_text: str, cur: int) -> tuple[int, str]:
+    """Parses the (ASCII) character at cursor position and what follows it.
+
+    This is one step of the parser: the longest matching pattern, or the
+    character itself if nothing matches.
+
+    Parameters:
+    -----------
+
+    fixed_text: str
+        The text to be parsed.
+
+    cur: int
+        The cursor position.
+
+    Returns:
+    --------
+
+    tuple[int, str]
+        Where the next step starts, and the output of this one.
+    """
+
+    pattern = first_match(fixed_text, cur)
+
+    if pattern is not None and pattern.replace is not None:
+        return cur + len(pattern.find), pattern.replace  # type: ignore[arg-type]
+
+    pattern = first_match(fixed_text, cur, rule=True)
+
+    if pattern is not None and pattern.rules is not None:
+        cur_end = cur + len(pattern.find)  # type: ignore[arg-type]
+        replaced = apply_rules(pattern.rules, fixed_text, cur, cur_end)
+        if replaced:
+            return cur_end, replaced
+        return cur_end, pattern.replace or ""
+
+    return cur + 1, fixed_text[cur]
+
+
 def exact_find_in_pattern(
     fixed_text: str,
     reversed: bool,
     cur: int = 0,
-    patterns: list[PatternDict] = PATTERNS,
+    patterns: list[PatternDict] | None = None,
 ) -> list[PatternDict]:
     """Returns pattern items that match given text, cursor position and pattern.
 
@@ -151,8 +295,8 @@ def exact_find_in_pattern(
     cur: int = 0
         The cursor position.
 
-    patterns: Any = PATTERNS
-        The patterns to be matched.
+    patterns: Any = None
+        The patterns to be matched. Defaults to all patterns.
 
     Returns:
     --------
@@ -161,6 +305,9 @@ def exact_find_in_pattern(
         A list of dictionaries containing the matched patterns.
     """
 
+    if patterns is None:
+        patterns = _pattern_tables()[0]
+
     if reversed:
         return [
             x
@@ -211,17 +358,17 @@ def reverse_with_rules(
     added_suffix = ""
 
     if not (
-        fixed_text[cursor] in AVRO_KAR
-        or fixed_text[cursor] in AVRO_SHONGKHA
-        or fixed_text[cursor] in AVRO_SHORBORNO
-        or fixed_text[cursor] in AVRO_IGNORE
+        fixed_text[cursor] in config.AVRO_KAR
+        or fixed_text[cursor] in config.AVRO_SHONGKHA
+        or fixed_text[cursor] in config.AVRO_SHORBORNO
+        or fixed_text[cursor] in config.AVRO_IGNORE
         or len(fixed_text) == cursor + 1
     ):
         added_suffix = "o"
 
     with contextlib.suppress(IndexError):
-        if (fixed_text[cursor + 1] in AVRO_KAR) or (
-            fixed_text[cursor + 2] in AVRO_KAR and not cursor == 0
+        if (fixed_text[cursor + 1] in config.AVRO_KAR) or (
+            fixed_text[cursor + 2] in config.AVRO_KAR and not cursor == 0
         ):
             added_suffix = ""
 
@@ -384,6 +531,117 @@ def process_match(
     return replace
 
 
+def apply_rules(
+    rules: tuple[Rule, ...], fixed_text: str, cur: int = 0, cur_end: int = 1
+) -> str | None:
+    """Same as process_rules(), for the rule records of a compiled pattern.
+
+    Parameters:
+    -----------
+
+    rules: tuple[Rule, ...]
+        The rules to be processed.
+
+    fixed_text: str
+        The fixed text.
+
+    cur: int = 0
+        The cursor position.
+
+    cur_end: int = 1
+        The end cursor position.
+
+    Returns:
+    --------
+
+    Optional[str]
+        The replaced text if any rule's condition is satisfied, else None.
+    """
+
+    for rule in rules:
+        matched = False
+
+        for match in rule.matches:
+            matched = check_match(match, fixed_text, cur, cur_end)
+
+            if not matched:
+                break
+
+        if matched:
+            return rule.replace
+
+    return None
+
+
+def check_match(
+    match: RuleMatch, fixed_text: str, cur: int, cur_end: int
+) -> bool:
+    """Same as process_match(), for a compiled rule condition.
+
+    Parameters:
+    -----------
+
+    match: RuleMatch
+        The condition to be checked.
+
+    fixed_text: str
+        The fixed text.
+
+    cur: int
+        The cursor position.
+
+    cur_end: int
+        The end cursor position.
+
+    Returns:
+    --------
+
+    bool
+        True if the condition is satisfied, else False.
+    """
+
+    match_type, scope, negative, value = match
+
+    if match_type is None:
+        return False
+
+    prefix = match_type == "prefix"
+    chk = cur - 1 if prefix else cur_end
+
+    if scope == "punctuation":
+        return (
+            (chk < 0 and prefix)
+            or (chk >= len(fixed_text) and match_type == "suffix")
+            or validate.is_punctuation(fixed_text[chk])
+        ) != negative
+
+    if scope == "vowel" or scope == "consonant":
+        in_range = (chk >= 0 and prefix) or (
+            chk < len(fixed_text) and match_type == "suffix"
+        )
+        return (
+            in_range
+            and (
+                validate.is_vowel(fixed_text[chk])
+                if scope == "vowel"
+                else validate.is_consonant(fixed_text[chk])
+            )
+        ) != negative
+
+    if scope == "exact":
+        if not isinstance(value, str):
+            return False
+        if prefix:
+            return validate.is_exact(
+                value, fixed_text, cur - len(value), cur, negative
+            )
+        return validate.is_exact(
+            value, fixed_text, cur_end, cur_end + len(value), negative
+        )
+
+    return True
+
+
 def rearrange_unicode_text(text: str) -> str:
     """Rearranges Unicode (Avro) text to match conversion standards for ASCII.
 
@@ -404,8 +662,9 @@ def rearrange_unicode_text(text: str) -> str:
     chars = list(text)
     length = len(chars)
     barrier = 0
+    i = 0
 
-    for i in range(length):
+    while i < length:
         if validate.is_bangla_prekar(chars[i]):
             j = 1
 
@@ -417,42 +676,62 @@ def rearrange_unicode_text(text: str) -> str:
             ):
                 j += 2
 
-            chars[i - j], chars[i] = chars[i], chars[i - j]
+            # Nothing is before a sign at the start of the text.
+            if i - j >= 0:
+                chars[i - j], chars[i] = chars[i], chars[i - j]
             barrier = i + 1
 
+        # A reph (not part of a conjunct itself) moves after the consonants
+        # it's written over, if any.
         if (
-            i < length - 1
+            0 < i < length - 1
             and validate.is_bangla_halant(chars[i])
             and chars[i - 1] == "র"
-            and not validate.is_bangla_halant(chars[i - 2])
+            and (i < 2 or not validate.is_bangla_halant(chars[i - 2]))
+            and validate.is_bangla_banjonborno(chars[i + 1])
         ):
             j = 1
             found_pre_kar = 0
 
-            while True:
-                if validate.is_bangla_banjonborno(chars[i + j]):
-                    if validate.is_bangla_halant(chars[i + j + 1]):
-                        j += 2
-                    elif validate.is_bangla_prekar(chars[i + j + 1]):
-                        found_pre_kar = 1
-                        break
+            # Skip the conjunct following the reph, up to its pre-kar.
+            while i + j + 1 < length and validate.is_bangla_banjonborno(
+                chars[i + j]
+            ):
+                if validate.is_bangla_halant(chars[i + j + 1]):
+                    j += 2
                 else:
+                    found_pre_kar = int(
+                        validate.is_bangla_prekar(chars[i + j + 1])
+                    )
                     break
 
             chars = (
                 chars[: i - 1]
-                + [chars[i + j + 1]]
+                + chars[i + j + 1 : i + j + found_pre_kar + 1]
                 + chars[i + 1 : i + j + 1]
                 + [chars[i - 1]]
                 + [chars[i]]
                 + chars[i + j + found_pre_kar + 1 :]
             )
+            # Carry on after the moved reph, rather than moving it again at
+            # every halant that follows.
             i += j + found_pre_kar
             barrier = i + 1
 
+        i += 1
+
     return "".join(chars)
 
 
+@once
+def _bijoy_moves() -> re.Pattern[str]:
+    # The characters rearrange_bijoy_text() moves text around; nothing
+    # happens anywhere else, so it skips straight to the next of them.
+    chars = {"\u09cd", "র", "ঁ", config.BIJOY_EXCEPTIONS["halant"]}
+    chars.update(config.BIJOY_PREKAR)
+    return re.compile(f"[{re.escape(''.join(sorted(chars)))}]")
+
+
 def rearrange_bijoy_text(text: str) -> str:
     """Rearranges Bijoy Keyboard text to match conversion standards for Unicode.
 
@@ -469,8 +748,14 @@ def rearrange_bijoy_text(text: str) -> str:
         The rearranged text.
     """
 
+    moves = _bijoy_moves()
     i = 0
     while i < len(text):
+        found = moves.search(text, i)
+        if found is None:
+            break
+        i = found.start()
+
         if (
             i > 0
             and text[i] == "\u09cd"
@@ -492,7 +777,7 @@ def rearrange_bijoy_text(text: str) -> str:
             0 < i < len(text) - 1
             and text[i] == "\u09cd"
             and text[i - 1] == "\u09b0"
-            and text[i - 2] != "\u09cd"
+            and (i < 2 or text[i - 2] != "\u09cd")
             and validate.is_bangla_kar(text[i + 1])
         ):
             text = (
@@ -504,23 +789,28 @@ def rearrange_bijoy_text(text: str) -> str:
             )
 
         if (
-            i < len(text) - 1
+            0 < i < len(text) - 1
             and text[i] == "র"
             and validate.is_bangla_halant(text[i + 1])
             and not validate.is_bangla_halant(text[i - 1])
         ):
+            # Nothing before the start of the text is looked at (the
+            # indexes would wrap around to its end).
             j = 1
             while True:
                 if i - j < 0:
                     break
-                if validate.is_bangla_banjonborno(
-                    text[i - j]
-                ) and validate.is_bangla_halant(text[i - j - 1]):
+                if (
+                    i - j > 0
+                    and validate.is_bangla_banjonborno(text[i - j])
+                    and validate.is_bangla_halant(text[i - j - 1])
+                ):
                     j += 2
                 elif j == 1 and validate.is_bangla_kar(text[i - j]):
                     j += 1
                 else:
                     break
+            j = min(j, i)
             text = (
                 text[: i - j]
                 + text[i]
@@ -538,7 +828,11 @@ def rearrange_bijoy_text(text: str) -> str:
         ):
             j = 1
             part = ""
-            while validate.is_bangla_banjonborno(text[i + j]):
+            while i + j < len(text) and validate.is_bangla_banjonborno(
+                text[i + j]
+            ):
+                if i + j + 1 == len(text):
+                    break
                 if validate.is_bangla_halant((part := text[i + j + 1])):
                     j += 2
                 else:
@@ -0,0 +1,256 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Typing sessions, for input methods fed one keystroke at a time.
+
+A session keeps the word being typed (everything since the last separator,
+see PhoneticTables.separators()) along with the steps of the parser over
+it: where every match started and what it output. A keystroke can only
+change the matches starting within a few characters of its position (the
+longest pattern plus the farthest rule condition after it), so only those
+are undone and parsed again, and the cost of a keystroke doesn't depend on
+the length of the word. Typing a separator completes the word, which is
+then parsed as a whole, once.
+
+Exception words (and custom words) replace whole stretches of text, so a
+word containing one of them is parsed as a whole on every keystroke.
+"""
+
+# Imports.
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import processor, tables, validate
+from .cache import once
+
+if TYPE_CHECKING:
+    from .custom import Snapshot
+
+# Literal remap markers in the text (see main._process_remapped()).
+_MARKER = "<rm>"
+
+
+# Classes.
+class Keystroke(NamedTuple):
+    """What a keystroke changed: the number of characters to delete from
+    the end of the output, and the text to insert in their place."""
+
+    deleted: int
+    inserted: str
+
+
+class TypingSession:
+    """Parses text as it's typed, one keystroke at a time.
+
+    Parameters:
+    -----------
+
+    convert: Callable[[str], str]
+        Parses a whole word (see main.Transliterator._parse()).
+
+    separators: Iterable[str]
+        The characters that complete a word.
+
+    remap_words: bool
+        Whether convert() parses text with remapped (exception) words.
+
+    custom: Snapshot | None = None
+        The snapshot of custom words convert() runs on, if any.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[str], str],
+        separators: Iterable[str],
+        remap_words: bool,
+        custom: Snapshot | None = None,
+    ) -> None:
+        self._convert = convert
+        self._separators = frozenset(separators)
+        self._remap_words = remap_words
+        self._custom = custom
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets everything typed so far, e.g. when the cursor moves."""
+
+        # The completed words, and their output.
+        self._words: list[str] = []
+        self._outputs: list[str] = []
+        self._start_word("")
+
+    def _start_word(self, text: str) -> None:
+        # The word being typed: as typed, and case-fixed.
+        self._raw = text
+        self._fixed = validate.fix_string_case(text)
+        # Where the parser steps end, and their output.
+        self._ends: list[int] = []
+        self._pieces: list[str] = []
+        # The output of the word parsed as a whole, if it has to be.
+        self._whole: str | None = None
+
+        if self._needs_whole(False) or self._has_exception():
+            self._whole = self._convert(text)
+        else:
+            self._step(0)
+
+    @property
+    def text(self) -> str:
+        """Everything typed so far."""
+
+        return "".join(self._words) + self._raw
+
+    @property
+    def output(self) -> str:
+        """The parsed text."""
+
+        return "".join(self._outputs) + self._word_output()
+
+    def _word_output(self) -> str:
+        if self._whole is not None:
+            return self._whole
+        return "".join(self._pieces)
+
+    def press(self, key: str) -> Keystroke:
+        """Types a character.
+
+        Parameters:
+        -----------
+
+        key: str
+            The character.
+
+        Returns:
+        --------
+
+        Keystroke
+            The change of the output.
+        """
+
+        if len(key) != 1:
+            raise ValueError(f"Expected a single character, got {key!r}")
+
+        if key in self._separators:
+            word = self._raw + key
+            previous = self._word_output()
+            output = self._convert(word)
+            self._words.append(word)
+            self._outputs.append(output)
+            self._start_word("")
+            return _keystroke(previous, output)
+
+        self._raw += key
+        self._fixed += validate.fix_string_case(key)
+        return self._update(len(self._fixed) - 1, True)
+
+    def backspace(self) -> Keystroke:
+        """Deletes the last character typed.
+
+        Returns:
+        --------
+
+        Keystroke
+            The change of the output.
+        """
+
+        if not self._raw:
+            if not self._words:
+                return Keystroke(0, "")
+
+            # Back into the previous word.
+            self._outputs.pop()
+            self._start_word(self._words.pop())
+
+        self._raw = self._raw[:-1]
+        self._fixed = self._fixed[:-1]
+        return self._update(len(self._fixed), False)
+
+    def _needs_whole(self, appended: bool) -> bool:
+        # Whether the word has to be parsed as a whole.
+        if not self._remap_words:
+            return False
+
+        if self._custom and any(
+            custom for _, custom in self._custom.split(self._raw)
+        ):
+            return True
+
+        if self._whole is None:
+            # Steps are only used while there's no exception word, so that
+            # only the last keystroke can have completed one.
+            return appended and (
+                tables.phonetic().exception_ends(self._fixed)
+                or self._fixed.endswith(_MARKER)
+            )
+
+        return self._has_exception()
+
+    def _has_exception(self) -> bool:
+        return self._remap_words and (
+            _MARKER in self._fixed
+            or tables.phonetic().remap(self._fixed) != self._fixed
+        )
+
+    def _update(self, changed: int, appended: bool) -> Keystroke:
+        # Brings the output up to date after a change of the word from
+        # position `changed` on.
+        if self._needs_whole(appended):
+            previous = self._word_output()
+            self._whole = self._convert(self._raw)
+            self._ends.clear()
+            self._pieces.clear()
+            return _keystroke(previous, self._whole)
+
+        if self._whole is not None:
+            previous, self._whole = self._whole, None
+            self._step(0)
+            return _keystroke(previous, "".join(self._pieces))
+
+        # Undo the steps that may have looked at the changed position.
+        ends, pieces = self._ends, self._pieces
+        limit = changed - _window()
+        count = len(ends)
+        while count and (ends[count - 2] if count > 1 else 0) > limit:
+            count -= 1
+
+        previous = "".join(pieces[count:])
+        del ends[count:], pieces[count:]
+        self._step(ends[-1] if ends else 0)
+        return _keystroke(previous, "".join(pieces[count:]))
+
+    def _step(self, cur: int) -> None:
+        # Parses the word from cursor position on.
+        fixed = self._fixed
+        while cur < len(fixed):
+            if ord(fixed[cur]) >= 128:
+                cur, output = cur + 1, fixed[cur]
+            else:
+                cur, output = processor.parse_step(fixed, cur)
+            self._ends.append(cur)
+            self._pieces.append(output)
+
+
+# Functions.
+@once
+def _window() -> int:
+    # How far past its start a parser step may look: the longest pattern,
+    # and the farthest rule condition after it (including the character
+    # that exact conditions require after their value).
+    longest = reach = 1
+    for pattern in tables.phonetic().patterns:
+        longest = max(longest, len(pattern.find or ""))
+        for rule in pattern.rules or ():
+            for match in rule.matches:
+                if match.type == "suffix":
+                    reach = max(reach, len(match.value or "") + 1)
+    return longest + reach
+
+
+def _keystroke(previous: str, output: str) -> Keystroke:
+    # The change turning previous into output, keeping their common start.
+    common = 0
+    limit = min(len(previous), len(output))
+    while common < limit and previous[common] == output[common]:
+        common += 1
+    return Keystroke(len(previous) - common, output[common:])
@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Conversion of UTF-8 bytes, a chunk at a time.
+
+Input is read and decoded a block at a time, converted in chunks as soon as
+enough of it is there, and the output is encoded and written to a sink as
+it goes, so that neither the decoded input nor the output of a large
+payload ever exists in full. Chunks are cut where parallel.split() would
+cut the text (see core/parallel.py), so the output is exactly that of
+converting the whole text at once.
+"""
+
+# Imports.
+from __future__ import annotations
+
+import codecs
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import BinaryIO
+
+from . import parallel
+
+# The size of the blocks read, and of the chunks converted at once.
+BLOCK_SIZE = 1 << 16
+
+Source = bytes | bytearray | memoryview | BinaryIO
+Sink = bytearray | BinaryIO
+
+
+# Classes.
+class Stream:
+    """Converts text for an operation, as it's fed a piece at a time.
+
+    Parameters:
+    -----------
+
+    convert: Callable[[str], str]
+        Converts a chunk of text (see parallel.wrap()).
+
+    operation: str
+        The operation: one of parallel.OPERATIONS.
+
+    phrases: bool = False
+        Whether there are custom phrases (see parallel.boundary()).
+
+    size: int | None = None
+        How much text to gather before converting it. Defaults to
+        BLOCK_SIZE.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[str], str],
+        operation: str,
+        phrases: bool = False,
+        size: int | None = None,
+    ) -> None:
+        self._convert = convert
+        self._operation = operation
+        self._boundary = parallel.boundary(operation, phrases)
+        self._size = BLOCK_SIZE if size is None else size
+        self._stripped = operation in ("to_bijoy", "to_unicode")
+
+        # The text not converted yet, and the end of the text before it.
+        self._pending: list[str] = []
+        self._length = 0
+        self._previous = ""
+        # How much text to gather before trying to cut it again.
+        self._wanted = self._size
+        # Whether nothing can be cut off the text anymore.
+        self._stopped = False
+        # For stripped output: whether any of it went out, and the
+        # whitespace at its end, which only goes out if more follows.
+        self._started = False
+        self._held = ""
+
+    @property
+    def stripped(self) -> bool:
+        """Whether the output is stripped, as the converters strip it."""
+
+        return self._stripped
+
+    def feed(self, text: str) -> str:
+        """Adds text, and returns the conversion of what could be cut off."""
+
+        if not text:
+            return ""
+
+        self._pending.append(text)
+        self._length += len(text)
+        if self._stopped or self._length < self._wanted:
+            return ""
+
+        pending = "".join(self._pending)
+        self._pending = [pending]
+
+        end = parallel.limit(pending, self._operation)
+        self._stopped = end < len(pending)
+
+        cut = _last_boundary(self._boundary, pending, end)
+        if not cut:
+            # Text without boundaries is gathered until it doubles.
+            self._wanted = 2 * self._length
+            return ""
+
+        rest = pending[cut:]
+        self._pending = [rest] if rest else []
+        self._length = len(rest)
+        self._wanted = self._size
+        return self._chunk(pending[:cut], False)
+
+    def close(self) -> str:
+        """Returns the conversion of the rest of the text."""
+
+        text = "".join(self._pending)
+        self._pending = []
+        self._length = 0
+
+        if not self._previous:
+            # Nothing was cut off: the text is converted as a whole.
+            return self._convert(text) if text else ""
+        if not text:
+            self._held = ""
+            return ""
+        return self._chunk(text, True)
+
+    def _chunk(self, chunk: str, last: bool) -> str:
+        before, after = parallel.around(
+            chunk, self._operation, self._previous, last
+        )
+        output = self._convert(before + chunk + after)
+        output = output[len(before) : len(output) - len(after)]
+        self._previous = chunk[-1]
+
+        if not self._stripped:
+            return output
+
+        # Strip the whole output, as the converters would.
+        if not self._started:
+            output = output.lstrip()
+            if not output:
+                return ""
+            self._started = True
+
+        output = self._held + output
+        body = output.rstrip()
+        self._held = "" if last else output[len(body) :]
+        return body
+
+
+# Functions.
+def _last_boundary(pattern: re.Pattern[str], text: str, end: int) -> int:
+    # Where the last boundary before end ends (0 if there's none), looking
+    # back from end in growing windows rather than through the whole text.
+    # Boundaries are single characters, so the windows find them all.
+    window = 1 << 10
+    while True:
+        start = max(0, end - window)
+        cut = 0
+        for match in pattern.finditer(text, start, end):
+            cut = match.end()
+        if cut or not start:
+            return cut
+        window *= 8
+
+
+def _blocks(source: Source, size: int) -> Iterator[bytes | memoryview]:
+    # Reads the input a block at a time.
+    if hasattr(source, "read"):
+        yield from iter(lambda: source.read(size), b"")
+    else:
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), size):
+            yield view[start : start + size]
+
+
+def write(sink: Sink, data: bytes) -> None:
+    """Writes all of the data to a sink: a bytearray to extend, or a binary
+    file, whose write() may write only part of it (or return None, as
+    unbuffered files may)."""
+
+    if isinstance(sink, bytearray):
+        sink += data
+        return
+
+    view = memoryview(data)
+    while view:
+        written = sink.write(view)
+        view = view[len(view) if written is None else written :]
+
+
+def pipe(texts: Iterable[str], streams: Iterable[Stream]) -> Iterator[str]:
+    """Converts text through a chain of streams, as it's read.
+
+    Parameters:
+    -----------
+
+    texts: Iterable[str]
+        The text, a piece at a time.
+
+    streams: Iterable[Stream]
+        The streams to convert it with, each one feeding the next.
+
+    Yields:
+    -------
+
+    str
+        The output, a piece at a time (as soon as it's converted).
+    """
+
+    streams = list(streams)
+
+    def convert(text: str, final: bool) -> str:
+        for stream in streams:
+            text = stream.feed(text)
+            if final:
+                text += stream.close()
+        return text
+
+    for text in texts:
+        output = convert(text, False)
+        if output:
+            yield output
+    output = convert("", True)
+    if output:
+        yield output
+
+
+def run(
+    source: Source,
+    streams: Iterable[Stream],
+    sink: Sink | None = None,
+    size: int | None = None,
+) -> bytes | int:
+    """Converts UTF-8 input through a chain of streams.
+
+    Parameters:
+    -----------
+
+    source: bytes | bytearray | memoryview | BinaryIO
+        The UTF-8 input, or a binary file to read it from.
+
+    streams: Iterable[Stream]
+        The streams to convert it with, each one feeding the next.
+
+    sink: bytearray | BinaryIO | None = None
+        Where to write the UTF-8 output: a bytearray to extend, or a binary
+        file (or anything with a write() method taking bytes).
+
+    size: int | None = None
+        The size of the blocks read. Defaults to BLOCK_SIZE.
+
+    Returns:
+    --------
+
+    bytes | int
+        The output if there's no sink, else the number of bytes written.
+    """
+
+    output = bytearray() if sink is None else sink
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    written = 0
+
+    def decoded() -> Iterator[str]:
+        for block in _blocks(source, BLOCK_SIZE if size is None else size):
+            yield decoder.decode(block)
+        yield decoder.decode(b"", True)
+
+    for text in pipe(decoded(), streams):
+        data = text.encode("utf-8")
+        write(output, data)
+        written += len(data)
+
+    return bytes(output) if sink is None else written
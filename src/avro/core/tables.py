@@ -0,0 +1,828 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+"""Precompiled, versioned snapshots of the dictionary tables.
+
+The matcher doesn't scan the dictionary as written. It works off compiled
+tables (per-character pattern indexes, the exception matcher and the Bijoy
+alternations), which this module builds from the two halves of the
+dictionary. The compiled tables can be written to disk as snapshots, so
+that cold processes load them ready-to-use instead of loading and compiling
+the dictionary literals.
+
+Snapshots are keyed by a hash of the dictionary sources, the snapshot format
+version and the running Python version; stale or foreign snapshots are
+simply ignored and the tables are rebuilt. Build them with:
+
+    $ python -m avro.core.tables [--output DIRECTORY]
+"""
+
+# Imports.
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import re
+import string
+import sys
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .cache import once
+
+if TYPE_CHECKING:
+    from ..resources.dictionary import AvroDict, BijoyDict, PatternRule
+
+# Bump this whenever the layout of the snapshot data changes.
+SNAPSHOT_VERSION = 2
+
+# Every snapshot file starts with this magic number.
+_MAGIC = b"AVROTBL\x00"
+
+# The dictionary sources, and the directory for snapshots shipped along with
+# the package (see write_snapshots()).
+_RESOURCES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources"
+)
+PACKAGE_SNAPSHOT_DIR = os.path.join(_RESOURCES, "snapshots")
+
+# Characters of exception words that can't overlap the "<rm>" markers; see
+# PhoneticTables.remap() for why this matters.
+_PLAIN_WORD = r"[A-Za-z0-9 ]{3,}"
+
+
+# Functions.
+def cache_dir() -> str | None:
+    """Returns the user cache directory for snapshots.
+
+    This is $AVRO_CACHE_DIR if set (an empty value disables the cache
+    directory), else $XDG_CACHE_HOME/avro.py or ~/.cache/avro.py.
+
+    Returns:
+    --------
+
+    str | None
+        The directory, or None if disabled.
+    """
+
+    directory = os.environ.get("AVRO_CACHE_DIR")
+    if directory is not None:
+        return directory or None
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "avro.py")
+
+
+def source_digest(name: str) -> str | None:
+    """Computes the snapshot key for a half of the dictionary.
+
+    Parameters:
+    -----------
+
+    name: str
+        Either "phonetic" or "bijoy".
+
+    Returns:
+    --------
+
+    str | None
+        The hex digest, or None if the source isn't available (e.g. when
+        running from a zip archive).
+    """
+
+    try:
+        with open(os.path.join(_RESOURCES, f"{name}.py"), "rb") as file:
+            source = file.read()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(source)
+    digest.update(
+        f"{SNAPSHOT_VERSION}:{sys.implementation.cache_tag}".encode()
+    )
+    return digest.hexdigest()
+
+
+def snapshot_path(directory: str, name: str, digest: str) -> str:
+    """Returns the path of a snapshot inside a directory."""
+
+    return os.path.join(directory, f"{name}-{digest[:16]}.bin")
+
+
+def build_phonetic(phonetic: AvroDict) -> dict[str, Any]:
+    """Compiles the phonetic half of the dictionary into snapshot data.
+
+    Parameters:
+    -----------
+
+    phonetic: AvroDict
+        The phonetic dictionary.
+
+    Returns:
+    --------
+
+    dict[str, Any]
+        Plain (marshal-able) data, loaded by PhoneticTables.
+    """
+
+    patterns = phonetic["patterns"]
+
+    def index(rule: bool, reversed: bool) -> dict[str, tuple[int, ...]]:
+        # Maps the first character of the matched text to the indexes of
+        # the candidate patterns, in dictionary order, so that the first
+        # candidate that matches is the one a linear scan would've found.
+        # Patterns matching the empty string are candidates everywhere and
+        # are listed under "".
+        key = "replace" if reversed else "find"
+        buckets: dict[str, list[int]] = {"": []}
+
+        for i, pattern in enumerate(patterns):
+            text = pattern.get(key)
+            if ("rules" in pattern) != rule or text is None:
+                continue
+            if text:
+                buckets.setdefault(text[0], list(buckets[""])).append(i)
+            else:
+                for bucket in buckets.values():
+                    bucket.append(i)
+
+        return {char: tuple(bucket) for char, bucket in buckets.items()}
+
+    exceptions = phonetic["exceptions"]
+
+    return {
+        "patterns": tuple(
+            (
+                pattern.get("find"),
+                pattern.get("replace"),
+                pattern.get("reverse"),
+                _compile_rules(pattern["rules"])
+                if pattern.get("rules") is not None
+                else None,
+                i,
+            )
+            for i, pattern in enumerate(patterns)
+        ),
+        "index": {
+            (rule, reversed): index(rule, reversed)
+            for rule in (False, True)
+            for reversed in (False, True)
+        },
+        "exceptions": exceptions,
+        "remap": tuple(
+            (value.lower(), key) for key, value in exceptions.items()
+        ),
+        "remap_reverse": tuple(exceptions.items()),
+        # Whether the exception words allow for plain substring search
+        # instead of case-insensitive regular expressions.
+        "plain_remap": all(
+            re.fullmatch(_PLAIN_WORD, value)
+            and not _has_ascii(
+                key + key.lower() + key.upper() + key.casefold()
+            )
+            for key, value in exceptions.items()
+        ),
+        "plain_remap_reverse": all(
+            key
+            and not _has_ascii(key)
+            and key == key.lower() == key.upper() == key.casefold()
+            and value.isascii()
+            for key, value in exceptions.items()
+        ),
+        "sets": {
+            name: frozenset(phonetic[name])  # type: ignore[literal-required]
+            for name in (
+                "vowel",
+                "consonant",
+                "casesensitive",
+                "number",
+                "shorborno",
+                "shongkha",
+                "kar",
+                "ignore",
+            )
+        },
+    }
+
+
+def build_bijoy(bijoy: BijoyDict) -> dict[str, Any]:
+    """Compiles the Bijoy half of the dictionary into snapshot data.
+
+    Parameters:
+    -----------
+
+    bijoy: BijoyDict
+        The Bijoy dictionary.
+
+    Returns:
+    --------
+
+    dict[str, Any]
+        Plain (marshal-able) data, loaded by BijoyTables.
+    """
+
+    mappings = bijoy["mappings"]
+    reverse = {v: k for k, v in mappings.items()}
+
+    def alternation(keys: Any) -> str:
+        # Sort by length (descending) to match longer patterns first.
+        return "|".join(
+            re.escape(k) for k in sorted(keys, key=len, reverse=True)
+        )
+
+    return {
+        "mappings": mappings,
+        "reverse": reverse,
+        "pattern": alternation(mappings),
+        "reverse_pattern": alternation(reverse),
+        "prekar": frozenset(bijoy["prekar"]),
+        "postkar": frozenset(bijoy["postkar"]),
+        "banjonborno": frozenset(bijoy["banjonborno"]),
+        "exceptions": bijoy["exceptions"],
+    }
+
+
+def _compile_rules(rules: list[PatternRule]) -> tuple[Any, ...]:
+    # Flattens rules into tuples in the layout of Rule / RuleMatch.
+    return tuple(
+        (
+            tuple(
+                (
+                    match.get("type"),
+                    (match.get("scope") or "").removeprefix("!"),
+                    (match.get("scope") or "").startswith("!"),
+                    match.get("value"),
+                )
+                if match.get("type") is not None
+                and match.get("scope") is not None
+                else (None, "", False, None)
+                for match in rule["matches"]
+            ),
+            rule["replace"],
+        )
+        for rule in rules
+    )
+
+
+def _has_ascii(text: str) -> bool:
+    # Also used on the case variants of words, since e.g. the Kelvin sign
+    # matches "k" case-insensitively.
+    return any(char.isascii() for char in text)
+
+
+def _build(name: str) -> dict[str, Any]:
+    if name == "phonetic":
+        from ..resources.phonetic import PHONETIC
+
+        return build_phonetic(PHONETIC)
+
+    from ..resources.bijoy import BIJOY
+
+    return build_bijoy(BIJOY)
+
+
+def read_snapshot(path: str, digest: str) -> dict[str, Any] | None:
+    """Reads a snapshot, returning None if it's missing, stale or corrupt.
+
+    Parameters:
+    -----------
+
+    path: str
+        The snapshot file.
+
+    digest: str
+        The expected key (see source_digest()).
+
+    Returns:
+    --------
+
+    dict[str, Any] | None
+        The snapshot data.
+    """
+
+    try:
+        with open(path, "rb") as file:
+            blob = file.read()
+    except OSError:
+        return None
+
+    if not blob.startswith(_MAGIC):
+        return None
+
+    try:
+        snapshot = marshal.loads(blob[len(_MAGIC) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("digest") != digest:
+        return None
+
+    return snapshot["data"]
+
+
+def write_snapshot(path: str, digest: str, data: dict[str, Any]) -> None:
+    """Atomically writes a snapshot.
+
+    Parameters:
+    -----------
+
+    path: str
+        The snapshot file.
+
+    digest: str
+        The key of the snapshot (see source_digest()).
+
+    data: dict[str, Any]
+        The snapshot data.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary, "wb") as file:
+        file.write(_MAGIC + marshal.dumps({"digest": digest, "data": data}))
+
+    os.replace(temporary, path)
+
+
+def load(name: str) -> dict[str, Any]:
+    """Loads the data for a half of the dictionary.
+
+    Looks for a matching snapshot shipped with the package first, then in
+    the cache directory, and falls back to building the data from the
+    dictionary.
+
+    Parameters:
+    -----------
+
+    name: str
+        Either "phonetic" or "bijoy".
+
+    Returns:
+    --------
+
+    dict[str, Any]
+        The snapshot data.
+    """
+
+    digest = source_digest(name)
+
+    if digest is not None:
+        for directory in (PACKAGE_SNAPSHOT_DIR, cache_dir()):
+            if directory is None:
+                continue
+            data = read_snapshot(
+                snapshot_path(directory, name, digest), digest
+            )
+            if data is not None:
+                return data
+
+    return _build(name)
+
+
+def write_snapshots(directory: str | None = None) -> list[str]:
+    """Builds and writes snapshots for both halves of the dictionary.
+
+    Parameters:
+    -----------
+
+    directory: str | None = None
+        Where to write the snapshots. Defaults to the cache directory.
+
+    Returns:
+    --------
+
+    list[str]
+        The paths of the written snapshots.
+    """
+
+    directory = directory or cache_dir()
+    if directory is None:
+        raise ValueError("No snapshot directory given and caching is disabled")
+
+    paths = []
+
+    for name in ("phonetic", "bijoy"):
+        digest = source_digest(name)
+        if digest is None:
+            raise FileNotFoundError(f"The {name} dictionary source is missing")
+        path = snapshot_path(directory, name, digest)
+        write_snapshot(path, digest, _build(name))
+        paths.append(path)
+
+    return paths
+
+
+# Classes.
+class RuleMatch(NamedTuple):
+    """A condition of a rule (see PatternRuleMatch)."""
+
+    # "prefix" or "suffix", or None if the condition is malformed (and thus
+    # never satisfied).
+    type: str | None
+    # The scope without its "!" prefix, and whether it had one.
+    scope: str
+    negative: bool
+    value: str | None
+
+
+class Rule(NamedTuple):
+    """A rule of a pattern (see PatternRule)."""
+
+    matches: tuple[RuleMatch, ...]
+    replace: str
+
+
+class Pattern(NamedTuple):
+    """A pattern of the phonetic dictionary (see PatternDict)."""
+
+    find: str | None
+    replace: str | None
+    reverse: str | None
+    rules: tuple[Rule, ...] | None
+    # The position of the pattern in the dictionary.
+    index: int
+
+
+class PhoneticTables:
+    """The compiled phonetic tables used by the parse / reverse matcher."""
+
+    __slots__ = (
+        "_exception_ends",
+        "_plain_remap",
+        "_plain_remap_reverse",
+        "_remap",
+        "_remap_regexes",
+        "_remap_reverse",
+        "_runs",
+        "_separators",
+        "exceptions",
+        "index",
+        "patterns",
+        "sets",
+    )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        # Patterns are turned into compact, immutable records on load.
+        self.patterns: tuple[Pattern, ...] = tuple(
+            Pattern(
+                find,
+                replace,
+                reverse,
+                None
+                if rules is None
+                else tuple(
+                    Rule(tuple(RuleMatch._make(m) for m in matches), value)
+                    for matches, value in rules
+                ),
+                i,
+            )
+            for find, replace, reverse, rules, i in data["patterns"]
+        )
+        self.index: dict[
+            tuple[bool, bool],
+            tuple[dict[str, tuple[Pattern, ...]], tuple[Pattern, ...]],
+        ] = {}
+
+        for key, buckets in data["index"].items():
+            resolved = {
+                char: tuple(self.patterns[i] for i in bucket)
+                for char, bucket in buckets.items()
+            }
+            self.index[key] = (resolved, resolved.pop(""))
+
+        self.exceptions: dict[str, str] = data["exceptions"]
+        self.sets: dict[str, frozenset[str]] = data["sets"]
+        self._remap: tuple[tuple[str, str], ...] = data["remap"]
+        self._remap_reverse: tuple[tuple[str, str], ...] = data[
+            "remap_reverse"
+        ]
+        self._plain_remap: bool = data["plain_remap"]
+        self._plain_remap_reverse: bool = data["plain_remap_reverse"]
+        self._remap_regexes: dict[bool, Any] = {}
+        self._separators: frozenset[str] | None = None
+        self._exception_ends: dict[int, frozenset[str]] | None = None
+        self._runs: dict[bool, re.Pattern[str]] = {}
+
+    def candidates(
+        self, char: str, rule: bool = False, reversed: bool = False
+    ) -> tuple[Pattern, ...]:
+        """Returns the patterns that may match text starting with char.
+
+        Parameters:
+        -----------
+
+        char: str
+            The character at the cursor.
+
+        rule: bool = False
+            Whether to return rule patterns.
+
+        reversed: bool = False
+            Whether to operate in reverse mode.
+
+        Returns:
+        --------
+
+        tuple[Pattern, ...]
+            The candidates, in dictionary order.
+        """
+
+        buckets, default = self.index[rule, reversed]
+        return buckets.get(char, default)
+
+    def remap(self, text: str, reversed: bool = False) -> str:
+        """Surrounds every exception word in text with "<rm>" markers.
+
+        The words are substituted one after the other, in dictionary order,
+        exactly like case-insensitive regular expressions would. When the
+        words can't overlap the markers or each other's replacements, this
+        is done with plain (and much cheaper) substring search.
+
+        Parameters:
+        -----------
+
+        text: str
+            The text to remap.
+
+        reversed: bool = False
+            Whether to operate in reverse mode.
+
+        Returns:
+        --------
+
+        str
+            The remapped text, with markers.
+        """
+
+        if reversed:
+            if self._plain_remap_reverse:
+                # Uncased non-ASCII words can only match themselves.
+                for key, value in self._remap_reverse:
+                    if key in text:
+                        text = text.replace(key, "<rm>" + value + "</rm>")
+                return text
+        elif self._plain_remap and text.isascii():
+            return self._plain_remap_ascii(text)
+
+        for regex, replacement in self._regexes(reversed):
+            # Literal replacements: backslashes are all there is to escape.
+            text = regex.sub(replacement.replace("\\", r"\\"), text)
+
+        return text
+
+    def _plain_remap_ascii(self, text: str) -> str:
+        # In ASCII text, case-insensitive matching is matching in lowercase.
+        # The words are ASCII letters, digits and spaces only (three or more
+        # of them), so they can never match across or inside the markers, nor
+        # inside the (non-ASCII) replacements; substituting within each of
+        # the remaining unmatched pieces is thus equivalent.
+        pieces: list[tuple[str, str] | str] = [(text, text.lower())]
+
+        for word, key in self._remap:
+            replacement = "<rm>" + key + "</rm>"
+            updated: list[tuple[str, str] | str] = []
+
+            for piece in pieces:
+                if isinstance(piece, str) or word not in piece[1]:
+                    updated.append(piece)
+                    continue
+
+                raw, lowered = piece
+                start = 0
+                found = lowered.find(word)
+
+                while found != -1:
+                    if found > start:
+                        updated.append(
+                            (raw[start:found], lowered[start:found])
+                        )
+                    updated.append(replacement)
+                    start = found + len(word)
+                    found = lowered.find(word, start)
+
+                if start < len(raw):
+                    updated.append((raw[start:], lowered[start:]))
+
+            pieces = updated
+
+        return "".join(
+            piece if isinstance(piece, str) else piece[0] for piece in pieces
+        )
+
+    def runs(self, reversed: bool = False) -> re.Pattern[str]:
+        """Returns a regex matching the runs of characters to be matched.
+
+        No pattern can start with any other character, so the text between
+        these runs is passed through as-is. When parsing, the rule patterns
+        are included as well.
+
+        Parameters:
+        -----------
+
+        reversed: bool = False
+            Whether to operate in reverse mode.
+
+        Returns:
+        --------
+
+        re.Pattern[str]
+            The regex.
+        """
+
+        regex = self._runs.get(reversed)
+
+        if regex is None:
+            chars: set[str] = set()
+            everything = False
+            for rule in (False,) if reversed else (False, True):
+                buckets, default = self.index[rule, reversed]
+                chars.update(buckets)
+                everything = everything or bool(default)
+
+            if everything:
+                source = "(?s).+"
+            else:
+                escaped = "".join(re.escape(char) for char in sorted(chars))
+                # Lone surrogates are left to the reverse matcher, which
+                # fails to encode them.
+                if reversed:
+                    escaped += "\\ud800-\\udfff"
+                source = f"[{escaped}]+"
+            # Compiled once per direction; a concurrent duplicate is harmless.
+            regex = self._runs[reversed] = re.compile(source)
+
+        return regex
+
+    def separators(self) -> frozenset[str]:
+        """Returns the characters that parsing can split text after.
+
+        These are punctuation and whitespace characters which no pattern,
+        rule condition or exception word contains. As the rules treat the
+        ends of the text like punctuation, text ending with one of them
+        parses the same on its own as in front of any other text, which
+        lets long text be parsed a piece at a time. The "<" and ">" of the
+        remap markers are left out, so that literal markers typed into the
+        text are never split either.
+
+        Returns:
+        --------
+
+        frozenset[str]
+            The separator characters.
+        """
+
+        if self._separators is None:
+            used = set("<>")
+            for pattern in self.patterns:
+                used.update(pattern.find or "")
+                for rule in pattern.rules or ():
+                    for match in rule.matches:
+                        used.update(match.value or "")
+            for word, _ in self._remap:
+                used.update(word)
+
+            # A concurrent duplicate is harmless.
+            self._separators = frozenset(
+                char
+                for char in string.punctuation + string.whitespace
+                if char not in used
+                and char not in self.sets["vowel"]
+                and char not in self.sets["consonant"]
+            )
+
+        return self._separators
+
+    def exception_ends(self, text: str) -> bool:
+        """Returns whether an exception word may end at the end of text.
+
+        Parameters:
+        -----------
+
+        text: str
+            The (case-fixed) text.
+
+        Returns:
+        --------
+
+        bool
+            False if no exception word ends there, else True.
+        """
+
+        if not (self._plain_remap and text.isascii()):
+            return True
+
+        if self._exception_ends is None:
+            ends: dict[int, set[str]] = {}
+            for word, _ in self._remap:
+                ends.setdefault(len(word), set()).add(word)
+            # A concurrent duplicate is harmless.
+            self._exception_ends = {
+                length: frozenset(words) for length, words in ends.items()
+            }
+
+        return any(
+            text[-length:].lower() in words
+            for length, words in self._exception_ends.items()
+            if length <= len(text)
+        )
+
+    def compile(self) -> None:
+        """Eagerly compiles the regexes that remap() otherwise builds on
+        first use (they're only needed for non-ASCII input)."""
+
+        self._regexes(False)
+        self._regexes(True)
+
+    def _regexes(self, reversed: bool) -> Any:
+        regexes = self._remap_regexes.get(reversed)
+
+        if regexes is None:
+            # Compiled once per direction; a concurrent duplicate is harmless.
+            pairs = (
+                (
+                    (key, "<rm>" + value + "</rm>")
+                    for key, value in self._remap_reverse
+                )
+                if reversed
+                else (
+                    (word, "<rm>" + key + "</rm>") for word, key in self._remap
+                )
+            )
+            regexes = self._remap_regexes[reversed] = tuple(
+                (re.compile(re.escape(word), re.IGNORECASE), replacement)
+                for word, replacement in pairs
+            )
+
+        return regexes
+
+
+class BijoyTables:
+    """The compiled tables used by the Bijoy converters."""
+
+    __slots__ = (
+        "banjonborno",
+        "exceptions",
+        "mappings",
+        "pattern",
+        "postkar",
+        "prekar",
+        "reverse",
+        "reverse_pattern",
+    )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.mappings: dict[str, str] = data["mappings"]
+        self.reverse: dict[str, str] = data["reverse"]
+        self.pattern = re.compile(data["pattern"])
+        self.reverse_pattern = re.compile(data["reverse_pattern"])
+        self.prekar: frozenset[str] = data["prekar"]
+        self.postkar: frozenset[str] = data["postkar"]
+        self.banjonborno: frozenset[str] = data["banjonborno"]
+        self.exceptions: dict[str, str | list[str]] = data["exceptions"]
+
+
+@once
+def phonetic() -> PhoneticTables:
+    """Returns the (shared) compiled phonetic tables, loading them once."""
+
+    return PhoneticTables(load("phonetic"))
+
+
+@once
+def bijoy() -> BijoyTables:
+    """Returns the (shared) compiled Bijoy tables, loading them once."""
+
+    return BijoyTables(load("bijoy"))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point for building the snapshots."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m avro.core.tables",
+        description="Build the precompiled dictionary table snapshots.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Output directory. Defaults to the user cache directory.",
+    )
+    parser.add_argument(
+        "--package",
+        action="store_true",
+        help="Write the snapshots into the installed package.",
+    )
+    args = parser.parse_args(argv)
+
+    for path in write_snapshots(
+        PACKAGE_SNAPSHOT_DIR if args.package else args.output
+    ):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
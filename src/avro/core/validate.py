@@ -2,13 +2,11 @@
 
 
 # Import local modules.
-from functools import lru_cache
 from avro.core import config
 
 
 # Unicode-specific validation functions.
 # These are only used for converting to and from Unicode characters.
-@lru_cache(maxsize=256)
 def is_vowel(text: str) -> bool:
     """
     Check if given string is a vowel.
@@ -17,7 +15,6 @@ def is_vowel(text: str) -> bool:
     return text.lower() in config.AVRO_VOWELS
 
 
-@lru_cache(maxsize=256)
 def is_consonant(text: str) -> bool:
     """
     Check if given string is a consonant.
@@ -34,7 +31,6 @@ def is_number(text: str) -> bool:
     return text.lower() in config.AVRO_NUMBERS
 
 
-@lru_cache(maxsize=256)
 def is_punctuation(text: str) -> bool:
     """
     Check if given string is a punctuation.
@@ -46,7 +42,6 @@ def is_punctuation(text: str) -> bool:
     )
 
 
-@lru_cache(maxsize=256)
 def is_case_sensitive(text: str) -> bool:
     """
     Check if given string is case sensitive.
@@ -83,7 +78,6 @@ def fix_string_case(text: str) -> str:
 
 # Conversion-specific validation functions.
 # These are only used for converting to and from ASCII characters.
-@lru_cache(maxsize=256)
 def is_bangla_kar(char: str) -> bool:
     """
     Check if given character is a Bengali kar.
@@ -91,7 +85,6 @@ def is_bangla_kar(char: str) -> bool:
     return char in config.AVRO_KAR
 
 
-@lru_cache(maxsize=256)
 def is_bangla_prekar(char: str) -> bool:
     """
     Check if given character is a Bengali pre-kar.
@@ -100,7 +93,6 @@ def is_bangla_prekar(char: str) -> bool:
     return char in config.BIJOY_PREKAR
 
 
-@lru_cache(maxsize=256)
 def is_bangla_postkar(char: str) -> bool:
     """
     Check if given character is a Bengali post-kar.
@@ -108,7 +100,6 @@ def is_bangla_postkar(char: str) -> bool:
     return char in config.BIJOY_POSTKAR
 
 
-@lru_cache(maxsize=256)
 def is_bangla_banjonborno(char: str) -> bool:
     """
     Check if given character is a Bengali banjonborno.
@@ -117,7 +108,6 @@ def is_bangla_banjonborno(char: str) -> bool:
     return char in config.BIJOY_BANJONBORNO
 
 
-@lru_cache(maxsize=256)
 def is_bangla_halant(char: str) -> bool:
     """
     Check if given character is a Bengali halant.
@@ -126,7 +116,6 @@ def is_bangla_halant(char: str) -> bool:
     return char == config.BIJOY_EXCEPTIONS["halant"]
 
 
-@lru_cache(maxsize=256)
 def is_bangla_nukta(char: str) -> bool:
     """
     Check if given character is a Bengali nukta.
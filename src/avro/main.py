@@ -8,72 +8,132 @@ Licensed under the terms of the MIT OR Apache-2.0 License.
 """
 
 # Imports.
-import asyncio
-import re
-from collections.abc import Generator, Iterable
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
-from itertools import chain
-from typing import Callable
+# asyncio and concurrent.futures are only imported on first use of the
+# async / batch APIs, as they dominate the import time of the package.
+from __future__ import annotations
 
-from .core import processor, validate
-from .core.config import BIJOY_MAP, BIJOY_MAP_REVERSE
+import os
+import re
+import string
+import threading
+import weakref
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from functools import partial
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from .core import (
+    backends,
+    bijoy,
+    classify,
+    columns,
+    config,
+    engines,
+    frequency,
+    incremental,
+    parallel,
+    processor,
+    session,
+    streams,
+    tables,
+    validate,
+)
+from .core.cache import once, thread_cache
+from .core.concurrency import BatchDeduplicator, Coalescer, SingleFlight
+from .core.custom import CustomWords, Snapshot
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 # Compiled regex patterns. These are primarily used in parse() and reverse()
 # function calls to validate input text and search for invalid UTF-8 characters.
 UTF8_REGEX = re.compile(r"\A[\x00-\x7F]*\Z", re.UNICODE)
 REVERSE_REGEX = re.compile(r"(\s|\.|,|\?|।|-|;|')", re.UNICODE)
 
-# Pre-compiled regex patterns for bijoy conversion optimization.
-_BIJOY_REGEX_PATTERN: re.Pattern[str] | None = None
-_BIJOY_REVERSE_REGEX_PATTERN: re.Pattern[str] | None = None
 
+# Pre-compiled regex pattern for bijoy conversion optimization.
+# These are part of the compiled Bijoy tables (see core/tables.py), which
+# are loaded once on first use, even on free-threaded (no-GIL) interpreters.
+def _get_bijoy_regex_pattern() -> re.Pattern[str]:
+    """Get the compiled regex pattern for bijoy conversion."""
 
-def _get_bijoy_regex_pattern():
-    """Get or create the compiled regex pattern for bijoy conversion."""
-    global _BIJOY_REGEX_PATTERN
+    return tables.bijoy().pattern
 
-    if _BIJOY_REGEX_PATTERN is None:
-        # Sort by length (descending) to match longer patterns first
-        sorted_patterns = sorted(BIJOY_MAP.keys(), key=len, reverse=True)
-        # Escape each pattern and join with |
-        pattern = "|".join(re.escape(p) for p in sorted_patterns)
-        _BIJOY_REGEX_PATTERN = re.compile(pattern)
 
-    return _BIJOY_REGEX_PATTERN
+# The conversion from each encoding to each target encoding (see convert()):
+# the method doing it, and the options it's called with.
+_ROUTES: dict[tuple[str, str], tuple[str, dict[str, bool]]] = {
+    (classify.BIJOY, classify.UNICODE): ("to_unicode", {}),
+    (classify.BANGLISH, classify.UNICODE): ("parse", {"bijoy": False}),
+    (classify.UNICODE, classify.BIJOY): ("to_bijoy", {}),
+    (classify.BANGLISH, classify.BIJOY): ("parse", {"bijoy": True}),
+    (classify.UNICODE, classify.BANGLISH): ("reverse", {"from_bijoy": False}),
+    (classify.BIJOY, classify.BANGLISH): ("reverse", {"from_bijoy": True}),
+}
 
 
-def _get_bijoy_reverse_regex_pattern():
-    """Get or create the compiled regex pattern for reverse bijoy conversion."""
-    global _BIJOY_REVERSE_REGEX_PATTERN
+# Shared table of in-flight calls made through the concurrency helpers,
+# and the counters for duplicate items collapsed out of batches.
+_SINGLE_FLIGHT = SingleFlight()
+_BATCH_DEDUPLICATOR = BatchDeduplicator()
 
-    if _BIJOY_REVERSE_REGEX_PATTERN is None:
-        # Sort by length (descending) to match longer patterns first
-        sorted_patterns = sorted(
-            BIJOY_MAP_REVERSE.keys(), key=len, reverse=True
-        )
-        # Escape each pattern and join with |
-        pattern = "|".join(re.escape(p) for p in sorted_patterns)
-        _BIJOY_REVERSE_REGEX_PATTERN = re.compile(pattern)
 
-    return _BIJOY_REVERSE_REGEX_PATTERN
+# This is a backend function and MUST NOT BE EXPORTED!
+def _init_worker() -> None:
+    """Initializer for process / interpreter pool workers.
+
+    Builds the lazily compiled tables once per worker, so that the first
+    batch shipped to every worker doesn't pay for it.
+    """
+
+    tables.phonetic()
+    tables.bijoy()
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
 async def _async_concurrency_helper(
-    func: Callable[[str], str], params: tuple[str, ...]
+    func: Callable[..., str],
+    params: tuple[str, ...],
+    *args: bool | str | None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    batch: bool = True,
 ) -> list[str]:
     """Concurrency helper for the core functions of avro.py.
 
+    Duplicate items are collapsed before dispatch. On the thread backend,
+    identical calls already in flight (same function, text and options)
+    share a single executor job; the process and interpreter backends ship
+    the items to their workers in chunks.
+
     Parameters:
     -----------
 
-    func: Callable[[str], str]
+    func: Callable[..., str]
         The function to run concurrently.
 
     params: tuple[str, ...]
         The parameters to pass to the function.
 
+    *args: bool | str | None
+        Extra options passed to the function after each parameter.
+
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+
+    max_workers: int | None = None
+        The number of process / interpreter workers.
+
+    executor: Executor | None = None
+        The executor of the thread backend. Uses the event loop's default
+        executor if None.
+
+    batch: bool = True
+        Whether the parameters are the items of a batch call, which are
+        collapsed and counted in stats(); the text of a single call (or
+        the chunks of one) is dispatched as it is.
+
     Returns:
     --------
 
@@ -82,35 +142,262 @@ async def _async_concurrency_helper(
 
     """
 
-    loop = asyncio.get_event_loop()
-    tasks = [loop.run_in_executor(None, func, text) for text in params]
-    results: list[str] = await asyncio.gather(*tasks)
-    return results
+    import asyncio
+
+    backend = backends.resolve_backend(backend)
+    unique, positions = (
+        _BATCH_DEDUPLICATOR.collapse(params) if batch else (params, None)
+    )
+
+    if backend == "thread":
+        tasks = [
+            _SINGLE_FLIGHT.do_async(
+                (func, text, args), func, text, *args, executor=executor
+            )
+            for text in unique
+        ]
+        results: list[str] = await asyncio.gather(*tasks)
+    else:
+        loop = asyncio.get_running_loop()
+        pool = backends.get_pool(backend, max_workers, _init_worker)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _batch_backend, func, args, part)
+                for part in backends.chunk(unique, max_workers)
+            )
+        )
+        results = list(chain.from_iterable(chunks))
+
+    if positions is None:
+        return results
+    return _BATCH_DEDUPLICATOR.scatter(results, positions)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
 def _sync_concurrency_helper(
-    func: Callable[[str], str], params: tuple[str, ...]
+    func: Callable[..., str],
+    params: tuple[str, ...],
+    *args: bool | str | None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    batch: bool = True,
 ) -> list[str]:
     """Synchronous concurrency helper for the core functions of avro.py using multithreading.
 
+    Duplicate items are collapsed before dispatch. On the thread backend,
+    identical calls already in flight (same function, text and options)
+    share a single computation; the process and interpreter backends ship
+    the items to their workers in chunks.
+
     Parameters:
     -----------
-    func: Callable[[str], str]
+    func: Callable[..., str]
         The function to run concurrently.
 
     params: tuple[str, ...]
         The parameters to pass to the function.
 
+    *args: bool | str | None
+        Extra options passed to the function after each parameter.
+
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    executor: Executor | None = None
+        The executor of the thread backend. Uses a new thread pool (with
+        `max_workers` workers) if None.
+
+    batch: bool = True
+        Whether the parameters are the items of a batch call, which are
+        collapsed and counted in stats(); the text of a single call (or
+        the chunks of one) is dispatched as it is.
+
     Returns:
     --------
     list[str]
         The results of the function run concurrently.
     """
 
-    with ThreadPoolExecutor() as executor:
-        results = list(executor.map(func, params))
-    return results
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(text: str) -> str:
+        return _SINGLE_FLIGHT.do((func, text, args), func, text, *args)
+
+    backend = backends.resolve_backend(backend)
+    unique, positions = (
+        _BATCH_DEDUPLICATOR.collapse(params) if batch else (params, None)
+    )
+
+    if backend == "thread" and executor is not None:
+        results = list(executor.map(run, unique))
+    elif backend == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(run, unique))
+    else:
+        pool = backends.get_pool(backend, max_workers, _init_worker)
+        chunks = pool.map(
+            partial(_batch_backend, func, args),
+            backends.chunk(unique, max_workers),
+        )
+        results = list(chain.from_iterable(chunks))
+
+    if positions is None:
+        return results
+    return _BATCH_DEDUPLICATOR.scatter(results, positions)
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _batch_backend(
+    func: Callable[..., str], args: tuple, params: tuple[str, ...]
+) -> list[str]:
+    """Runs a backend function over a whole batch in a single worker job.
+
+    This is kept at module level so that it can be pickled and shipped to
+    process / interpreter pools by the batch functions and the
+    micro-batching scheduler.
+
+    Parameters:
+    -----------
+    func: Callable[..., str]
+        The backend function to run for each item.
+
+    args: tuple
+        Extra positional arguments passed after each item.
+
+    params: tuple[str, ...]
+        The items of the batch.
+
+    Returns:
+    --------
+    list[str]
+        The results, in the same order as the items.
+    """
+
+    return [func(text, *args) for text in params]
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _vectorized_helper(
+    func: Callable[[Sequence[str]], list[str]],
+    params: tuple[str, ...],
+    backend: str = "thread",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[str]:
+    """Runs a function converting whole batches, on a pool of workers.
+
+    Duplicate items are collapsed before dispatch, and the rest are split
+    into a few chunks per worker, each converted in a single call (see
+    core/bijoy.py).
+
+    Parameters:
+    -----------
+    func: Callable[[Sequence[str]], list[str]]
+        The function converting a batch.
+
+    params: tuple[str, ...]
+        The items to convert.
+
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    executor: Executor | None = None
+        The executor of the thread backend. Uses a new thread pool (with
+        `max_workers` workers) if None.
+
+    Returns:
+    --------
+    list[str]
+        The results, in the same order as the items.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    backend = backends.resolve_backend(backend)
+    unique, positions = _BATCH_DEDUPLICATOR.collapse(params)
+    chunks = backends.chunk(unique, max_workers)
+
+    if len(chunks) <= 1:
+        results = func(unique)
+    elif backend == "thread" and executor is not None:
+        results = list(chain.from_iterable(executor.map(func, chunks)))
+    elif backend == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(chain.from_iterable(pool.map(func, chunks)))
+    else:
+        pool = backends.get_pool(backend, max_workers, _init_worker)
+        results = list(chain.from_iterable(pool.map(func, chunks)))
+
+    return _BATCH_DEDUPLICATOR.scatter(results, positions)
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _columns_helper(
+    func: Callable[..., str],
+    column: columns.Column,
+    *args: bool | str | None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> columns.Column:
+    """Converts every row of a column on a pool of workers.
+
+    The column is split into a few columns of consecutive rows per worker;
+    the process and interpreter backends are shipped copies of their rows
+    only.
+
+    Parameters:
+    -----------
+    func: Callable[..., str]
+        The function converting a row.
+
+    column: columns.Column
+        The column to convert.
+
+    *args: bool | str | None
+        Extra options passed to the function after each row.
+
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    executor: Executor | None = None
+        The executor of the thread backend. Uses a new thread pool (with
+        `max_workers` workers) if None.
+
+    Returns:
+    --------
+    columns.Column
+        The conversions, in the same order as the rows.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    run = partial(columns.convert, func, args)
+    backend = backends.resolve_backend(backend)
+    parts = columns.split(column, max_workers)
+
+    if len(parts) <= 1:
+        return run(column)
+    if backend == "thread" and executor is not None:
+        results = list(executor.map(run, parts))
+    elif backend == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(run, parts))
+    else:
+        pool = backends.get_pool(backend, max_workers, _init_worker)
+        results = list(pool.map(run, map(columns.compact, parts)))
+
+    return columns.join(results)
 
 
 # Helper function to manage remapped markers in text.
@@ -152,6 +439,31 @@ def _process_remapped(
     return "".join(processed_segments)
 
 
+# This is a backend function and MUST NOT BE EXPORTED!
+def _encoded_pieces(
+    text: str, target: str, runs: bool
+) -> list[tuple[str | None, str]]:
+    """Splits text into pieces along with the encoding they're converted
+    from (see convert()), None for the pieces kept as they are."""
+
+    if target not in classify.ENCODINGS:
+        raise ValueError(f"Unknown encoding: {target!r}")
+    if not runs:
+        return [(classify.classify(text), text)]
+
+    # The whitespace around every run is kept out of its conversion (as
+    # Bijoy conversions strip it).
+    pieces: list[tuple[str | None, str]] = []
+    for start, end, encoding in classify.runs(text):
+        run = text[start:end]
+        head = len(run) - len(run.lstrip())
+        core = run[head:].rstrip()
+        pieces.append((None, run[:head]))
+        pieces.append((encoding, core))
+        pieces.append((None, run[head + len(core) :]))
+    return pieces
+
+
 # This is a backend function and MUST NOT BE EXPORTED!
 def _parse_output_generator(
     fixed_text: str, cur_end: int
@@ -171,59 +483,27 @@ def _parse_output_generator(
         The parsed output.
     """
 
-    for cur, i in enumerate(fixed_text):
-        # Optimized UTF-8 check - most ASCII chars are in range 0-127
-        uni_pass = ord(i) < 128
-        if not uni_pass:
-            cur_end = cur + 1
-            yield i
-        elif cur >= cur_end and uni_pass:
-            match = processor.match_patterns(fixed_text, cur, rule=False)
-            matched = bool(match.get("matched"))
-            replaced = match.get("replaced")
-            found = match.get("found")
-
-            if (
-                matched
-                and isinstance(replaced, str)
-                and isinstance(found, str)
-            ):
-                yield replaced
-                cur_end = cur + len(found)
-            else:
-                match_rule = processor.match_patterns(
-                    fixed_text, cur, rule=True
-                )
-                matched_rule = bool(match_rule.get("matched"))
-                found_rule = match_rule.get("found")
-                rules = match_rule.get("rules")
-                replaced_rule = match_rule.get("replaced")
-
-                if (
-                    matched_rule
-                    and isinstance(found_rule, str)
-                    and isinstance(rules, list)
-                ):
-                    cur_end = cur + len(found_rule)
-                    replaced_val = processor.process_rules(
-                        rules=rules,
-                        fixed_text=fixed_text,
-                        cur=cur,
-                        cur_end=cur_end,
-                    )
-                    if isinstance(replaced_val, str) and replaced_val:
-                        yield replaced_val
-                    elif isinstance(replaced_rule, str):
-                        yield replaced_rule
+    # Only the runs of characters that patterns start with are matched; the
+    # text in between (e.g. Bengali or spaces) is passed through as slices.
+    cur = cur_end
+    for run in tables.phonetic().runs().finditer(fixed_text, cur_end):
+        start, end = run.span()
+        if start > cur:
+            yield fixed_text[cur:start]
+        # A match may have run past the start (or the end) of this run.
+        cur = max(cur, start)
+        while cur < end:
+            cur, output = processor.parse_step(fixed_text, cur)
+            yield output
 
-                else:
-                    cur_end = cur + 1
-                    yield i
+    if cur < len(fixed_text):
+        yield fixed_text[cur:]
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
-@lru_cache(maxsize=128)
-def _parse_backend(text: str, remap_words: bool) -> str:
+def _parse_backend(
+    text: str, remap_words: bool, engine: str | None = None
+) -> str:
     """The working backend for the parse() function.
 
     Parameters:
@@ -232,6 +512,8 @@ def _parse_backend(text: str, remap_words: bool) -> str:
         The text to parse.
     remap_words: bool
         Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on. Defaults to the selected engine.
 
     Returns:
     --------
@@ -240,31 +522,25 @@ def _parse_backend(text: str, remap_words: bool) -> str:
     """
 
     fixed_text = validate.fix_string_case(text)
+    selected = engines.get(engine)
 
     if remap_words:
-        fixed_text, manual_required = processor.find_in_remap(fixed_text)
-        return _process_remapped(
-            fixed_text,
-            manual_required,
-            lambda segment: "".join(
-                chain.from_iterable(_parse_output_generator(segment, 0))
-            ),
-        )
+        fixed_text, manual_required = selected.remap(fixed_text)
+        return _process_remapped(fixed_text, manual_required, selected.parse)
     else:
-        return "".join(
-            chain.from_iterable(_parse_output_generator(fixed_text, 0))
-        )
+        return selected.parse(fixed_text)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
-@lru_cache(maxsize=128)
-def _convert_backend(text: str) -> str:
+def _convert_backend(text: str, engine: str | None = None) -> str:
     """The working backend for the to_bijoy() function.
 
     Parameters:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on. Defaults to the selected engine.
 
     Returns:
     --------
@@ -272,29 +548,26 @@ def _convert_backend(text: str) -> str:
         The converted text.
     """
 
-    text = processor.rearrange_unicode_text(
-        re.sub("ৌ", "ৌ", re.sub("ো", "ো", text))
-    )
+    return engines.get(engine).to_bijoy(text)
 
-    # Use compiled regex with replacement function for better performance
-    def replace_func(match: re.Match[str]) -> str:
-        return BIJOY_MAP[match.group(0)]
 
-    pattern = _get_bijoy_regex_pattern()
-    text = pattern.sub(replace_func, text)
+# This is a backend function and MUST NOT BE EXPORTED!
+def _to_bijoy(text: str) -> str:
+    """Converts Unicode text to Bijoy with the compiled Bijoy tables."""
 
-    return text.strip()
+    return bijoy.to_bijoy(text)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
-@lru_cache(maxsize=128)
-def _convert_backend_unicode(text: str) -> str:
+def _convert_backend_unicode(text: str, engine: str | None = None) -> str:
     """The working backend for the to_unicode() function.
 
     Parameters:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on. Defaults to the selected engine.
 
     Returns:
     --------
@@ -302,16 +575,14 @@ def _convert_backend_unicode(text: str) -> str:
         The converted text.
     """
 
-    # Use compiled regex with replacement function for better performance
-    def replace_func(match: re.Match[str]):
-        return BIJOY_MAP_REVERSE[match.group(0)]
+    return engines.get(engine).to_unicode(text)
 
-    pattern = _get_bijoy_reverse_regex_pattern()
-    text = pattern.sub(replace_func, text)
 
-    text = re.sub("অা", "আ", processor.rearrange_bijoy_text(text))
+# This is a backend function and MUST NOT BE EXPORTED!
+def _to_unicode(text: str) -> str:
+    """Converts Bijoy text to Unicode with the compiled Bijoy tables."""
 
-    return text.strip()
+    return bijoy.to_unicode(text)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
@@ -329,32 +600,231 @@ def _reverse_output_generator(text: str) -> Generator[str, None, None]:
         The reversed output.
     """
 
-    for cur, i in enumerate(text):
-        try:
-            _ = i.encode("utf-8")
-            match = processor.match_patterns(
-                text, cur, rule=False, reversed=True
-            )
+    # Characters no pattern starts with (e.g. spaces and Latin text) are
+    # passed through as slices; every other character is matched on its own.
+    cur = 0
+    for run in tables.phonetic().runs(reversed=True).finditer(text):
+        start, end = run.span()
+        if start > cur:
+            yield text[cur:start]
+
+        for cur in range(start, end):
+            i = text[cur]
+            try:
+                _ = i.encode("utf-8")
+                pattern = processor.first_match(text, cur, reversed=True)
+
+                if pattern is None:
+                    yield i
+                    continue
 
-            if match["matched"]:
-                # Ensure only str is yielded
-                reversed_val = match.get("reversed")
-                found_val = match.get("found")
-                if isinstance(reversed_val, str):
-                    yield reversed_val
-                elif isinstance(found_val, str):
-                    yield found_val
+                reversed = processor.reverse_with_rules(
+                    cur, text, pattern.reverse
+                )
+                if reversed is not None:
+                    yield reversed
+                elif pattern.find is not None:
+                    yield pattern.find
                 else:
                     yield i
-            else:
+            except UnicodeDecodeError:
                 yield i
-        except UnicodeDecodeError:
-            yield i
+
+        cur = end
+
+    if cur < len(text):
+        yield text[cur:]
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _parse_interpreted(fixed_text: str) -> str:
+    """Parses case-fixed text with the interpreted matcher."""
+
+    return "".join(chain.from_iterable(_parse_output_generator(fixed_text, 0)))
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _reverse_interpreted(text: str) -> str:
+    """Reverses text with the interpreted matcher."""
+
+    return "".join(chain.from_iterable(_reverse_output_generator(text)))
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _parse_reference(fixed_text: str) -> str:
+    """Parses case-fixed text by scanning the dictionary patterns as-is."""
+
+    output: list[str] = []
+    cur_end = 0
+
+    for cur, i in enumerate(fixed_text):
+        if ord(i) >= 128:
+            cur_end = cur + 1
+            output.append(i)
+        elif cur >= cur_end:
+            match = processor.match_patterns(fixed_text, cur, rule=False)
+            replaced = match.get("replaced")
+            found = match.get("found")
+
+            if (
+                match.get("matched")
+                and isinstance(replaced, str)
+                and isinstance(found, str)
+            ):
+                output.append(replaced)
+                cur_end = cur + len(found)
+                continue
+
+            match = processor.match_patterns(fixed_text, cur, rule=True)
+            found = match.get("found")
+            rules = match.get("rules")
+
+            if (
+                match.get("matched")
+                and isinstance(found, str)
+                and isinstance(rules, list)
+            ):
+                cur_end = cur + len(found)
+                replaced_rule = processor.process_rules(
+                    rules=rules,
+                    fixed_text=fixed_text,
+                    cur=cur,
+                    cur_end=cur_end,
+                )
+                if replaced_rule:
+                    output.append(replaced_rule)
+                elif isinstance(match.get("replaced"), str):
+                    output.append(match["replaced"])  # type: ignore[arg-type]
+            else:
+                cur_end = cur + 1
+                output.append(i)
+
+    return "".join(output)
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _reverse_reference(text: str) -> str:
+    """Reverses text by scanning the dictionary patterns as-is."""
+
+    output: list[str] = []
+
+    for cur, i in enumerate(text):
+        i.encode("utf-8")
+        match = processor.match_patterns(text, cur, rule=False, reversed=True)
+        reversed = match.get("reversed")
+        found = match.get("found")
+
+        if not match["matched"]:
+            output.append(i)
+        elif isinstance(reversed, str):
+            output.append(reversed)
+        elif isinstance(found, str):
+            output.append(found)
+        else:
+            output.append(i)
+
+    return "".join(output)
+
+
+@once
+def _bijoy_reference_patterns() -> tuple[re.Pattern[str], re.Pattern[str]]:
+    # Alternations of the Bijoy sequences, the longest first, straight from
+    # the dictionary: for Unicode text, and for Bijoy text.
+    def alternation(keys: Iterable[str]) -> re.Pattern[str]:
+        return re.compile(
+            "|".join(map(re.escape, sorted(keys, key=len, reverse=True)))
+        )
+
+    return (
+        alternation(config.BIJOY_MAP),
+        alternation(config.BIJOY_MAP_REVERSE),
+    )
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _to_bijoy_reference(text: str) -> str:
+    """Converts Unicode text to Bijoy by substituting the sequences as-is.
+
+    Unlike the compiled Bijoy tables, the whole text is rearranged at once,
+    and every sequence is looked up on its own.
+    """
+
+    text = text.replace("\u09cb", "\u09c7\u09be")
+    text = text.replace("\u09cc", "\u09c7\u09d7")
+    text = processor.rearrange_unicode_text(text)
+    pattern = _bijoy_reference_patterns()[0]
+    text = pattern.sub(lambda match: config.BIJOY_MAP[match.group(0)], text)
+
+    return text.strip()
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _to_unicode_reference(text: str) -> str:
+    """Converts Bijoy text to Unicode by substituting the sequences as-is.
+
+    Unlike the compiled Bijoy tables, the whole text is rearranged at once,
+    and every sequence is looked up on its own.
+    """
+
+    pattern = _bijoy_reference_patterns()[1]
+    text = pattern.sub(
+        lambda match: config.BIJOY_MAP_REVERSE[match.group(0)], text
+    )
+    text = processor.rearrange_bijoy_text(text)
+
+    return text.replace("অা", "আ").strip()
+
+
+def _legacy_engine() -> engines.Engine:
+    return engines.Engine(
+        remap=processor.find_in_remap_reference,
+        parse=_parse_reference,
+        reverse=_reverse_reference,
+        to_bijoy=_to_bijoy_reference,
+        to_unicode=_to_unicode_reference,
+    )
+
+
+def _interpreted_engine() -> engines.Engine:
+    return engines.Engine(
+        remap=processor.find_in_remap,
+        parse=_parse_interpreted,
+        reverse=_reverse_interpreted,
+        to_bijoy=_to_bijoy,
+        to_unicode=_to_unicode,
+    )
+
+
+def _generated_engine() -> engines.Engine:
+    from .core import codegen
+    from .core import matcher as generated
+
+    digest = codegen.dictionary_digest()
+    if digest is not None and digest != generated.DICTIONARY_DIGEST:
+        raise RuntimeError(
+            "The generated matcher is out of date, regenerate it with "
+            "`python -m avro.core.codegen`"
+        )
+
+    return engines.Engine(
+        remap=processor.find_in_remap,
+        parse=generated.parse,
+        reverse=generated.reverse,
+        to_bijoy=_to_bijoy,
+        to_unicode=_to_unicode,
+    )
+
+
+# The built-in engines (see set_engine()).
+engines.register("legacy", _legacy_engine)
+engines.register("interpreted", _interpreted_engine)
+engines.register("generated", _generated_engine)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
-@lru_cache(maxsize=128)
-def _reverse_backend(text: str, remap_words: bool) -> str:
+def _reverse_backend(
+    text: str, remap_words: bool, engine: str | None = None
+) -> str:
     """The working backend for the reverse() function.
 
     Parameters:
@@ -363,6 +833,8 @@ def _reverse_backend(text: str, remap_words: bool) -> str:
         The text to reverse.
     remap_words: bool
         Whether to reverse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on. Defaults to the selected engine.
 
     Returns:
     --------
@@ -370,110 +842,1254 @@ def _reverse_backend(text: str, remap_words: bool) -> str:
         The reversed text.
     """
 
+    selected = engines.get(engine)
+
     if remap_words:
-        text, manual_required = processor.find_in_remap(text, reversed=True)
-        return _process_remapped(
-            text,
-            manual_required,
-            lambda segment: "".join(
-                chain.from_iterable(_reverse_output_generator(segment))
-            ),
-        )
+        text, manual_required = selected.remap(text, reversed=True)
+        return _process_remapped(text, manual_required, selected.reverse)
     else:
-        return "".join(chain.from_iterable(_reverse_output_generator(text)))
+        return selected.reverse(text)
 
 
 # This is a backend function and MUST NOT BE EXPORTED!
-@lru_cache(maxsize=128)
-def _reverse_backend_ext(text: str, remap_words: bool) -> str:
-    """Backend extension for the reverse() function.
+def _transliterate_words(
+    words: Iterable[str],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Computes frequency table entries for the given words.
+
+    Roman-script (ASCII) words get a parse entry, and their Bengali forms
+    a reverse entry; other words get a reverse entry only. Reverse entries
+    are only made for single segments (see Transliterator.reverse()), as
+    nothing else is ever looked up.
 
     Parameters:
     -----------
-    text: str
-        The text to reverse.
-    remap_words: bool
-        Whether to reverse input text with remapped (exception) words.
+    words: Iterable[str]
+        The words.
 
     Returns:
     --------
-    str
-        The reversed text.
+    tuple[dict[str, str], dict[str, str]]
+        The parse and reverse entries.
     """
 
-    separated_texts = REVERSE_REGEX.split(text)
-    text_segments = [
-        _reverse_backend(separated_text, remap_words)
-        for separated_text in separated_texts
-    ]
-    return "".join(text_segments)
+    parse: dict[str, str] = {}
+    reverse: dict[str, str] = {}
+
+    for word in words:
+        if word.isascii():
+            parse[word] = _parse_backend(word, True)
+            word = parse[word]
+        if word not in reverse and len(REVERSE_REGEX.split(word)) == 1:
+            reverse[word] = _reverse_backend(word, True)
+
+    return parse, reverse
 
 
 # ---
 
-# Primary user-end functions.
+# Reusable transliterators.
 # ---
 
+# Every live transliterator, whose caches set_engine() drops if they follow
+# the selected engine.
+_INSTANCES: weakref.WeakSet[Transliterator] = weakref.WeakSet()
+_INSTANCES_LOCK = threading.Lock()
 
-async def parse_async(
-    text: str, bijoy: bool = False, remap_words: bool = True
-) -> str:
-    """Asynchronous version of parse() function.
 
-    Parses input text, matches and replaces using the Avro Dictionary.
-    If a valid replacement is found, then it returns the replaced string.
-    If no replacement is found, then it instead returns the input text.
+class Transliterator:
+    """Transliterates text with its own options, caches and executor.
+
+    Every transliterator keeps its own result caches, so that several
+    configurations (e.g. with and without remapped words) can be used side
+    by side in one process without evicting each other's results. The
+    compiled dictionary tables are immutable and shared by all of them.
+
+    The methods mirror the module-level functions, which run on a default
+    instance. Options left as None in a method call fall back to the ones
+    given to the constructor.
 
     Parameters:
     -----------
-    text: str
-        The text to parse.
     bijoy: bool = False
-        Whether to return result in the Bijoy Keyboard format (ASCII).
+        Whether parse() returns its results in the Bijoy Keyboard format.
+    from_bijoy: bool = False
+        Whether reverse() expects its input in the Bijoy Keyboard format.
     remap_words: bool = True
-        Whether to parse input text with remapped (exception) words.
-
-    Returns:
+        Whether to parse / reverse text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on. Follows set_engine() if None.
+    backend: str = "thread"
+        The execution backend of the batch methods: "thread", "process" or
+        "interpreter".
+    max_workers: int | None = None
+        The number of workers of the batch methods.
+    executor: Executor | None = None
+        The executor to run thread backend jobs on. The batch methods start
+        a thread pool per call, and the async methods use the event loop's
+        default executor if None.
+    cache_size: int = 128
+        The maximum number of results kept by each of the caches.
+    exceptions: Mapping[str, str] | None = None
+        Custom exception words (see add_exceptions()).
+
+    Example:
     --------
-    str
-        The parsed text.
+    >>> plain = Transliterator(remap_words=False)
+    >>> plain.parse("ami Microsoft e kaj kori")
+    'আমি মিচ্রসফত এ কাজ করি'
     """
 
-    result = await _async_concurrency_helper(
-        lambda t: _parse_backend(t, remap_words), (text,)
-    )
-    parsed = result[0]
-    if bijoy:
-        return await to_bijoy_async(parsed)
-    return parsed
+    def __init__(
+        self,
+        *,
+        bijoy: bool = False,
+        from_bijoy: bool = False,
+        remap_words: bool = True,
+        engine: str | None = None,
+        backend: str = "thread",
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        cache_size: int = 128,
+        exceptions: Mapping[str, str] | None = None,
+    ) -> None:
+        self.bijoy = bijoy
+        self.from_bijoy = from_bijoy
+        self.remap_words = remap_words
+        self.engine = engine
+        self.backend = backend
+        self.max_workers = max_workers
+        self.executor = executor
+        self.cache_size = cache_size
+        self.custom_words = CustomWords(exceptions)
+
+        cache = thread_cache(maxsize=cache_size)
+        self._parse_cached = cache(_parse_backend)
+        self._reverse_cached = cache(_reverse_backend)
+        self._reverse_ext_cached = cache(self._reverse_segments)
+        self._to_bijoy_cached = cache(_convert_backend)
+        self._to_unicode_cached = cache(_convert_backend_unicode)
+
+        with _INSTANCES_LOCK:
+            _INSTANCES.add(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(bijoy={self.bijoy!r}, "
+            f"from_bijoy={self.from_bijoy!r}, "
+            f"remap_words={self.remap_words!r}, engine={self.engine!r})"
+        )
 
+    def __reduce__(self) -> tuple:
+        # Bound methods are shipped to process / interpreter workers with
+        # the batch jobs. Workers rebuild an equivalent instance (once per
+        # version of the custom words) from its options instead of
+        # receiving the caches and the executor. The custom words are
+        # written to a file once per version and only its path is shipped,
+        # so jobs don't grow with the number of words.
+        words = self.custom_words.snapshot
+        if self is _DEFAULT and not words:
+            return (_default_transliterator, ())
+        return (
+            _worker_transliterator,
+            (
+                (
+                    self.bijoy,
+                    self.from_bijoy,
+                    self.remap_words,
+                    self.engine,
+                    self.cache_size,
+                ),
+                (self.custom_words.id, words.version),
+                _shipped_words(self.custom_words.id, words) if words else None,
+            ),
+        )
 
-async def parse_async_iter(
-    texts: Iterable[str], bijoy: bool = False, remap_words: bool = True
-) -> list[str]:
-    """Asynchronous version of parse for multiple texts."""
-    params = tuple(texts)
-    output = await _async_concurrency_helper(
-        lambda text: _parse_backend(text, remap_words), params
-    )
-    if bijoy:
-        return await to_bijoy_async_iter(output)
-    return output
+    def cache_clear(self) -> None:
+        """Drops all cached results."""
+
+        self._parse_cached.cache_clear()
+        self._reverse_cached.cache_clear()
+        self._reverse_ext_cached.cache_clear()
+        self._to_bijoy_cached.cache_clear()
+        self._to_unicode_cached.cache_clear()
+
+    def add_exceptions(self, words: Mapping[str, str]) -> int:
+        """Adds custom exception words, or overrides existing ones.
+
+        Custom words are matched as whole words (or phrases, with any
+        whitespace between their words), case-insensitively, and take
+        precedence over the built-in exception words. Their Bengali text is
+        reversed back to the words. The cost of matching doesn't depend on
+        the number of custom words.
+
+        Results are cached by the text around custom words, so adding (or
+        removing) words never invalidates anything. Updates are published
+        atomically, without locking out readers: calls in flight finish
+        with the words they started with, and later calls see all of the
+        new words.
+
+        Parameters:
+        -----------
+        words: Mapping[str, str]
+            Roman-script words (or phrases) and the Bengali text to parse
+            them to.
+
+        Returns:
+        --------
+        int
+            The number of custom words.
+        """
+
+        return self.custom_words.add(words)
+
+    def remove_exceptions(self, words: Iterable[str]) -> int:
+        """Removes custom exception words (see add_exceptions()).
+
+        Parameters:
+        -----------
+        words: Iterable[str]
+            The Roman-script words (or phrases) to remove.
+
+        Returns:
+        --------
+        int
+            The number of custom words left.
+        """
+
+        return self.custom_words.remove(words)
+
+    def set_exceptions(self, words: Mapping[str, str]) -> int:
+        """Replaces all custom exception words at once.
+
+        The new words are compiled while calls keep running on the old
+        ones, and then swapped in atomically (see add_exceptions()).
+
+        Parameters:
+        -----------
+        words: Mapping[str, str]
+            Roman-script words (or phrases) and the Bengali text to parse
+            them to.
+
+        Returns:
+        --------
+        int
+            The number of custom words.
+        """
+
+        return self.custom_words.replace(words)
+
+    # Backends shipped to the concurrency helpers.
+    def _parse(
+        self,
+        text: str,
+        remap_words: bool,
+        engine: str | None,
+        words: Snapshot | None = None,
+    ) -> str:
+        # Every call reads the custom words once (unless it's given the
+        # snapshot to run on), so that it runs on a single snapshot of them,
+        # however they're updated meanwhile.
+        if words is None:
+            words = self.custom_words.snapshot
+        if remap_words and words:
+            return "".join(
+                piece if custom else self._parse_piece(piece, True, engine)
+                for piece, custom in words.split(text)
+            )
 
+        return self._parse_piece(text, remap_words, engine)
+
+    def _parse_piece(
+        self, text: str, remap_words: bool, engine: str | None
+    ) -> str:
+        # Frequent words are resolved from the read-only frequency table
+        # (see core/frequency.py) and never reach the cache or the matcher,
+        # unless an engine is explicitly requested.
+        if remap_words and engine is None:
+            parsed = frequency.table().parse.get(text)
+            if parsed is not None:
+                return parsed
+
+        return self._parse_cached(text, remap_words, engine)
+
+    def _reverse_segment(
+        self, text: str, remap_words: bool, engine: str | None
+    ) -> str:
+        if remap_words and engine is None:
+            reversed = frequency.table().reverse.get(text)
+            if reversed is not None:
+                return reversed
+
+        return self._reverse_cached(text, remap_words, engine)
+
+    def _reverse_segments(
+        self, text: str, remap_words: bool, engine: str | None
+    ) -> str:
+        return "".join(
+            self._reverse_segment(segment, remap_words, engine)
+            for segment in REVERSE_REGEX.split(text)
+        )
 
-def parse(text: str, bijoy: bool = False, remap_words: bool = True) -> str:
-    """Parses input text, matches and replaces using the Avro Dictionary.
-    If a valid replacement is found, then it returns the replaced string.
-    If no replacement is found, then it instead returns the input text.
+    def _reverse(
+        self, text: str, remap_words: bool, engine: str | None
+    ) -> str:
+        words = self.custom_words.snapshot
+        if remap_words and words:
+            return "".join(
+                piece
+                if custom
+                else self._reverse_ext_cached(piece, True, engine)
+                for piece, custom in words.split(text, True)
+            )
 
-    Parameters:
-    -----------
-    text: str
-        The text to parse.
-    bijoy: bool = False
-        Whether to return result in the Bijoy Keyboard format (ASCII).
-    remap_words: bool = True
+        return self._reverse_ext_cached(text, remap_words, engine)
+
+    def _parse_chunk(
+        self,
+        text: str,
+        remap_words: bool,
+        engine: str | None,
+        words: Snapshot | None,
+    ) -> str:
+        # Chunks of a large text (see _parallel()) run on the custom words
+        # the whole call started with, and bypass the cache, which would
+        # otherwise keep them alive.
+        if remap_words and words:
+            return "".join(
+                piece if custom else _parse_backend(piece, True, engine)
+                for piece, custom in words.split(text)
+            )
+
+        return _parse_backend(text, remap_words, engine)
+
+    def _reverse_chunk(
+        self,
+        text: str,
+        remap_words: bool,
+        engine: str | None,
+        words: Snapshot | None,
+    ) -> str:
+        if remap_words and words:
+            return "".join(
+                piece
+                if custom
+                else self._reverse_segments(piece, True, engine)
+                for piece, custom in words.split(text, True)
+            )
+
+        return self._reverse_segments(text, remap_words, engine)
+
+    def _to_bijoy(self, text: str, engine: str | None) -> str:
+        return self._to_bijoy_cached(text, engine)
+
+    def _to_unicode(self, text: str, engine: str | None) -> str:
+        return self._to_unicode_cached(text, engine)
+
+    def _batch_options(
+        self, backend: str | None, max_workers: int | None
+    ) -> dict:
+        return {
+            "backend": self.backend if backend is None else backend,
+            "max_workers": (
+                self.max_workers if max_workers is None else max_workers
+            ),
+            "executor": self.executor,
+        }
+
+    def _parallel(
+        self,
+        operation: str,
+        text: str,
+        remap_words: bool,
+        engine: str | None,
+        backend: str | None,
+        max_workers: int | None,
+    ) -> str | None:
+        # Converts a large text in chunks, concurrently (see core/parallel.py).
+        # Returns None if the text isn't worth splitting, or can't be split.
+        options = self._batch_options(backend, max_workers)
+        words = self.custom_words.snapshot if remap_words else None
+        phrases = bool(words) and words.has_phrases(operation == "reverse")
+
+        chunks = parallel.split(
+            text, operation, options["max_workers"], phrases=phrases
+        )
+        if len(chunks) < 2:
+            return None
+
+        func, args = self._chunk_backend(operation, remap_words, engine, words)
+        outputs = _sync_concurrency_helper(
+            func,
+            tuple(parallel.wrap(chunks, operation)),
+            *args,
+            **options,
+            batch=False,
+        )
+        return parallel.unwrap(outputs, chunks, operation)
+
+    def _chunk_backend(
+        self,
+        operation: str,
+        remap_words: bool,
+        engine: str | None,
+        words: Snapshot | None,
+    ) -> tuple[Callable[..., str], tuple]:
+        # The backend converting chunks of text for an operation, and the
+        # options to pass it after every chunk.
+        if operation == "parse":
+            return self._parse_chunk, (remap_words, engine, words or None)
+        if operation == "reverse":
+            return self._reverse_chunk, (remap_words, engine, words or None)
+        if operation == "to_bijoy":
+            return _convert_backend, (engine,)
+        return _convert_backend_unicode, (engine,)
+
+    def _stream(
+        self, operation: str, remap_words: bool, engine: str | None
+    ) -> streams.Stream:
+        # Converts text for an operation as it's read (see core/streams.py).
+        words = self.custom_words.snapshot if remap_words else None
+        func, args = self._chunk_backend(operation, remap_words, engine, words)
+        return streams.Stream(
+            lambda text: func(text, *args),
+            operation,
+            bool(words) and words.has_phrases(operation == "reverse"),
+        )
+
+    def _streams(
+        self,
+        operation: str,
+        bijoy: bool | None = None,
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+    ) -> list[streams.Stream]:
+        # The chain of streams running an operation on text as it's read,
+        # with the options of the operation (see the *_bytes() methods and
+        # core/jobs.py).
+        engine = self.engine if engine is None else engine
+        if operation in ("to_bijoy", "to_unicode"):
+            return [self._stream(operation, False, engine)]
+
+        remap_words = self.remap_words if remap_words is None else remap_words
+        chain = [self._stream(operation, remap_words, engine)]
+        if operation == "parse" and (self.bijoy if bijoy is None else bijoy):
+            chain.append(self._stream("to_bijoy", False, engine))
+        if operation == "reverse" and (
+            self.from_bijoy if from_bijoy is None else from_bijoy
+        ):
+            chain.insert(0, self._stream("to_unicode", False, engine))
+        return chain
+
+    # Parsing.
+    def parse(
+        self,
+        text: str,
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        parallel: bool = False,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> str:
+        """Parses input text. See avro.parse() for details."""
+
+        engine = self.engine if engine is None else engine
+        remap_words = self.remap_words if remap_words is None else remap_words
+        parsed = None
+        if parallel:
+            parsed = self._parallel(
+                "parse", text, remap_words, engine, backend, max_workers
+            )
+        if parsed is None:
+            parsed = self._parse(text, remap_words, engine)
+        if self.bijoy if bijoy is None else bijoy:
+            return self.to_bijoy(
+                parsed,
+                engine=engine,
+                parallel=parallel,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        return parsed
+
+    async def parse_async(
+        self,
+        text: str,
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+    ) -> str:
+        """Asynchronous version of parse()."""
+
+        engine = self.engine if engine is None else engine
+        result = await _async_concurrency_helper(
+            self._parse,
+            (text,),
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            executor=self.executor,
+            batch=False,
+        )
+        if self.bijoy if bijoy is None else bijoy:
+            return await self.to_bijoy_async(result[0], engine=engine)
+        return result[0]
+
+    def parse_iter(
+        self,
+        texts: Iterable[str],
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Parses multiple texts. See avro.parse_iter() for details."""
+
+        engine = self.engine if engine is None else engine
+        output = _sync_concurrency_helper(
+            self._parse,
+            tuple(texts),
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+        if self.bijoy if bijoy is None else bijoy:
+            return self.to_bijoy_iter(
+                output,
+                engine=engine,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        return output
+
+    async def parse_async_iter(
+        self,
+        texts: Iterable[str],
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Asynchronous version of parse_iter()."""
+
+        engine = self.engine if engine is None else engine
+        output = await _async_concurrency_helper(
+            self._parse,
+            tuple(texts),
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+        if self.bijoy if bijoy is None else bijoy:
+            return await self.to_bijoy_async_iter(
+                output,
+                engine=engine,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        return output
+
+    # Reversing.
+    def parse_incremental(
+        self,
+        text: str,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+    ) -> incremental.Document:
+        """Parses text for editing. See avro.parse_incremental()."""
+
+        engine = self.engine if engine is None else engine
+        remap_words = self.remap_words if remap_words is None else remap_words
+        # The document runs on the custom words it's created with, which its
+        # separators depend on.
+        words = self.custom_words.snapshot
+        separators = tables.phonetic().separators()
+
+        # Custom phrases span the whitespace between their words.
+        if words.has_phrases():
+            separators = separators.difference(string.whitespace)
+
+        return incremental.Document(
+            text,
+            partial(
+                self._parse,
+                remap_words=remap_words,
+                engine=engine,
+                words=words,
+            ),
+            separators,
+        )
+
+    def typing_session(
+        self, remap_words: bool | None = None, *, engine: str | None = None
+    ) -> session.TypingSession:
+        """Starts a typing session. See avro.typing_session()."""
+
+        engine = self.engine if engine is None else engine
+        remap_words = self.remap_words if remap_words is None else remap_words
+        # As for parse_incremental().
+        words = self.custom_words.snapshot
+        separators = tables.phonetic().separators()
+
+        if words.has_phrases():
+            separators = separators.difference(string.whitespace)
+
+        return session.TypingSession(
+            partial(
+                self._parse,
+                remap_words=remap_words,
+                engine=engine,
+                words=words,
+            ),
+            separators,
+            remap_words,
+            words,
+        )
+
+    def reverse(
+        self,
+        text: str,
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        parallel: bool = False,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> str:
+        """Reverses input text. See avro.reverse() for details."""
+
+        engine = self.engine if engine is None else engine
+        remap_words = self.remap_words if remap_words is None else remap_words
+        if self.from_bijoy if from_bijoy is None else from_bijoy:
+            text = self.to_unicode(
+                text,
+                engine=engine,
+                parallel=parallel,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        if parallel:
+            reversed = self._parallel(
+                "reverse", text, remap_words, engine, backend, max_workers
+            )
+            if reversed is not None:
+                return reversed
+        return self._reverse(text, remap_words, engine)
+
+    async def reverse_async(
+        self,
+        text: str,
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+    ) -> str:
+        """Asynchronous version of reverse()."""
+
+        engine = self.engine if engine is None else engine
+        if self.from_bijoy if from_bijoy is None else from_bijoy:
+            text = await self.to_unicode_async(text, engine=engine)
+        result = await _async_concurrency_helper(
+            self._reverse,
+            (text,),
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            executor=self.executor,
+            batch=False,
+        )
+        return result[0]
+
+    def reverse_iter(
+        self,
+        texts: Iterable[str],
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Reverses multiple texts. See avro.reverse_iter() for details."""
+
+        engine = self.engine if engine is None else engine
+        params = tuple(texts)
+        if self.from_bijoy if from_bijoy is None else from_bijoy:
+            params = tuple(
+                self.to_unicode_iter(
+                    params,
+                    engine=engine,
+                    backend=backend,
+                    max_workers=max_workers,
+                )
+            )
+        return _sync_concurrency_helper(
+            self._reverse,
+            params,
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    async def reverse_async_iter(
+        self,
+        texts: Iterable[str],
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Asynchronous version of reverse_iter()."""
+
+        engine = self.engine if engine is None else engine
+        params = tuple(texts)
+        if self.from_bijoy if from_bijoy is None else from_bijoy:
+            params = tuple(
+                await self.to_unicode_async_iter(
+                    params,
+                    engine=engine,
+                    backend=backend,
+                    max_workers=max_workers,
+                )
+            )
+        return await _async_concurrency_helper(
+            self._reverse,
+            params,
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    # Bijoy conversions.
+    def to_bijoy(
+        self,
+        text: str,
+        *,
+        engine: str | None = None,
+        parallel: bool = False,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> str:
+        """Converts text to Bijoy. See avro.to_bijoy() for details."""
+
+        engine = self.engine if engine is None else engine
+        if parallel:
+            converted = self._parallel(
+                "to_bijoy", text, False, engine, backend, max_workers
+            )
+            if converted is not None:
+                return converted
+        return self._to_bijoy(text, engine)
+
+    async def to_bijoy_async(
+        self, text: str, *, engine: str | None = None
+    ) -> str:
+        """Asynchronous version of to_bijoy()."""
+
+        result = await _async_concurrency_helper(
+            self._to_bijoy,
+            (text,),
+            self.engine if engine is None else engine,
+            executor=self.executor,
+            batch=False,
+        )
+        return result[0]
+
+    def to_bijoy_iter(
+        self,
+        texts: Iterable[str],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Converts multiple texts to Bijoy. See avro.to_bijoy_iter()."""
+
+        engine = self.engine if engine is None else engine
+        if engines.get(engine).to_bijoy is _to_bijoy:
+            return _vectorized_helper(
+                bijoy.to_bijoy_batch,
+                tuple(texts),
+                **self._batch_options(backend, max_workers),
+            )
+        return _sync_concurrency_helper(
+            self._to_bijoy,
+            tuple(texts),
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    async def to_bijoy_async_iter(
+        self,
+        texts: Iterable[str],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Asynchronous version of to_bijoy_iter()."""
+
+        return await _async_concurrency_helper(
+            self._to_bijoy,
+            tuple(texts),
+            self.engine if engine is None else engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    def to_unicode(
+        self,
+        text: str,
+        *,
+        engine: str | None = None,
+        parallel: bool = False,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> str:
+        """Converts Bijoy text to Unicode. See avro.to_unicode()."""
+
+        engine = self.engine if engine is None else engine
+        if parallel:
+            converted = self._parallel(
+                "to_unicode", text, False, engine, backend, max_workers
+            )
+            if converted is not None:
+                return converted
+        return self._to_unicode(text, engine)
+
+    async def to_unicode_async(
+        self, text: str, *, engine: str | None = None
+    ) -> str:
+        """Asynchronous version of to_unicode()."""
+
+        result = await _async_concurrency_helper(
+            self._to_unicode,
+            (text,),
+            self.engine if engine is None else engine,
+            executor=self.executor,
+            batch=False,
+        )
+        return result[0]
+
+    def to_unicode_iter(
+        self,
+        texts: Iterable[str],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Converts multiple Bijoy texts. See avro.to_unicode_iter()."""
+
+        engine = self.engine if engine is None else engine
+        if engines.get(engine).to_unicode is _to_unicode:
+            return _vectorized_helper(
+                bijoy.to_unicode_batch,
+                tuple(texts),
+                **self._batch_options(backend, max_workers),
+            )
+        return _sync_concurrency_helper(
+            self._to_unicode,
+            tuple(texts),
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    async def to_unicode_async_iter(
+        self,
+        texts: Iterable[str],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Asynchronous version of to_unicode_iter()."""
+
+        return await _async_concurrency_helper(
+            self._to_unicode,
+            tuple(texts),
+            self.engine if engine is None else engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    # Bytes.
+    def parse_bytes(
+        self,
+        data: streams.Source,
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        sink: streams.Sink | None = None,
+    ) -> bytes | int:
+        """Parses UTF-8 input. See avro.parse_bytes() for details."""
+
+        chain = self._streams(
+            "parse", bijoy=bijoy, remap_words=remap_words, engine=engine
+        )
+        return streams.run(data, chain, sink)
+
+    def reverse_bytes(
+        self,
+        data: streams.Source,
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        sink: streams.Sink | None = None,
+    ) -> bytes | int:
+        """Reverses UTF-8 input. See avro.reverse_bytes() for details."""
+
+        chain = self._streams(
+            "reverse",
+            from_bijoy=from_bijoy,
+            remap_words=remap_words,
+            engine=engine,
+        )
+        return streams.run(data, chain, sink)
+
+    def to_bijoy_bytes(
+        self,
+        data: streams.Source,
+        *,
+        engine: str | None = None,
+        sink: streams.Sink | None = None,
+    ) -> bytes | int:
+        """Converts UTF-8 input to Bijoy. See avro.to_bijoy_bytes()."""
+
+        return streams.run(
+            data, self._streams("to_bijoy", engine=engine), sink
+        )
+
+    def to_unicode_bytes(
+        self,
+        data: streams.Source,
+        *,
+        engine: str | None = None,
+        sink: streams.Sink | None = None,
+    ) -> bytes | int:
+        """Converts UTF-8 Bijoy input. See avro.to_unicode_bytes()."""
+
+        return streams.run(
+            data, self._streams("to_unicode", engine=engine), sink
+        )
+
+    # Columns.
+    def parse_columns(
+        self,
+        buffer: columns.Buffer,
+        offsets: Sequence[int],
+        bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> columns.Column:
+        """Parses a column of texts. See avro.parse_columns() for details."""
+
+        engine = self.engine if engine is None else engine
+        output = _columns_helper(
+            self._parse,
+            columns.Column(buffer, offsets),
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+        if self.bijoy if bijoy is None else bijoy:
+            return self.to_bijoy_columns(
+                *output,
+                engine=engine,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        return output
+
+    def reverse_columns(
+        self,
+        buffer: columns.Buffer,
+        offsets: Sequence[int],
+        from_bijoy: bool | None = None,
+        remap_words: bool | None = None,
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> columns.Column:
+        """Reverses a column of texts. See avro.reverse_columns()."""
+
+        engine = self.engine if engine is None else engine
+        column = columns.Column(buffer, offsets)
+        if self.from_bijoy if from_bijoy is None else from_bijoy:
+            column = self.to_unicode_columns(
+                *column,
+                engine=engine,
+                backend=backend,
+                max_workers=max_workers,
+            )
+        return _columns_helper(
+            self._reverse,
+            column,
+            self.remap_words if remap_words is None else remap_words,
+            engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    def to_bijoy_columns(
+        self,
+        buffer: columns.Buffer,
+        offsets: Sequence[int],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> columns.Column:
+        """Converts a column of texts to Bijoy. See avro.to_bijoy_columns()."""
+
+        return _columns_helper(
+            self._to_bijoy,
+            columns.Column(buffer, offsets),
+            self.engine if engine is None else engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    def to_unicode_columns(
+        self,
+        buffer: columns.Buffer,
+        offsets: Sequence[int],
+        *,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> columns.Column:
+        """Converts a column of Bijoy texts. See avro.to_unicode_columns()."""
+
+        return _columns_helper(
+            self._to_unicode,
+            columns.Column(buffer, offsets),
+            self.engine if engine is None else engine,
+            **self._batch_options(backend, max_workers),
+        )
+
+    # Detection.
+    def convert(
+        self,
+        text: str,
+        target: str = classify.UNICODE,
+        *,
+        runs: bool = False,
+        engine: str | None = None,
+    ) -> str:
+        """Converts text, whatever it's in. See avro.convert() for details."""
+
+        pieces = []
+        for encoding, piece in _encoded_pieces(text, target, runs):
+            route = _ROUTES.get((encoding, target))
+            if route is not None:
+                name, options = route
+                piece = getattr(self, name)(piece, engine=engine, **options)
+            pieces.append(piece)
+        return "".join(pieces)
+
+    def convert_iter(
+        self,
+        texts: Iterable[str],
+        target: str = classify.UNICODE,
+        *,
+        runs: bool = False,
+        engine: str | None = None,
+        backend: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Converts multiple texts, whatever they're in. See
+        avro.convert_iter() for details."""
+
+        outputs: list[list[str]] = []
+        # The pieces converted from every encoding, and where they go.
+        batches: dict[str, tuple[list[str], list[tuple[int, int]]]] = {}
+        for i, text in enumerate(texts):
+            pieces = []
+            for j, (encoding, piece) in enumerate(
+                _encoded_pieces(text, target, runs)
+            ):
+                if (encoding, target) in _ROUTES:
+                    batch = batches.setdefault(encoding, ([], []))
+                    batch[0].append(piece)
+                    batch[1].append((i, j))
+                pieces.append(piece)
+            outputs.append(pieces)
+
+        # Every encoding is converted in one batch.
+        for encoding, (pieces, places) in batches.items():
+            name, options = _ROUTES[(encoding, target)]
+            converted = getattr(self, f"{name}_iter")(
+                pieces,
+                engine=engine,
+                backend=backend,
+                max_workers=max_workers,
+                **options,
+            )
+            for (i, j), piece in zip(places, converted):
+                outputs[i][j] = piece
+
+        return ["".join(pieces) for pieces in outputs]
+
+
+# The instance behind the module-level functions.
+_DEFAULT = Transliterator()
+
+# Instances rebuilt in process / interpreter workers, by their options and
+# custom words, along with the version of the words they were built with.
+_WORKER_TRANSLITERATORS: dict[tuple, tuple[int, Transliterator]] = {}
+
+
+# The files custom words are shipped to workers in (see _shipped_words()),
+# by the id and version of the words, and the directory holding them along
+# with the process that made it.
+_SHIPPED_WORDS: dict[tuple[str, int], str] = {}
+_SHIPPED_WORDS_DIRECTORY: tuple[int, str] | None = None
+_SHIPPED_WORDS_LOCK = threading.Lock()
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _remove_shipped_words(pid: int, directory: str) -> None:
+    """Removes the shipped words on exit (but not from forked children)."""
+
+    import shutil
+
+    if os.getpid() == pid:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _shipped_words(id: str, words: Snapshot) -> str:
+    """Returns the file a version of custom words is shipped to workers in.
+
+    The words are written once per version, to a temporary directory that
+    is removed when the process exits.
+    """
+
+    global _SHIPPED_WORDS_DIRECTORY
+
+    key = (id, words.version)
+    with _SHIPPED_WORDS_LOCK:
+        path = _SHIPPED_WORDS.get(key)
+        if path is not None:
+            return path
+
+        import json
+
+        if (
+            _SHIPPED_WORDS_DIRECTORY is None
+            or _SHIPPED_WORDS_DIRECTORY[0] != os.getpid()
+        ):
+            import atexit
+            import tempfile
+
+            _SHIPPED_WORDS.clear()
+            _SHIPPED_WORDS_DIRECTORY = (
+                os.getpid(),
+                tempfile.mkdtemp(prefix="avro-words-"),
+            )
+            atexit.register(_remove_shipped_words, *_SHIPPED_WORDS_DIRECTORY)
+
+        path = os.path.join(
+            _SHIPPED_WORDS_DIRECTORY[1], f"{id}-{words.version}.json"
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(dict(words.items()), file, ensure_ascii=False)
+        _SHIPPED_WORDS[key] = path
+
+    return path
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _default_transliterator() -> Transliterator:
+    """Returns the default instance (used when unpickling it)."""
+
+    return _DEFAULT
+
+
+# This is a backend function and MUST NOT BE EXPORTED!
+def _worker_transliterator(
+    options: tuple[bool, bool, bool, str | None, int],
+    custom_words: tuple[str, int],
+    exceptions: str | None,
+) -> Transliterator:
+    """Returns the worker-side instance for the given options.
+
+    The custom words are loaded from the file they're shipped in (see
+    _shipped_words()) only when their version changes.
+    """
+
+    key = (options, custom_words[0])
+    version = custom_words[1]
+    entry = _WORKER_TRANSLITERATORS.get(key)
+
+    if entry is None or entry[0] != version:
+        import json
+
+        bijoy, from_bijoy, remap_words, engine, cache_size = options
+        words = {}
+        if exceptions is not None:
+            with open(exceptions, encoding="utf-8") as file:
+                words = json.load(file)
+
+        entry = _WORKER_TRANSLITERATORS[key] = (
+            version,
+            Transliterator(
+                bijoy=bijoy,
+                from_bijoy=from_bijoy,
+                remap_words=remap_words,
+                engine=engine,
+                cache_size=cache_size,
+                exceptions=words,
+            ),
+        )
+
+    return entry[1]
+
+
+# ---
+
+# Primary user-end functions.
+# ---
+
+
+async def parse_async(
+    text: str,
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+) -> str:
+    """Asynchronous version of parse() function.
+
+    Parses input text, matches and replaces using the Avro Dictionary.
+    If a valid replacement is found, then it returns the replaced string.
+    If no replacement is found, then it instead returns the input text.
+
+    Parameters:
+    -----------
+    text: str
+        The text to parse.
+    bijoy: bool = False
+        Whether to return result in the Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
         Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
 
     Returns:
     --------
@@ -481,26 +2097,191 @@ def parse(text: str, bijoy: bool = False, remap_words: bool = True) -> str:
         The parsed text.
     """
 
-    parsed = _parse_backend(text, remap_words)
-    if bijoy:
-        return to_bijoy(parsed)
-    return parsed
+    return await _DEFAULT.parse_async(text, bijoy, remap_words, engine=engine)
+
+
+async def parse_async_iter(
+    texts: Iterable[str],
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
+    """Asynchronous version of parse for multiple texts."""
+
+    return await _DEFAULT.parse_async_iter(
+        texts,
+        bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def parse(
+    text: str,
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    parallel: bool = False,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> str:
+    """Parses input text, matches and replaces using the Avro Dictionary.
+    If a valid replacement is found, then it returns the replaced string.
+    If no replacement is found, then it instead returns the input text.
+
+    Parameters:
+    -----------
+    text: str
+        The text to parse.
+    bijoy: bool = False
+        Whether to return result in the Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
+        Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    parallel: bool = False
+        Whether to split a large text into chunks at the characters nothing
+        parses across, and parse them concurrently. The result is the same.
+    backend: str = "thread"
+        The execution backend of parallel parsing: "thread", "process" or
+        "interpreter".
+    max_workers: int | None = None
+        The number of workers of parallel parsing.
+
+    Returns:
+    --------
+    str
+        The parsed text.
+    """
+
+    return _DEFAULT.parse(
+        text,
+        bijoy,
+        remap_words,
+        engine=engine,
+        parallel=parallel,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def parse_incremental(
+    text: str, remap_words: bool = True, *, engine: str | None = None
+) -> incremental.Document:
+    """Parses text that is going to be edited, e.g. in an editor.
+
+    Returns a document keeping the text along with its parsed output. Its
+    edit() method applies an edit (offset, deleted length, inserted text)
+    and parses only the few words around it again, so that the cost of an
+    edit doesn't depend on the size of the text. It returns the matching
+    edit of the output, and the document's output stays equal to what
+    parse() would return for its text, with the custom words as of its
+    creation (words added later only apply to later documents). The output
+    is always in Unicode.
+
+    Parameters:
+    -----------
+    text: str
+        The initial text.
+    remap_words: bool = True
+        Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+
+    Returns:
+    --------
+    Document
+        The document, with its text and output.
+
+    Example:
+    --------
+    >>> document = parse_incremental("ami tomake gan gai")
+    >>> document.edit(4, 6, "tumi")
+    Edit(offset=5, deleted=4, inserted='ুমি')
+    >>> document.output
+    'আমি তুমি গান গাই'
+    """
+
+    return _DEFAULT.parse_incremental(text, remap_words, engine=engine)
+
+
+def typing_session(
+    remap_words: bool = True, *, engine: str | None = None
+) -> session.TypingSession:
+    """Starts a typing session, for input methods.
+
+    The session is fed one keystroke at a time, and returns what each of
+    them changed at the end of the output: the number of characters to
+    delete, and the text to insert. Later keystrokes may change the output
+    of earlier ones (e.g. "k" then "h"). Only the last few characters are
+    parsed again on every keystroke, so its cost doesn't depend on the
+    length of the word or of the text. The session's output stays equal to
+    what parse() would return for everything typed, with the custom words
+    as of the start of the session (words added later only apply to later
+    sessions).
+
+    Parameters:
+    -----------
+    remap_words: bool = True
+        Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to parse whole words on (see set_engine()). Defaults to
+        the selected engine.
+
+    Returns:
+    --------
+    TypingSession
+        The session.
+
+    Example:
+    --------
+    >>> typing = typing_session()
+    >>> typing.press("k")
+    Keystroke(deleted=0, inserted='ক')
+    >>> typing.press("h")
+    Keystroke(deleted=1, inserted='খ')
+    >>> typing.backspace()
+    Keystroke(deleted=1, inserted='ক')
+    """
+
+    return _DEFAULT.typing_session(remap_words, engine=engine)
 
 
 def parse_iter(
-    texts: Iterable[str], bijoy: bool = False, remap_words: bool = True
+    texts: Iterable[str],
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
 ) -> list[str]:
-    """Parses multiple texts and returns list of parsed strings."""
-    params = tuple(texts)
-    output = _sync_concurrency_helper(
-        lambda text: _parse_backend(text, remap_words), params
+    """Parses multiple texts and returns list of parsed strings.
+
+    The texts are processed on a pool of workers selected by `backend`:
+    "thread" (default), "process" or "interpreter" (subinterpreters on
+    Python 3.14+, falling back to "thread" on older versions).
+    """
+
+    return _DEFAULT.parse_iter(
+        texts,
+        bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
     )
-    if bijoy:
-        return to_bijoy_iter(output)
-    return output
 
 
-async def to_bijoy_async(text: str) -> str:
+async def to_bijoy_async(text: str, *, engine: str | None = None) -> str:
     """Asynchronous version of to_bijoy() function.
 
     Converts input text (Avro, Unicode) to Bijoy Keyboard format (ASCII).
@@ -510,6 +2291,9 @@ async def to_bijoy_async(text: str) -> str:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
 
     Returns:
     --------
@@ -517,61 +2301,115 @@ async def to_bijoy_async(text: str) -> str:
         The converted text.
     """
 
-    result = await _async_concurrency_helper(_convert_backend, (text,))
-    return result[0]
+    return await _DEFAULT.to_bijoy_async(text, engine=engine)
 
 
 def reverse_iter(
-    texts: Iterable[str], from_bijoy: bool = False, remap_words: bool = True
+    texts: Iterable[str],
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
 ) -> list[str]:
     """Reverses multiple texts to Roman script and returns list of strings."""
-    params = tuple(texts)
-    if from_bijoy:
-        converted = to_unicode_iter(params)
-        params = tuple(converted)
-    return _sync_concurrency_helper(
-        lambda text: _reverse_backend_ext(text, remap_words), params
+
+    return _DEFAULT.reverse_iter(
+        texts,
+        from_bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
     )
 
 
 async def reverse_async_iter(
-    texts: Iterable[str], from_bijoy: bool = False, remap_words: bool = True
+    texts: Iterable[str],
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
 ) -> list[str]:
     """Asynchronous version of reverse for multiple texts."""
-    params = tuple(texts)
-    if from_bijoy:
-        converted = await to_unicode_async_iter(params)
-        params = tuple(converted)
-    return await _async_concurrency_helper(
-        lambda text: _reverse_backend_ext(text, remap_words), params
+
+    return await _DEFAULT.reverse_async_iter(
+        texts,
+        from_bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
     )
 
 
-def to_unicode_iter(texts: Iterable[str]) -> list[str]:
+def to_unicode_iter(
+    texts: Iterable[str],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
     """Converts multiple texts from Bijoy ASCII to Unicode and returns list of strings."""
-    params = tuple(texts)
-    return _sync_concurrency_helper(_convert_backend_unicode, params)
+
+    return _DEFAULT.to_unicode_iter(
+        texts, engine=engine, backend=backend, max_workers=max_workers
+    )
 
 
-async def to_unicode_async_iter(texts: Iterable[str]) -> list[str]:
+async def to_unicode_async_iter(
+    texts: Iterable[str],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
     """Asynchronous version of to_unicode for multiple texts."""
-    params = tuple(texts)
-    return await _async_concurrency_helper(_convert_backend_unicode, params)
+
+    return await _DEFAULT.to_unicode_async_iter(
+        texts, engine=engine, backend=backend, max_workers=max_workers
+    )
 
 
-def to_bijoy_iter(texts: Iterable[str]) -> list[str]:
+def to_bijoy_iter(
+    texts: Iterable[str],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
     """Converts multiple texts to Bijoy ASCII and returns list of strings."""
-    params = tuple(texts)
-    return _sync_concurrency_helper(_convert_backend, params)
+
+    return _DEFAULT.to_bijoy_iter(
+        texts, engine=engine, backend=backend, max_workers=max_workers
+    )
 
 
-async def to_bijoy_async_iter(texts: Iterable[str]) -> list[str]:
+async def to_bijoy_async_iter(
+    texts: Iterable[str],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
     """Asynchronous version of to_bijoy for multiple texts."""
-    params = tuple(texts)
-    return await _async_concurrency_helper(_convert_backend, params)
+
+    return await _DEFAULT.to_bijoy_async_iter(
+        texts, engine=engine, backend=backend, max_workers=max_workers
+    )
 
 
-def to_bijoy(text: str) -> str:
+def to_bijoy(
+    text: str,
+    *,
+    engine: str | None = None,
+    parallel: bool = False,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> str:
     """Converts input text (Avro, Unicode) to Bijoy Keyboard format (ASCII).
     If a valid conversion is found, then it returns the converted string.
 
@@ -579,6 +2417,17 @@ def to_bijoy(text: str) -> str:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    parallel: bool = False
+        Whether to split a large text into chunks at the characters nothing
+        converts across, and convert them concurrently. The result is the same.
+    backend: str = "thread"
+        The execution backend of parallel conversion: "thread", "process" or
+        "interpreter".
+    max_workers: int | None = None
+        The number of workers of parallel conversion.
 
     Returns:
     --------
@@ -586,10 +2435,16 @@ def to_bijoy(text: str) -> str:
         The converted text.
     """
 
-    return _convert_backend(text)
+    return _DEFAULT.to_bijoy(
+        text,
+        engine=engine,
+        parallel=parallel,
+        backend=backend,
+        max_workers=max_workers,
+    )
 
 
-async def to_unicode_async(text: str) -> str:
+async def to_unicode_async(text: str, *, engine: str | None = None) -> str:
     """Asynchronous version of to_unicode() function.
 
     Converts input text (Bijoy Keyboard, ASCII) to Unicode (Avro Keyboard format).
@@ -599,6 +2454,9 @@ async def to_unicode_async(text: str) -> str:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
 
     Returns:
     --------
@@ -606,11 +2464,17 @@ async def to_unicode_async(text: str) -> str:
         The converted text.
     """
 
-    result = await _async_concurrency_helper(_convert_backend_unicode, (text,))
-    return result[0]
+    return await _DEFAULT.to_unicode_async(text, engine=engine)
 
 
-def to_unicode(text: str) -> str:
+def to_unicode(
+    text: str,
+    *,
+    engine: str | None = None,
+    parallel: bool = False,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> str:
     """Converts input text (Bijoy Keyboard, ASCII) to Unicode (Avro Keyboard format).
     If a valid conversion is found, then it returns the converted string.
 
@@ -618,6 +2482,17 @@ def to_unicode(text: str) -> str:
     -----------
     text: str
         The text to convert.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    parallel: bool = False
+        Whether to split a large text into chunks at the characters nothing
+        converts across, and convert them concurrently. The result is the same.
+    backend: str = "thread"
+        The execution backend of parallel conversion: "thread", "process" or
+        "interpreter".
+    max_workers: int | None = None
+        The number of workers of parallel conversion.
 
     Returns:
     --------
@@ -625,11 +2500,21 @@ def to_unicode(text: str) -> str:
         The converted text.
     """
 
-    return _convert_backend_unicode(text)
+    return _DEFAULT.to_unicode(
+        text,
+        engine=engine,
+        parallel=parallel,
+        backend=backend,
+        max_workers=max_workers,
+    )
 
 
 async def reverse_async(
-    text: str, from_bijoy: bool = False, remap_words: bool = True
+    text: str,
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
 ) -> str:
     """Asynchronous version of reverse() function.
 
@@ -645,6 +2530,9 @@ async def reverse_async(
         Whether to reverse input text from Bijoy Keyboard format (ASCII).
     remap_words: bool = True
         Whether to reverse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
 
     Returns:
     --------
@@ -652,17 +2540,20 @@ async def reverse_async(
         The reversed text.
     """
 
-    # Convert from Bijoy to Unicode if from_bijoy is True
-    if from_bijoy:
-        text = await to_unicode_async(text)
-    result = await _async_concurrency_helper(
-        lambda t: _reverse_backend_ext(t, remap_words), (text,)
+    return await _DEFAULT.reverse_async(
+        text, from_bijoy, remap_words, engine=engine
     )
-    return result[0]
 
 
 def reverse(
-    text: str, from_bijoy: bool = False, remap_words: bool = True
+    text: str,
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    parallel: bool = False,
+    backend: str = "thread",
+    max_workers: int | None = None,
 ) -> str:
     """Reverses input text to Roman script typed in English.
     If a valid replacement is found, then it returns the replaced string.
@@ -676,6 +2567,17 @@ def reverse(
         Whether to reverse input text from Bijoy Keyboard format (ASCII).
     remap_words: bool = True
         Whether to reverse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    parallel: bool = False
+        Whether to split a large text into chunks at the characters nothing
+        reverses across, and reverse them concurrently. The result is the same.
+    backend: str = "thread"
+        The execution backend of parallel reversing: "thread", "process" or
+        "interpreter".
+    max_workers: int | None = None
+        The number of workers of parallel reversing.
 
     Returns:
     --------
@@ -683,7 +2585,778 @@ def reverse(
         The reversed text.
     """
 
-    # Convert from Bijoy to Unicode if from_bijoy is True
-    if from_bijoy:
-        text = to_unicode(text)
-    return _reverse_backend_ext(text, remap_words)
+    return _DEFAULT.reverse(
+        text,
+        from_bijoy,
+        remap_words,
+        engine=engine,
+        parallel=parallel,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def parse_bytes(
+    data: streams.Source,
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    sink: streams.Sink | None = None,
+) -> bytes | int:
+    """Parses UTF-8 input, without decoding or building it as a whole.
+
+    The input is decoded, parsed and encoded back a chunk at a time (cut
+    where nothing parses across), so that large payloads never exist in
+    full as strings. The output is exactly that of parse().
+
+    Parameters:
+    -----------
+    data: bytes | bytearray | memoryview | BinaryIO
+        The UTF-8 input, or a binary file to read it from.
+    bijoy: bool = False
+        Whether to return result in the Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
+        Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    sink: bytearray | BinaryIO | None = None
+        Where to write the UTF-8 output as it's produced: a bytearray to
+        extend, or a binary file (or anything with a write() method taking
+        bytes). The output is returned if None.
+
+    Returns:
+    --------
+    bytes | int
+        The output, or the number of bytes written to the sink.
+    """
+
+    return _DEFAULT.parse_bytes(
+        data, bijoy, remap_words, engine=engine, sink=sink
+    )
+
+
+def reverse_bytes(
+    data: streams.Source,
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    sink: streams.Sink | None = None,
+) -> bytes | int:
+    """Reverses UTF-8 input, a chunk at a time (see parse_bytes()).
+
+    Parameters:
+    -----------
+    data: bytes | bytearray | memoryview | BinaryIO
+        The UTF-8 input, or a binary file to read it from.
+    from_bijoy: bool = False
+        Whether to reverse input text from Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
+        Whether to reverse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    sink: bytearray | BinaryIO | None = None
+        Where to write the UTF-8 output as it's produced: a bytearray to
+        extend, or a binary file (or anything with a write() method taking
+        bytes). The output is returned if None.
+
+    Returns:
+    --------
+    bytes | int
+        The output, or the number of bytes written to the sink.
+    """
+
+    return _DEFAULT.reverse_bytes(
+        data, from_bijoy, remap_words, engine=engine, sink=sink
+    )
+
+
+def to_bijoy_bytes(
+    data: streams.Source,
+    *,
+    engine: str | None = None,
+    sink: streams.Sink | None = None,
+) -> bytes | int:
+    """Converts UTF-8 input to Bijoy, a chunk at a time (see parse_bytes()).
+
+    Parameters:
+    -----------
+    data: bytes | bytearray | memoryview | BinaryIO
+        The UTF-8 input, or a binary file to read it from.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    sink: bytearray | BinaryIO | None = None
+        Where to write the UTF-8 output as it's produced: a bytearray to
+        extend, or a binary file (or anything with a write() method taking
+        bytes). The output is returned if None.
+
+    Returns:
+    --------
+    bytes | int
+        The output, or the number of bytes written to the sink.
+    """
+
+    return _DEFAULT.to_bijoy_bytes(data, engine=engine, sink=sink)
+
+
+def to_unicode_bytes(
+    data: streams.Source,
+    *,
+    engine: str | None = None,
+    sink: streams.Sink | None = None,
+) -> bytes | int:
+    """Converts UTF-8 Bijoy input to Unicode, a chunk at a time (see
+    parse_bytes()).
+
+    Parameters:
+    -----------
+    data: bytes | bytearray | memoryview | BinaryIO
+        The UTF-8 input, or a binary file to read it from.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    sink: bytearray | BinaryIO | None = None
+        Where to write the UTF-8 output as it's produced: a bytearray to
+        extend, or a binary file (or anything with a write() method taking
+        bytes). The output is returned if None.
+
+    Returns:
+    --------
+    bytes | int
+        The output, or the number of bytes written to the sink.
+    """
+
+    return _DEFAULT.to_unicode_bytes(data, engine=engine, sink=sink)
+
+
+def parse_columns(
+    buffer: columns.Buffer,
+    offsets: Sequence[int],
+    bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> columns.Column:
+    """Parses a column of texts, held as one buffer plus offsets.
+
+    Equivalent to parse_iter(), without building a string per text on
+    either side: every text is only decoded while it's parsed, and its
+    result encoded straight into the output buffer (see core/columns.py).
+
+    Parameters:
+    -----------
+    buffer: bytes | bytearray | memoryview
+        The texts, UTF-8 encoded back to back.
+    offsets: Sequence[int]
+        Where every text starts in the buffer, followed by where the last
+        one ends (e.g. an array("q"), or the offsets of an Arrow string
+        array).
+    bijoy: bool = False
+        Whether to return result in the Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
+        Whether to parse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    Returns:
+    --------
+    Column
+        The buffer and offsets of the results (a bytearray and an
+        array("q"), with offsets starting at 0), in the same order as the
+        texts.
+    """
+
+    return _DEFAULT.parse_columns(
+        buffer,
+        offsets,
+        bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def reverse_columns(
+    buffer: columns.Buffer,
+    offsets: Sequence[int],
+    from_bijoy: bool = False,
+    remap_words: bool = True,
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> columns.Column:
+    """Reverses a column of texts, held as one buffer plus offsets (see
+    parse_columns()).
+
+    Parameters:
+    -----------
+    buffer: bytes | bytearray | memoryview
+        The texts, UTF-8 encoded back to back.
+    offsets: Sequence[int]
+        Where every text starts in the buffer, followed by where the last
+        one ends (e.g. an array("q"), or the offsets of an Arrow string
+        array).
+    from_bijoy: bool = False
+        Whether to reverse input text from Bijoy Keyboard format (ASCII).
+    remap_words: bool = True
+        Whether to reverse input text with remapped (exception) words.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    Returns:
+    --------
+    Column
+        The buffer and offsets of the results (a bytearray and an
+        array("q"), with offsets starting at 0), in the same order as the
+        texts.
+    """
+
+    return _DEFAULT.reverse_columns(
+        buffer,
+        offsets,
+        from_bijoy,
+        remap_words,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def to_bijoy_columns(
+    buffer: columns.Buffer,
+    offsets: Sequence[int],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> columns.Column:
+    """Converts a column of texts to Bijoy, held as one buffer plus offsets
+    (see parse_columns()).
+
+    Parameters:
+    -----------
+    buffer: bytes | bytearray | memoryview
+        The texts, UTF-8 encoded back to back.
+    offsets: Sequence[int]
+        Where every text starts in the buffer, followed by where the last
+        one ends (e.g. an array("q"), or the offsets of an Arrow string
+        array).
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    Returns:
+    --------
+    Column
+        The buffer and offsets of the results (a bytearray and an
+        array("q"), with offsets starting at 0), in the same order as the
+        texts.
+    """
+
+    return _DEFAULT.to_bijoy_columns(
+        buffer,
+        offsets,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def to_unicode_columns(
+    buffer: columns.Buffer,
+    offsets: Sequence[int],
+    *,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> columns.Column:
+    """Converts a column of Bijoy texts to Unicode, held as one buffer plus
+    offsets (see parse_columns()).
+
+    Parameters:
+    -----------
+    buffer: bytes | bytearray | memoryview
+        The texts, UTF-8 encoded back to back.
+    offsets: Sequence[int]
+        Where every text starts in the buffer, followed by where the last
+        one ends (e.g. an array("q"), or the offsets of an Arrow string
+        array).
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    Returns:
+    --------
+    Column
+        The buffer and offsets of the results (a bytearray and an
+        array("q"), with offsets starting at 0), in the same order as the
+        texts.
+    """
+
+    return _DEFAULT.to_unicode_columns(
+        buffer,
+        offsets,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def detect(text: str) -> str | None:
+    """Detects whether text is Unicode Bengali, Bijoy or Banglish.
+
+    The characters are counted by what they tell (see core/classify.py):
+    Bengali ones for Unicode, the non-ASCII ones of Bijoy and the keys of
+    its vowel signs (e.g. v for া) for Bijoy, and vowels for Banglish. It
+    runs in linear time, and loads no dictionary beyond the character sets.
+
+    Parameters:
+    -----------
+    text: str
+        The text.
+
+    Returns:
+    --------
+    str | None
+        "unicode", "bijoy" or "banglish", whichever most of the text is in;
+        None if it has nothing to tell them apart (e.g. only digits).
+    """
+
+    return classify.classify(text)
+
+
+def detect_runs(text: str) -> list[classify.Run]:
+    """Splits mixed text into runs of the same encoding (see detect()).
+
+    Consecutive words of the same script make a run (as single words are
+    often too short to tell Bijoy and Banglish apart), and runs of ASCII
+    words end at line breaks, and where a few words in a row switch from
+    Bijoy to Banglish or the other way around.
+
+    Parameters:
+    -----------
+    text: str
+        The text.
+
+    Returns:
+    --------
+    list[Run]
+        The start, end and encoding of every run, covering the text from
+        start to end (the encoding is None if the text has nothing to
+        tell).
+    """
+
+    return classify.runs(text)
+
+
+def convert(
+    text: str,
+    target: str = "unicode",
+    *,
+    runs: bool = False,
+    engine: str | None = None,
+) -> str:
+    """Converts text to an encoding, detecting the one it's in.
+
+    Unicode text is reversed to Banglish or converted to Bijoy, Bijoy text
+    converted to Unicode or reversed to Banglish, and Banglish text parsed
+    to Unicode or Bijoy; text already in the target encoding (or in none)
+    is returned as it is.
+
+    Parameters:
+    -----------
+    text: str
+        The text to convert.
+    target: str = "unicode"
+        The encoding to convert to: "unicode", "bijoy" or "banglish".
+    runs: bool = False
+        Whether to detect and convert every run of the text on its own
+        (see detect_runs()), rather than the whole text at once. The
+        whitespace around runs is kept as it is.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+
+    Returns:
+    --------
+    str
+        The converted text.
+    """
+
+    return _DEFAULT.convert(text, target, runs=runs, engine=engine)
+
+
+def convert_iter(
+    texts: Iterable[str],
+    target: str = "unicode",
+    *,
+    runs: bool = False,
+    engine: str | None = None,
+    backend: str = "thread",
+    max_workers: int | None = None,
+) -> list[str]:
+    """Converts multiple texts to an encoding, detecting the one each of
+    them (or each of their runs) is in (see convert()).
+
+    The texts are grouped by the conversion they need, and every group is
+    converted in one batch (through parse_iter(), to_unicode_iter(), etc.).
+
+    Parameters:
+    -----------
+    texts: Iterable[str]
+        The texts to convert.
+    target: str = "unicode"
+        The encoding to convert to: "unicode", "bijoy" or "banglish".
+    runs: bool = False
+        Whether to detect and convert every run of the texts on its own.
+    engine: str | None = None
+        The engine to run on (see set_engine()). Defaults to the selected
+        engine.
+    backend: str = "thread"
+        The execution backend: "thread", "process" or "interpreter".
+    max_workers: int | None = None
+        The number of workers. Uses the executor default if None.
+
+    Returns:
+    --------
+    list[str]
+        The converted texts, in the same order.
+    """
+
+    return _DEFAULT.convert_iter(
+        texts,
+        target,
+        runs=runs,
+        engine=engine,
+        backend=backend,
+        max_workers=max_workers,
+    )
+
+
+def set_engine(engine: str) -> None:
+    """Selects the engine that the conversion functions run on by default.
+
+    All engines produce identical output:
+    - "legacy" is the reference implementation, scanning the dictionary
+      patterns as-is for every character.
+    - "interpreted" (default) walks the compiled dictionary tables.
+    - "generated" runs a module generated from the dictionary (see
+      core/codegen.py), with the pattern checks unrolled and the rule
+      conditions inlined.
+
+    Every conversion function also takes an `engine` keyword argument, to
+    select an engine for a single call. Other engines can be registered
+    with avro.core.engines.register().
+
+    The selection applies to the current process (or interpreter) only.
+
+    Parameters:
+    -----------
+    engine: str
+        The name of the engine.
+    """
+
+    engines.use(engine)
+
+    # Drop results cached by the previous engine, so that the new one is
+    # actually exercised from now on, by every transliterator following it.
+    with _INSTANCES_LOCK:
+        instances = list(_INSTANCES)
+    for instance in instances:
+        if instance.engine is None:
+            instance.cache_clear()
+
+
+def load_wordlist(
+    source: str | os.PathLike[str] | Iterable[str], *, limit: int | None = None
+) -> int:
+    """Precomputes the words of a frequency list into the frequency table.
+
+    Words in the table are parsed / reversed with a single lookup, without
+    taking up room in the (bounded) caches. Roman-script words are added
+    for parse(), Bengali words for reverse(). Only the default options
+    (remap_words=True) are served from the table.
+
+    Parameters:
+    -----------
+    source: str | os.PathLike[str] | Iterable[str]
+        The path of a UTF-8 text file with one word per line (anything after
+        the first whitespace, e.g. a count, is ignored), or the words.
+    limit: int | None = None
+        Only load the first `limit` words.
+
+    Returns:
+    --------
+    int
+        The number of entries in the frequency table.
+    """
+
+    words = frequency.read_wordlist(source, limit)
+    return frequency.extend(*_transliterate_words(words))
+
+
+def add_exceptions(words: Mapping[str, str]) -> int:
+    """Adds custom exception words, or overrides existing ones.
+
+    Custom words are matched as whole words (or phrases), case-insensitively,
+    and take precedence over the built-in exception words. Their Bengali
+    text is reversed back to the words. See Transliterator.add_exceptions()
+    for details.
+
+    As text is matched a whole word at a time, words with anything but
+    letters, digits and whitespace in them (e.g. "C++" or "e-mail") raise
+    ValueError, and Bengali text with punctuation isn't reversed.
+
+    Parameters:
+    -----------
+    words: Mapping[str, str]
+        Roman-script words (or phrases) and the Bengali text to parse them
+        to.
+
+    Returns:
+    --------
+    int
+        The number of custom words.
+    """
+
+    return _DEFAULT.add_exceptions(words)
+
+
+def remove_exceptions(words: Iterable[str]) -> int:
+    """Removes custom exception words added with add_exceptions().
+
+    Parameters:
+    -----------
+    words: Iterable[str]
+        The Roman-script words (or phrases) to remove.
+
+    Returns:
+    --------
+    int
+        The number of custom words left.
+    """
+
+    return _DEFAULT.remove_exceptions(words)
+
+
+def set_exceptions(words: Mapping[str, str]) -> int:
+    """Replaces all custom exception words at once, atomically.
+
+    Parameters:
+    -----------
+    words: Mapping[str, str]
+        Roman-script words (or phrases) and the Bengali text to parse them
+        to.
+
+    Returns:
+    --------
+    int
+        The number of custom words.
+    """
+
+    return _DEFAULT.set_exceptions(words)
+
+
+def warmup(words: Iterable[str] = (), *, freeze: bool = True) -> None:
+    """Eagerly builds everything that avro.py otherwise loads lazily.
+
+    Meant to be called in the parent process of pre-fork servers (gunicorn,
+    uWSGI, multiprocessing with "fork", etc.) right before forking, so that
+    workers inherit ready-to-use tables instead of each building their own.
+
+    Parameters:
+    -----------
+    words: Iterable[str] = ()
+        Words (or texts) to parse up front, priming the parse cache. The
+        cache is bounded (to 128 entries), so only the first 128 unique
+        words are primed and the rest are left alone; precompute longer
+        lists into the frequency table with load_wordlist() instead.
+    freeze: bool = True
+        Whether to move every object tracked by the garbage collector into
+        its permanent generation (gc.freeze()), so that collections in
+        forked children never touch (and thereby copy) the shared pages.
+        Children should call gc.enable() if the parent disabled it.
+    """
+
+    import gc
+
+    tables.phonetic().compile()
+    tables.bijoy()
+    frequency.table()
+
+    for name in dir(config):
+        getattr(config, name)
+
+    # Fill the regex cache of the re module too.
+    parse("ami Microsoft e kaj kori", bijoy=True)
+    reverse("আমি বাংলায় গান গাই।")
+    to_unicode("Avwg evsjvq Mvb MvB|")
+
+    # More would only evict the words primed before them.
+    for word in islice(dict.fromkeys(words), _DEFAULT.cache_size):
+        parse(word)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+
+def stats() -> dict[str, float]:
+    """Returns runtime counters for observing the batch and async APIs.
+
+    Returns:
+    --------
+    dict[str, float]
+        A dictionary containing the following keys:
+        1. deduplicated_calls: the number of calls that shared the result
+           of an identical call already in flight instead of running.
+        2. batch_items: the number of items passed to batch functions.
+        3. batch_unique_items: the number of those that were unique
+           within their batch and therefore actually computed.
+        4. batch_unique_ratio: batch_unique_items / batch_items.
+    """
+
+    return {
+        "deduplicated_calls": _SINGLE_FLIGHT.deduplicated,
+        "batch_items": _BATCH_DEDUPLICATOR.items,
+        "batch_unique_items": _BATCH_DEDUPLICATOR.unique,
+        "batch_unique_ratio": _BATCH_DEDUPLICATOR.unique_ratio,
+    }
+
+
+# ---
+
+# Opt-in micro-batching scheduler for high-throughput async workloads.
+# ---
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-text async calls into batch jobs.
+
+    Calls arriving within `max_delay` seconds of each other are grouped
+    (up to `max_batch_size` texts) into one job on the worker pool, and
+    the results are fanned back out to each awaiting caller. This trades
+    a bounded amount of latency for much higher throughput when serving
+    many small requests at once.
+
+    Parameters:
+    -----------
+    max_batch_size: int = 64
+        The maximum number of texts dispatched in a single batch job.
+    max_delay: float = 0.002
+        The maximum time (in seconds) a call waits for its batch to fill.
+    executor: Executor | None = None
+        The worker pool to run batch jobs on, e.g. a ProcessPoolExecutor.
+        Uses the event loop's default executor if None.
+
+    Example:
+    --------
+    >>> batcher = MicroBatcher(executor=ProcessPoolExecutor())
+    >>> await batcher.parse("ami banglay gan gai.")
+    'আমি বাংলায় গান গাই।'
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        executor: Executor | None = None,
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self._coalescers: dict[tuple, Coalescer] = {}
+
+    def _coalescer(
+        self, func: Callable[..., str], *args: bool | None
+    ) -> Coalescer:
+        """Returns the coalescer for a backend function and its options."""
+
+        key = (func, args)
+        coalescer = self._coalescers.get(key)
+        if coalescer is None:
+            coalescer = self._coalescers[key] = Coalescer(
+                partial(_batch_backend, func, args),
+                max_batch_size=self.max_batch_size,
+                max_delay=self.max_delay,
+                executor=self.executor,
+            )
+        return coalescer
+
+    @property
+    def batches(self) -> int:
+        """The number of batch jobs dispatched so far."""
+
+        return sum(c.batches for c in self._coalescers.values())
+
+    @property
+    def items(self) -> int:
+        """The number of texts processed through batch jobs so far."""
+
+        return sum(c.items for c in self._coalescers.values())
+
+    def flush(self) -> None:
+        """Dispatches all pending calls right away."""
+
+        for coalescer in self._coalescers.values():
+            coalescer.flush()
+
+    async def parse(
+        self, text: str, bijoy: bool = False, remap_words: bool = True
+    ) -> str:
+        """Batched version of parse_async(). See parse() for details."""
+
+        parsed = await self._coalescer(
+            _DEFAULT._parse, remap_words, None
+        ).submit(text)
+        if bijoy:
+            return await self.to_bijoy(parsed)
+        return parsed
+
+    async def reverse(
+        self, text: str, from_bijoy: bool = False, remap_words: bool = True
+    ) -> str:
+        """Batched version of reverse_async(). See reverse() for details."""
+
+        if from_bijoy:
+            text = await self.to_unicode(text)
+        return await self._coalescer(
+            _DEFAULT._reverse, remap_words, None
+        ).submit(text)
+
+    async def to_bijoy(self, text: str) -> str:
+        """Batched version of to_bijoy_async(). See to_bijoy() for details."""
+
+        return await self._coalescer(_DEFAULT._to_bijoy, None).submit(text)
+
+    async def to_unicode(self, text: str) -> str:
+        """Batched version of to_unicode_async(). See to_unicode()."""
+
+        return await self._coalescer(_DEFAULT._to_unicode, None).submit(text)
@@ -7,4 +7,10 @@ Licensed under the terms of the MIT OR Apache-2.0 License.
 """
 
 # Import local modules.
+from . import dictionary
 from .dictionary import *
+
+
+def __getattr__(name: str):
+    # Lazily forwards DICT (see dictionary.py).
+    return getattr(dictionary, name)
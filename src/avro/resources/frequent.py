@@ -0,0 +1,500 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Precomputed transliterations of common Roman-script words (parse()
+# with the default options), and of their Bengali forms (reverse()).
+#
+# Generated by `python -m avro.core.frequency`, do not edit by hand.
+FREQUENT_PARSE: dict[str, str] = {
+    "ami": "আমি",
+    "tumi": "তুমি",
+    "apni": "আপ্নি",
+    "se": "সে",
+    "o": "অ",
+    "tara": "তারা",
+    "amra": "আম্রা",
+    "tomra": "তম্রা",
+    "apnara": "আপ্নারা",
+    "ora": "অরা",
+    "eta": "এতা",
+    "ota": "অতা",
+    "oi": "অই",
+    "ei": "এই",
+    "sei": "সেই",
+    "ki": "কি",
+    "ke": "কে",
+    "keno": "কেন",
+    "kothay": "কথায়",
+    "kokhon": "কখন",
+    "kivabe": "কিভাবে",
+    "koto": "কত",
+    "kon": "কন",
+    "kar": "কার",
+    "kake": "কাকে",
+    "na": "না",
+    "nai": "নাই",
+    "hya": "হ্যা",
+    "ha": "হা",
+    "hae": "হাএ",
+    "thik": "থিক",
+    "ache": "আছে",
+    "achi": "আছি",
+    "acho": "আছ",
+    "achen": "আছেন",
+    "chilo": "ছিল",
+    "chilam": "ছিলাম",
+    "hobe": "হবে",
+    "hoy": "হয়",
+    "hoyeche": "হয়েছে",
+    "hoyni": "হয়নি",
+    "holo": "হল",
+    "kori": "করি",
+    "koro": "কর",
+    "koren": "করেন",
+    "korbo": "করব",
+    "korchi": "করছি",
+    "korchen": "করছেন",
+    "korlam": "করলাম",
+    "korle": "করলে",
+    "korte": "করতে",
+    "kore": "করে",
+    "korechi": "করেছি",
+    "jai": "জাই",
+    "jao": "জাও",
+    "jan": "জান",
+    "jabo": "জাব",
+    "jacchi": "জাচ্ছি",
+    "gelam": "গেলাম",
+    "geche": "গেছে",
+    "jete": "জেতে",
+    "ashi": "আশি",
+    "asho": "আশ",
+    "ashen": "আশেন",
+    "ashbo": "আশব",
+    "ashchi": "আশ্ছি",
+    "eshe": "এশে",
+    "aste": "আস্তে",
+    "bolo": "বল",
+    "bolen": "বলেন",
+    "boli": "বলি",
+    "bollam": "বল্লাম",
+    "bolche": "বলছে",
+    "bolte": "বলতে",
+    "dekho": "দেখ",
+    "dekhi": "দেখি",
+    "dekhbo": "দেখব",
+    "dekhechi": "দেখেছি",
+    "dite": "দিতে",
+    "dao": "দাও",
+    "din": "দিন",
+    "dibo": "দিব",
+    "khabo": "খাব",
+    "khai": "খাই",
+    "khao": "খাও",
+    "khete": "খেতে",
+    "khawa": "খাওা",
+    "khabar": "খাবার",
+    "pani": "পানি",
+    "bhat": "ভাত",
+    "dal": "দাল",
+    "mach": "মাছ",
+    "mangsho": "মাংশ",
+    "cha": "ছা",
+    "bhalo": "ভাল",
+    "valo": "ভাল",
+    "kharap": "খারাপ",
+    "sundor": "সুন্দর",
+    "boro": "বর",
+    "choto": "ছত",
+    "notun": "নতুন",
+    "purono": "পুরন",
+    "onek": "অনেক",
+    "kichu": "কিছু",
+    "sob": "সব",
+    "shob": "শব",
+    "aro": "আর",
+    "ekhon": "এখন",
+    "tokhon": "তখন",
+    "aj": "আজ",
+    "ajke": "আজকে",
+    "kal": "কাল",
+    "kalke": "কাল্কে",
+    "porshu": "পরশু",
+    "shokal": "শকাল",
+    "bikel": "বিকেল",
+    "rat": "রাত",
+    "raat": "রাআত",
+    "bhai": "ভাই",
+    "bon": "বন",
+    "ma": "মা",
+    "baba": "বাবা",
+    "maa": "মাআ",
+    "abba": "আব্বা",
+    "ammu": "আম্মু",
+    "apu": "আপু",
+    "dada": "দাদা",
+    "didi": "দিদি",
+    "chele": "ছেলে",
+    "meye": "মেয়ে",
+    "manush": "মানুশ",
+    "bondhu": "বন্ধু",
+    "bondhura": "বন্ধুরা",
+    "poribar": "পরিবার",
+    "shishu": "শিশু",
+    "bari": "বারি",
+    "basha": "বাশা",
+    "ghor": "ঘর",
+    "school": "সছুল",
+    "kolej": "কলেজ",
+    "office": "অফফিচে",
+    "dokan": "দকান",
+    "bazar": "বাযার",
+    "rasta": "রাস্তা",
+    "shohor": "শহর",
+    "gram": "গ্রাম",
+    "desh": "দেশ",
+    "bangla": "বাংলা",
+    "bangladesh": "বাংলাদেশ",
+    "dhaka": "ঢাকা",
+    "kaj": "কাজ",
+    "boi": "বই",
+    "kolom": "কলম",
+    "khata": "খাতা",
+    "shomoy": "শময়",
+    "tk": "তক",
+    "taka": "টাকা",
+    "poisha": "পইশা",
+    "dam": "দাম",
+    "kotha": "কথা",
+    "gan": "গান",
+    "golpo": "গল্প",
+    "chobi": "ছবি",
+    "ek": "এক",
+    "dui": "দুই",
+    "tin": "তিন",
+    "char": "ছার",
+    "pach": "পাছ",
+    "choy": "ছয়",
+    "sat": "সাত",
+    "at": "আত",
+    "noy": "নয়",
+    "dosh": "দশ",
+    "ar": "আর",
+    "ba": "বা",
+    "kintu": "কিন্তু",
+    "tai": "তাই",
+    "jodi": "জদি",
+    "tahole": "তাহলে",
+    "karon": "কারন",
+    "jonno": "জন্ন",
+    "shathe": "শাথে",
+    "sathe": "সাথে",
+    "theke": "থেকে",
+    "porjonto": "পরজন্ত",
+    "moto": "মত",
+    "por": "পর",
+    "age": "আগে",
+    "pore": "পরে",
+    "amar": "আমার",
+    "tomar": "তমার",
+    "tar": "তার",
+    "tader": "তাদের",
+    "amader": "আমাদের",
+    "tomader": "তমাদের",
+    "apnar": "আপ্নার",
+    "take": "তাকে",
+    "amake": "আমাকে",
+    "tomake": "তমাকে",
+    "apnake": "আপ্নাকে",
+    "kemon": "কেমন",
+    "kamon": "কামন",
+    "khub": "খুব",
+    "ekta": "এক্তা",
+    "ekti": "এক্তি",
+    "duita": "দুইতা",
+    "kichui": "কিছুই",
+    "keu": "কেউ",
+    "kono": "কন",
+    "shudhu": "শুধু",
+    "dhonnobad": "ধন্নবাদ",
+    "shuvo": "শুভ",
+    "shubho": "শুভ",
+    "sokal": "সকাল",
+    "shuprobhat": "শুপ্রভাত",
+    "ratri": "রাত্রি",
+    "valobashi": "ভালবাশি",
+    "bhalobashi": "ভালবাশি",
+    "bhalobasha": "ভালবাশা",
+    "kothin": "কথিন",
+    "shohoj": "শহজ",
+    "thanda": "থান্দা",
+    "gorom": "গরম",
+    "brishti": "ব্রিশ্তি",
+    "megh": "মেঘ",
+    "rod": "রদ",
+    "akash": "আকাশ",
+    "nodi": "নদি",
+    "gach": "গাছ",
+    "ful": "ফুল",
+    "pakhi": "পাখি",
+    "shuru": "শুরু",
+    "shesh": "শেশ",
+    "cholo": "ছল",
+    "choli": "ছলি",
+    "chol": "ছল",
+    "bosho": "বশ",
+    "utho": "উথ",
+    "ghumao": "ঘুমাও",
+    "ghum": "ঘুম",
+    "pora": "পরা",
+    "pori": "পরি",
+    "porbo": "পরব",
+    "likhi": "লিখি",
+    "lekha": "লেখা",
+    "shekha": "শেখা",
+    "shikhi": "শিখি",
+}
+
+FREQUENT_REVERSE: dict[str, str] = {
+    "আমি": "ami",
+    "তুমি": "tumi",
+    "আপ্নি": "apno্ni",
+    "সে": "se",
+    "অ": "অ",
+    "তারা": "tara",
+    "আম্রা": "amo্ra",
+    "তম্রা": "tomo্ra",
+    "আপ্নারা": "apno্nara",
+    "অরা": "অra",
+    "এতা": "eta",
+    "অতা": "অta",
+    "অই": "অi",
+    "এই": "ei",
+    "সেই": "sei",
+    "কি": "ki",
+    "কে": "ke",
+    "কেন": "ken",
+    "কথায়": "kothay",
+    "কখন": "kokhon",
+    "কিভাবে": "kibhabe",
+    "কত": "kot",
+    "কন": "kon",
+    "কার": "kar",
+    "কাকে": "kake",
+    "না": "na",
+    "নাই": "nai",
+    "হ্যা": "hoZza",
+    "হা": "ha",
+    "হাএ": "hae",
+    "থিক": "thik",
+    "আছে": "ache",
+    "আছি": "achi",
+    "আছ": "ach",
+    "আছেন": "achen",
+    "ছিল": "chil",
+    "ছিলাম": "chilam",
+    "হবে": "hobe",
+    "হয়": "hoy",
+    "হয়েছে": "hoyeche",
+    "হয়নি": "hoyni",
+    "হল": "hol",
+    "করি": "kori",
+    "কর": "kor",
+    "করেন": "koren",
+    "করব": "korob",
+    "করছি": "korchi",
+    "করছেন": "korchen",
+    "করলাম": "korlam",
+    "করলে": "korle",
+    "করতে": "korte",
+    "করে": "kore",
+    "করেছি": "korechi",
+    "জাই": "jai",
+    "জাও": "jaw",
+    "জান": "jan",
+    "জাব": "jab",
+    "জাচ্ছি": "jaccho্chi",
+    "গেলাম": "gelam",
+    "গেছে": "geche",
+    "জেতে": "jete",
+    "আশি": "ashi",
+    "আশ": "ash",
+    "আশেন": "ashen",
+    "আশব": "ashob",
+    "আশ্ছি": "ascho্chi",
+    "এশে": "eshe",
+    "আস্তে": "asto্te",
+    "বল": "bol",
+    "বলেন": "bolen",
+    "বলি": "boli",
+    "বল্লাম": "bollo্lam",
+    "বলছে": "bolche",
+    "বলতে": "bolte",
+    "দেখ": "dekh",
+    "দেখি": "dekhi",
+    "দেখব": "dekhob",
+    "দেখেছি": "dekhechi",
+    "দিতে": "dite",
+    "দাও": "daw",
+    "দিন": "din",
+    "দিব": "dib",
+    "খাব": "khab",
+    "খাই": "khai",
+    "খাও": "khaw",
+    "খেতে": "khete",
+    "খাওা": "khawa",
+    "খাবার": "khabar",
+    "পানি": "pani",
+    "ভাত": "bhat",
+    "দাল": "dal",
+    "মাছ": "mach",
+    "মাংশ": "mangosh",
+    "ছা": "cha",
+    "ভাল": "bhal",
+    "খারাপ": "kharap",
+    "সুন্দর": "sundo্dor",
+    "বর": "bor",
+    "ছত": "cht",
+    "নতুন": "notun",
+    "পুরন": "puron",
+    "অনেক": "অnek",
+    "কিছু": "kichu",
+    "সব": "sob",
+    "শব": "shob",
+    "আর": "ar",
+    "এখন": "ekhon",
+    "তখন": "tokhon",
+    "আজ": "aj",
+    "আজকে": "ajke",
+    "কাল": "kal",
+    "কাল্কে": "kalko্ke",
+    "পরশু": "porshu",
+    "শকাল": "shokal",
+    "বিকেল": "bikel",
+    "রাত": "rat",
+    "রাআত": "raat",
+    "ভাই": "bhai",
+    "বন": "bon",
+    "মা": "ma",
+    "বাবা": "baba",
+    "মাআ": "maa",
+    "আব্বা": "abbo্ba",
+    "আম্মু": "ammo্mu",
+    "আপু": "apu",
+    "দাদা": "dada",
+    "দিদি": "didi",
+    "ছেলে": "chele",
+    "মেয়ে": "meye",
+    "মানুশ": "manush",
+    "বন্ধু": "bondho্dhu",
+    "বন্ধুরা": "bondho্dhura",
+    "পরিবার": "poribar",
+    "শিশু": "shishu",
+    "বারি": "bari",
+    "বাশা": "basha",
+    "ঘর": "ghor",
+    "সছুল": "sochul",
+    "কলেজ": "kolej",
+    "অফফিচে": "অphphiche",
+    "দকান": "dokan",
+    "বাযার": "bazar",
+    "রাস্তা": "rasto্ta",
+    "শহর": "shohor",
+    "গ্রাম": "go্ram",
+    "দেশ": "desh",
+    "বাংলা": "bangla",
+    "বাংলাদেশ": "Bangladesh",
+    "ঢাকা": "Dhaka",
+    "কাজ": "kaj",
+    "বই": "boi",
+    "কলম": "kolom",
+    "খাতা": "khata",
+    "শময়": "shomoy",
+    "তক": "tok",
+    "টাকা": "Taka",
+    "পইশা": "poisha",
+    "দাম": "dam",
+    "কথা": "kotha",
+    "গান": "gan",
+    "গল্প": "golpo্p",
+    "ছবি": "chbi",
+    "এক": "ek",
+    "দুই": "dui",
+    "তিন": "tin",
+    "ছার": "char",
+    "পাছ": "pach",
+    "ছয়": "chy",
+    "সাত": "sat",
+    "আত": "at",
+    "নয়": "noy",
+    "দশ": "dosh",
+    "বা": "ba",
+    "কিন্তু": "kinto্tu",
+    "তাই": "tai",
+    "জদি": "jodi",
+    "তাহলে": "tahle",
+    "কারন": "karon",
+    "জন্ন": "jonno্n",
+    "শাথে": "shathe",
+    "সাথে": "sathe",
+    "থেকে": "theke",
+    "পরজন্ত": "porojonto্t",
+    "মত": "mot",
+    "পর": "por",
+    "আগে": "age",
+    "পরে": "pore",
+    "আমার": "amar",
+    "তমার": "tomar",
+    "তার": "tar",
+    "তাদের": "tader",
+    "আমাদের": "amader",
+    "তমাদের": "tomader",
+    "আপ্নার": "apno্nar",
+    "তাকে": "take",
+    "আমাকে": "amake",
+    "তমাকে": "tomake",
+    "আপ্নাকে": "apno্nake",
+    "কেমন": "kemon",
+    "কামন": "kamon",
+    "খুব": "khub",
+    "এক্তা": "ekto্ta",
+    "এক্তি": "ekto্ti",
+    "দুইতা": "duita",
+    "কিছুই": "kichui",
+    "কেউ": "keu",
+    "শুধু": "shudhu",
+    "ধন্নবাদ": "dhonno্nbad",
+    "শুভ": "shubh",
+    "সকাল": "sokal",
+    "শুপ্রভাত": "shupo্rbhat",
+    "রাত্রি": "rato্ri",
+    "ভালবাশি": "bhalbashi",
+    "ভালবাশা": "bhalbasha",
+    "কথিন": "kothin",
+    "শহজ": "shohoj",
+    "থান্দা": "thando্da",
+    "গরম": "gorom",
+    "ব্রিশ্তি": "bo্risht্ti",
+    "মেঘ": "megh",
+    "রদ": "rod",
+    "আকাশ": "akash",
+    "নদি": "nodi",
+    "গাছ": "gach",
+    "ফুল": "phul",
+    "পাখি": "pakhi",
+    "শুরু": "shuru",
+    "শেশ": "shesh",
+    "ছল": "chl",
+    "ছলি": "chli",
+    "বশ": "bosh",
+    "উথ": "uth",
+    "ঘুমাও": "ghumaw",
+    "ঘুম": "ghum",
+    "পরা": "pora",
+    "পরি": "pori",
+    "পরব": "porob",
+    "লিখি": "likhi",
+    "লেখা": "lekha",
+    "শেখা": "shekha",
+    "শিখি": "shikhi",
+}
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+
+# Hooks for this directory.
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--avro-engine",
+        default=None,
+        help="Run the tests on the given avro.py engine (see set_engine()).",
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def avro_engine(request: pytest.FixtureRequest) -> None:
+    """
+    Select the engine requested on the command line, if any.
+    """
+
+    engine = request.config.getoption("--avro-engine")
+
+    if engine is not None:
+        import avro
+
+        avro.set_engine(engine)
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import json
+import os
+import subprocess
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import avro
+
+
+# Helper functions for this file.
+def loaded_modules(code: str) -> set[str]:
+    """
+    Runs code in a fresh interpreter and returns the loaded module names.
+    """
+
+    script = f"import sys, json\n{code}\nprint(json.dumps(list(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            # Always build the tables from the dictionary sources.
+            "AVRO_CACHE_DIR": "",
+        },
+    )
+    return set(json.loads(output.stdout.splitlines()[-1]))
+
+
+# Test functions for this file.
+def test_import_is_lazy() -> None:
+    """
+    Test that importing the package doesn't load any subsystem.
+    """
+
+    modules = loaded_modules("import avro")
+
+    assert "avro.main" not in modules
+    assert "avro.resources.phonetic" not in modules
+    assert "avro.resources.bijoy" not in modules
+    assert "asyncio" not in modules
+
+
+def test_bijoy_conversion_loads_only_bijoy_tables() -> None:
+    """
+    Test that Bijoy conversions don't load the phonetic dictionary.
+    """
+
+    modules = loaded_modules(
+        "import avro; avro.to_bijoy('আমি'); avro.to_unicode('Avwg evsjvq')"
+    )
+
+    assert "avro.resources.bijoy" in modules
+    assert "avro.resources.phonetic" not in modules
+    assert "asyncio" not in modules
+
+
+def test_lazy_attributes() -> None:
+    """
+    Test that lazily loaded attributes remain accessible.
+    """
+
+    from avro.core import config, processor
+    from avro.resources import DICT
+
+    assert set(avro.__all__) <= set(dir(avro))
+    assert processor.PATTERNS is DICT["avro"]["patterns"]
+    assert len(processor.NON_RULE_PATTERNS) + len(
+        processor.RULE_PATTERNS
+    ) == len(processor.PATTERNS)
+    assert config.BIJOY_MAP == DICT["bijoy"]["mappings"]
+    assert "AVRO_VOWELS" in dir(config)
+
+
+def test_warmup_preloads_and_freezes() -> None:
+    """
+    Test that warmup() builds all tables and freezes them for forking.
+    """
+
+    modules = loaded_modules(
+        "import avro, gc; avro.warmup(['ami']); assert gc.get_freeze_count()"
+    )
+
+    assert "avro.resources.phonetic" in modules
+    assert "avro.resources.bijoy" in modules
+    assert "asyncio" not in modules
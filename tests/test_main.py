@@ -369,3 +369,112 @@ async def test_reverse_sentences() -> None:
         == await avro.reverse_async("Avwg evsjvi Mvb MvB|", from_bijoy=True)
         == avro.reverse("Avwg evsjvi Mvb MvB|", from_bijoy=True)
     )
+
+
+def test_warmup() -> None:
+    """
+    Test that warmup() primes the parse cache with the given words.
+    """
+
+    from avro import main
+
+    avro.warmup(["phuchka", "jhalmuri"], freeze=False)
+    hits = main._DEFAULT._parse_cached.cache_info().hits
+
+    assert avro.parse("phuchka") == "ফুছকা"
+    assert main._DEFAULT._parse_cached.cache_info().hits == hits + 1
+
+    # Only as many words as the cache holds are primed.
+    words = [f"shobdo{i}" for i in range(main._DEFAULT.cache_size + 10)]
+    avro.warmup(words, freeze=False)
+    info = main._DEFAULT._parse_cached.cache_info()
+
+    avro.parse(words[0])
+    avro.parse(words[-1])
+    assert main._DEFAULT._parse_cached.cache_info().hits == info.hits + 1
+
+
+@pytest.mark.asyncio
+async def test_transliterator() -> None:
+    """
+    Test transliterators with their own options side by side.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    text = "ami Microsoft e kaj kori"
+    remapped = avro.parse(text)
+    plain = avro.parse(text, remap_words=False)
+
+    with ThreadPoolExecutor(2) as executor:
+        transliterator = avro.Transliterator(
+            remap_words=False, executor=executor
+        )
+
+        assert transliterator.parse(text) == plain
+        assert transliterator.parse(text, remap_words=True) == remapped
+        assert await transliterator.parse_async(text) == plain
+        assert transliterator.parse_iter([text, "ami"]) == [plain, "আমি"]
+        assert await transliterator.parse_async_iter([text]) == [plain]
+        assert avro.parse(text) == remapped
+
+    bijoy = avro.Transliterator(bijoy=True, from_bijoy=True)
+    assert bijoy.parse("ami") == avro.to_bijoy("আমি")
+    assert bijoy.reverse("Avwg evsjvi Mvb MvB|") == "ami banglar gan gai."
+    assert bijoy.reverse_iter(["আমি"], from_bijoy=False) == ["ami"]
+
+
+def test_transliterator_caches_are_separate() -> None:
+    """
+    Test that transliterators don't share (or evict) each other's results.
+    """
+
+    first = avro.Transliterator(cache_size=4)
+    second = avro.Transliterator(cache_size=4)
+
+    for word in ("kheyal", "kheyali", "kheyalkhushi", "kheyalipona", "ek"):
+        first.parse(word)
+    second.parse("kheyal")
+
+    assert first._parse_cached.cache_info().currsize == 4
+    assert second._parse_cached.cache_info().currsize == 1
+
+    first.cache_clear()
+    assert first._parse_cached.cache_info().currsize == 0
+    assert second._parse_cached.cache_info().currsize == 1
+
+
+def test_transliterator_on_process_backend() -> None:
+    """
+    Test that transliterators keep their options in worker processes.
+    """
+
+    text = "tumi Microsoft"
+    transliterator = avro.Transliterator(remap_words=False)
+
+    assert transliterator.parse_iter(
+        [text], backend="process", max_workers=1
+    ) == [avro.parse(text, remap_words=False)]
+
+
+def test_transliterator_ships_custom_words_once() -> None:
+    """
+    Test that custom words are shipped to workers apart from the jobs.
+    """
+
+    import pickle
+
+    few = avro.Transliterator(exceptions={"tumi": "আপনি"})
+    many = avro.Transliterator(
+        exceptions={f"shobdo{i}": "শব্দ" for i in range(1_000)}
+    )
+
+    assert len(pickle.dumps(many.parse)) == len(pickle.dumps(few.parse))
+    assert few.parse_iter(
+        ["tumi Microsoft"], backend="process", max_workers=1
+    ) == [few.parse("tumi Microsoft")]
+
+    few.add_exceptions({"Microsoft": "মাইক্রোসফট"})
+    assert few.parse_iter(
+        ["tumi Microsoft"], backend="process", max_workers=1
+    ) == ["আপনি মাইক্রোসফট"]
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import backends
+
+# Set up test environments.
+texts = [
+    "ami banglay gan gai.",
+    "tumi kOthay zao?",
+    "amar sOnar bangla",
+    "ami banglay gan gai.",
+]
+
+
+# Test functions for this file.
+def test_resolve_backend() -> None:
+    """
+    Test backend validation and the fallback for subinterpreters.
+    """
+
+    assert backends.resolve_backend("thread") == "thread"
+    assert backends.resolve_backend("process") == "process"
+    assert backends.resolve_backend("interpreter") == (
+        "interpreter" if backends.HAS_INTERPRETER_POOL else "thread"
+    )
+
+    with pytest.raises(ValueError):
+        backends.resolve_backend("gpu")
+
+
+def test_chunk() -> None:
+    """
+    Test that chunking keeps every item in order.
+    """
+
+    items = [str(i) for i in range(37)]
+    chunks = backends.chunk(items, max_workers=2)
+
+    assert len(chunks) == 8
+    assert [item for part in chunks for item in part] == items
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["process", "interpreter"])
+async def test_batch_backends_match_thread(backend: str) -> None:
+    """
+    Test that every backend returns the same output as the thread pool.
+    """
+
+    try:
+        parsed = avro.parse_iter(texts)
+        assert avro.parse_iter(texts, backend=backend, max_workers=2) == parsed
+        assert (
+            await avro.parse_async_iter(texts, backend=backend, max_workers=2)
+            == parsed
+        )
+        assert avro.to_bijoy_iter(
+            parsed, backend=backend, max_workers=2
+        ) == avro.to_bijoy_iter(parsed)
+        assert avro.reverse_iter(
+            parsed, backend=backend, max_workers=2
+        ) == avro.reverse_iter(parsed)
+    finally:
+        backends.shutdown_pools()
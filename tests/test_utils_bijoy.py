@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import io
+import os
+import random
+import sys
+from pathlib import Path
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import bijoy, fuzz, parallel, streams, tables
+
+
+# Test functions for this file.
+def test_convert_matches_table_patterns() -> None:
+    """
+    Test that converting sequences matches the Bijoy tables' own patterns.
+    """
+
+    rng = random.Random(47)
+
+    for reverse in (False, True):
+        table = tables.bijoy()
+        mapping = table.reverse if reverse else table.mappings
+        pattern = table.reverse_pattern if reverse else table.pattern
+        chars = sorted({char for key in mapping for char in key} | {" ", "x"})
+
+        for _ in range(2000):
+            text = "".join(
+                rng.choice(chars) for _ in range(rng.randint(0, 40))
+            )
+            expected = pattern.sub(lambda match: mapping[match.group(0)], text)
+            assert bijoy.convert(text, reverse) == expected
+
+    assert len(bijoy.decode(bytes(range(256)))) == 256
+    assert bijoy.decode("‡Zvgvi •L".encode(bijoy.ENCODING)) == "‡Zvgvi •L"
+
+
+def test_batches() -> None:
+    """
+    Test that converting batches in one pass gives the results of
+    converting every text on its own.
+    """
+
+    rng = random.Random(49)
+    pieces = fuzz._Pieces()
+    separators = [" ", "\n", ". ", ""]
+
+    for batch, convert in (
+        (bijoy.to_bijoy_batch, avro.to_bijoy),
+        (bijoy.to_unicode_batch, avro.to_unicode),
+    ):
+        texts, expected = [], []
+        while len(texts) < 300:
+            generate = rng.choice([fuzz.banglish, fuzz.bengali, fuzz.bijoy])
+            text = "".join(
+                generate(rng, pieces) + rng.choice(separators)
+                for _ in range(rng.randint(0, 4))
+            )
+            try:
+                expected.append(convert(text))
+            except IndexError:
+                continue
+            texts.append(text)
+
+        assert batch(texts) == expected
+        assert batch([]) == []
+
+        # Texts containing the separator are converted one by one.
+        texts.append(f"ami{bijoy.SEPARATOR}tumi")
+        expected.append(convert(texts[-1]))
+        assert batch(texts) == expected
+
+    assert avro.to_bijoy_iter(["আমি", "আমি", "তুমি"], max_workers=2) == [
+        avro.to_bijoy("আমি"),
+        avro.to_bijoy("আমি"),
+        avro.to_bijoy("তুমি"),
+    ]
+    assert avro.to_unicode_iter(
+        ["Avwg evsjvq", "Mvb MvB"], backend="process", max_workers=2
+    ) == [avro.to_unicode("Avwg evsjvq"), avro.to_unicode("Mvb MvB")]
+
+
+def test_convert_file(tmp_path: Path) -> None:
+    """
+    Test converting a file in small blocks, to a path and to a binary file.
+    """
+
+    rng = random.Random(7)
+    pieces = fuzz._Pieces()
+    text = "".join(
+        fuzz.bijoy(rng, pieces) + rng.choice([" ", "\n", ". "])
+        for _ in range(300)
+    )
+    source = tmp_path / "news.txt"
+    source.write_bytes(text.encode(bijoy.ENCODING))
+    expected = avro.to_unicode(text).encode("utf-8")
+
+    stats = bijoy.convert_file(source, tmp_path / "news.bn.txt", size=64)
+    assert (tmp_path / "news.bn.txt").read_bytes() == expected
+    assert stats.read == len(text)
+    assert stats.written == len(expected)
+    assert "MB/s" in str(stats)
+
+    output = io.BytesIO()
+    bijoy.convert_file(source, output)
+    assert output.getvalue() == expected
+
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert bijoy.convert_file(tmp_path / "empty.txt", output).read == 0
+
+    class Trickle:
+        # Writes a few bytes at a time, but every other time it writes
+        # everything, returning None.
+        def __init__(self) -> None:
+            self.data = bytearray()
+            self.calls = 0
+
+        def write(self, data) -> int | None:
+            self.calls += 1
+            if self.calls % 2:
+                self.data += data
+                return None
+            self.data += data[:5]
+            return len(data[:5])
+
+    sink = Trickle()
+    stats = bijoy.convert_file(source, sink, size=64)
+    assert sink.data == expected
+    assert stats.written == len(expected)
+
+
+@pytest.mark.parametrize("lead", ["w", "\u2021", "\u00a9", "Av"])
+def test_leading_signs(monkeypatch: pytest.MonkeyPatch, lead: str) -> None:
+    """
+    Test that text starting with a sign is still converted in chunks.
+    """
+
+    monkeypatch.setattr(parallel, "_MIN_CHUNK", 1)
+    rng = random.Random(lead)
+    pieces = fuzz._Pieces()
+    text = lead + "".join(
+        fuzz.bijoy(rng, pieces) + rng.choice([" ", "\n", " w"])
+        for _ in range(100)
+    )
+    expected = avro.to_unicode(text)
+
+    assert avro.to_unicode(text, parallel=True, max_workers=16) == expected
+    stream = streams.Stream(bijoy.to_unicode, "to_unicode", size=64)
+    assert stream.feed(text)
+    unicode = avro.to_unicode(text)
+    assert avro.to_bijoy(unicode, parallel=True, max_workers=16) == (
+        avro.to_bijoy(unicode)
+    )
+
+    # Signs at the end of the text.
+    assert avro.to_unicode("Avwg") == "\u0986\u09ae\u09bf"
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the command-line entry point.
+    """
+
+    text = "Avwg evsjvq Mvb MvB|"
+    for name in ("a", "b"):
+        (tmp_path / name).write_bytes(text.encode(bijoy.ENCODING))
+    args = [str(tmp_path / name) for name in ("a", "a.out", "b", "b.out")]
+
+    assert bijoy.main(args) == 0
+    assert (tmp_path / "b.out").read_text("utf-8") == avro.to_unicode(text)
+    assert "Total:" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        bijoy.main(args[:3])
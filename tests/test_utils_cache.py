@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import avro
+from avro import main
+from avro.core import cache
+
+
+# Test functions for this file.
+def test_sharded_cache_memoizes_and_evicts() -> None:
+    """
+    Test that the sharded cache memoizes calls and stays within bounds.
+    """
+
+    calls: list[int] = []
+
+    def square(value: int, *, offset: int = 0) -> int:
+        calls.append(value)
+        return value * value + offset
+
+    cached = cache._ShardedLRUCache(square, maxsize=8, shards=4)
+
+    assert cached(3) == cached(3) == 9
+    assert cached(3, offset=1) == 10
+    assert calls == [3, 3]
+
+    for value in range(100):
+        cached(value)
+
+    info = cached.cache_info()
+    assert info.currsize <= 8
+    assert info.hits >= 1
+
+    cached.cache_clear()
+    assert cached.cache_info().currsize == 0
+    assert cached.__name__ == "square"
+
+
+def test_sharded_cache_capacity() -> None:
+    """
+    Test that the sharded cache holds as much as functools.lru_cache.
+    """
+
+    import random
+    from functools import lru_cache
+
+    rng = random.Random(29)
+    keys = [rng.randrange(300) for _ in range(3_000)]
+
+    for maxsize in (None, 0, 1, 8, 128):
+        expected = lru_cache(maxsize=maxsize)(str)
+        cached = cache._ShardedLRUCache(str, maxsize=maxsize, shards=16)
+
+        for key in keys:
+            assert cached(key) == expected(key)
+        assert cached.cache_info() == expected.cache_info()
+
+    # Primed results all stay, however they spread over the shards.
+    cached = cache._ShardedLRUCache(str, maxsize=128, shards=16)
+    for key in range(128):
+        cached(key)
+    for key in range(128):
+        cached(key)
+    assert cached.cache_info().misses == 128
+
+
+def test_sharded_cache_pickles_its_function() -> None:
+    """
+    Test that the sharded cache pickles as an empty cache of its function.
+    """
+
+    import pickle
+
+    transliterator = avro.Transliterator(exceptions={"tumi": "আপনি"})
+    cached = cache._ShardedLRUCache(transliterator._parse, maxsize=8, shards=4)
+    cached("tumi", True, None)
+
+    copy = pickle.loads(pickle.dumps(cached))
+
+    assert copy.cache_info() == (0, 0, 8, 0)
+    assert copy("tumi", True, None) == "আপনি"
+
+
+def test_sharded_cache_under_threads() -> None:
+    """
+    Test that concurrent callers always get correct results.
+    """
+
+    cached = cache._ShardedLRUCache(avro.parse, maxsize=32, shards=4)
+    texts = [f"ami {i} ta gan gai" for i in range(40)] * 10
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(cached, texts))
+
+    assert results == [avro.parse(text) for text in texts]
+
+
+def test_thread_cache_matches_build() -> None:
+    """
+    Test that the plain lru_cache is used unless the GIL is disabled.
+    """
+
+    cached = cache.thread_cache(maxsize=4)(str.upper)
+
+    if cache.FREE_THREADED:
+        assert isinstance(cached, cache._ShardedLRUCache)
+    else:
+        assert hasattr(cached, "cache_parameters")
+
+
+def test_once_is_race_free() -> None:
+    """
+    Test that concurrent first calls run a once() function only once.
+    """
+
+    calls: list[int] = []
+
+    @cache.once
+    def build() -> object:
+        calls.append(1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: build(), range(64)))
+
+    assert all(result is results[0] for result in results)
+    assert calls == [1]
+    assert main._get_bijoy_regex_pattern() is main._get_bijoy_regex_pattern()
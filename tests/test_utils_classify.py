@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import classify
+
+SENTENCES = [
+    "ami banglay gan gai",
+    "tumi kothay jachho?",
+    "amader desh onek sundor",
+    "ei boi ti amar khub priyo",
+    "shokal bela ami hat te jai",
+    "ekhon ki korbo bujhte parchi na",
+    "Ami bhalo achi",
+]
+
+
+# Test functions for this file.
+def test_classify() -> None:
+    """
+    Test detecting the encoding of whole texts.
+    """
+
+    for text in SENTENCES:
+        unicode = avro.parse(text)
+        assert classify.classify(text) == classify.BANGLISH
+        assert classify.classify(unicode) == classify.UNICODE
+        assert classify.classify(avro.to_bijoy(unicode)) == classify.BIJOY
+
+    assert classify.classify("") is None
+    assert classify.classify("2024, 12:30!") is None
+    assert avro.detect("Avgvi ‡mvbvi evsjv") == classify.BIJOY
+
+
+def test_runs() -> None:
+    """
+    Test splitting mixed text into runs of the same encoding.
+    """
+
+    text = "১৯৭১ আমি তুমি\n2024 Avgvi ‡mvbvi evsjv\nami banglay gan gai"
+    runs = avro.detect_runs(text)
+
+    assert [text[start:end] for start, end, _ in runs] == [
+        "১৯৭১ আমি তুমি\n2024 ",
+        "Avgvi ‡mvbvi evsjv\n",
+        "ami banglay gan gai",
+    ]
+    assert [run.encoding for run in runs] == [
+        classify.UNICODE,
+        classify.BIJOY,
+        classify.BANGLISH,
+    ]
+
+    assert classify.runs("") == []
+    assert classify.runs(" 12 ") == [classify.Run(0, 4, None)]
+    # Runs of the same encoding are merged.
+    assert classify.runs("ami\ntumi") == [
+        classify.Run(0, 8, classify.BANGLISH)
+    ]
+
+
+def test_mixed_line_runs() -> None:
+    """
+    Test splitting a line switching between Bijoy and Banglish text.
+    """
+
+    text = "আমি Avwg evsjvq Mvb MvB and ami banglay gan gai"
+
+    assert [
+        (text[start:end], encoding)
+        for start, end, encoding in classify.runs(text)
+    ] == [
+        ("আমি ", classify.UNICODE),
+        ("Avwg evsjvq Mvb MvB ", classify.BIJOY),
+        ("and ami banglay gan gai", classify.BANGLISH),
+    ]
+    assert avro.convert(text, runs=True) == "আমি {} {}".format(
+        avro.to_unicode("Avwg evsjvq Mvb MvB"),
+        avro.parse("and ami banglay gan gai"),
+    )
+
+    # Single words leaning the other way don't split runs.
+    for text in SENTENCES + ["PDF file ta pathao"]:
+        bijoy = avro.to_bijoy(avro.parse(text))
+        assert [run.encoding for run in classify.runs(text)] == [
+            classify.BANGLISH
+        ]
+        assert [run.encoding for run in classify.runs(bijoy)] == [
+            classify.BIJOY
+        ]
+
+
+def test_convert_routes() -> None:
+    """
+    Test converting texts by the encoding they're detected in.
+    """
+
+    banglish = "ami banglay gan gai"
+    unicode = avro.parse(banglish)
+    bijoy = avro.to_bijoy(unicode)
+    texts = [banglish, unicode, bijoy, "2024"]
+
+    assert [avro.convert(text) for text in texts] == [
+        unicode,
+        unicode,
+        avro.to_unicode(bijoy),
+        "2024",
+    ]
+    assert [avro.convert(text, "bijoy") for text in texts] == [
+        avro.parse(banglish, bijoy=True),
+        bijoy,
+        bijoy,
+        "2024",
+    ]
+    assert [avro.convert(text, "banglish") for text in texts] == [
+        banglish,
+        avro.reverse(unicode),
+        avro.reverse(bijoy, from_bijoy=True),
+        "2024",
+    ]
+
+    for target in classify.ENCODINGS:
+        for runs in (False, True):
+            assert avro.convert_iter(texts, target, runs=runs) == [
+                avro.convert(text, target, runs=runs) for text in texts
+            ]
+
+    with pytest.raises(ValueError):
+        avro.convert(banglish, "latin")
+
+
+def test_convert_runs() -> None:
+    """
+    Test converting every run of mixed text on its own.
+    """
+
+    text = "  আমি তুমি\nAvgvi ‡mvbvi evsjv\n\nami banglay gan gai "
+    expected = "  আমি তুমি\n{}\n\n{} ".format(
+        avro.to_unicode("Avgvi ‡mvbvi evsjv"),
+        avro.parse("ami banglay gan gai"),
+    )
+
+    assert avro.convert(text, runs=True) == expected
+    assert avro.convert_iter([text, text], runs=True) == [expected] * 2
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import random
+import subprocess
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro import main
+from avro.core import codegen, engines, matcher, validate
+from avro.resources.phonetic import PHONETIC
+
+# Characters the fuzzed texts are made of: every letter (including the
+# case-sensitive ones), the characters used by rules and some punctuation.
+ROMAN = "abcdefghijklmnopqrstuvwxyzADGIJNORSTUYZ`^:.,?!' -0123456789"
+BENGALI = "অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়ৎংঃঁািীুূৃেৈোৌ্।"
+
+
+# Helper functions for this file.
+def fuzz(alphabet: str, count: int, seed: int) -> list[str]:
+    """
+    Returns random texts made of the given characters.
+    """
+
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 24)))
+        for _ in range(count)
+    ]
+
+
+# Test functions for this file.
+def test_generated_matcher_is_up_to_date() -> None:
+    """
+    Test that core/matcher.py was generated from the current dictionary.
+
+    If this fails after changing the dictionary, regenerate the matcher
+    with `python -m avro.core.codegen`.
+    """
+
+    with open(codegen.MATCHER_PATH, encoding="utf-8") as file:
+        source = file.read()
+
+    assert source == codegen.generate(PHONETIC, codegen.dictionary_digest())
+
+
+def test_generated_matcher_agrees_on_fuzzed_text() -> None:
+    """
+    Test that the generated matcher agrees with the interpreted one.
+    """
+
+    for text in fuzz(ROMAN, 3000, seed=36):
+        fixed = validate.fix_string_case(text)
+        assert matcher.parse(fixed) == main._parse_interpreted(fixed), text
+
+    for text in fuzz(BENGALI + " ", 3000, seed=63):
+        assert matcher.reverse(text) == main._reverse_interpreted(text), text
+
+
+def test_set_engine() -> None:
+    """
+    Test switching engines through the public API.
+    """
+
+    expected = avro.parse("ami banglay gan gai.")
+
+    try:
+        avro.set_engine("generated")
+        assert engines.default() == "generated"
+        assert engines.get().parse is matcher.parse
+        assert avro.parse("ami banglay gan gai.") == expected
+    finally:
+        avro.set_engine("interpreted")
+
+    with pytest.raises(ValueError):
+        avro.set_engine("jit")
+
+
+def test_main_suite_on_generated_engine() -> None:
+    """
+    Test that the main test suite passes on the generated engine.
+    """
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--avro-engine=generated",
+            os.path.join(os.path.dirname(__file__), "test_main.py"),
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    assert result.returncode == 0, result.stdout
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+from array import array
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import columns
+
+TEXTS = ["amra", "", "banglay gan gai", "tomra", "amra", "kothay jachho?"] * 5
+
+
+# Test functions for this file.
+def test_columns_match_iter() -> None:
+    """
+    Test that converting columns gives the results of the batch functions.
+    """
+
+    column = columns.Column.from_texts(TEXTS)
+    assert column.rows == len(TEXTS)
+    assert list(column.texts()) == TEXTS
+
+    parsed = avro.parse_columns(*column, max_workers=2)
+    assert parsed.offsets.typecode == columns.TYPECODE
+    assert list(parsed.texts()) == avro.parse_iter(TEXTS)
+
+    bijoy = avro.parse_columns(*column, bijoy=True, max_workers=2)
+    assert list(bijoy.texts()) == avro.parse_iter(TEXTS, bijoy=True)
+    assert list(avro.to_unicode_columns(*bijoy).texts()) == (
+        avro.to_unicode_iter(avro.parse_iter(TEXTS, bijoy=True))
+    )
+    assert list(avro.reverse_columns(*bijoy, from_bijoy=True).texts()) == (
+        avro.reverse_iter(avro.parse_iter(TEXTS, bijoy=True), from_bijoy=True)
+    )
+    assert list(
+        avro.to_bijoy_columns(
+            *parsed, backend="process", max_workers=2
+        ).texts()
+    ) == avro.to_bijoy_iter(avro.parse_iter(TEXTS))
+
+
+def test_column_slices() -> None:
+    """
+    Test columns whose offsets don't start at the start of the buffer.
+    """
+
+    buffer = b"xxamitumiyy"
+    parsed = avro.parse_columns(memoryview(buffer), array("q", [2, 5, 9]))
+    assert list(parsed.texts()) == ["আমি", "তুমি"]
+    assert list(avro.parse_columns(buffer, [4]).texts()) == []
+    assert list(avro.parse_columns(b"", []).texts()) == []
+
+    with pytest.raises(ValueError):
+        avro.parse_columns(buffer, [2, 12])
+    with pytest.raises(ValueError):
+        avro.parse_columns(buffer, [2, 5, 4, 9])
@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core.concurrency import (
+    BatchDeduplicator,
+    Coalescer,
+    SingleFlight,
+)
+
+
+# Test functions for this file.
+@pytest.mark.asyncio
+async def test_coalescer_batches_concurrent_calls() -> None:
+    """
+    Test that concurrent submissions are grouped into bounded batches.
+    """
+
+    seen: list[tuple[str, ...]] = []
+
+    def upper_batch(texts: tuple[str, ...]) -> list[str]:
+        seen.append(texts)
+        return [text.upper() for text in texts]
+
+    coalescer = Coalescer(upper_batch, max_batch_size=4, max_delay=0.05)
+    texts = [f"text{i}" for i in range(10)]
+    results = await asyncio.gather(*(coalescer.submit(t) for t in texts))
+
+    assert results == [t.upper() for t in texts]
+    assert [len(batch) for batch in seen] == [4, 4, 2]
+    assert coalescer.batches == 3
+    assert coalescer.items == 10
+
+
+@pytest.mark.asyncio
+async def test_coalescer_propagates_errors() -> None:
+    """
+    Test that a failing batch job fails every caller in the batch.
+    """
+
+    def failing_batch(texts: tuple[str, ...]) -> list[str]:
+        raise ValueError("boom")
+
+    coalescer = Coalescer(failing_batch)
+    results = await asyncio.gather(
+        coalescer.submit("a"), coalescer.submit("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_matches_direct_calls() -> None:
+    """
+    Test that batched calls return the same output as the direct API.
+    """
+
+    texts = ["ami banglay gan gai.", "tumi kOthay zao?"] * 20
+    batcher = avro.MicroBatcher(max_batch_size=16)
+
+    parsed = await asyncio.gather(*(batcher.parse(t) for t in texts))
+    assert parsed == [avro.parse(t) for t in texts]
+    assert batcher.batches == 3
+
+    bijoy = await asyncio.gather(
+        *(batcher.parse(t, bijoy=True) for t in texts)
+    )
+    assert bijoy == [avro.parse(t, bijoy=True) for t in texts]
+
+    reversed = await asyncio.gather(*(batcher.reverse(t) for t in parsed))
+    assert reversed == [avro.reverse(t) for t in parsed]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_process_pool() -> None:
+    """
+    Test that batch jobs can be shipped to a process pool.
+    """
+
+    texts = ["ami banglay gan gai.", "amar sOnar bangla"] * 8
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        batcher = avro.MicroBatcher(executor=executor)
+        results = await asyncio.gather(*(batcher.parse(t) for t in texts))
+
+    assert results == avro.parse_iter(texts)
+    assert batcher.batches == 1
+
+
+def test_single_flight_shares_in_flight_calls() -> None:
+    """
+    Test that concurrent identical calls share a single computation.
+    """
+
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow(text: str) -> str:
+        calls.append(text)
+        started.set()
+        release.wait()
+        return text.upper()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", slow, "abc")
+        started.wait()
+        followers = [
+            executor.submit(flight.do, "key", slow, "abc") for _ in range(3)
+        ]
+        while flight.deduplicated < 3:
+            time.sleep(0.001)
+        release.set()
+
+        assert leader.result() == "ABC"
+        assert [f.result() for f in followers] == ["ABC"] * 3
+
+    assert calls == ["abc"]
+
+    # Finished calls are forgotten, so the next one runs again.
+    assert flight.do("key", str.lower, "ABC") == "abc"
+    assert flight.deduplicated == 3
+
+
+@pytest.mark.asyncio
+async def test_single_flight_async() -> None:
+    """
+    Test that identical async calls on one loop share a single job.
+    """
+
+    flight = SingleFlight()
+    calls: list[str] = []
+
+    def work(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    results = await asyncio.gather(
+        *(flight.do_async("key", work, "abc") for _ in range(5))
+    )
+
+    assert results == ["ABC"] * 5
+    assert calls == ["abc"]
+    assert flight.deduplicated == 4
+
+
+@pytest.mark.asyncio
+async def test_async_iter_deduplicates_in_flight_calls() -> None:
+    """
+    Test that the public async API reports deduplicated calls.
+    """
+
+    before = avro.stats()["deduplicated_calls"]
+    results = await asyncio.gather(
+        *(avro.parse_async("bhairal frez") for _ in range(10))
+    )
+
+    assert results == [avro.parse("bhairal frez")] * 10
+    assert avro.stats()["deduplicated_calls"] - before == 9
+
+
+def test_batch_deduplicator_preserves_order() -> None:
+    """
+    Test that collapsing and scattering a batch preserves output order.
+    """
+
+    dedup = BatchDeduplicator()
+    unique, positions = dedup.collapse(["b", "a", "b", "b", "c", "a"])
+
+    assert unique == ("b", "a", "c")
+    assert dedup.scatter([t.upper() for t in unique], positions) == [
+        "B",
+        "A",
+        "B",
+        "B",
+        "C",
+        "A",
+    ]
+    assert dedup.unique_ratio == 0.5
+
+
+@pytest.mark.asyncio
+async def test_batch_functions_collapse_duplicates() -> None:
+    """
+    Test that the batch functions compute each unique input only once.
+    """
+
+    texts = ["ami", "tumi", "ami", "ami", "se", "tumi"] * 5
+    before = avro.stats()
+
+    assert avro.parse_iter(texts) == [avro.parse(t) for t in texts]
+    assert await avro.parse_async_iter(texts) == avro.parse_iter(texts)
+
+    after = avro.stats()
+    assert after["batch_items"] - before["batch_items"] == 3 * len(texts)
+    assert after["batch_unique_items"] - before["batch_unique_items"] == 9
+    assert 0 < after["batch_unique_ratio"] <= 1
+
+    # Single calls aren't batches.
+    await avro.parse_async("ami")
+    await avro.reverse_async("আমি")
+    await avro.to_bijoy_async("আমি")
+    assert avro.stats()["batch_items"] == after["batch_items"]
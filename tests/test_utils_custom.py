@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+import threading
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core.custom import CustomWords
+
+
+# Test functions for this file.
+def test_split() -> None:
+    """
+    Test splitting text around whole custom words and phrases.
+    """
+
+    words = CustomWords({"iPhone": "আইফোন", "American Express": "আমেক্স"})
+
+    assert words.split("ami iphone kini") == [
+        ("ami ", False),
+        ("আইফোন", True),
+        (" kini", False),
+    ]
+    assert words.split("AMERICAN\n express!") == [
+        ("আমেক্স", True),
+        ("!", False),
+    ]
+    assert words.split("iphones, american-express") == [
+        ("iphones, american-express", False)
+    ]
+    assert words.split("আমি আইফোন কিনি", True) == [
+        ("আমি ", False),
+        ("iPhone", True),
+        (" কিনি", False),
+    ]
+
+    with pytest.raises(ValueError):
+        words.add({"--": "-"})
+
+
+def test_words_with_punctuation() -> None:
+    """
+    Test that words with more than letters and digits to them are rejected,
+    rather than matched without it.
+    """
+
+    words = CustomWords({"c sharp": "সি শার্প"})
+
+    for word in ("C++", "e-mail", "c#"):
+        with pytest.raises(ValueError):
+            words.add({word: "শব্দ"})
+    assert words.split("c ba c++ ki") == [("c ba c++ ki", False)]
+
+    # Nor is Bengali text with punctuation reversed, or anything removed
+    # by words with it.
+    words.add({"jpt": "জিপিটি-৪"})
+    assert words.split("জিপিটি ৪", True) == [("জিপিটি ৪", False)]
+    assert words.remove(["c-sharp"]) == 2
+
+    transliterator = avro.Transliterator()
+    with pytest.raises(ValueError):
+        transliterator.add_exceptions({"C++": "সি প্লাস প্লাস"})
+    assert transliterator.parse("c ba c++ ki") == avro.parse("c ba c++ ki")
+
+
+def test_add_and_remove() -> None:
+    """
+    Test overriding and removing words, in both directions.
+    """
+
+    words = CustomWords({"gpt": "জিপিটি"})
+    version = words.version
+
+    assert words.add({"GPT": "জিপিটি-৪"}) == 1
+    assert words.version > version
+    assert words.split("gpt") == [("জিপিটি-৪", True)]
+    assert words.split("জিপিটি", True) == [("জিপিটি", False)]
+
+    assert words.remove(["Gpt", "missing"]) == 0
+    assert not words
+    assert words.split("gpt") == [("gpt", False)]
+    assert words.split("জিপিটি-৪", True) == [("জিপিটি-৪", False)]
+
+
+def test_transliterator_exceptions() -> None:
+    """
+    Test custom exception words through the public API.
+    """
+
+    text = "ami iphone kini"
+    transliterator = avro.Transliterator(exceptions={"iPhone": "আইফোন"})
+
+    assert transliterator.parse(text) == "আমি আইফোন কিনি"
+    assert transliterator.parse(text, remap_words=False) == avro.parse(text)
+    assert transliterator.reverse("আমি আইফোন কিনি") == "ami iPhone kini"
+    assert transliterator.parse_iter(
+        [text], backend="process", max_workers=1
+    ) == ["আমি আইফোন কিনি"]
+
+    # Custom words take precedence over the built-in ones.
+    transliterator.add_exceptions({"Microsoft": "মাইক্রোসফ্ট"})
+    assert transliterator.parse("Microsoft") == "মাইক্রোসফ্ট"
+    assert avro.parse("Microsoft") == "মাইক্রোসফট"
+
+    transliterator.remove_exceptions(["iphone"])
+    assert transliterator.parse(text) == avro.parse(text)
+
+
+def test_module_exceptions() -> None:
+    """
+    Test custom exception words on the module-level functions.
+    """
+
+    expected = avro.parse("ami phuchka khai")
+
+    try:
+        assert avro.add_exceptions({"phuchka": "ফুচকা"}) == 1
+        assert avro.parse("ami phuchka khai") == "আমি ফুচকা খাই"
+        assert avro.parse_iter(
+            ["phuchka"], backend="process", max_workers=1
+        ) == ["ফুচকা"]
+    finally:
+        avro.remove_exceptions(["phuchka"])
+
+    assert avro.parse("ami phuchka khai") == expected
+
+
+def test_snapshots_are_shared_and_merged() -> None:
+    """
+    Test that updates copy a small delta, and merge it back when it grows.
+    """
+
+    words = CustomWords({f"word{i}": f"শব্দ{i}" for i in range(10_000)})
+    base = words.snapshot._parse.base
+
+    words.add({"extra": "এক্সট্রা"})
+    assert words.snapshot._parse.base is base
+    assert words.snapshot._parse.delta
+
+    for i in range(200):
+        words.remove([f"word{i}"])
+    assert words.snapshot._parse.base is not base
+    assert len(words) == 10_000 - 200 + 1
+    assert words.split("word5 word500 extra", True) == [
+        ("word5 word500 extra", False)
+    ]
+    assert words.split("শব্দ5 শব্দ500", True) == [
+        ("শব্দ5 ", False),
+        ("word500", True),
+    ]
+
+
+def test_hot_swap_under_load() -> None:
+    """
+    Test that concurrent calls always see whole snapshots of the words.
+    """
+
+    text = "alpha beta gamma"
+    versions = [
+        {"alpha": f"আলফা{n}", "beta": f"বেটা{n}", "gamma": f"গামা{n}"}
+        for n in "১২"
+    ]
+    expected = {" ".join(v.values()) for v in versions}
+    transliterator = avro.Transliterator(exceptions=versions[0])
+    seen: set[str] = set()
+    stop = threading.Event()
+
+    def read() -> None:
+        while not stop.is_set():
+            seen.add(transliterator.parse(text))
+
+    readers = [threading.Thread(target=read) for _ in range(8)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        for i in range(500):
+            transliterator.set_exceptions(versions[i % 2])
+            transliterator.add_exceptions(versions[(i + 1) % 2])
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert seen <= expected
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro import main
+from avro.core import bijoy, engines, fuzz
+
+
+# Test functions for this file.
+def test_builtin_engines() -> None:
+    """
+    Test that the built-in engines are registered and selectable per call.
+    """
+
+    assert {"legacy", "interpreted", "generated"} <= set(engines.names())
+
+    for name in engines.names():
+        assert avro.parse("ami Microsoft e kaj kori", engine=name) == (
+            "আমি মাইক্রোসফট এ কাজ করি"
+        )
+        assert avro.reverse("আমি তুমি", engine=name) == "ami tumi"
+        assert avro.to_bijoy("আমি", engine=name) == "Avwg"
+
+    with pytest.raises(ValueError):
+        avro.parse("ami", engine="jit")
+
+
+def test_register_engine() -> None:
+    """
+    Test registering a custom engine and selecting it.
+    """
+
+    interpreted = engines.get("interpreted")
+    shouting = interpreted._replace(parse=lambda text: text.upper())
+    engines.register("shouting", lambda: shouting)
+
+    following = avro.Transliterator(remap_words=False)
+    pinned = avro.Transliterator(remap_words=False, engine="interpreted")
+
+    try:
+        assert avro.parse("ami", remap_words=False, engine="shouting") == "AMI"
+        assert avro.parse_iter(["ami"], engine="shouting") == ["AMI"]
+        assert avro.parse("ami", remap_words=False) == "আমি"
+        assert following.parse("ami") == pinned.parse("ami") == "আমি"
+
+        avro.set_engine("shouting")
+        assert avro.parse("tumi", remap_words=False) == "TUMI"
+        # Cached results of the previous engine are dropped too.
+        assert following.parse("ami") == "AMI"
+        assert pinned.parse("ami") == "আমি"
+    finally:
+        avro.set_engine("interpreted")
+        del engines._FACTORIES["shouting"]
+        engines._ENGINES.pop("shouting", None)
+
+
+def test_engines_agree_on_fuzzed_text() -> None:
+    """
+    Test that all engines agree on random Banglish, Bengali and Bijoy text.
+    """
+
+    assert fuzz.run(300, seed=37) == []
+
+
+def test_fuzzer_reports_disagreements() -> None:
+    """
+    Test that the fuzzer catches an engine that gets something wrong.
+    """
+
+    interpreted = engines.get("interpreted")
+    broken = interpreted._replace(
+        reverse=lambda text: main._reverse_interpreted(text).replace("o", "")
+    )
+    engines.register("broken", lambda: broken)
+
+    try:
+        mismatches = fuzz.run(50, seed=1, names=("interpreted", "broken"))
+    finally:
+        del engines._FACTORIES["broken"]
+        engines._ENGINES.pop("broken", None)
+
+    assert mismatches
+    assert {m.operation for m in mismatches} <= {
+        "reverse",
+        "reverse(remap_words=False)",
+    }
+
+
+def test_fuzzer_checks_bijoy_conversions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the fuzzer checks the Bijoy conversions against the legacy
+    engine's own.
+    """
+
+    monkeypatch.setattr(bijoy, "_rearrange_bijoy", str.strip)
+    mismatches = fuzz.run(100, seed=3, names=("legacy", "interpreted"))
+
+    assert mismatches
+    assert {m.operation for m in mismatches} == {"to_unicode"}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("কর্মা", "Kg©v"),
+        ("র্কি", "wK©"),
+        ("কর্ম কাজ", "Kg© KvR"),
+        ("ধর্ম আর কর্ম", "ag© Avi Kg©"),
+        ("বর্ণে বর্ণে", "e‡Y© e‡Y©"),
+        ("আর্ট কর্মী", "AvU© Kg©x"),
+        ("ধর্ অ", "a© A"),
+    ],
+)
+def test_reph_rearrangement(text: str, expected: str) -> None:
+    """
+    Test that rephs move after the consonants they're written over, and
+    only those.
+    """
+
+    assert avro.to_bijoy(text) == expected
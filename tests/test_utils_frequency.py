@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import avro
+from avro import main
+from avro.core import frequency
+from avro.resources.frequent import FREQUENT_PARSE, FREQUENT_REVERSE
+
+
+# Test functions for this file.
+def test_shipped_table_is_up_to_date() -> None:
+    """
+    Test that the shipped table matches the output of the matcher.
+
+    If this fails after changing the dictionary, regenerate the table with
+    `python -m avro.core.frequency`.
+    """
+
+    parse, reverse = main._transliterate_words(FREQUENT_PARSE)
+
+    assert parse == FREQUENT_PARSE
+    assert reverse == FREQUENT_REVERSE
+
+
+def test_frequent_words_skip_the_cache() -> None:
+    """
+    Test that frequent words are resolved without touching the caches.
+    """
+
+    before = main._DEFAULT._parse_cached.cache_info()
+    assert avro.parse("ami") == "আমি"
+    assert avro.reverse("আমি তুমি") == "ami tumi"
+    assert main._DEFAULT._parse_cached.cache_info() == before
+
+    # Other options still go through the matcher.
+    assert avro.parse("ami", remap_words=False) == "আমি"
+    assert main._DEFAULT._parse_cached.cache_info().misses >= before.misses
+
+
+def test_read_wordlist(tmp_path) -> None:
+    """
+    Test reading frequency lists in the "word count" format.
+    """
+
+    path = tmp_path / "words.txt"
+    path.write_text("# word count\nami 10\n\ntumi 5\nami 1\nse 1\n", "utf-8")
+
+    assert frequency.read_wordlist(path) == ["ami", "tumi", "se"]
+    assert frequency.read_wordlist(str(path), limit=2) == ["ami", "tumi"]
+    assert frequency.read_wordlist(["ki", "keno"]) == ["ki", "keno"]
+
+
+def test_render_escapes_words() -> None:
+    """
+    Test that rendered tables are valid Python, whatever the words hold.
+    """
+
+    parse = {'say "ami"': 'সে "আমি"', "back\\slash": "\\", "ami": "আমি"}
+    reverse = {"আমি": "ami"}
+    import ast
+
+    source = frequency.render(parse, reverse)
+    namespace = {
+        node.target.id: ast.literal_eval(node.value)
+        for node in ast.parse(source).body
+        if isinstance(node, ast.AnnAssign)
+        and isinstance(node.target, ast.Name)
+        and node.value is not None
+    }
+
+    assert namespace["FREQUENT_PARSE"] == parse
+    assert namespace["FREQUENT_REVERSE"] == reverse
+    assert '    "ami": "আমি",\n' in source
+
+
+def test_load_wordlist() -> None:
+    """
+    Test that loaded words are served from the frequency table.
+    """
+
+    try:
+        size = len(frequency.table())
+        assert avro.load_wordlist(["jhalmuri", "ঝালমুড়ি"]) > size
+
+        table = frequency.table()
+        assert table.parse["jhalmuri"] == main._parse_backend("jhalmuri", True)
+        assert "ঝালমুড়ি" in table.reverse
+
+        before = main._DEFAULT._parse_cached.cache_info()
+        avro.parse("jhalmuri")
+        assert main._DEFAULT._parse_cached.cache_info() == before
+    finally:
+        frequency.reset()
+
+    assert "jhalmuri" not in frequency.table().parse
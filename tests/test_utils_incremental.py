@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import random
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import fuzz, incremental
+
+
+# Test functions for this file.
+def test_parse_incremental() -> None:
+    """
+    Test that edits only touch the output around them.
+    """
+
+    document = avro.parse_incremental("ami tomake gan gai")
+
+    assert document.output == "আমি তমাকে গান গাই"
+    assert document.edit(4, 6, "tumi") == (5, 4, "ুমি")
+    assert document.text == "ami tumi gan gai"
+    assert document.output == "আমি তুমি গান গাই"
+
+    # Typing at the end, then deleting everything.
+    for char in " o":
+        document.edit(len(document), 0, char)
+    assert document.output == avro.parse("ami tumi gan gai o")
+    document.edit(0, len(document), "")
+    assert document.output == ""
+
+    with pytest.raises(ValueError):
+        document.edit(1, 0, "a")
+
+
+def test_incremental_matches_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test random edits of random text against parsing the whole text.
+    """
+
+    # Small pages, so that edits span several of them.
+    monkeypatch.setattr(incremental, "_PAGE", 4)
+    rng = random.Random(41)
+    pieces = fuzz._Pieces()
+
+    for _ in range(200):
+        text = "".join(fuzz.banglish(rng, pieces) for _ in range(6))
+        document = avro.parse_incremental(text)
+        output = document.output
+
+        for _ in range(10):
+            offset = rng.randint(0, len(text))
+            deleted = rng.randint(0, min(len(text) - offset, 6))
+            inserted = fuzz.banglish(rng, pieces)[: rng.randint(0, 5)]
+
+            edit = document.edit(offset, deleted, inserted)
+            text = text[:offset] + inserted + text[offset + deleted :]
+            output = (
+                output[: edit.offset]
+                + edit.inserted
+                + output[edit.offset + edit.deleted :]
+            )
+
+            assert document.text == text
+            assert document.output == output == avro.parse(text)
+
+
+def test_incremental_special_cases() -> None:
+    """
+    Test custom phrases and literal remap markers typed into the text.
+    """
+
+    transliterator = avro.Transliterator(
+        exceptions={"American Express": "আমেক্স"}
+    )
+    document = transliterator.parse_incremental("ami american kini")
+    document.edit(12, 0, " express")
+    assert document.output == "আমি আমেক্স কিনি"
+
+    # Documents run on the custom words they're created with, phrases
+    # added later included.
+    transliterator = avro.Transliterator()
+    before = transliterator.parse_incremental("ami american express card")
+    parsed = transliterator.parse("tumi american express card")
+    transliterator.add_exceptions({"American Express": "AMEX"})
+    after = transliterator.parse_incremental("ami american express card")
+    for document in (before, after):
+        document.edit(0, 3, "tumi")
+    assert before.output == parsed
+    assert after.output == transliterator.parse("tumi american express card")
+    assert "AMEX" in after.output
+
+    document = avro.parse_incremental("ami <rm>kaj</r> kori")
+    document.edit(14, 0, "m")
+    assert document.output == avro.parse("ami <rm>kaj</rm> kori")
+    document.edit(5, 1, "")
+    assert document.output == avro.parse("ami <m>kaj</rm> kori")
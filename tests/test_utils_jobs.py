@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+from pathlib import Path
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import jobs, streams
+
+TEXTS = {
+    "a.txt": "ami banglay gan gai",
+    "news/b.txt": "tumi kothay jachho?\r\n",
+    "news/c.txt": "amar sonar bangla",
+}
+
+
+def _corpus(tmp_path: Path) -> Path:
+    for name, text in TEXTS.items():
+        path = tmp_path / "in" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(text.encode("utf-8"))
+
+    manifest = tmp_path / "in" / "manifest.txt"
+    manifest.write_text(
+        "# The corpus.\n" + "\n".join(TEXTS) + "\n\nmissing.txt\n"
+    )
+    return manifest
+
+
+# Test functions for this file.
+def test_run_and_resume(tmp_path: Path) -> None:
+    """
+    Test converting a manifest, and resuming a job that was interrupted.
+    """
+
+    manifest = _corpus(tmp_path)
+    output = tmp_path / "out"
+
+    def interrupt(progress: jobs.Progress) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        jobs.run(manifest, output, "parse", on_progress=interrupt)
+
+    seen: list[jobs.Progress] = []
+    report = jobs.run(manifest, output, "parse", on_progress=seen.append)
+
+    assert report.progress.skipped == 1
+    assert report.progress.files == len(seen) == 2
+    assert list(report.errors) == ["missing.txt"]
+    for name, text in TEXTS.items():
+        assert (output / name).read_bytes() == avro.parse(text).encode()
+
+    # Done, until an input changes.
+    assert jobs.run(manifest, output, "parse").progress.skipped == 3
+    (tmp_path / "in" / "a.txt").write_text("tumi")
+    report = jobs.run(manifest, output, "parse")
+    assert report.progress.skipped == 2
+    assert (output / "a.txt").read_text() == "তুমি"
+
+    # Other operations (or options) are jobs of their own.
+    report = jobs.run(manifest, output, "parse", {"bijoy": True})
+    assert report.progress.skipped == 0
+    assert not list(output.rglob("*.tmp"))
+
+
+def test_streamed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that files are converted a block at a time, keeping the
+    whitespace at their edges.
+    """
+
+    monkeypatch.setattr(streams, "BLOCK_SIZE", 16)
+    bijoy = "Avwg evsjvq Mvb MvB|\n" * 20
+    texts = {
+        "bijoy.txt": "\n  " + bijoy + "\n",
+        "blank.txt": " \n\t\n",
+        "empty.txt": "",
+    }
+    for name, text in texts.items():
+        (tmp_path / name).write_bytes(text.encode())
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("\n".join(texts))
+    output = tmp_path / "out"
+
+    report = jobs.run(manifest, output, "to_unicode")
+
+    assert not report.errors
+    assert (output / "bijoy.txt").read_bytes().decode() == (
+        "\n  " + avro.to_unicode(bijoy) + "\n\n"
+    )
+    assert (output / "blank.txt").read_bytes().decode() == " \n\t\n"
+    assert (output / "empty.txt").read_bytes().decode() == ""
+
+    report = jobs.run(manifest, output, "reverse", {"from_bijoy": True})
+    assert (output / "bijoy.txt").read_bytes().decode() == (
+        "\n  " + avro.reverse(bijoy, from_bijoy=True) + "\n\n"
+    )
+
+
+def test_failed_bytes(tmp_path: Path) -> None:
+    """
+    Test that the bytes of files that failed aren't counted as converted.
+    """
+
+    (tmp_path / "good.txt").write_bytes(b"ami")
+    (tmp_path / "bad.txt").write_bytes(b"tumi \xff")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("good.txt\nbad.txt\n")
+
+    progress = jobs.run(manifest, tmp_path / "out", "parse").progress
+
+    assert (progress.files, progress.failed) == (2, 1)
+    assert (progress.bytes, progress.failed_bytes) == (3, 6)
+    assert progress.eta == 0
+    assert "1 failed (0.0 MB)" in str(progress)
+
+
+def test_shards(tmp_path: Path) -> None:
+    """
+    Test splitting a job into shards, on worker processes.
+    """
+
+    manifest = _corpus(tmp_path)
+    output = tmp_path / "out"
+    converted = 0
+
+    for index in range(2):
+        report = jobs.run(
+            manifest, output, "parse", shard=(index, 2), workers=2
+        )
+        converted += report.progress.files
+
+    assert converted == len(TEXTS)
+    assert len(list((output / jobs.CHECKPOINTS).iterdir())) == 2
+    assert jobs.run(manifest, output, "parse").progress.skipped == 3
+
+    with pytest.raises(ValueError):
+        jobs.run(manifest, output, "parse", shard=(2, 2))
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the command-line entry point.
+    """
+
+    manifest = _corpus(tmp_path)
+    output = tmp_path / "out"
+    (tmp_path / "in" / "missing.txt").write_text("‡Zvgvi")
+
+    assert jobs.main([str(manifest), str(output), "-O", "to_unicode"]) == 0
+    assert (output / "missing.txt").read_text() == "তোমার"
+    assert "4/4 files" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        jobs.main([str(manifest), str(output), "-O", "parse", "--from-bijoy"])
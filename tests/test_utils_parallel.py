@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import random
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import fuzz, parallel
+
+
+# Test functions for this file.
+def test_split() -> None:
+    """
+    Test splitting text after the characters nothing converts across.
+    """
+
+    text = "ami tumi! se; ora"
+    assert parallel.split(text, "parse", size=3) == [
+        "ami ",
+        "tumi!",
+        " se;",
+        " ora",
+    ]
+    assert parallel.split(text, "parse", size=3, phrases=True) == [
+        "ami tumi!",
+        " se;",
+        " ora",
+    ]
+    assert parallel.split(text, "parse") == [text]
+    assert parallel.split("ami <rm>tumi</rm> se", "parse", size=1) == [
+        "ami ",
+        "<rm>tumi</rm> se",
+    ]
+
+    # Signs are never split from what they follow.
+    assert parallel.split("আমি ি তুমি", "to_bijoy", size=1) == [
+        "আমি ি ",
+        "তুমি",
+    ]
+    assert parallel.split("আমি কর্ম তুমি", "to_bijoy", size=1) == [
+        "আমি ",
+        "কর্ম ",
+        "তুমি",
+    ]
+
+    with pytest.raises(ValueError):
+        parallel.boundary("spell")
+
+
+def test_parallel_matches_sequential(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that converting in chunks gives exactly the sequential results.
+    """
+
+    monkeypatch.setattr(parallel, "_MIN_CHUNK", 1)
+    rng = random.Random(44)
+    pieces = fuzz._Pieces()
+    separators = [" ", "\n", ". ", ", ", "\t", "- ", " ami ", " কর ছি "]
+    transliterator = avro.Transliterator(
+        exceptions={"ami": "আমি!", "kor": "কর ছি"}
+    )
+
+    for _ in range(60):
+        generate = rng.choice([fuzz.banglish, fuzz.bengali, fuzz.bijoy])
+        text = "".join(
+            generate(rng, pieces) + rng.choice(separators)
+            for _ in range(rng.randint(1, 30))
+        )
+
+        for func in (
+            transliterator.parse,
+            transliterator.reverse,
+            transliterator.to_bijoy,
+            transliterator.to_unicode,
+        ):
+            try:
+                expected = func(text)
+            except IndexError:
+                continue
+            assert func(text, parallel=True, max_workers=16) == expected
+
+
+def test_parallel_to_bijoy_rephs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test converting chunks to Bijoy around rephs, pre-kars and halants.
+    """
+
+    monkeypatch.setattr(parallel, "_MIN_CHUNK", 1)
+    rng = random.Random(37)
+    pieces = [
+        "\u0995",
+        "\u09ae",
+        "\u09b8",
+        "\u09b0",
+        "\u09cd",
+        "\u09bf",
+        "\u09c7",
+        "\u09c8",
+        "\u09be",
+        "\u09c0",
+        "\u0986",
+        " ",
+        " ",
+        "\n",
+        "\u09b0\u09cd",
+        "\u09b0\u09c7\u09cd",
+    ]
+
+    for _ in range(300):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 40)))
+        expected = avro.to_bijoy(text)
+        assert "\x00" not in expected
+        assert avro.to_bijoy(text, parallel=True, max_workers=16) == expected
+
+
+def test_parallel_process_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test converting chunks on the process backend, with custom words.
+    """
+
+    monkeypatch.setattr(parallel, "_MIN_CHUNK", 1)
+    text = "ami iphone kini, tumi kino. " * 20
+    transliterator = avro.Transliterator(exceptions={"iPhone": "আইফোন"})
+    parsed = transliterator.parse(text)
+
+    assert "আইফোন" in parsed
+    assert (
+        transliterator.parse(
+            text, parallel=True, backend="process", max_workers=2
+        )
+        == parsed
+    )
+    assert avro.reverse(parsed, parallel=True, max_workers=4) == avro.reverse(
+        parsed
+    )
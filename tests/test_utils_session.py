@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import random
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import fuzz
+
+
+# Test functions for this file.
+def test_typing_session() -> None:
+    """
+    Test keystrokes changing the output of earlier ones.
+    """
+
+    typing = avro.typing_session()
+
+    assert typing.press("k") == (0, "ক")
+    assert typing.press("h") == (1, "খ")
+    assert typing.backspace() == (1, "ক")
+    assert [typing.press(key) for key in "ami "][-1] == (0, " ")
+    assert typing.output == avro.parse("kami ")
+
+    # Backspacing into the previous word.
+    assert typing.backspace() == (1, "")
+    assert typing.press("r") == (0, "র")
+    assert typing.output == avro.parse("kamir")
+
+    typing.reset()
+    assert typing.backspace() == (0, "")
+    assert typing.text == typing.output == ""
+
+    with pytest.raises(ValueError):
+        typing.press("kh")
+
+
+def test_typing_exceptions() -> None:
+    """
+    Test typing exception words, and custom words.
+    """
+
+    typing = avro.typing_session()
+    for key in "ami Microsof":
+        typing.press(key)
+    assert typing.press("t") == (6, "াইক্রোসফট")
+    assert typing.output == "আমি মাইক্রোসফট"
+    typing.backspace()
+    assert typing.output == avro.parse("ami Microsof")
+
+    transliterator = avro.Transliterator(exceptions={"iPhone": "আইফোন"})
+    typing = transliterator.typing_session()
+    for key in "ami iphon":
+        typing.press(key)
+    assert typing.press("e").inserted == "আইফোন"
+    assert typing.output == "আমি আইফোন"
+
+    # Sessions run on the custom words they're started with, phrases added
+    # later included.
+    before = transliterator.typing_session()
+    transliterator.add_exceptions({"American Express": "AMEX"})
+    after = transliterator.typing_session()
+    for typing in (before, after):
+        for key in "ami american express card":
+            typing.press(key)
+    assert before.output == avro.parse("ami american express card")
+    assert after.output == transliterator.parse("ami american express card")
+    assert "AMEX" in after.output
+
+
+def test_typing_matches_parse() -> None:
+    """
+    Test random typing (and backspacing) against parsing the whole text.
+    """
+
+    rng = random.Random(42)
+    pieces = fuzz._Pieces()
+
+    for _ in range(300):
+        typing = avro.typing_session()
+        text = output = ""
+
+        for key in "".join(fuzz.banglish(rng, pieces) for _ in range(3)):
+            if text and rng.random() < 0.15:
+                keystroke = typing.backspace()
+                text = text[:-1]
+            else:
+                keystroke = typing.press(key)
+                text += key
+            output = output[: len(output) - keystroke.deleted]
+            output += keystroke.inserted
+
+            assert typing.text == text
+            assert typing.output == output == avro.parse(text)
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import io
+import os
+import random
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import fuzz, streams
+
+
+# Test functions for this file.
+def test_bytes_match_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that converting bytes in small blocks gives the text results.
+    """
+
+    monkeypatch.setattr(streams, "BLOCK_SIZE", 7)
+    rng = random.Random(46)
+    pieces = fuzz._Pieces()
+    separators = [" ", "\n", ". ", ", ", "\t", "- ", " ami ", " কর ছি "]
+    transliterator = avro.Transliterator(
+        exceptions={"ami": "আমি!", "kor": "কর ছি"}
+    )
+
+    for _ in range(60):
+        generate = rng.choice([fuzz.banglish, fuzz.bengali, fuzz.bijoy])
+        text = "".join(
+            generate(rng, pieces) + rng.choice(separators)
+            for _ in range(rng.randint(1, 30))
+        )
+        data = text.encode("utf-8")
+
+        for func, func_bytes in (
+            (transliterator.parse, transliterator.parse_bytes),
+            (transliterator.reverse, transliterator.reverse_bytes),
+            (transliterator.to_bijoy, transliterator.to_bijoy_bytes),
+            (transliterator.to_unicode, transliterator.to_unicode_bytes),
+        ):
+            try:
+                expected = func(text)
+            except IndexError:
+                continue
+            assert func_bytes(data).decode("utf-8") == expected
+
+
+def test_sinks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test writing the output to sinks, from bytes-like and file inputs.
+    """
+
+    monkeypatch.setattr(streams, "BLOCK_SIZE", 5)
+    text = "ami banglay gan gai. tumi kothay jachho?\n" * 10
+    expected = avro.parse(text, bijoy=True).encode("utf-8")
+
+    # Multi-byte characters are split across blocks here.
+    assert avro.parse_bytes(memoryview(text.encode()), bijoy=True) == expected
+
+    sink = bytearray(b">")
+    assert avro.parse_bytes(text.encode(), bijoy=True, sink=sink) == len(
+        expected
+    )
+    assert sink == b">" + expected
+
+    unicode = avro.to_unicode(expected.decode()).encode("utf-8")
+    file = io.BytesIO()
+    assert avro.to_unicode_bytes(io.BytesIO(expected), sink=file) == len(
+        unicode
+    )
+    assert file.getvalue() == unicode
+    assert avro.reverse_bytes(expected, from_bijoy=True) == avro.reverse(
+        unicode.decode()
+    ).encode("utf-8")
+
+    assert avro.to_bijoy_bytes(b"") == b""
+    with pytest.raises(UnicodeDecodeError):
+        avro.to_bijoy_bytes(b"\xe0\xa6")
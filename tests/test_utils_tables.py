@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+
+
+# Import first-party Python modules.
+import os
+import sys
+
+# Add support layer for accessing the primary package.
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+# Import local modules.
+import pytest
+
+import avro
+from avro.core import processor, tables
+from avro.resources.phonetic import PHONETIC
+
+
+# Test functions for this file.
+def test_snapshot_round_trip(tmp_path) -> None:
+    """
+    Test that written snapshots load back into equivalent tables.
+    """
+
+    paths = tables.write_snapshots(str(tmp_path))
+    assert len(paths) == 2
+
+    digest = tables.source_digest("phonetic")
+    data = tables.read_snapshot(
+        tables.snapshot_path(str(tmp_path), "phonetic", digest), digest
+    )
+    loaded = tables.PhoneticTables(data)
+    built = tables.phonetic()
+
+    assert loaded.patterns == built.patterns
+    assert loaded.sets == built.sets
+    for text in ("ami Microsoft e kaj kori", "AMERICAN EXPRESS"):
+        assert loaded.remap(text) == built.remap(text)
+
+    digest = tables.source_digest("bijoy")
+    data = tables.read_snapshot(
+        tables.snapshot_path(str(tmp_path), "bijoy", digest), digest
+    )
+    assert tables.BijoyTables(data).pattern == tables.bijoy().pattern
+
+
+def test_stale_or_corrupt_snapshots_are_ignored(tmp_path) -> None:
+    """
+    Test that snapshots for other dictionary versions are never loaded.
+    """
+
+    digest = tables.source_digest("bijoy")
+    path = tables.snapshot_path(str(tmp_path), "bijoy", digest)
+
+    tables.write_snapshot(path, digest, {"version": 1})
+    assert tables.read_snapshot(path, digest) == {"version": 1}
+    assert tables.read_snapshot(path, "0" * 64) is None
+
+    with open(path, "wb") as file:
+        file.write(b"garbage")
+    assert tables.read_snapshot(path, digest) is None
+    assert tables.read_snapshot(str(tmp_path / "missing.bin"), digest) is None
+
+
+def test_load_prefers_cache_directory(tmp_path, monkeypatch) -> None:
+    """
+    Test that the loader picks up snapshots from the cache directory.
+    """
+
+    monkeypatch.setenv("AVRO_CACHE_DIR", str(tmp_path))
+    digest = tables.source_digest("bijoy")
+    path = tables.snapshot_path(str(tmp_path), "bijoy", digest)
+    tables.write_snapshot(path, digest, {"marker": True})
+
+    assert tables.load("bijoy") == {"marker": True}
+
+    monkeypatch.setenv("AVRO_CACHE_DIR", "")
+    assert tables.cache_dir() is None
+    assert "mappings" in tables.load("bijoy")
+
+
+def test_first_match_agrees_with_linear_scan() -> None:
+    """
+    Test that indexed matching finds the same pattern as a full scan.
+    """
+
+    for text in ("ami banglay gan gai.", "kOthay zao?", "আমি বাংলায়"):
+        for cur in range(len(text) + 1):
+            for rule in (False, True):
+                for reversed in (False, True):
+                    patterns = (
+                        processor.RULE_PATTERNS
+                        if rule
+                        else processor.NON_RULE_PATTERNS
+                    )
+                    found = processor.exact_find_in_pattern(
+                        text, reversed, cur, patterns
+                    )
+                    match = processor.first_match(text, cur, rule, reversed)
+
+                    if found:
+                        assert processor.PATTERNS[match.index] is found[0]
+                    else:
+                        assert match is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "ami Microsoft e kaj kori",
+        "AMERICAN express aliexpress",
+        "my motorcycle driver uses WhatsApp and Apple",
+        "ami facebook-e achi, tumi?",
+    ],
+)
+def test_plain_remap_matches_regex_remap(text: str) -> None:
+    """
+    Test that the substring-search remapper agrees with regexes.
+    """
+
+    data = tables.build_phonetic(PHONETIC)
+    plain = tables.PhoneticTables(data)
+    regex = tables.PhoneticTables(
+        {**data, "plain_remap": False, "plain_remap_reverse": False}
+    )
+
+    assert plain.remap(text) == regex.remap(text)
+
+    parsed = avro.parse(text)
+    assert plain.remap(parsed, True) == regex.remap(parsed, True)
+
+
+def test_rule_records_agree_with_rule_dicts() -> None:
+    """
+    Test that compiled rule records behave like the dictionary rules.
+    """
+
+    records = [p for p in tables.phonetic().patterns if p.rules is not None]
+    assert len(records) == len(processor.RULE_PATTERNS)
+
+    for text in ("o", "oi", "kor", "rri", "ao o", "Ooo", "tOmar", "o-ti"):
+        for record in records:
+            rules = processor.PATTERNS[record.index]["rules"]
+            for cur in range(len(text)):
+                for cur_end in range(cur + 1, len(text) + 1):
+                    assert processor.apply_rules(
+                        record.rules, text, cur, cur_end
+                    ) == processor.process_rules(rules, text, cur, cur_end)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "The quick brown fox",
+        "আমি বাংলায় গান গাই, ami tOmar",
+        "  kh\nবাংলা.oi ",
+        "Hello আমি বাংলায়",
+    ],
+)
+def test_runs_match_the_reference(text: str) -> None:
+    """
+    Test that skipping the passed-through runs doesn't change anything.
+    """
+
+    for operation in ("parse", "reverse"):
+        for rm in (True, False):
+            assert getattr(avro, operation)(
+                text, remap_words=rm, engine="interpreted"
+            ) == getattr(avro, operation)(
+                text, remap_words=rm, engine="legacy"
+            )
+
+    assert tables.phonetic().runs(reversed=True).fullmatch("বাংলা")
+    assert not tables.phonetic().runs(reversed=True).search("Hello world")